@@ -0,0 +1,193 @@
+#! /usr/bin/env python
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+# Benchmark for the native UTF8 and UTF16 converters ('quex/converter/utf')
+# against iconv.
+#
+# USAGE:  benchmark-converter.py [MegaByteN [LexatomSize_bit]]
+#
+# A corpus of 'MegaByteN' megabytes of UTF8 is generated in memory, along with
+# its UTF16 (little endian) equivalent. Two corpora are used: pure ASCII text,
+# and 'mixed' text where about every tenth character lies beyond ASCII (2, 3,
+# and 4 byte sequences in UTF8). Each corpus is converted chunk by chunk, as 
+# the buffer's loader does it: chunks of odd sizes, unconverted bytes at the 
+# end of a chunk are carried into the next. Throughput in MB/s of input and a
+# checksum over the produced lexatoms are reported. The checksums of native 
+# and iconv conversion must be the same.
+#
+# For 8 bit lexatoms, only the ASCII corpus can be converted. For 16 bit
+# lexatoms, the mixed corpus contains no code points beyond 0xFFFF.
+#
+# Requires 'gcc' and iconv.
+#_______________________________________________________________________________
+import os
+import sys
+sys.path.insert(0, os.environ["QUEX_PATH"])
+
+import shutil
+import subprocess
+import tempfile
+
+GRAMMAR = """
+token { X; }
+mode MAIN { x => QUEX_TKN_X; }
+"""
+
+MAIN_C = """
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "Lexer.c"
+#include "lib/quex/converter/iconv/Converter_IConv.i"
+#include "lib/quex/converter/utf/Converter_UTF8.i"
+#include "lib/quex/converter/utf/Converter_UTF16.i"
+
+typedef struct { uint8_t* utf8; size_t utf8_n; uint8_t* utf16; size_t utf16_n; } Corpus;
+
+static unsigned long random_state = 4711;
+static uint32_t random_next(void)
+{ random_state = random_state * 6364136223846793005UL + 1442695040888963407UL;
+  return (uint32_t)(random_state >> 33); }
+
+static uint32_t code_point(int MixedF, uint32_t CodePointMax)
+{
+    uint32_t r = random_next() % 100;
+    if( ! MixedF || r < 90 )          return r % 10 ? 0x61 + random_next() % 26 : 0x20;
+    else if( r < 96 )                 return 0xC0 + random_next() % 0x140;   /* 2 byte */
+    else if( r < 99 || CodePointMax < 0x10000 ) 
+                                      return 0x4E00 + random_next() % 0x5000; /* 3 byte */
+    else                              return 0x1F600 + random_next() % 0x50;  /* 4 byte */
+}
+
+static void corpus_generate(Corpus* me, size_t ByteN, int MixedF, uint32_t CodePointMax)
+{
+    uint32_t c, u;
+    me->utf8  = (uint8_t*)malloc(ByteN + 4);
+    me->utf16 = (uint8_t*)malloc(2 * ByteN + 8);
+    me->utf8_n = me->utf16_n = 0;
+    while( me->utf8_n < ByteN ) {
+        c = code_point(MixedF, CodePointMax);
+        if     ( c < 0x80 )    { me->utf8[me->utf8_n++] = (uint8_t)c; }
+        else if( c < 0x800 )   { me->utf8[me->utf8_n++] = (uint8_t)(0xC0 | c >> 6);
+                                 me->utf8[me->utf8_n++] = (uint8_t)(0x80 | (c & 0x3F)); }
+        else if( c < 0x10000 ) { me->utf8[me->utf8_n++] = (uint8_t)(0xE0 | c >> 12);
+                                 me->utf8[me->utf8_n++] = (uint8_t)(0x80 | ((c >> 6) & 0x3F));
+                                 me->utf8[me->utf8_n++] = (uint8_t)(0x80 | (c & 0x3F)); }
+        else                   { me->utf8[me->utf8_n++] = (uint8_t)(0xF0 | c >> 18);
+                                 me->utf8[me->utf8_n++] = (uint8_t)(0x80 | ((c >> 12) & 0x3F));
+                                 me->utf8[me->utf8_n++] = (uint8_t)(0x80 | ((c >> 6) & 0x3F));
+                                 me->utf8[me->utf8_n++] = (uint8_t)(0x80 | (c & 0x3F)); }
+        if( c >= 0x10000 ) {
+            u = 0xD800 | (c - 0x10000) >> 10;
+            me->utf16[me->utf16_n++] = (uint8_t)u; me->utf16[me->utf16_n++] = (uint8_t)(u >> 8);
+            c = 0xDC00 | ((c - 0x10000) & 0x3FF);
+        }
+        me->utf16[me->utf16_n++] = (uint8_t)c; me->utf16[me->utf16_n++] = (uint8_t)(c >> 8);
+    }
+}
+
+static void run(const char* Name, quex_Converter* converter, 
+                const uint8_t* Begin, size_t ByteN, size_t LexatomSize)
+{
+    static uint8_t drain[65536 * 4];
+    uint8_t        chunk[65521 + 16];
+    const uint8_t* input      = Begin;
+    const uint8_t* End        = &Begin[ByteN];
+    size_t         chunk_n    = 0;
+    size_t         k, i;
+    uint8_t*       source;
+    void*          drain_p;
+    unsigned long  checksum   = 0;
+    E_LoadResult   result;
+    clock_t        begin      = clock();
+    double         seconds;
+
+    while( input != End || chunk_n ) {
+        k = (size_t)(End - input) < 65521 - chunk_n ? (size_t)(End - input) : 65521 - chunk_n;
+        memcpy(&chunk[chunk_n], input, k);
+        input   += k;
+        chunk_n += k;
+        source   = &chunk[0];
+        do {
+            drain_p = &drain[0];
+            result  = converter->convert(converter, &source, &chunk[chunk_n], 
+                                         &drain_p, &drain[65536 * LexatomSize]);
+            if( result == E_LoadResult_ENCODING_ERROR ) { printf("%s encoding error\\n", Name); return; }
+            for(i = 0; i < (size_t)((uint8_t*)drain_p - drain); i += 4093) {
+                checksum = checksum * 31 + drain[i];
+            }
+            checksum += (size_t)((uint8_t*)drain_p - drain);
+        } while( result == E_LoadResult_COMPLETE && source != &chunk[chunk_n] );
+        chunk_n = (size_t)(&chunk[chunk_n] - source);
+        memmove(&chunk[0], source, chunk_n);
+        if( input == End && chunk_n ) { printf("%s incomplete end\\n", Name); return; }
+    }
+    seconds = (double)(clock() - begin) / CLOCKS_PER_SEC;
+    printf("%-16s %10.1f [MB/s]  checksum: %lu\\n", Name, 
+           (double)ByteN / 1e6 / seconds, checksum & 0xFFFFFFFFul);
+}
+
+int main(int argc, char** argv)
+{
+    const size_t   ByteN       = (size_t)atol(argv[1]) * 1000000;
+    const size_t   LexatomSize = (size_t)atol(argv[2]) / 8;
+    const char*    to          = LexatomSize == 4 ? (quex_system_is_little_endian() ? "UCS-4LE" : "UCS-4BE")
+                               : LexatomSize == 2 ? (quex_system_is_little_endian() ? "UCS-2LE" : "UCS-2BE")
+                               :                    "ASCII";
+    quex_Converter* converter;
+    Corpus          corpus;
+    int             mixed_f;
+
+    for(mixed_f = 0; mixed_f != (LexatomSize == 1 ? 1 : 2); ++mixed_f) {
+        corpus_generate(&corpus, ByteN, mixed_f, LexatomSize == 2 ? 0xFFFF : 0x10FFFF);
+        printf("%s corpus: UTF8: %i [byte]; UTF16: %i [byte]\\n", mixed_f ? "mixed" : "ASCII",
+               (int)corpus.utf8_n, (int)corpus.utf16_n);
+
+        converter = quex_Converter_UTF8_new(8 * LexatomSize);
+        run("UTF8  native:", converter, corpus.utf8, corpus.utf8_n, LexatomSize);
+        quex_Converter_delete(&converter);
+        converter = quex_Converter_IConv_new(8 * LexatomSize, "UTF-8", to);
+        run("UTF8  iconv:", converter, corpus.utf8, corpus.utf8_n, LexatomSize);
+        quex_Converter_delete(&converter);
+
+        converter = quex_Converter_UTF16_new(8 * LexatomSize, false);
+        run("UTF16 native:", converter, corpus.utf16, corpus.utf16_n, LexatomSize);
+        quex_Converter_delete(&converter);
+        converter = quex_Converter_IConv_new(8 * LexatomSize, "UTF-16LE", to);
+        run("UTF16 iconv:", converter, corpus.utf16, corpus.utf16_n, LexatomSize);
+        quex_Converter_delete(&converter);
+
+        free(corpus.utf8);
+        free(corpus.utf16);
+    }
+    return 0;
+}
+"""
+
+def main():
+    megabyte_n      = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    lexatom_size_bit = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    work_dir = tempfile.mkdtemp(prefix="benchmark-converter-")
+
+    with open(os.path.join(work_dir, "grammar.qx"), "w") as fh: fh.write(GRAMMAR)
+    with open(os.path.join(work_dir, "main.c"), "w") as fh:     fh.write(MAIN_C)
+
+    subprocess.check_call([sys.executable,
+                           os.path.join(os.environ["QUEX_PATH"], "quex-exe.py"),
+                           "-i", "grammar.qx", "-o", "Lexer", "-l", "C", "--odir", ".",
+                           "-b", "%i" % (lexatom_size_bit // 8)],
+                          cwd=work_dir, stdout=subprocess.DEVNULL)
+    subprocess.check_call(["gcc", "-O2", "-I.", "-DQUEX_OPTION_ASSERTS_DISABLED_EXT",
+                           "-o", "benchmark", "main.c"],
+                          cwd=work_dir, stderr=subprocess.DEVNULL)
+
+    print("megabytes: %i; lexatom size: %i [bit]" % (megabyte_n, lexatom_size_bit))
+    sys.stdout.flush()
+    subprocess.check_call([os.path.join(work_dir, "benchmark"), 
+                           "%i" % megabyte_n, "%i" % lexatom_size_bit], cwd=work_dir)
+    shutil.rmtree(work_dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#! /usr/bin/env python
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+# Benchmark for the post categorizer ('extra/post_categorizer').
+#
+# USAGE:  benchmark-post_categorizer.py [EntryN [LookupN]]
+#
+# A dictionary of 'EntryN' identifiers is built. Then, 'LookupN' identifiers
+# are looked up, half of which are in the dictionary. Time per 'enter' and per
+# 'get_token_id' is reported, along with a checksum over the token ids found.
+#
+# The code base is taken from $QUEX_PATH. To compare with an earlier revision,
+# run the benchmark with QUEX_PATH set to an export of that revision--the
+# checksums must be the same.
+#
+# Requires 'gcc'.
+#_______________________________________________________________________________
+import os
+import sys
+sys.path.insert(0, os.environ["QUEX_PATH"])
+
+import random
+import shutil
+import subprocess
+import tempfile
+
+GRAMMAR = """
+token { ID; }
+mode MAIN { [a-z_]+ => QUEX_TKN_ID; }
+"""
+
+MAIN_C = """
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "Lexer.c"
+#include "lib/extra/post_categorizer/PostCategorizer.i"
+
+static Lexer_lexatom_t** read_list(FILE* fh, size_t N)
+{
+    Lexer_lexatom_t** result = (Lexer_lexatom_t**)malloc(sizeof(Lexer_lexatom_t*) * N);
+    char              line[256];
+    size_t            i, k, L;
+    for(i = 0; i < N; ++i) {
+        if( ! fgets(line, sizeof(line), fh) ) exit(1);
+        L         = strlen(line) - 1;
+        result[i] = (Lexer_lexatom_t*)malloc(sizeof(Lexer_lexatom_t) * (L + 1));
+        for(k = 0; k < L; ++k) result[i][k] = (Lexer_lexatom_t)line[k];
+        result[i][L] = 0;
+    }
+    return result;
+}
+
+static double seconds(clock_t Begin)
+{ return (double)(clock() - Begin) / CLOCKS_PER_SEC; }
+
+int main(int argc, char** argv)
+{
+    Lexer_Dictionary  dictionary;
+    FILE*             fh       = fopen(argv[1], "rb");
+    size_t            entry_n  = (size_t)atol(argv[2]);
+    size_t            lookup_n = (size_t)atol(argv[3]);
+    Lexer_lexatom_t** entry    = read_list(fh, entry_n);
+    Lexer_lexatom_t** lookup   = read_list(fh, lookup_n);
+    unsigned long     checksum = 0;
+    clock_t           begin;
+    double            t_enter, t_lookup;
+    size_t            i;
+    int               r;
+
+    Lexer_PostCategorizer_construct(&dictionary);
+
+    begin = clock();
+    for(i = 0; i < entry_n; ++i) {
+        dictionary.enter(&dictionary, entry[i], (Lexer_token_id_t)(1 + i % 1000));
+    }
+    t_enter = seconds(begin);
+
+    begin = clock();
+    for(r = 0; r < 10; ++r) {
+        for(i = 0; i < lookup_n; ++i) {
+            checksum = checksum * 31 + (unsigned long)dictionary.get_token_id(&dictionary, lookup[i]);
+        }
+    }
+    t_lookup = seconds(begin) / 10;
+
+    printf("enter:  %8.1f [ns]\\n", 1e9 * t_enter  / (double)entry_n);
+    printf("lookup: %8.1f [ns]\\n", 1e9 * t_lookup / (double)lookup_n);
+    printf("checksum: %lu\\n", checksum & 0xFFFFFFFFul);
+    Lexer_PostCategorizer_destruct(&dictionary);
+    return 0;
+}
+"""
+
+def identifier_list(N, Seed):
+    random.seed(Seed)
+    result = set()
+    while len(result) < N:
+        result.add("".join(random.choice("abcdefghijklmnopqrstuvwxyz_")
+                           for i in range(random.randint(3, 16))))
+    return sorted(result)
+
+def main():
+    entry_n  = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    lookup_n = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    work_dir = tempfile.mkdtemp(prefix="benchmark-post_categorizer-")
+
+    entry_list = identifier_list(entry_n, 4711)
+    other_list = identifier_list(entry_n, 815)
+    random.seed(17)
+    random.shuffle(entry_list)       # not in alphabetical order
+    lookup_list = [ random.choice(entry_list if i % 2 else other_list)
+                    for i in range(lookup_n) ]
+    with open(os.path.join(work_dir, "input.txt"), "w") as fh:
+        fh.write("".join("%s\n" % x for x in entry_list + lookup_list))
+    with open(os.path.join(work_dir, "grammar.qx"), "w") as fh: fh.write(GRAMMAR)
+    with open(os.path.join(work_dir, "main.c"), "w") as fh:     fh.write(MAIN_C)
+
+    subprocess.check_call([sys.executable,
+                           os.path.join(os.environ["QUEX_PATH"], "quex-exe.py"),
+                           "-i", "grammar.qx", "-o", "Lexer", "-l", "C", "--odir", "."],
+                          cwd=work_dir, stdout=subprocess.DEVNULL)
+    subprocess.check_call(["gcc", "-O2", "-I.", "-DQUEX_OPTION_ASSERTS_DISABLED_EXT",
+                           "-o", "benchmark", "main.c"],
+                          cwd=work_dir, stderr=subprocess.DEVNULL)
+
+    print("entries: %i; lookups: %i" % (entry_n, lookup_n))
+    sys.stdout.flush()
+    subprocess.check_call([os.path.join(work_dir, "benchmark"), "input.txt",
+                           "%i" % entry_n, "%i" % lookup_n], cwd=work_dir)
+    shutil.rmtree(work_dir)
+
+if __name__ == "__main__":
+    main()
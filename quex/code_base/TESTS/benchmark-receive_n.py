@@ -0,0 +1,145 @@
+#! /usr/bin/env python
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+# Benchmark for batched token reception ('receive_n()' vs. 'receive()').
+#
+# USAGE:  benchmark-receive_n.py [MegaByteN [TokenArraySize]]
+#
+# A file of about 'MegaByteN' megabytes (default 64) containing identifiers,
+# numbers, and operators is lexed, once token by token via 'receive()', once
+# with 'receive_n()' into an array of 'TokenArraySize' tokens (default 256).
+# Tokens per second are reported for both, along with a checksum over the
+# token ids and lexemes--which must be the same for both. Each variant runs
+# three times in a process of its own; the best run is reported.
+#
+# The code base is taken from $QUEX_PATH. To compare with an earlier revision,
+# run the benchmark with QUEX_PATH set to an export of that revision.
+#
+# Requires 'gcc'.
+#_______________________________________________________________________________
+import os
+import sys
+sys.path.insert(0, os.environ["QUEX_PATH"])
+
+import random
+import shutil
+import subprocess
+import tempfile
+
+GRAMMAR = """
+token { ID; NUM; OP; }
+mode MAIN : <skip: [ \\t\\n]> {
+  [_a-zA-Z][_a-zA-Z0-9]*  => QUEX_TKN_ID(Lexeme);
+  [0-9]+                  => QUEX_TKN_NUM(Lexeme);
+  "+"|"-"|"("|")"|","|";" => QUEX_TKN_OP;
+}
+"""
+
+MAIN_C = """
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+#include "Lexer.c"
+
+static unsigned long digest(unsigned long checksum, const Lexer_Token* token)
+{
+    const Lexer_lexatom_t* p;
+    checksum = checksum * 31 + (unsigned long)token->id;
+    if( token->id != QUEX_TKN_ID && token->id != QUEX_TKN_NUM ) return checksum;
+    for(p = token->text; *p; ++p) checksum = checksum * 31 + (unsigned long)*p;
+    return checksum;
+}
+
+int main(int argc, char** argv)
+{
+    Lexer          lexer;
+    Lexer_Token*   token_p;
+    const size_t   N          = (size_t)atol(argv[2]);
+    Lexer_Token*   array      = (Lexer_Token*)malloc(sizeof(Lexer_Token) * (N ? N : 1));
+    unsigned long  checksum   = 0;
+    size_t         token_n    = 0;
+    size_t         received_n, i;
+    clock_t        begin;
+    double         t;
+
+    for(i = 0; i < N; ++i) Lexer_Token_construct(&array[i]);
+    Lexer_from_file_name(&lexer, argv[1], NULL);
+
+    begin = clock();
+    if( ! N ) {
+        do {
+            lexer.receive(&lexer, &token_p);
+            checksum = digest(checksum, token_p);
+            ++token_n;
+        } while( token_p->id != QUEX_TKN_TERMINATION );
+    }
+    else {
+        do {
+            received_n = lexer.receive_n(&lexer, array, N);
+            for(i = 0; i < received_n; ++i) checksum = digest(checksum, &array[i]);
+            token_n += received_n;
+        } while( received_n && array[received_n - 1].id != QUEX_TKN_TERMINATION );
+    }
+    t = (double)(clock() - begin) / CLOCKS_PER_SEC;
+
+    printf("%f %lu %lu\\n", 1e-6 * (double)token_n / t, (unsigned long)token_n, 
+           checksum & 0xFFFFFFFFul);
+
+    Lexer_destruct(&lexer);
+    for(i = 0; i < N; ++i) Lexer_Token_destruct(&array[i]);
+    free(array);
+    return 0;
+}
+"""
+
+def write_corpus(FileName, ByteN):
+    random.seed(4711)
+    word_list = [ "".join(random.choice("abcdefghijklmnopqrstuvwxyz_")
+                          for i in range(random.randint(1, 12)))
+                  for k in range(5000) ] \
+              + [ "%i" % random.randint(0, 100000) for k in range(1000) ] \
+              + [ "+", "-", "(", ")", ",", ";" ] * 200
+    with open(FileName, "w") as fh:
+        size = 0
+        while size < ByteN:
+            line = " ".join(random.choice(word_list) for i in range(12)) + "\n"
+            fh.write(line)
+            size += len(line)
+
+def main():
+    mega_byte_n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    array_size  = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    work_dir    = tempfile.mkdtemp(prefix="benchmark-receive_n-")
+
+    write_corpus(os.path.join(work_dir, "input.txt"), mega_byte_n << 20)
+    with open(os.path.join(work_dir, "grammar.qx"), "w") as fh: fh.write(GRAMMAR)
+    with open(os.path.join(work_dir, "main.c"), "w") as fh:     fh.write(MAIN_C)
+
+    subprocess.check_call([sys.executable,
+                           os.path.join(os.environ["QUEX_PATH"], "quex-exe.py"),
+                           "-i", "grammar.qx", "-o", "Lexer", "-l", "C", "--odir", "."],
+                          cwd=work_dir, stdout=subprocess.DEVNULL)
+    subprocess.check_call(["gcc", "-O2", "-I.", "-DQUEX_OPTION_ASSERTS_DISABLED_EXT",
+                           "-o", "benchmark", "main.c"],
+                          cwd=work_dir, stderr=subprocess.DEVNULL)
+
+    print("input: %i [MB]" % mega_byte_n)
+    # Each variant runs in a process of its own, alternating. Best of 3.
+    result_db = {}
+    for i in range(3):
+        for n in (0, array_size):
+            output = subprocess.check_output([os.path.join(work_dir, "benchmark"), 
+                                              "input.txt", "%i" % n], cwd=work_dir)
+            speed, token_n, checksum = output.split()
+            entry = result_db.get(n)
+            if entry is None or float(speed) > entry[0]:
+                result_db[n] = (float(speed), int(token_n), int(checksum))
+
+    for n, name in ((0, "receive()"), (array_size, "receive_n(%i)" % array_size)):
+        speed, token_n, checksum = result_db[n]
+        print("%-16s %6.1f [MToken/s] tokens: %i; checksum: %i" % (name, speed, token_n, checksum))
+    shutil.rmtree(work_dir)
+
+if __name__ == "__main__":
+    main()
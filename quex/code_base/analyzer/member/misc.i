@@ -149,6 +149,28 @@ QUEX_INLINE size_t QUEX_NAME(MF_column_number_at_begin)(const QUEX_TYPE_ANALYZER
 QUEX_INLINE size_t QUEX_NAME(MF_column_number_at_end)(const QUEX_TYPE_ANALYZER* me)   { return me->counter._column_number_at_end; }
 QUEX_INLINE void   QUEX_NAME(MF_column_number_set)(QUEX_TYPE_ANALYZER* me, size_t Value) { me->counter._column_number_at_end = Value; }
 $$-----------------------------------------------------------------------------
+$$<count-lazy>-----------------------------------------------------------------
+QUEX_INLINE bool
+QUEX_NAME(MF_line_column)(QUEX_TYPE_ANALYZER* me, size_t LexatomIndex,
+                          size_t* line_n, size_t* column_n)
+/* Line and column number of the lexatom at 'LexatomIndex' in the current 
+ * input stream, e.g. of a token's 'lexatom_index'. 
+ *
+ * RETURNS: true, if line and column could be determined.
+ *          false, if the position has not been loaded, yet.                  */
+{ 
+    return QUEX_NAME(Buffer_newline_index_find)(&me->buffer, LexatomIndex, line_n, column_n); 
+}
+
+QUEX_INLINE void
+QUEX_NAME(MF_line_column_forget)(QUEX_TYPE_ANALYZER* me, size_t LexatomIndex)
+/* Positions before 'LexatomIndex' will not be passed to 'line_column()' any
+ * longer. The newline index drops the newlines before it. Without this, the
+ * index holds all newlines of the stream.                                   */
+{ 
+    QUEX_NAME(Buffer_newline_index_forget)(&me->buffer, LexatomIndex); 
+}
+$$-----------------------------------------------------------------------------
 $$<indentation>----------------------------------------------------------------
 QUEX_INLINE size_t  QUEX_NAME(MF_indentation)(const QUEX_TYPE_ANALYZER* me)           
 { return (size_t)(me->counter._indentation_stack.back - me->counter._indentation_stack.front) + (size_t)1; }
@@ -252,6 +252,10 @@ QUEX_NAME(destruct)(QUEX_TYPE_ANALYZER* me)
 
     QUEX_NAME(user_destructor)(me);
 
+$$<statistics>-----------------------------------------------------------------
+    QUEX_NAME(statistics_save)(QUEX_SETTING_STATISTICS_FILE_NAME);
+$$-----------------------------------------------------------------------------
+
     /* Protect against double destruction.                                    */
     QUEX_NAME(MF_resources_absent_mark)(me);
 }
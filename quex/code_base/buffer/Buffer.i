@@ -62,6 +62,7 @@ QUEX_NAME(Buffer_construct)(QUEX_NAME(Buffer)*        me,
     QUEX_NAME(Buffer_callbacks_set)(me, (void (*)(void*))0, (void (*)(void*))0, (void*)0);
 
     /* Initialize.                                                           */
+    $$<count-lazy> QUEX_NAME(Buffer_newline_index_construct)(me);$$
     QUEX_NAME(Buffer_init)(me, EndOfFileP);
     me->_fallback_n = FallbackN;
 
@@ -107,6 +108,7 @@ QUEX_NAME(Buffer_init)(QUEX_NAME(Buffer)* me, QUEX_TYPE_LEXATOM* EndOfFileP)
 {
     QUEX_NAME(Buffer_init_content)(me, EndOfFileP);
     QUEX_NAME(Buffer_init_analyzis)(me); 
+    $$<count-lazy> QUEX_NAME(Buffer_newline_index_init)(me);$$
 }
 
 QUEX_INLINE void
@@ -123,6 +125,7 @@ QUEX_NAME(Buffer_destruct)(QUEX_NAME(Buffer)* me)
         QUEX_GNAME_LIB(MemoryManager_free)((void*)me->filler, E_MemoryObjectType_BUFFER_FILLER);
     }
     QUEX_NAME(BufferMemory_destruct)(&me->_memory);
+    $$<count-lazy> QUEX_NAME(Buffer_newline_index_destruct)(me);$$
     QUEX_NAME(Buffer_resources_absent_mark)(me);
 }
 
@@ -352,6 +355,7 @@ QUEX_NAME(Buffer_register_content)(QUEX_NAME(Buffer)*        me,
     if( CharacterIndexBegin != (QUEX_TYPE_STREAM_POSITION)-1 ) {
         me->input.lexatom_index_begin = CharacterIndexBegin;
     }
+    $$<count-lazy> (void)QUEX_NAME(Buffer_newline_index_update)(me);$$
 
     QUEX_IF_ASSERTS_poison(&me->content_end(me)[1], me->content_space_end(me));
     /* NOT: assert(QUEX_NAME(Buffer_input_lexatom_index_begin)(me) >= 0);
@@ -614,5 +618,6 @@ $$INC: buffer/Buffer_callbacks.i$$
 $$INC: buffer/Buffer_invariance.i$$
 $$INC: buffer/Buffer_move.i$$
 $$INC: buffer/BufferMemory.i$$
+$$INC: <count-lazy> buffer/Buffer_newline_index.i$$
 
 #endif /* QUEX_INCLUDE_GUARD__BUFFER__BUFFER_I */
@@ -326,6 +326,7 @@ QUEX_NAME(Buffer_move_and_load)(QUEX_NAME(Buffer)*  me,
 
     me->input.end_p    = &me->input.end_p[*loaded_n];
     me->input.end_p[0] = QUEX_SETTING_BUFFER_LEXATOM_BUFFER_BORDER;
+    $$<count-lazy> (void)QUEX_NAME(Buffer_newline_index_update)(me);$$
     return true;
 }
 
@@ -0,0 +1,225 @@
+/* vim:set ft=c: -*- C++ -*-
+ *
+ * PURPOSE: Newline index for lazy line and column computation ('--count-lazy').
+ *
+ * Instead of running counter code in every pattern terminal, the buffer
+ * records the lexatom indices of newlines whenever content is loaded. Tokens
+ * carry only the lexatom index of their begin. Line and column numbers are
+ * computed on demand by binary search:
+ *
+ *      line_n   = 1 + number of newlines before the lexatom index.
+ *      column_n = distance to the last newline before the lexatom index.
+ *
+ * The scan tests a 64 bit word of lexatoms at a time and inspects lexatoms
+ * one by one only in words that contain a newline.
+ *
+ * LIMITATIONS:
+ *
+ *   -- '\n' is the only newline. Columns are counted in lexatoms, i.e. there
+ *      is no tab grid and a multi-lexatom character occupies multiple
+ *      columns.
+ *   -- The index covers the stream contiguously from its begin. If a forward
+ *      seek skips content that has never been loaded, positions behind the
+ *      gap cannot be resolved.
+ *   -- An included stream has an index of its own. Positions of tokens from
+ *      an included stream can only be resolved while it is being analyzed.
+ *
+ * MEMORY: The index holds one 'size_t' per newline, i.e. it grows with the
+ * number of lines of the stream. If positions before some lexatom index are
+ * no longer of interest, 'Buffer_newline_index_forget()' drops the newlines
+ * before it. They are then only counted in the base line number, so that 
+ * later positions still resolve to the correct line and column. Calling it 
+ * regularly, e.g. with the position of the oldest token still to be 
+ * resolved, bounds the index to the newlines in between.
+ *
+ * (C) Frank-Rene Schaefer                                                    */
+#ifndef QUEX_INCLUDE_GUARD__BUFFER__BUFFER_NEWLINE_INDEX_I
+#define QUEX_INCLUDE_GUARD__BUFFER__BUFFER_NEWLINE_INDEX_I
+
+$$INC: buffer/Buffer$$
+$$INC: quex/MemoryManager$$
+
+QUEX_NAMESPACE_MAIN_OPEN
+
+QUEX_INLINE bool  QUEX_NAME(Buffer_newline_index_push)(QUEX_NAME(Buffer)* me,
+                                                       size_t             Position);
+
+QUEX_INLINE void
+QUEX_NAME(Buffer_newline_index_construct)(QUEX_NAME(Buffer)* me)
+{
+    me->newline_index.position    = (size_t*)0;
+    me->newline_index.capacity    = 0;
+    QUEX_NAME(Buffer_newline_index_init)(me);
+}
+
+QUEX_INLINE void
+QUEX_NAME(Buffer_newline_index_destruct)(QUEX_NAME(Buffer)* me)
+{
+    if( me->newline_index.position ) {
+        QUEX_GNAME_LIB(MemoryManager_free)((void*)me->newline_index.position,
+                                           E_MemoryObjectType_NEWLINE_INDEX);
+    }
+    QUEX_NAME(Buffer_newline_index_construct)(me);
+}
+
+QUEX_INLINE void
+QUEX_NAME(Buffer_newline_index_init)(QUEX_NAME(Buffer)* me)
+/* Forget all indexed newlines, but keep the allocated memory.                */
+{
+    me->newline_index.n             = 0;
+    me->newline_index.indexed_end   = 0;
+    me->newline_index.base_line_n   = 0;
+    me->newline_index.base_position = 0;
+}
+
+QUEX_INLINE bool
+QUEX_NAME(Buffer_newline_index_update)(QUEX_NAME(Buffer)* me)
+/* Index the newlines of the buffer's content that are not yet indexed.
+ *
+ * RETURNS: true, if the index covers the stream up to the content's end.
+ *          false, if there is a gap between the index and the content, or
+ *                 memory could not be allocated.                             */
+{
+    const int         LaneBitN = (int)(sizeof(QUEX_TYPE_LEXATOM) << 3);
+    const int         LaneN    = (int)(sizeof(uint64_t) / sizeof(QUEX_TYPE_LEXATOM));
+    const uint64_t    Ones     = ~(uint64_t)0 / (~(uint64_t)0 >> (64 - LaneBitN));
+    const uint64_t    High     = Ones << (LaneBitN - 1);
+    const uint64_t    Pattern  = Ones * (uint64_t)'\n';
+    QUEX_TYPE_LEXATOM* const ContentBeginP = me->content_begin(me);
+    QUEX_TYPE_LEXATOM* const ContentEndP   = me->content_end(me);
+    size_t             begin_index;
+    const QUEX_TYPE_LEXATOM* p;
+    const QUEX_TYPE_LEXATOM* word_end;
+    uint64_t           word;
+
+    if( ! ContentEndP ) {
+        return true;
+    }
+    begin_index = (size_t)me->input.lexatom_index_begin;
+    if( begin_index > me->newline_index.indexed_end ) {
+        return false;                          /* Gap: content was skipped.   */
+    }
+    else if( me->newline_index.indexed_end - begin_index >= (size_t)(ContentEndP - ContentBeginP) ) {
+        return true;                           /* Content is already indexed. */
+    }
+    p = &ContentBeginP[me->newline_index.indexed_end - begin_index];
+
+    while( p < ContentEndP ) {
+        if( ContentEndP - p >= LaneN ) {
+            QUEX_GSTD(memcpy)((void*)&word, (const void*)p, sizeof(uint64_t));
+            word ^= Pattern;
+            if( ! ((word - Ones) & ~word & High) ) {
+                p += LaneN;                     /* No newline in word.         */
+                continue;
+            }
+            word_end = &p[LaneN];
+        }
+        else {
+            word_end = ContentEndP;
+        }
+        for(; p != word_end; ++p) {
+            if( *p != (QUEX_TYPE_LEXATOM)'\n' ) continue;
+            else if( ! QUEX_NAME(Buffer_newline_index_push)(me, begin_index + (size_t)(p - ContentBeginP)) ) {
+                me->newline_index.indexed_end = begin_index + (size_t)(p - ContentBeginP);
+                return false;
+            }
+        }
+    }
+    me->newline_index.indexed_end = begin_index + (size_t)(ContentEndP - ContentBeginP);
+    return true;
+}
+
+QUEX_INLINE bool
+QUEX_NAME(Buffer_newline_index_find)(QUEX_NAME(Buffer)* me,
+                                     size_t             LexatomIndex,
+                                     size_t*            line_n,
+                                     size_t*            column_n)
+/* Determine line and column number of the lexatom at 'LexatomIndex'. Line
+ * and column numbers start at '1'.
+ *
+ * RETURNS: true, if 'LexatomIndex' is covered by the index, or if it 
+ *                lies right behind the indexed content (end of stream).
+ *          false, else. '*line_n' and '*column_n' remain untouched.          */
+{
+    const size_t  Position = LexatomIndex;
+    const size_t  BaseN    = me->newline_index.base_line_n;
+    size_t        low      = 0;
+    size_t        high     = me->newline_index.n;
+    size_t        middle;
+
+    (void)QUEX_NAME(Buffer_newline_index_update)(me);
+    if( Position > me->newline_index.indexed_end ) {
+        return false;
+    }
+    else if( BaseN && Position <= me->newline_index.base_position ) {
+        return false;                          /* Newline before is forgotten.*/
+    }
+
+    /* Find number of newlines before 'Position'.                             */
+    while( low < high ) {
+        middle = low + ((high - low) >> 1);
+        if( me->newline_index.position[middle] < Position ) low  = middle + 1;
+        else                                                high = middle;
+    }
+
+    *line_n   = BaseN + low + 1;
+    *column_n =   low   ? Position - me->newline_index.position[low - 1] 
+                : BaseN ? Position - me->newline_index.base_position
+                :         Position + 1;
+    return true;
+}
+
+QUEX_INLINE void
+QUEX_NAME(Buffer_newline_index_forget)(QUEX_NAME(Buffer)* me,
+                                       size_t             LexatomIndex)
+/* Drop the newlines before 'LexatomIndex' from the index. Positions from 
+ * 'LexatomIndex' on can still be resolved. Positions before it may not.      */
+{
+    size_t  low    = 0;
+    size_t  high   = me->newline_index.n;
+    size_t  middle;
+
+    while( low < high ) {
+        middle = low + ((high - low) >> 1);
+        if( me->newline_index.position[middle] < LexatomIndex ) low  = middle + 1;
+        else                                                    high = middle;
+    }
+    if( ! low ) return;
+
+    me->newline_index.base_line_n   += low;
+    me->newline_index.base_position  = me->newline_index.position[low - 1];
+    me->newline_index.n             -= low;
+    QUEX_GSTD(memmove)((void*)&me->newline_index.position[0], 
+                       (const void*)&me->newline_index.position[low],
+                       me->newline_index.n * sizeof(size_t));
+}
+
+QUEX_INLINE bool
+QUEX_NAME(Buffer_newline_index_push)(QUEX_NAME(Buffer)* me, size_t Position)
+{
+    size_t  new_capacity;
+    size_t* new_position;
+
+    if( me->newline_index.n == me->newline_index.capacity ) {
+        new_capacity = me->newline_index.capacity ? me->newline_index.capacity << 1 : 1024;
+        new_position = (size_t*)QUEX_GNAME_LIB(MemoryManager_allocate)(new_capacity * sizeof(size_t),
+                                                                        E_MemoryObjectType_NEWLINE_INDEX);
+        if( ! new_position ) return false;
+
+        if( me->newline_index.position ) {
+            QUEX_GSTD(memcpy)((void*)new_position, (const void*)me->newline_index.position,
+                              me->newline_index.n * sizeof(size_t));
+            QUEX_GNAME_LIB(MemoryManager_free)((void*)me->newline_index.position,
+                                               E_MemoryObjectType_NEWLINE_INDEX);
+        }
+        me->newline_index.position = new_position;
+        me->newline_index.capacity = new_capacity;
+    }
+    me->newline_index.position[me->newline_index.n] = Position;
+    ++(me->newline_index.n);
+    return true;
+}
+
+QUEX_NAMESPACE_MAIN_CLOSE
+
+#endif /* QUEX_INCLUDE_GUARD__BUFFER__BUFFER_NEWLINE_INDEX_I */
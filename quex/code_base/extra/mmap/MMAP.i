@@ -0,0 +1,101 @@
+/* -*- C++ -*- vim: set syntax=cpp: */
+#ifndef QUEX_INCLUDE_GUARD__EXTRA__MMAP__MMAP_I
+#define QUEX_INCLUDE_GUARD__EXTRA__MMAP__MMAP_I
+
+$$INC: extra/mmap/MMAP$$
+$$INC: quex/byte_loader/ByteLoader_MMAP.i$$
+$$INC: quex/bom.i$$
+
+QUEX_NAMESPACE_MAIN_OPEN
+
+QUEX_INLINE bool
+QUEX_NAME(MMAP_content_fits_buffer)(const uint8_t* Begin, const uint8_t* End);
+
+QUEX_INLINE void
+QUEX_NAME(from_ByteLoader_MMAP)(QUEX_TYPE_ANALYZER*          me,
+                                QUEX_GNAME_LIB(ByteLoader)*  byte_loader)
+/* Construct an analyzer which lexes the content of a 'ByteLoader_MMAP' in
+ * place. The memory passed to 'from_memory()' is:
+ *
+ *             [BLC][x.x.x.x.x.x.x.x.x.x.x.x.x.x][BLC][BLC]
+ *                   |                            |    |
+ *                   content begin                |    back
+ *                                                end of file
+ *
+ * The lexatom before the content lies in the page in front of the mapped 
+ * file. The two lexatoms behind it lie in the rest of the file's last page
+ * or in the page behind it. 
+ *
+ * The content is rejected with 'E_Error_File_EncodingMismatch', if it cannot
+ * be the buffer's content without conversion (see 'MMAP_content_fits_buffer()').
+ * As with 'E_Error_File_OpenFailed', the analyzer's resources are absent.    */
+{
+    QUEX_GNAME_LIB(ByteLoader_MMAP)* loader = (QUEX_GNAME_LIB(ByteLoader_MMAP)*)byte_loader;
+    QUEX_TYPE_LEXATOM*               content_p;
+    size_t                           content_n;
+
+    QUEX_NAME(MF_error_code_clear)(me);
+
+    if(    ! byte_loader 
+        || byte_loader->derived.chunk_load != QUEX_GNAME_LIB(ByteLoader_MMAP_chunk_load)
+        || ! loader->byte_array.begin_p ) {
+        QUEX_NAME(MF_error_code_set_if_first)(me, E_Error_File_OpenFailed);
+        QUEX_NAME(MF_resources_absent_mark)(me);
+        return;
+    }
+    else if( ! QUEX_NAME(MMAP_content_fits_buffer)(loader->byte_array.begin_p, 
+                                                   loader->byte_array.end_p) ) {
+        QUEX_NAME(MF_error_code_set_if_first)(me, E_Error_File_EncodingMismatch);
+        QUEX_NAME(MF_resources_absent_mark)(me);
+        return;
+    }
+
+    content_p = (QUEX_TYPE_LEXATOM*)loader->byte_array.begin_p;
+    content_n =   (size_t)(loader->byte_array.end_p - loader->byte_array.begin_p) 
+                / sizeof(QUEX_TYPE_LEXATOM);
+
+    content_p[-1]          = QUEX_SETTING_BUFFER_LEXATOM_BUFFER_BORDER;
+    content_p[content_n]   = QUEX_SETTING_BUFFER_LEXATOM_BUFFER_BORDER;
+    content_p[content_n+1] = QUEX_SETTING_BUFFER_LEXATOM_BUFFER_BORDER;
+
+    QUEX_NAME(from_memory)(me, &content_p[-1], content_n + 3, &content_p[content_n]);
+}
+
+QUEX_INLINE bool
+QUEX_NAME(MMAP_content_fits_buffer)(const uint8_t* Begin, const uint8_t* End)
+/* In place, there is no converter and no byte order reversion. The bytes of
+ * the file are the buffer's lexatoms. That is impossible, if
+ *
+ *   -- the file size is not a multiple of the lexatom size.
+ *   -- the file starts with a byte order mark of another lexatom size, or 
+ *      with a byte order mark that is not U+FEFF in the system's byte order.
+ *
+ * RETURNS: true, if the bytes in [Begin, End) may be the buffer's content.
+ *          false, else.                                                      */
+{
+    const size_t    ByteN     = (size_t)(End - Begin);
+    uint8_t         head[4]   = { 0, 0, 0, 0 };
+    size_t          bom_n     = 0;
+    E_ByteOrderMark bom;
+
+    if( ByteN % sizeof(QUEX_TYPE_LEXATOM) ) return false;
+
+    QUEX_GSTD(memcpy)((void*)&head[0], (const void*)Begin, ByteN < 4 ? ByteN : 4);
+    bom = QUEX_GNAME_LIB(bom_snap_core)(head, ByteN < 4 ? ByteN : 4, &bom_n);
+
+    switch( sizeof(QUEX_TYPE_LEXATOM) ) {
+    case 1:  return    bom != QUEX_BOM_UTF_16_LE && bom != QUEX_BOM_UTF_16_BE
+                    && bom != QUEX_BOM_UTF_32_LE && bom != QUEX_BOM_UTF_32_BE;
+    case 2:  return    bom == QUEX_BOM_NONE 
+                    || (   (bom == QUEX_BOM_UTF_16_LE || bom == QUEX_BOM_UTF_16_BE)
+                        && *(const uint16_t*)Begin == (uint16_t)0xFEFF);
+    case 4:  return    bom == QUEX_BOM_NONE 
+                    || (   (bom == QUEX_BOM_UTF_32_LE || bom == QUEX_BOM_UTF_32_BE)
+                        && *(const uint32_t*)Begin == (uint32_t)0xFEFF);
+    default: return bom == QUEX_BOM_NONE;
+    }
+}
+
+QUEX_NAMESPACE_MAIN_CLOSE
+
+#endif /* QUEX_INCLUDE_GUARD__EXTRA__MMAP__MMAP_I */
@@ -14,100 +14,55 @@ $$INC: quex/asserts$$
 QUEX_NAMESPACE_MAIN_OPEN
 
 QUEX_INLINE void
-QUEX_NAME(PostCategorizer__enter)(QUEX_NAME(Dictionary)*    me, 
-                                  const QUEX_TYPE_LEXATOM*  EntryName, 
+QUEX_NAME(PostCategorizer__enter)(QUEX_NAME(Dictionary)*    me,
+                                  const QUEX_TYPE_LEXATOM*  EntryName,
                                   QUEX_TYPE_TOKEN_ID        TokenID);
-                          
-QUEX_INLINE void          
-QUEX_NAME(PostCategorizer__insert)(QUEX_NAME(Dictionary)*    me, 
-                                   const QUEX_TYPE_LEXATOM*  EntryName, 
-                                   QUEX_TYPE_TOKEN_ID        TokenID);
-                          
-QUEX_INLINE QUEX_TYPE_TOKEN_ID 
+
+QUEX_INLINE bool
+QUEX_NAME(PostCategorizer__enter_list)(QUEX_NAME(Dictionary)*           me,
+                                       const QUEX_TYPE_LEXATOM* const*  EntryNameList,
+                                       const QUEX_TYPE_TOKEN_ID*        TokenIdList,
+                                       size_t                           N);
+
+QUEX_INLINE QUEX_TYPE_TOKEN_ID
 QUEX_NAME(PostCategorizer__get_token_id)(const QUEX_NAME(Dictionary)*  me,
                                          const QUEX_TYPE_LEXATOM*      Lexeme);
 
-QUEX_INLINE void          
-QUEX_NAME(PostCategorizer__remove)(QUEX_NAME(Dictionary)*    me, 
+QUEX_INLINE void
+QUEX_NAME(PostCategorizer__remove)(QUEX_NAME(Dictionary)*    me,
                                    const QUEX_TYPE_LEXATOM*  EntryName);
-                          
-QUEX_INLINE void          
-QUEX_NAME(PostCategorizer__clear)(QUEX_NAME(Dictionary)* me);
-                          
-QUEX_INLINE void          
-QUEX_NAME(PostCategorizer__clear_recursively)(QUEX_NAME(Dictionary)*      me, 
-                                              QUEX_NAME(DictionaryNode)*  branch);
-QUEX_INLINE int           
-QUEX_NAME(PostCategorizer__compare)(QUEX_NAME(DictionaryNode)*  me, 
-                                    QUEX_TYPE_LEXATOM           FirstCharacter, 
-                                    const QUEX_TYPE_LEXATOM*    Remainder);
-
-QUEX_INLINE QUEX_NAME(DictionaryNode)*  
-QUEX_NAME(PostCategorizer__allocate_node)(const QUEX_TYPE_LEXATOM* Remainder);
-
-QUEX_INLINE void 
-QUEX_NAME(PostCategorizer__free_node)(QUEX_NAME(DictionaryNode)* node);
-
-QUEX_INLINE QUEX_NAME(DictionaryNode)*
-QUEX_NAME(PostCategorizer__find)(const QUEX_NAME(Dictionary)* me, 
-                                 const QUEX_TYPE_LEXATOM*     EntryName);
-
 
+QUEX_INLINE void
+QUEX_NAME(PostCategorizer__clear)(QUEX_NAME(Dictionary)* me);
 
-QUEX_INLINE  QUEX_NAME(DictionaryNode)*  
-QUEX_NAME(PostCategorizer__allocate_node)(const QUEX_TYPE_LEXATOM* Remainder)
-{
-    const size_t  RemainderL = QUEX_NAME(lexeme_length)(Remainder);
-    /* Allocate in one beat: base and remainder: 
-     *
-     *   [Base   |Remainder             ]
-     *
-     * Then bend the base->name_remainder to the Remainder part of the allocated
-     * memory. Note, that this is not very efficient, since one should try to allocate
-     * the small node objects and refer to the remainder only when necessary. This
-     * would reduce cache misses.                                                      */
-    const size_t   BaseSize      = sizeof(QUEX_NAME(DictionaryNode));
-    /* Length + 1 == memory size (terminating zero) */
-    const size_t   RemainderSize = sizeof(QUEX_TYPE_LEXATOM) * (RemainderL + 1);
-    uint8_t*       base          = 
-                      (uint8_t*)
-                      QUEX_GNAME_LIB(MemoryManager_allocate)(BaseSize + RemainderSize, 
-                                                     E_MemoryObjectType_POST_CATEGORIZER_NODE);
-    ((QUEX_NAME(DictionaryNode)*)base)->name_remainder = (const QUEX_TYPE_LEXATOM*)(base + BaseSize);
-    return (QUEX_NAME(DictionaryNode)*)base;
-}
-
-QUEX_INLINE  void 
-QUEX_NAME(PostCategorizer__free_node)(QUEX_NAME(DictionaryNode)* node)
-{ 
-    if( ! node ) return;
-    
-    QUEX_GNAME_LIB(MemoryManager_free)((void*)node, 
-                               E_MemoryObjectType_POST_CATEGORIZER_NODE); 
-}
+QUEX_INLINE uint32_t
+QUEX_NAME(PostCategorizer__hash)(const QUEX_TYPE_LEXATOM* EntryName,
+                                 size_t*                  length);
 
-QUEX_INLINE QUEX_NAME(DictionaryNode)* 
-QUEX_NAME(DictionaryNode_new)(QUEX_TYPE_LEXATOM         FirstCharacter,
-                              const QUEX_TYPE_LEXATOM*  Remainder,
-                              QUEX_TYPE_TOKEN_ID        TokenID)
-{
-    QUEX_NAME(DictionaryNode)* me = QUEX_NAME(PostCategorizer__allocate_node)(Remainder);
+QUEX_INLINE bool
+QUEX_NAME(PostCategorizer__reserve)(QUEX_NAME(Dictionary)* me,
+                                    size_t                 EntryN,
+                                    size_t                 LexatomN);
 
-    me->name_first_character = FirstCharacter;
-    me->name_remainder       = Remainder;
-    me->token_id             = TokenID;
-    me->lesser               = 0x0;
-    me->greater              = 0x0;
+QUEX_INLINE void
+QUEX_NAME(PostCategorizer__insert)(QUEX_NAME(Dictionary)*    me,
+                                   uint32_t                  Hash,
+                                   const QUEX_TYPE_LEXATOM*  EntryName,
+                                   size_t                    Length,
+                                   QUEX_TYPE_TOKEN_ID        TokenID);
 
-    return me;
-}
+QUEX_INLINE QUEX_NAME(DictionarySlot)*
+QUEX_NAME(PostCategorizer__find)(const QUEX_NAME(Dictionary)* me,
+                                 uint32_t                     Hash,
+                                 const QUEX_TYPE_LEXATOM*     EntryName);
 
 QUEX_INLINE bool
 QUEX_NAME(PostCategorizer_construct)(QUEX_NAME(Dictionary)* me)
 {
-    me->root = 0x0;
+    QUEX_NAME(PostCategorizer_resources_absent_mark)(me);
 $$<C>--------------------------------------------------------------------------
     me->enter         = QUEX_NAME(PostCategorizer__enter);
+    me->enter_list    = QUEX_NAME(PostCategorizer__enter_list);
     me->remove        = QUEX_NAME(PostCategorizer__remove);
     me->get_token_id  = QUEX_NAME(PostCategorizer__get_token_id);
     me->clear         = QUEX_NAME(PostCategorizer__clear);
@@ -123,254 +78,267 @@ QUEX_NAME(PostCategorizer_destruct)(QUEX_NAME(Dictionary)* me)
     QUEX_NAME(PostCategorizer__clear)(me);
 }
 
-QUEX_INLINE int
-QUEX_NAME(PostCategorizer__compare)(QUEX_NAME(DictionaryNode)* me, 
-                                    QUEX_TYPE_LEXATOM          FirstCharacter, 
-                                    const QUEX_TYPE_LEXATOM*   Remainder)
-    /* Returns: '0'   if both strings are the same
-       '< 0' string 0 < string 1
-       '> 0' string 0 > string 1           */
+QUEX_INLINE uint32_t
+QUEX_NAME(PostCategorizer__hash)(const QUEX_TYPE_LEXATOM* EntryName,
+                                 size_t*                  length)
+/* FNV-1a hash over the lexatoms of 'EntryName'.
+ *
+ * RETURNS: hash value; '*length' = number of lexatoms in 'EntryName'.        */
 {
-    const QUEX_TYPE_LEXATOM* it0 = 0x0;
-    const QUEX_TYPE_LEXATOM* it1 = 0x0;
-
-    if     ( FirstCharacter > me->name_first_character ) return 1;
-    else if( FirstCharacter < me->name_first_character ) return -1;
-    else {
-        /* Implementation according to: P.J. Plauger, "The Standard C Library", 1992 */
-        it0 = Remainder;
-        it1 = me->name_remainder;
-        for(; *it0 == *it1; ++it0, ++it1) {
-            /* Both letters are the same and == 0?
-             * => both reach terminall zero without being different. */
-            if( *it0 == 0 ) return 0;
-        }
-        return (int)(*it0) - (int)(*it1);
+    const QUEX_TYPE_LEXATOM* p    = EntryName;
+    uint32_t                 hash = (uint32_t)2166136261u;
+
+    for(; *p; ++p) {
+        hash = (uint32_t)((hash ^ (uint32_t)*p) * (uint32_t)16777619u);
     }
+    *length = (size_t)(p - EntryName);
+    return hash;
 }
 
-QUEX_INLINE void
-QUEX_NAME(PostCategorizer__enter)(QUEX_NAME(Dictionary)* me,
-                                  const QUEX_TYPE_LEXATOM*  EntryName, 
-                                  const QUEX_TYPE_TOKEN_ID    TokenID)
+QUEX_INLINE QUEX_NAME(DictionarySlot)*
+QUEX_NAME(PostCategorizer__find)(const QUEX_NAME(Dictionary)* me,
+                                 uint32_t                     Hash,
+                                 const QUEX_TYPE_LEXATOM*     EntryName)
+/* RETURNS: Slot of 'EntryName', if it is in the dictionary.
+ *          Empty slot where it would be inserted, else.
+ *          Null, if there are no slots.                                      */
 {
-    QUEX_TYPE_LEXATOM           FirstCharacter = EntryName[0];
-    const QUEX_TYPE_LEXATOM*    Remainder = FirstCharacter == 0x0 ? 0x0 : EntryName + 1;
-    QUEX_NAME(DictionaryNode)*    node      = me->root;
-    QUEX_NAME(DictionaryNode)*    prev_node = 0x0;
-    int                           result = 0;
-
-    if( me->root == 0x0 ) {
-        me->root = QUEX_NAME(DictionaryNode_new)(FirstCharacter, Remainder, TokenID);
-        return;
-    }
-    while( node != 0x0 ) {
-        prev_node = node;
-        result    = QUEX_NAME(PostCategorizer__compare)(node, FirstCharacter, Remainder);
-        if     ( result > 0 ) node = node->greater;
-        else if( result < 0 ) node = node->lesser;
-        else                  return; /* Node with that name already exists */
-    }
-    __quex_assert( prev_node != 0x0 );
-    __quex_assert( result != 0 );
+    const size_t                Mask = me->slot_n - 1;
+    size_t                      i    = (size_t)Hash & Mask;
+    QUEX_NAME(DictionarySlot)*  slot = me->slot;
+
+    if( ! slot ) return (QUEX_NAME(DictionarySlot)*)0;
 
-    if( result > 0 ) 
-        prev_node->greater = QUEX_NAME(DictionaryNode_new)(FirstCharacter, Remainder, TokenID);
-    else 
-        prev_node->lesser  = QUEX_NAME(DictionaryNode_new)(FirstCharacter, Remainder, TokenID);
+    for(; slot[i].name_offset; i = (i + 1) & Mask) {
+        if(    slot[i].hash == Hash
+            && QUEX_NAME(lexeme_compare)(&me->arena[slot[i].name_offset], EntryName) == 0 ) {
+            break;
+        }
+    }
+    return &slot[i];
 }
 
-QUEX_INLINE void
-QUEX_NAME(PostCategorizer__remove)(QUEX_NAME(Dictionary)*  me,
-                                   const QUEX_TYPE_LEXATOM*   EntryName)
+QUEX_INLINE bool
+QUEX_NAME(PostCategorizer__reserve)(QUEX_NAME(Dictionary)* me,
+                                    size_t                 EntryN,
+                                    size_t                 LexatomN)
+/* Provides space for 'EntryN' more entries with 'LexatomN' lexatoms in total
+ * (including terminating zeros). The slot table grows by powers of 2; entries
+ * are re-hashed. The arena grows at least by a factor of 2; offsets remain.
+ *
+ * RETURNS: false, if memory could not be allocated. The dictionary remains
+ *                 unchanged.                                                 */
 {
-    int                         result = 0;
-    QUEX_TYPE_LEXATOM           FirstCharacter = EntryName[0];
-    const QUEX_TYPE_LEXATOM*    Remainder = FirstCharacter == 0x0 ? 0x0 : EntryName + 1;
-    QUEX_NAME(DictionaryNode)*  node   = 0x0;
-    QUEX_NAME(DictionaryNode)*  parent = 0x0;
-    QUEX_NAME(DictionaryNode)*  found  = me->root;
-
-    __quex_assert( found != 0x0 );
-    while( 1 + 1 == 2 ) {
-        result = QUEX_NAME(PostCategorizer__compare)(found, FirstCharacter, Remainder);
-
-        /* result == 0: found's name == EntryName 
-         * On 'break': If found == root then parent = 0x0 which triggers a special treatment. */
-        if( result == 0 ) break;
-
-        parent = found;
-
-        if     ( result > 0 )  found = found->greater;
-        else if( result < 0 ) found = found->lesser;
-
-        if( found == 0x0 ) return; /* Not found name with that name */
-    };
-    /* Found a node with 'EntryName' */
-
-    /* Remove node and re-order tree */
-    if( ! parent ) {
-        if( found->lesser ) {
-            for(node = found->lesser; node->greater != 0x0; node = node->greater );
-            node->greater = found->greater;
-            me->root      = found->lesser;
+    const size_t                RequiredEntryN  = me->entry_n + EntryN;
+    const size_t                RequiredArenaN  = (me->arena_size ? me->arena_size : 1) + LexatomN;
+    size_t                      new_slot_n      = me->slot_n ? me->slot_n : 16;
+    size_t                      new_capacity    = me->arena_capacity ? me->arena_capacity : 256;
+    QUEX_NAME(DictionarySlot)*  new_slot;
+    QUEX_TYPE_LEXATOM*          new_arena;
+    size_t                      i, k;
+
+    while( RequiredEntryN * 4 > new_slot_n * 3 ) new_slot_n    *= 2;
+    while( RequiredArenaN > new_capacity )       new_capacity  *= 2;
+
+    if( new_capacity != me->arena_capacity ) {
+        new_arena = (QUEX_TYPE_LEXATOM*)
+                    QUEX_GNAME_LIB(MemoryManager_allocate)(new_capacity * sizeof(QUEX_TYPE_LEXATOM),
+                                                           E_MemoryObjectType_POST_CATEGORIZER_NODE);
+        if( ! new_arena ) return false;
+
+        if( me->arena ) {
+            QUEX_GSTD(memcpy)(new_arena, me->arena, me->arena_size * sizeof(QUEX_TYPE_LEXATOM));
+            QUEX_GNAME_LIB(MemoryManager_free)((void*)me->arena,
+                                               E_MemoryObjectType_POST_CATEGORIZER_NODE);
         } else {
-            me->root      = found->greater;
+            new_arena[0]   = (QUEX_TYPE_LEXATOM)0;  /* offset '0' => empty slot */
+            me->arena_size = 1;
         }
+        me->arena          = new_arena;
+        me->arena_capacity = new_capacity;
     }
-    else if( found == parent->lesser ) {
-        /* (1) 'found' is the 'lesser' child of the parent:
-         *
-         *                 (parent's greater tree)
-         *                /
-         *        (parent)        (greater tree)
-         *               \       /
-         *                (found)
-         *                       \
-         *                        (lesser tree)
-         *
-         *     All subnodes of (greater tree) are greater than all subnodes in (lesser tree).
-         *     => (i) mount (lesser tree) to the least node of (greater tree).                
-         *     Anything in the subtree of 'found' is lesser than anything in 'parent's 
-         *     greater tree.
-         *     => (ii) mount (greater tree) to the least node of the (parent's greater tree). */
-        /* parent != 0x0, see above */
-        if( found->greater ) {
-            for(node = found->greater; node->lesser != 0x0; node = node->lesser );
-            node->lesser   = found->lesser;
-            parent->lesser = found->greater;
-        } else {
-            parent->lesser = found->lesser;
-        }
 
-    } else {
-        /* (2) 'found' is the 'greater' child of the parent:
-         *
-         *     (i)  mount (greater tree) to the greatest node of (greater tree).                  
-         *     (ii) mount (lesser tree) to the greatest node of the (parent's lesser tree). */
-        /* parent != 0x0, see above */
-        if( found->lesser ) {
-            for(node = found->lesser; node->greater != 0x0; node = node->greater );
-            node->greater   = found->greater;
-            parent->greater = found->lesser;
-        } else {
-            parent->greater = found->greater;
+    if( new_slot_n != me->slot_n ) {
+        new_slot = (QUEX_NAME(DictionarySlot)*)
+                   QUEX_GNAME_LIB(MemoryManager_allocate)(new_slot_n * sizeof(QUEX_NAME(DictionarySlot)),
+                                                          E_MemoryObjectType_POST_CATEGORIZER_NODE);
+        if( ! new_slot ) return false;
+
+        QUEX_GSTD(memset)((void*)new_slot, 0, new_slot_n * sizeof(QUEX_NAME(DictionarySlot)));
+        for(i = 0; i < me->slot_n; ++i) {
+            if( ! me->slot[i].name_offset ) continue;
+            for(k = (size_t)me->slot[i].hash & (new_slot_n - 1); new_slot[k].name_offset;
+                k = (k + 1) & (new_slot_n - 1)) {
+            }
+            new_slot[k] = me->slot[i];
+        }
+        if( me->slot ) {
+            QUEX_GNAME_LIB(MemoryManager_free)((void*)me->slot,
+                                               E_MemoryObjectType_POST_CATEGORIZER_NODE);
         }
+        me->slot   = new_slot;
+        me->slot_n = new_slot_n;
     }
-    QUEX_NAME(PostCategorizer__free_node)(found);
+    return true;
+}
+
+QUEX_INLINE void
+QUEX_NAME(PostCategorizer__insert)(QUEX_NAME(Dictionary)*    me,
+                                   uint32_t                  Hash,
+                                   const QUEX_TYPE_LEXATOM*  EntryName,
+                                   size_t                    Length,
+                                   QUEX_TYPE_TOKEN_ID        TokenID)
+/* REQUIRES: Space has been reserved.                                         */
+{
+    QUEX_NAME(DictionarySlot)* slot = QUEX_NAME(PostCategorizer__find)(me, Hash, EntryName);
+
+    __quex_assert(slot);
+    if( slot->name_offset ) return; /* Entry with that name already exists */
+
+    __quex_assert(me->arena_size + Length + 1 <= me->arena_capacity);
+    QUEX_GSTD(memcpy)(&me->arena[me->arena_size], EntryName,
+                      (Length + 1) * sizeof(QUEX_TYPE_LEXATOM));
+    slot->hash        = Hash;
+    slot->name_offset = (uint32_t)me->arena_size;
+    slot->token_id    = TokenID;
+    me->arena_size   += Length + 1;
+    me->entry_n      += 1;
 }
 
-QUEX_INLINE QUEX_NAME(DictionaryNode)*
-QUEX_NAME(PostCategorizer__find)(const QUEX_NAME(Dictionary)*  me, 
-                                 const QUEX_TYPE_LEXATOM*      EntryName)
+QUEX_INLINE void
+QUEX_NAME(PostCategorizer__enter)(QUEX_NAME(Dictionary)*    me,
+                                  const QUEX_TYPE_LEXATOM*  EntryName,
+                                  const QUEX_TYPE_TOKEN_ID  TokenID)
 {
-    QUEX_TYPE_LEXATOM           FirstCharacter = EntryName[0];
-    const QUEX_TYPE_LEXATOM*    Remainder      = FirstCharacter == 0x0 ? 0x0 : EntryName + 1;
-    QUEX_NAME(DictionaryNode)*  node           = me->root;
+    size_t    length;
+    uint32_t  hash = QUEX_NAME(PostCategorizer__hash)(EntryName, &length);
+
+    if( ! QUEX_NAME(PostCategorizer__reserve)(me, 1, length + 1) ) return;
 
-    while( node != 0x0 ) {
-        int result = QUEX_NAME(PostCategorizer__compare)(node, FirstCharacter, Remainder);
+    QUEX_NAME(PostCategorizer__insert)(me, hash, EntryName, length, TokenID);
+}
 
-        if     ( result > 0 ) node = node->greater;
-        else if( result < 0 ) node = node->lesser;
-        else                  return node;
+QUEX_INLINE bool
+QUEX_NAME(PostCategorizer__enter_list)(QUEX_NAME(Dictionary)*           me,
+                                       const QUEX_TYPE_LEXATOM* const*  EntryNameList,
+                                       const QUEX_TYPE_TOKEN_ID*        TokenIdList,
+                                       size_t                           N)
+/* Enters 'N' names with their token ids. Memory is reserved once for all.
+ *
+ * RETURNS: false, if memory could not be allocated. Then, nothing is entered.*/
+{
+    size_t    lexatom_n = 0;
+    size_t    length;
+    size_t    i;
+
+    for(i = 0; i < N; ++i) {
+        lexatom_n += QUEX_NAME(lexeme_length)(EntryNameList[i]) + 1;
     }
-    return 0x0;
+    if( ! QUEX_NAME(PostCategorizer__reserve)(me, N, lexatom_n) ) return false;
+
+    for(i = 0; i < N; ++i) {
+        uint32_t hash = QUEX_NAME(PostCategorizer__hash)(EntryNameList[i], &length);
+        QUEX_NAME(PostCategorizer__insert)(me, hash, EntryNameList[i], length, TokenIdList[i]);
+    }
+    return true;
 }
 
 QUEX_INLINE void
-QUEX_NAME(PostCategorizer__clear_recursively)(QUEX_NAME(Dictionary)*      me, 
-                                             QUEX_NAME(DictionaryNode)*  branch)
+QUEX_NAME(PostCategorizer__remove)(QUEX_NAME(Dictionary)*  me,
+                                   const QUEX_TYPE_LEXATOM*   EntryName)
+/* Backward shift deletion: Entries following the removed entry in the probe
+ * sequence are moved back, if the removed slot lies between their home slot
+ * and their current slot. Thus, no 'tombstones' are required.               */
 {
-    __quex_assert(branch);
-
-    if( branch->lesser )  QUEX_NAME(PostCategorizer__clear_recursively)(me, branch->lesser);
-    if( branch->greater ) QUEX_NAME(PostCategorizer__clear_recursively)(me, branch->greater);
-    QUEX_NAME(PostCategorizer__free_node)(branch);
+    const size_t                Mask = me->slot_n - 1;
+    size_t                      length;
+    uint32_t                    hash = QUEX_NAME(PostCategorizer__hash)(EntryName, &length);
+    QUEX_NAME(DictionarySlot)*  found = QUEX_NAME(PostCategorizer__find)(me, hash, EntryName);
+    size_t                      i, k, home;
+
+    if( ! found || ! found->name_offset ) return; /* Not found name with that name */
+
+    i = (size_t)(found - me->slot);
+    for(k = (i + 1) & Mask; me->slot[k].name_offset; k = (k + 1) & Mask) {
+        home = (size_t)me->slot[k].hash & Mask;
+        /* Move back, if 'i' lies cyclically in [home, k).                   */
+        if( ((k - home) & Mask) >= ((k - i) & Mask) ) {
+            me->slot[i] = me->slot[k];
+            i           = k;
+        }
+    }
+    me->slot[i].name_offset = 0;
+    me->entry_n            -= 1;
 }
 
-QUEX_INLINE QUEX_TYPE_TOKEN_ID 
+QUEX_INLINE QUEX_TYPE_TOKEN_ID
 QUEX_NAME(PostCategorizer__get_token_id)(const QUEX_NAME(Dictionary)*  me,
                                          const QUEX_TYPE_LEXATOM*      Lexeme)
 {
-    QUEX_NAME(DictionaryNode)* found = QUEX_NAME(PostCategorizer__find)(me, Lexeme);
-    if( ! found ) return  QUEX_SETTING_TOKEN_ID_TERMINATION;
+    size_t                      length;
+    uint32_t                    hash  = QUEX_NAME(PostCategorizer__hash)(Lexeme, &length);
+    QUEX_NAME(DictionarySlot)*  found = QUEX_NAME(PostCategorizer__find)(me, hash, Lexeme);
+
+    if( ! found || ! found->name_offset ) return QUEX_SETTING_TOKEN_ID_TERMINATION;
     return found->token_id;
 }
 
 QUEX_INLINE void
 QUEX_NAME(PostCategorizer__clear)(QUEX_NAME(Dictionary)* me)
 {
-    if( ! me->root ) return;
-    QUEX_NAME(PostCategorizer__clear_recursively)(me, me->root);
-    me->root = (QUEX_NAME(DictionaryNode)*)0;
+    if( me->slot ) {
+        QUEX_GNAME_LIB(MemoryManager_free)((void*)me->slot,
+                                           E_MemoryObjectType_POST_CATEGORIZER_NODE);
+    }
+    if( me->arena ) {
+        QUEX_GNAME_LIB(MemoryManager_free)((void*)me->arena,
+                                           E_MemoryObjectType_POST_CATEGORIZER_NODE);
+    }
+    QUEX_NAME(PostCategorizer_resources_absent_mark)(me);
 }
 
 QUEX_INLINE void
 QUEX_NAME(PostCategorizer_resources_absent_mark)(QUEX_NAME(Dictionary)* me)
-{ 
-    me->root = (QUEX_NAME(DictionaryNode)*)0;
+{
+    me->slot           = (QUEX_NAME(DictionarySlot)*)0;
+    me->slot_n         = 0;
+    me->entry_n        = 0;
+    me->arena          = (QUEX_TYPE_LEXATOM*)0;
+    me->arena_size     = 0;
+    me->arena_capacity = 0;
 }
 
 QUEX_INLINE bool
 QUEX_NAME(PostCategorizer_resources_absent)(QUEX_NAME(Dictionary)* me)
-{ 
-    return me->root == (QUEX_NAME(DictionaryNode)*)0;
+{
+    return me->slot == (QUEX_NAME(DictionarySlot)*)0 && me->arena == (QUEX_TYPE_LEXATOM*)0;
 }
 
 QUEX_INLINE void
-QUEX_NAME(PostCategorizer__print_tree)(QUEX_NAME(DictionaryNode)* node, int Depth)
+QUEX_NAME(PostCategorizer_print_this)(QUEX_NAME(Dictionary)* me)
 {
-    int i = 0;
-    if( ! node ) {
-        for(i=0; i<Depth; ++i) QUEX_DEBUG_PRINT("        ");
-        QUEX_DEBUG_PRINT("[EMPTY]\n");
-        return;
-    }
+    size_t i;
 
-    QUEX_NAME(PostCategorizer__print_tree)(node->greater, Depth + 1);
-
-    for(i=0; i < Depth + 1; ++i) QUEX_DEBUG_PRINT("        ");
-    QUEX_DEBUG_PRINT("/\n");
-
-    for(i=0; i<Depth; ++i) QUEX_DEBUG_PRINT("        ");
-    {
+    for(i = 0; i < me->slot_n; ++i) {
         uint8_t                  drain[256];
-        uint8_t*                 drain_p     = &drain[0];
-        uint8_t*                 remainder_p = (uint8_t*)0; 
-        const QUEX_TYPE_LEXATOM* source_p     = (QUEX_TYPE_LEXATOM*)&node->name_first_character;
-        const QUEX_TYPE_LEXATOM* source_end_p = &source_p[1];
+        uint8_t*                 drain_p      = &drain[0];
+        const QUEX_TYPE_LEXATOM* source_p;
+        const QUEX_TYPE_LEXATOM* source_end_p;
 
-        /* Convert the first character                                       */
-        QUEX_NAME(lexeme_nnzt_to_utf8)(&source_p, source_end_p, &drain_p, &drain[256]);
+        if( ! me->slot[i].name_offset ) continue;
 
-        *drain_p++   = '\0';
-        remainder_p  = drain_p;
-        source_p     = (QUEX_TYPE_LEXATOM*)node->name_remainder;
-        source_end_p = &source_p[QUEX_NAME(lexeme_length)((QUEX_TYPE_LEXATOM*)source_p) + 1];
-
-        /* Convert the remainder                                             */
+        source_p     = &me->arena[me->slot[i].name_offset];
+        source_end_p = &source_p[QUEX_NAME(lexeme_length)(source_p) + 1];
         QUEX_NAME(lexeme_nnzt_to_utf8)(&source_p, source_end_p, &drain_p, &drain[256]);
+        drain[255] = '\0';
 
-        QUEX_DEBUG_PRINT3("[%s]%s: %i\n", &drain[0], remainder_p, 
-                          (int)node->token_id);
+        QUEX_DEBUG_PRINT3("[%i] %s: %i\n", (int)i, &drain[0], (int)me->slot[i].token_id);
     }
-
-    for(i=0; i<Depth + 1; ++i) QUEX_DEBUG_PRINT("        ");
-    QUEX_DEBUG_PRINT("\\\n");
-
-    QUEX_NAME(PostCategorizer__print_tree)(node->lesser, Depth + 1);
-}
-
-QUEX_INLINE void
-QUEX_NAME(PostCategorizer_print_this)(QUEX_NAME(Dictionary)* me)
-{
-    QUEX_NAME(PostCategorizer__print_tree)(me->root, 0);
 }
 
 
 $$<Cpp>------------------------------------------------------------------------
-QUEX_INLINE 
+QUEX_INLINE
 QUEX_NAME(Dictionary)::QUEX_NAME(Dictionary)()
 { /* C/C++ Compability: Constructors/Destructors do nothing. */ }
 
@@ -382,7 +350,7 @@ QUEX_INLINE void
 QUEX_NAME(Dictionary)::clear()
 { QUEX_NAME(PostCategorizer__clear)(this); }
 
-QUEX_INLINE QUEX_TYPE_TOKEN_ID 
+QUEX_INLINE QUEX_TYPE_TOKEN_ID
 QUEX_NAME(Dictionary)::get_token_id(const QUEX_TYPE_LEXATOM* Lexeme) const
 { return QUEX_NAME(PostCategorizer__get_token_id)(this, Lexeme); }
 
@@ -391,10 +359,16 @@ QUEX_NAME(Dictionary)::remove(const QUEX_TYPE_LEXATOM* EntryName)
 { QUEX_NAME(PostCategorizer__remove)(this, EntryName); }
 
 QUEX_INLINE void
-QUEX_NAME(Dictionary)::enter(const QUEX_TYPE_LEXATOM*  EntryName, 
+QUEX_NAME(Dictionary)::enter(const QUEX_TYPE_LEXATOM*  EntryName,
                              const QUEX_TYPE_TOKEN_ID    TokenID)
 { QUEX_NAME(PostCategorizer__enter)(this, EntryName, TokenID); }
 
+QUEX_INLINE bool
+QUEX_NAME(Dictionary)::enter_list(const QUEX_TYPE_LEXATOM* const* EntryNameList,
+                                  const QUEX_TYPE_TOKEN_ID*       TokenIdList,
+                                  size_t                          N)
+{ return QUEX_NAME(PostCategorizer__enter_list)(this, EntryNameList, TokenIdList, N); }
+
 QUEX_INLINE void
 QUEX_NAME(Dictionary)::print_this()
 { QUEX_NAME(PostCategorizer_print_this)(this); }
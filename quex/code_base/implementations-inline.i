@@ -28,6 +28,7 @@ $$INC: analyzer/Mode.i$$
 
 $$INC: lexeme/basics.i$$
 $$INC: <count> analyzer/Counter.i$$
+$$INC: <statistics> analyzer/Statistics.i$$
 
 #endif
 
@@ -28,6 +28,7 @@ $$INC: analyzer/Mode.i$$
 
 $$INC: <lib-lexeme> lexeme/basics.i$$
 $$INC: <count>      analyzer/Counter.i$$
+$$INC: <statistics> analyzer/Statistics.i$$
 
 
 #endif
@@ -46,5 +47,11 @@ QUEX_TYPE_LEXATOM   QUEX_NAME(LexemeNull) = (QUEX_TYPE_LEXATOM)0;
 QUEX_NAMESPACE_MAIN_CLOSE
 $$-----------------------------------------------------------------------------
 
+$$<not-token-class-only && statistics>------------------------------------------
+QUEX_NAMESPACE_MAIN_OPEN
+QUEX_NAME(statistics_state)* QUEX_NAME(statistics_state_list) = (QUEX_NAME(statistics_state)*)0;
+QUEX_NAMESPACE_MAIN_CLOSE
+$$-----------------------------------------------------------------------------
+
 
 #endif /* QUEX_INCLUDE_GUARD__IMPLEMENTATIONS_I */
@@ -0,0 +1,201 @@
+/* vim: set ft=c:
+ * (C) Frank-Rene Schaefer */
+#ifndef  QUEX_INCLUDE_GUARD__QUEX__BYTE_LOADER__BYTE_LOADER_MMAP_I
+#define  QUEX_INCLUDE_GUARD__QUEX__BYTE_LOADER__BYTE_LOADER_MMAP_I
+
+$$INC: quex/MemoryManager$$
+$$INC: quex/byte_loader/ByteLoader_MMAP$$
+$$INC: quex/asserts$$
+
+#if ! defined(MAP_ANONYMOUS) && defined(MAP_ANON)
+#   define MAP_ANONYMOUS MAP_ANON
+#endif
+
+QUEX_NAMESPACE_QUEX_OPEN
+
+extern void                       QUEX_NAME_LIB(ByteLoader_MMAP_chunk_seek)(QUEX_GNAME_LIB(ByteLoader)* me,
+                                                                      QUEX_TYPE_STREAM_POSITION   Pos);
+extern void                       QUEX_NAME_LIB(ByteLoader_MMAP_destruct)(QUEX_GNAME_LIB(ByteLoader)* me);
+extern void                       QUEX_NAME_LIB(ByteLoader_MMAP_print_this)(QUEX_GNAME_LIB(ByteLoader)* me);
+extern bool                       QUEX_NAME_LIB(ByteLoader_MMAP_compare_handle)(const QUEX_GNAME_LIB(ByteLoader)* alter_ego_A,
+                                                                          const QUEX_GNAME_LIB(ByteLoader)* alter_ego_B);
+extern bool                       QUEX_NAME_LIB(ByteLoader_MMAP_map)(QUEX_GNAME_LIB(ByteLoader_MMAP)* me, int fd);
+
+$$<Cpp>------------------------------------------------------------------------
+QUEX_NAME_LIB(ByteLoader_MMAP)::QUEX_NAME_LIB(ByteLoader_MMAP)(const char* FileName)
+{
+    (void)QUEX_NAME_LIB(ByteLoader_MMAP_construct_from_file_name)(this, FileName);
+}
+$$-----------------------------------------------------------------------------
+
+QUEX_GNAME_LIB(ByteLoader)*
+QUEX_NAME_LIB(ByteLoader_MMAP_new_from_file_name)(const char* FileName)
+{
+    QUEX_GNAME_LIB(ByteLoader_MMAP)* me;
+
+    me = (QUEX_GNAME_LIB(ByteLoader_MMAP)*)QUEX_GNAME_LIB(MemoryManager_allocate)(sizeof(QUEX_GNAME_LIB(ByteLoader_MMAP)),
+                                                           E_MemoryObjectType_BYTE_LOADER);
+    if( ! me ) {
+        return (QUEX_GNAME_LIB(ByteLoader)*)0;
+    }
+    else if( ! QUEX_GNAME_LIB(ByteLoader_MMAP_construct_from_file_name)(me, FileName) ) {
+        QUEX_GNAME_LIB(ByteLoader_MMAP_destruct)(&QUEX_BASE);
+        QUEX_GNAME_LIB(MemoryManager_free)(me, E_MemoryObjectType_BYTE_LOADER);
+        return (QUEX_GNAME_LIB(ByteLoader)*)0;
+    }
+    else {
+        QUEX_BASE.ownership = E_Ownership_LEXER;
+        return &QUEX_BASE;
+    }
+}
+
+bool
+QUEX_NAME_LIB(ByteLoader_MMAP_construct_from_file_name)(QUEX_GNAME_LIB(ByteLoader_MMAP)* me,
+                                                        const char*                      FileName)
+{
+    int  fd = open(FileName, O_RDONLY);
+    bool verdict_f;
+
+    me->mapping.begin_p     = (void*)0;
+    me->mapping.size        = 0;
+    me->byte_array.begin_p  = (uint8_t*)0;
+    me->byte_array.end_p    = (uint8_t*)0;
+    me->byte_array.position = (const uint8_t*)0;
+
+    QUEX_GNAME_LIB(ByteLoader_construct)(&QUEX_BASE, true,
+                                    /* ChunkSizeInBytes */ 1,
+                                    /* ChunkPositionOfReadByteIdxZero */ 0,
+                                    QUEX_GNAME_LIB(ByteLoader_MMAP_chunk_seek),
+                                    QUEX_GNAME_LIB(ByteLoader_MMAP_chunk_load),
+                                    QUEX_GNAME_LIB(ByteLoader_MMAP_destruct),
+                                    QUEX_GNAME_LIB(ByteLoader_MMAP_print_this),
+                                    QUEX_GNAME_LIB(ByteLoader_MMAP_compare_handle));
+    if( fd == -1 ) {
+        return false;
+    }
+    /* The mapping remains valid after the file descriptor is closed.        */
+    verdict_f = QUEX_GNAME_LIB(ByteLoader_MMAP_map)(me, fd);
+    close(fd);
+    return verdict_f;
+}
+
+bool
+QUEX_NAME_LIB(ByteLoader_MMAP_map)(QUEX_GNAME_LIB(ByteLoader_MMAP)* me, int fd)
+/* Reserve anonymous memory for [page][file content][page] and map the file
+ * over the middle part. Bytes behind the file's end in its last page are
+ * zero. An empty file does not need to be mapped at all.
+ *
+ * RETURNS: true, if the file has been mapped.
+ *          false, else.                                                     */
+{
+    struct stat  file_info;
+    size_t       page_size;
+    size_t       file_size;
+    uint8_t*     begin_p;
+
+    if( fstat(fd, &file_info) == -1 || file_info.st_size < 0 ) {
+        return false;
+    }
+    page_size = (size_t)sysconf(_SC_PAGESIZE);
+    file_size = (size_t)file_info.st_size;
+
+    me->mapping.size    = page_size + (file_size + page_size - 1) / page_size * page_size
+                          + page_size;
+    me->mapping.begin_p = mmap((void*)0, me->mapping.size, PROT_READ | PROT_WRITE,
+                               MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+    if( me->mapping.begin_p == MAP_FAILED ) {
+        me->mapping.begin_p = (void*)0;
+        return false;
+    }
+
+    begin_p = &((uint8_t*)me->mapping.begin_p)[page_size];
+    if(    file_size
+        && mmap((void*)begin_p, file_size, PROT_READ | PROT_WRITE,
+                MAP_PRIVATE | MAP_FIXED, fd, 0) == MAP_FAILED ) {
+        return false;
+    }
+
+    me->byte_array.begin_p  = begin_p;
+    me->byte_array.end_p    = &begin_p[file_size];
+    me->byte_array.position = begin_p;
+    return true;
+}
+
+void
+QUEX_NAME_LIB(ByteLoader_MMAP_destruct)(QUEX_GNAME_LIB(ByteLoader)* alter_ego)
+{
+    QUEX_GNAME_LIB(ByteLoader_MMAP)* me = (QUEX_GNAME_LIB(ByteLoader_MMAP)*)(alter_ego);
+
+    if( me->mapping.begin_p ) {
+        (void)munmap(me->mapping.begin_p, me->mapping.size);
+        me->mapping.begin_p = (void*)0;
+        me->mapping.size    = 0;
+    }
+    me->byte_array.begin_p  = (uint8_t*)0;
+    me->byte_array.end_p    = (uint8_t*)0;
+    me->byte_array.position = (const uint8_t*)0;
+}
+
+void
+QUEX_NAME_LIB(ByteLoader_MMAP_chunk_seek)(QUEX_GNAME_LIB(ByteLoader)* alter_ego,
+                                          QUEX_TYPE_STREAM_POSITION   Pos)
+{
+    QUEX_GNAME_LIB(ByteLoader_MMAP)* me = (QUEX_GNAME_LIB(ByteLoader_MMAP)*)(alter_ego);
+
+    if( Pos > me->byte_array.end_p - me->byte_array.begin_p ) {
+        /* Make sure, that the 'load()' will not provide data!                */
+        me->byte_array.position = &me->byte_array.end_p[0];
+    }
+    else {
+        me->byte_array.position = &me->byte_array.begin_p[(ptrdiff_t)Pos];
+    }
+}
+
+size_t
+QUEX_NAME_LIB(ByteLoader_MMAP_chunk_load)(QUEX_GNAME_LIB(ByteLoader)* alter_ego,
+                                          void*                       buffer,
+                                          const size_t                ByteN,
+                                          bool*                       end_of_stream_f)
+{
+    QUEX_GNAME_LIB(ByteLoader_MMAP)* me = (QUEX_GNAME_LIB(ByteLoader_MMAP)*)(alter_ego);
+    const ptrdiff_t                  Remaining = me->byte_array.end_p - me->byte_array.position;
+    ptrdiff_t                        copy_n;
+
+    if( (size_t)Remaining <= ByteN ) { copy_n = Remaining; *end_of_stream_f = true; }
+    else                             { copy_n = (ptrdiff_t)ByteN; }
+
+    QUEX_GSTD(memcpy)((void*)buffer, (const void*)me->byte_array.position, (size_t)copy_n);
+    me->byte_array.position += copy_n;
+    return (size_t)copy_n;
+}
+
+bool
+QUEX_NAME_LIB(ByteLoader_MMAP_compare_handle)(const QUEX_GNAME_LIB(ByteLoader)* alter_ego_A,
+                                              const QUEX_GNAME_LIB(ByteLoader)* alter_ego_B)
+/* RETURNS: true  -- if A and B refer to the same mapping.
+ *          false -- else.                                                   */
+{
+    const QUEX_GNAME_LIB(ByteLoader_MMAP)* A = (QUEX_GNAME_LIB(ByteLoader_MMAP)*)(alter_ego_A);
+    const QUEX_GNAME_LIB(ByteLoader_MMAP)* B = (QUEX_GNAME_LIB(ByteLoader_MMAP)*)(alter_ego_B);
+
+    return A->mapping.begin_p == B->mapping.begin_p;
+}
+
+void
+QUEX_NAME_LIB(ByteLoader_MMAP_print_this)(QUEX_GNAME_LIB(ByteLoader)* alter_ego)
+{
+    QUEX_GNAME_LIB(ByteLoader_MMAP)* me = (QUEX_GNAME_LIB(ByteLoader_MMAP)*)(alter_ego);
+
+    QUEX_DEBUG_PRINT("        type:             mmap;\n");
+    QUEX_DEBUG_PRINT2("        mapping:          { begin: ((%p)) size: %i; }\n",
+                      (const void*)me->mapping.begin_p, (int)me->mapping.size);
+    QUEX_DEBUG_PRINT2("        byte_array:       { begin: ((%p)) size: %i; }\n",
+                      (const void*)me->byte_array.begin_p,
+                      (int)(me->byte_array.end_p - me->byte_array.begin_p));
+    QUEX_DEBUG_PRINT1("        input_position:   %i;\n",
+                      (int)(me->byte_array.position - me->byte_array.begin_p));
+}
+
+QUEX_NAMESPACE_QUEX_CLOSE
+
+#endif /* QUEX_INCLUDE_GUARD__QUEX__BYTE_LOADER__BYTE_LOADER_MMAP_I */
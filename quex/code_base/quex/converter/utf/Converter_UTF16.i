@@ -0,0 +1,314 @@
+/* -*- C++ -*-  vim: set syntax=cpp:
+ * (C) 2020 Frank-Rene Schaefer  */
+#ifndef  QUEX_INCLUDE_GUARD__QUEX__CONVERTER__UTF__CONVERTER_UTF16_I
+#define  QUEX_INCLUDE_GUARD__QUEX__CONVERTER__UTF__CONVERTER_UTF16_I
+
+$$INC: quex/asserts$$
+$$INC: quex/converter/utf/Converter_UTF16$$
+$$INC: quex/MemoryManager$$
+
+$$<Cpp>--------------------------------------------------------------------------
+#define BASE (*me)
+$$-----------------------------------------------------------------------------
+$$<C>--------------------------------------------------------------------------
+#define BASE me->base
+$$-----------------------------------------------------------------------------
+
+QUEX_NAMESPACE_QUEX_OPEN
+
+extern E_LoadResult 
+QUEX_NAME_LIB(Converter_UTF16_convert)(QUEX_GNAME_LIB(Converter)* me, 
+                                       uint8_t**                  source, 
+                                       const uint8_t*             SourceEnd,
+                                       void**                     drain,  
+                                       const void*                DrainEnd);
+extern const uint8_t*
+QUEX_NAME_LIB(Converter_UTF16_copy_direct)(QUEX_GNAME_LIB(Converter_UTF16)* me,
+                                           const uint8_t*                   source, 
+                                           const uint8_t*                   SourceEnd,
+                                           uint8_t**                        drain);
+extern void 
+QUEX_NAME_LIB(Converter_UTF16_destruct)(QUEX_GNAME_LIB(Converter)* me);
+
+extern ptrdiff_t 
+QUEX_NAME_LIB(Converter_UTF16_stomach_byte_n)(QUEX_GNAME_LIB(Converter)* me);
+
+extern void 
+QUEX_NAME_LIB(Converter_UTF16_stomach_clear)(QUEX_GNAME_LIB(Converter)* me);
+
+extern void 
+QUEX_NAME_LIB(Converter_UTF16_print_this)(QUEX_GNAME_LIB(Converter)* me);
+
+#define QUEX_CONVERTER_UTF16_UNIT(ME, P) \
+        ((ME)->big_endian_f ? (uint32_t)(((P)[0] << 8) | (P)[1]) \
+                            : (uint32_t)(((P)[1] << 8) | (P)[0]))
+
+$$<Cpp>------------------------------------------------------------------------
+QUEX_NAME_LIB(Converter_UTF16)::QUEX_NAME_LIB(Converter_UTF16)(size_t LexatomSize_bit, bool BigEndianF)
+{
+    QUEX_NAME_LIB(Converter_UTF16_construct)(this, LexatomSize_bit, BigEndianF);
+}
+$$-----------------------------------------------------------------------------
+
+QUEX_GNAME_LIB(Converter)*
+QUEX_NAME_LIB(Converter_UTF16_new)(size_t LexatomSize_bit, bool BigEndianF)
+{
+    QUEX_NAME_LIB(Converter_UTF16)*  me = \
+       (QUEX_NAME_LIB(Converter_UTF16)*)
+       QUEX_GNAME_LIB(MemoryManager_allocate)(sizeof(QUEX_NAME_LIB(Converter_UTF16)),
+                                              E_MemoryObjectType_CONVERTER);
+    if( ! me ) {
+        return (QUEX_GNAME_LIB(Converter)*)0;
+    }
+    else if( ! QUEX_NAME_LIB(Converter_UTF16_construct)(me, LexatomSize_bit, BigEndianF) ) {
+        QUEX_NAME_LIB(MemoryManager_free)((void*)&QUEX_BASE, E_MemoryObjectType_CONVERTER);
+        return (QUEX_GNAME_LIB(Converter)*)0;
+    }
+    return &QUEX_BASE;
+}
+
+bool
+QUEX_NAME_LIB(Converter_UTF16_construct)(QUEX_GNAME_LIB(Converter_UTF16)* me, 
+                                         size_t                           LexatomSize_bit,
+                                         bool                             BigEndianF)
+/* Sets up the masks for the word-wise test. A mask's bytes are placed in the
+ * byte order of the input. Loaded into a 'uint64_t' with 'memcpy()', they
+ * match the input's bytes independently of the machine's byte order.
+ *
+ * RETURNS: true, if success. false, if the lexatom size is not supported.   */
+{
+    uint8_t  mask_direct[8];
+    uint8_t  mask_surrogate_hi[8];
+    uint8_t  pattern_surrogate_hi[8];
+    uint8_t  ones_lo[8];
+    int      hi_i = BigEndianF ? 0 : 1;
+    int      i;
+
+    switch( LexatomSize_bit ) {
+    case 32: me->code_point_max = 0x10FFFF; break;
+    case 16: me->code_point_max = 0xFFFF;   break;
+    case 8:  me->code_point_max = 0x7F;     break;
+    default: return false;
+    }
+    me->big_endian_f = BigEndianF;
+
+    for(i = 0; i < 8; i += 2) {
+        mask_direct[i + hi_i]              = 0xFF;  /* ASCII: high byte zero, */
+        mask_direct[i + 1 - hi_i]          = 0x80;  /*        low byte < 0x80 */
+        mask_surrogate_hi[i + hi_i]        = 0xF8;
+        mask_surrogate_hi[i + 1 - hi_i]    = 0x00;
+        pattern_surrogate_hi[i + hi_i]     = 0xD8;
+        pattern_surrogate_hi[i + 1 - hi_i] = 0x00;
+        ones_lo[i + hi_i]                  = 0x00;
+        ones_lo[i + 1 - hi_i]              = 0x01;
+    }
+    QUEX_GSTD(memcpy)((void*)&me->mask_direct,          (const void*)&mask_direct[0], 8);
+    QUEX_GSTD(memcpy)((void*)&me->mask_surrogate_hi,    (const void*)&mask_surrogate_hi[0], 8);
+    QUEX_GSTD(memcpy)((void*)&me->pattern_surrogate_hi, (const void*)&pattern_surrogate_hi[0], 8);
+    QUEX_GSTD(memcpy)((void*)&me->ones_lo,              (const void*)&ones_lo[0], 8);
+
+    return QUEX_NAME_LIB(Converter_construct)((QUEX_GNAME_LIB(Converter)*)me,
+                                              LexatomSize_bit,
+                                              /* InputCodeUnitSize */ 2,
+                                              QUEX_NAME_LIB(Converter_UTF16_convert),
+                                              QUEX_NAME_LIB(Converter_UTF16_destruct),
+                                              QUEX_NAME_LIB(Converter_UTF16_stomach_byte_n),
+                                              QUEX_NAME_LIB(Converter_UTF16_stomach_clear),
+                                              QUEX_NAME_LIB(Converter_UTF16_print_this));
+}
+
+E_LoadResult 
+QUEX_NAME_LIB(Converter_UTF16_convert)(QUEX_GNAME_LIB(Converter)* alter_ego, 
+                                       uint8_t**                  source, 
+                                       const uint8_t*             SourceEnd,
+                                       void**                     drain,  
+                                       const void*                DrainEnd)
+/* Converts UTF16 from '*source' into lexatoms at '*drain'. Both pointers are
+ * set behind what has been converted. An incomplete code unit or surrogate
+ * pair at the end of the source remains unconverted.
+ *
+ * RETURNS: COMPLETE       -- drain is filled.
+ *          INCOMPLETE     -- drain is not filled, more source is required.
+ *          ENCODING_ERROR -- '*source' points to an invalid sequence.        */
+{
+    QUEX_NAME_LIB(Converter_UTF16)* me          = (QUEX_NAME_LIB(Converter_UTF16)*)alter_ego;
+    const size_t                    LexatomSize = BASE.lexatom_size_bit >> 3;
+    const int                       SizeShift   = LexatomSize == 1 ? 0 : LexatomSize == 2 ? 1 : 2;
+    const uint8_t*                  iterator    = *source;
+    uint8_t*                        out         = (uint8_t*)*drain;
+    const uint8_t*                  block_end;
+    const uint8_t*                  next;
+    ptrdiff_t                       drain_n;
+    ptrdiff_t                       byte_n;
+    uint32_t                        code_point;
+    uint32_t                        low;
+    E_LoadResult                    result;
+
+    while( 1 + 1 == 2 ) {
+        if( (const void*)out == DrainEnd ) {
+            result = E_LoadResult_COMPLETE;
+            break;
+        }
+        else if( SourceEnd - iterator < 2 ) {
+            result = E_LoadResult_INCOMPLETE;
+            break;
+        }
+
+        drain_n   = ((const uint8_t*)DrainEnd - out) >> SizeShift;
+        block_end = (SourceEnd - iterator) / 2 < drain_n ? SourceEnd : &iterator[2 * drain_n];
+        next      = QUEX_NAME_LIB(Converter_UTF16_copy_direct)(me, iterator, block_end, &out);
+        if( next != iterator ) { 
+            iterator = next; 
+            continue; 
+        }
+
+        /* Surrogate, or no ASCII for 8 bit lexatoms.                         */
+        code_point = QUEX_CONVERTER_UTF16_UNIT(me, iterator);
+        byte_n     = 2;
+        if( code_point >= 0xD800 && code_point < 0xE000 ) {
+            if( code_point >= 0xDC00 ) {
+                /* Low surrogate without high surrogate.                      */
+                result = E_LoadResult_ENCODING_ERROR;
+                break;
+            }
+            else if( SourceEnd - iterator < 4 ) {
+                result = E_LoadResult_INCOMPLETE;
+                break;
+            }
+            low = QUEX_CONVERTER_UTF16_UNIT(me, &iterator[2]);
+            if( low < 0xDC00 || low >= 0xE000 ) {
+                result = E_LoadResult_ENCODING_ERROR;
+                break;
+            }
+            code_point = 0x10000 + ((code_point - 0xD800) << 10) + (low - 0xDC00);
+            byte_n     = 4;
+        }
+        if( code_point > me->code_point_max ) {
+            result = E_LoadResult_ENCODING_ERROR;
+            break;
+        }
+
+        switch( LexatomSize ) {
+        case 1:  *((uint8_t*)out)  = (uint8_t)code_point;  break;
+        case 2:  *((uint16_t*)out) = (uint16_t)code_point; break;
+        default: *((uint32_t*)out) = code_point;           break;
+        }
+        out      += LexatomSize;
+        iterator += byte_n;
+    }
+    *source = (uint8_t*)iterator;
+    *drain  = (void*)out;
+    return result;
+}
+
+const uint8_t*
+QUEX_NAME_LIB(Converter_UTF16_copy_direct)(QUEX_GNAME_LIB(Converter_UTF16)* me,
+                                           const uint8_t*                   source, 
+                                           const uint8_t*                   SourceEnd,
+                                           uint8_t**                        drain)
+/* Copies code units into the drain until one cannot be copied directly or
+ * 'SourceEnd' is reached. For 8 bit lexatoms, only ASCII is copied directly.
+ * Else, anything but surrogates. Blocks of 8 code units are tested at once,
+ * 4 code units per word ('SWAR'). For the surrogate test, high bytes of
+ * 0xD8-0xDF are mapped to zero and low bytes are set to non-zero. Then, a 
+ * zero byte is searched. The remainder is copied unit by unit. The caller 
+ * ensures that the drain can take all lexatoms until 'SourceEnd'.
+ *
+ * RETURNS: Pointer behind the last copied byte.                             */
+{
+    const uint64_t Ones     = (uint64_t)0x0101010101010101ULL;
+    const uint64_t HighBits = (uint64_t)0x8080808080808080ULL;
+    const uint8_t* iterator = source;
+    uint64_t       w0, w1;
+    uint32_t       unit;
+    int            i;
+
+#   define QUEX_CONVERTER_UTF16_HAS_SURROGATE(ME, W)                           \
+           (   (  ((((W) & (ME)->mask_surrogate_hi) ^ (ME)->pattern_surrogate_hi) | (ME)->ones_lo) \
+                - Ones)                                                        \
+             & ~((((W) & (ME)->mask_surrogate_hi) ^ (ME)->pattern_surrogate_hi) | (ME)->ones_lo) \
+             & HighBits)
+
+    switch( BASE.lexatom_size_bit ) {
+    case 8: {
+        uint8_t* out = (uint8_t*)*drain;
+        for(; SourceEnd - iterator >= 16; iterator += 16, out += 8) {
+            QUEX_GSTD(memcpy)((void*)&w0, (const void*)&iterator[0], 8);
+            QUEX_GSTD(memcpy)((void*)&w1, (const void*)&iterator[8], 8);
+            if( (w0 | w1) & me->mask_direct ) break;
+            for(i = 0; i < 8; ++i) out[i] = (uint8_t)QUEX_CONVERTER_UTF16_UNIT(me, &iterator[2*i]);
+        }
+        for(; SourceEnd - iterator >= 2; iterator += 2, ++out) {
+            unit = QUEX_CONVERTER_UTF16_UNIT(me, iterator);
+            if( unit >= 0x80 ) break;
+            *out = (uint8_t)unit;
+        }
+        *drain = (uint8_t*)out;
+        break;
+    }
+    case 16: {
+        uint16_t* out = (uint16_t*)*drain;
+        for(; SourceEnd - iterator >= 16; iterator += 16, out += 8) {
+            QUEX_GSTD(memcpy)((void*)&w0, (const void*)&iterator[0], 8);
+            QUEX_GSTD(memcpy)((void*)&w1, (const void*)&iterator[8], 8);
+            if(    QUEX_CONVERTER_UTF16_HAS_SURROGATE(me, w0) 
+                || QUEX_CONVERTER_UTF16_HAS_SURROGATE(me, w1) ) break;
+            for(i = 0; i < 8; ++i) out[i] = (uint16_t)QUEX_CONVERTER_UTF16_UNIT(me, &iterator[2*i]);
+        }
+        for(; SourceEnd - iterator >= 2; iterator += 2, ++out) {
+            unit = QUEX_CONVERTER_UTF16_UNIT(me, iterator);
+            if( unit >= 0xD800 && unit < 0xE000 ) break;
+            *out = (uint16_t)unit;
+        }
+        *drain = (uint8_t*)out;
+        break;
+    }
+    default: {
+        uint32_t* out = (uint32_t*)*drain;
+        for(; SourceEnd - iterator >= 16; iterator += 16, out += 8) {
+            QUEX_GSTD(memcpy)((void*)&w0, (const void*)&iterator[0], 8);
+            QUEX_GSTD(memcpy)((void*)&w1, (const void*)&iterator[8], 8);
+            if(    QUEX_CONVERTER_UTF16_HAS_SURROGATE(me, w0) 
+                || QUEX_CONVERTER_UTF16_HAS_SURROGATE(me, w1) ) break;
+            for(i = 0; i < 8; ++i) out[i] = QUEX_CONVERTER_UTF16_UNIT(me, &iterator[2*i]);
+        }
+        for(; SourceEnd - iterator >= 2; iterator += 2, ++out) {
+            unit = QUEX_CONVERTER_UTF16_UNIT(me, iterator);
+            if( unit >= 0xD800 && unit < 0xE000 ) break;
+            *out = unit;
+        }
+        *drain = (uint8_t*)out;
+        break;
+    }
+    }
+#   undef QUEX_CONVERTER_UTF16_HAS_SURROGATE
+    return iterator;
+}
+
+ptrdiff_t 
+QUEX_NAME_LIB(Converter_UTF16_stomach_byte_n)(QUEX_GNAME_LIB(Converter)* me)
+{ (void)me; return 0; }
+
+void 
+QUEX_NAME_LIB(Converter_UTF16_stomach_clear)(QUEX_GNAME_LIB(Converter)* me)
+{ (void)me; }
+
+void 
+QUEX_NAME_LIB(Converter_UTF16_destruct)(QUEX_GNAME_LIB(Converter)* me)
+{ (void)me; }
+
+void 
+QUEX_NAME_LIB(Converter_UTF16_print_this)(QUEX_GNAME_LIB(Converter)* alter_ego)
+{
+    QUEX_NAME_LIB(Converter_UTF16)* me = (QUEX_NAME_LIB(Converter_UTF16)*)alter_ego;
+
+    QUEX_DEBUG_PRINT("        type:                 UTF16, native;\n");
+    QUEX_DEBUG_PRINT1("        byte_order:           %s;\n", me->big_endian_f ? "big endian" : "little endian");
+    QUEX_DEBUG_PRINT1("        code_point_max:       0x%X;\n", (int)me->code_point_max);
+}
+
+#undef QUEX_CONVERTER_UTF16_UNIT
+
+QUEX_NAMESPACE_QUEX_CLOSE
+
+#endif /*  QUEX_INCLUDE_GUARD__QUEX__CONVERTER__UTF__CONVERTER_UTF16_I */
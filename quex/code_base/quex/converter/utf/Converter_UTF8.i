@@ -0,0 +1,301 @@
+/* -*- C++ -*-  vim: set syntax=cpp:
+ * (C) 2020 Frank-Rene Schaefer  */
+#ifndef  QUEX_INCLUDE_GUARD__QUEX__CONVERTER__UTF__CONVERTER_UTF8_I
+#define  QUEX_INCLUDE_GUARD__QUEX__CONVERTER__UTF__CONVERTER_UTF8_I
+
+$$INC: quex/asserts$$
+$$INC: quex/converter/utf/Converter_UTF8$$
+$$INC: quex/MemoryManager$$
+
+$$<Cpp>--------------------------------------------------------------------------
+#define BASE (*me)
+$$-----------------------------------------------------------------------------
+$$<C>--------------------------------------------------------------------------
+#define BASE me->base
+$$-----------------------------------------------------------------------------
+
+QUEX_NAMESPACE_QUEX_OPEN
+
+extern E_LoadResult 
+QUEX_NAME_LIB(Converter_UTF8_convert)(QUEX_GNAME_LIB(Converter)* me, 
+                                      uint8_t**                  source, 
+                                      const uint8_t*             SourceEnd,
+                                      void**                     drain,  
+                                      const void*                DrainEnd);
+extern const uint8_t*
+QUEX_NAME_LIB(Converter_UTF8_copy_ascii)(const uint8_t* source, 
+                                         const uint8_t* SourceEnd,
+                                         uint8_t**      drain,
+                                         size_t         LexatomSize_bit);
+extern ptrdiff_t
+QUEX_NAME_LIB(Converter_UTF8_decode)(const uint8_t* source, 
+                                     const uint8_t* SourceEnd,
+                                     uint32_t*      code_point);
+extern void 
+QUEX_NAME_LIB(Converter_UTF8_destruct)(QUEX_GNAME_LIB(Converter)* me);
+
+extern ptrdiff_t 
+QUEX_NAME_LIB(Converter_UTF8_stomach_byte_n)(QUEX_GNAME_LIB(Converter)* me);
+
+extern void 
+QUEX_NAME_LIB(Converter_UTF8_stomach_clear)(QUEX_GNAME_LIB(Converter)* me);
+
+extern void 
+QUEX_NAME_LIB(Converter_UTF8_print_this)(QUEX_GNAME_LIB(Converter)* me);
+
+$$<Cpp>------------------------------------------------------------------------
+QUEX_NAME_LIB(Converter_UTF8)::QUEX_NAME_LIB(Converter_UTF8)(size_t LexatomSize_bit)
+{
+    QUEX_NAME_LIB(Converter_UTF8_construct)(this, LexatomSize_bit);
+}
+$$-----------------------------------------------------------------------------
+
+QUEX_GNAME_LIB(Converter)*
+QUEX_NAME_LIB(Converter_UTF8_new)(size_t LexatomSize_bit)
+{
+    QUEX_NAME_LIB(Converter_UTF8)*  me = \
+       (QUEX_NAME_LIB(Converter_UTF8)*)
+       QUEX_GNAME_LIB(MemoryManager_allocate)(sizeof(QUEX_NAME_LIB(Converter_UTF8)),
+                                              E_MemoryObjectType_CONVERTER);
+    if( ! me ) {
+        return (QUEX_GNAME_LIB(Converter)*)0;
+    }
+    else if( ! QUEX_NAME_LIB(Converter_UTF8_construct)(me, LexatomSize_bit) ) {
+        QUEX_NAME_LIB(MemoryManager_free)((void*)&QUEX_BASE, E_MemoryObjectType_CONVERTER);
+        return (QUEX_GNAME_LIB(Converter)*)0;
+    }
+    return &QUEX_BASE;
+}
+
+bool
+QUEX_NAME_LIB(Converter_UTF8_construct)(QUEX_GNAME_LIB(Converter_UTF8)* me, 
+                                        size_t                          LexatomSize_bit)
+/* RETURNS: true, if success. false, if the lexatom size is not supported.   */
+{
+    switch( LexatomSize_bit ) {
+    case 32: me->code_point_max = 0x10FFFF; break;
+    case 16: me->code_point_max = 0xFFFF;   break;
+    case 8:  me->code_point_max = 0x7F;     break;
+    default: return false;
+    }
+    return QUEX_NAME_LIB(Converter_construct)((QUEX_GNAME_LIB(Converter)*)me,
+                                              LexatomSize_bit,
+                                              /* InputCodeUnitSize */ 1,
+                                              QUEX_NAME_LIB(Converter_UTF8_convert),
+                                              QUEX_NAME_LIB(Converter_UTF8_destruct),
+                                              QUEX_NAME_LIB(Converter_UTF8_stomach_byte_n),
+                                              QUEX_NAME_LIB(Converter_UTF8_stomach_clear),
+                                              QUEX_NAME_LIB(Converter_UTF8_print_this));
+}
+
+E_LoadResult 
+QUEX_NAME_LIB(Converter_UTF8_convert)(QUEX_GNAME_LIB(Converter)* alter_ego, 
+                                      uint8_t**                  source, 
+                                      const uint8_t*             SourceEnd,
+                                      void**                     drain,  
+                                      const void*                DrainEnd)
+/* Converts UTF8 from '*source' into lexatoms at '*drain'. Both pointers are
+ * set behind what has been converted. An incomplete sequence at the end of 
+ * the source remains unconverted.
+ *
+ * RETURNS: COMPLETE       -- drain is filled.
+ *          INCOMPLETE     -- drain is not filled, more source is required.
+ *          ENCODING_ERROR -- '*source' points to an invalid sequence.        */
+{
+    QUEX_NAME_LIB(Converter_UTF8)* me          = (QUEX_NAME_LIB(Converter_UTF8)*)alter_ego;
+    const size_t                   LexatomSize = BASE.lexatom_size_bit >> 3;
+    const int                      SizeShift   = LexatomSize == 1 ? 0 : LexatomSize == 2 ? 1 : 2;
+    const uint8_t*                 iterator    = *source;
+    uint8_t*                       out         = (uint8_t*)*drain;
+    const uint8_t*                 block_end;
+    ptrdiff_t                      drain_n;
+    ptrdiff_t                      byte_n;
+    uint32_t                       code_point;
+    E_LoadResult                   result;
+
+    while( 1 + 1 == 2 ) {
+        if( (const void*)out == DrainEnd ) {
+            result = E_LoadResult_COMPLETE;
+            break;
+        }
+        else if( iterator == SourceEnd ) {
+            result = E_LoadResult_INCOMPLETE;
+            break;
+        }
+        else if( *iterator < 0x80 ) {
+            drain_n   = ((const uint8_t*)DrainEnd - out) >> SizeShift;
+            block_end = SourceEnd - iterator < drain_n ? SourceEnd : &iterator[drain_n];
+            iterator  = QUEX_NAME_LIB(Converter_UTF8_copy_ascii)(iterator, block_end, 
+                                                                 &out, BASE.lexatom_size_bit);
+            continue;
+        }
+        else if(    iterator[0] >= 0xC2 && iterator[0] < 0xE0 
+                 && SourceEnd - iterator > 1 && (iterator[1] & 0xC0) == 0x80 ) {
+            /* Two byte sequence: the most frequent after ASCII.              */
+            code_point = ((uint32_t)(iterator[0] & 0x1F) << 6) | (uint32_t)(iterator[1] & 0x3F);
+            byte_n     = 2;
+        }
+        else {
+            byte_n = QUEX_NAME_LIB(Converter_UTF8_decode)(iterator, SourceEnd, &code_point);
+        }
+
+        if( byte_n == 0 ) {
+            /* Incomplete sequence at the end of the source.                  */
+            result = E_LoadResult_INCOMPLETE;
+            break;
+        }
+        else if( byte_n < 0 || code_point > me->code_point_max ) {
+            result = E_LoadResult_ENCODING_ERROR;
+            break;
+        }
+
+        switch( LexatomSize ) {
+        case 1:  *((uint8_t*)out)  = (uint8_t)code_point;  break;
+        case 2:  *((uint16_t*)out) = (uint16_t)code_point; break;
+        default: *((uint32_t*)out) = code_point;           break;
+        }
+        out      += LexatomSize;
+        iterator += byte_n;
+    }
+    *source = (uint8_t*)iterator;
+    *drain  = (void*)out;
+    return result;
+}
+
+const uint8_t*
+QUEX_NAME_LIB(Converter_UTF8_copy_ascii)(const uint8_t* source, 
+                                         const uint8_t* SourceEnd,
+                                         uint8_t**      drain,
+                                         size_t         LexatomSize_bit)
+/* Copies ASCII bytes into the drain until a byte with the highest bit set or
+ * 'SourceEnd' is reached. Blocks of 16 bytes are tested at once, 8 bytes per
+ * word ('SWAR'). The remainder is copied byte by byte. The caller ensures 
+ * that the drain can take all lexatoms until 'SourceEnd'.
+ *
+ * RETURNS: Pointer behind the last copied byte.                             */
+{
+    const uint64_t HighBits = (uint64_t)0x8080808080808080ULL;
+    const uint8_t* iterator = source;
+    uint64_t       w0, w1;
+    int            i;
+
+    switch( LexatomSize_bit ) {
+    case 8: {
+        uint8_t* out = (uint8_t*)*drain;
+        for(; SourceEnd - iterator >= 16; iterator += 16, out += 16) {
+            QUEX_GSTD(memcpy)((void*)&w0, (const void*)&iterator[0], 8);
+            QUEX_GSTD(memcpy)((void*)&w1, (const void*)&iterator[8], 8);
+            if( (w0 | w1) & HighBits ) break;
+            QUEX_GSTD(memcpy)((void*)out, (const void*)iterator, 16);
+        }
+        for(; iterator != SourceEnd && *iterator < 0x80; ++iterator, ++out) {
+            *out = *iterator;
+        }
+        *drain = (uint8_t*)out;
+        break;
+    }
+    case 16: {
+        uint16_t* out = (uint16_t*)*drain;
+        for(; SourceEnd - iterator >= 16; iterator += 16, out += 16) {
+            QUEX_GSTD(memcpy)((void*)&w0, (const void*)&iterator[0], 8);
+            QUEX_GSTD(memcpy)((void*)&w1, (const void*)&iterator[8], 8);
+            if( (w0 | w1) & HighBits ) break;
+            for(i = 0; i < 16; ++i) out[i] = (uint16_t)iterator[i];
+        }
+        for(; iterator != SourceEnd && *iterator < 0x80; ++iterator, ++out) {
+            *out = (uint16_t)*iterator;
+        }
+        *drain = (uint8_t*)out;
+        break;
+    }
+    default: {
+        uint32_t* out = (uint32_t*)*drain;
+        for(; SourceEnd - iterator >= 16; iterator += 16, out += 16) {
+            QUEX_GSTD(memcpy)((void*)&w0, (const void*)&iterator[0], 8);
+            QUEX_GSTD(memcpy)((void*)&w1, (const void*)&iterator[8], 8);
+            if( (w0 | w1) & HighBits ) break;
+            for(i = 0; i < 16; ++i) out[i] = (uint32_t)iterator[i];
+        }
+        for(; iterator != SourceEnd && *iterator < 0x80; ++iterator, ++out) {
+            *out = (uint32_t)*iterator;
+        }
+        *drain = (uint8_t*)out;
+        break;
+    }
+    }
+    return iterator;
+}
+
+ptrdiff_t
+QUEX_NAME_LIB(Converter_UTF8_decode)(const uint8_t* source, 
+                                     const uint8_t* SourceEnd,
+                                     uint32_t*      code_point)
+/* Decodes a non-ASCII UTF8 sequence. Overlong sequences, surrogates, and code
+ * points beyond 0x10FFFF are rejected (RFC 3629).
+ *
+ * RETURNS: > 0 -- number of bytes of the sequence; '*code_point' is set.
+ *          0   -- sequence is incomplete, but valid so far.
+ *          < 0 -- invalid sequence.                                         */
+{
+    const uint8_t   B0        = source[0];
+    const ptrdiff_t Available = SourceEnd - source;
+    ptrdiff_t       byte_n;
+    uint8_t         lower     = 0x80;   /* Range of the second byte.          */
+    uint8_t         upper     = 0xBF;
+    uint32_t        value;
+    ptrdiff_t       i;
+
+    if     ( B0 < 0xC2 ) { return -1; }   /* continuation byte or overlong    */
+    else if( B0 < 0xE0 ) { byte_n = 2; value = B0 & 0x1F; }
+    else if( B0 < 0xF0 ) { 
+        byte_n = 3; value = B0 & 0x0F; 
+        if     ( B0 == 0xE0 ) lower = 0xA0;   /* overlong                     */
+        else if( B0 == 0xED ) upper = 0x9F;   /* surrogates                   */
+    }
+    else if( B0 < 0xF5 ) {
+        byte_n = 4; value = B0 & 0x07; 
+        if     ( B0 == 0xF0 ) lower = 0x90;   /* overlong                     */
+        else if( B0 == 0xF4 ) upper = 0x8F;   /* beyond 0x10FFFF              */
+    }
+    else                 { return -1; }
+
+    /* Check what is available, even if the sequence is incomplete.           */
+    if( Available > 1 ) {
+        if( source[1] < lower || source[1] > upper ) return -1;
+        for(i = 2; i < byte_n && i < Available; ++i) {
+            if( (source[i] & 0xC0) != 0x80 ) return -1;
+        }
+    }
+    if( Available < byte_n ) return 0;
+
+    for(i = 1; i < byte_n; ++i) {
+        value = (value << 6) | (uint32_t)(source[i] & 0x3F);
+    }
+    *code_point = value;
+    return byte_n;
+}
+
+ptrdiff_t 
+QUEX_NAME_LIB(Converter_UTF8_stomach_byte_n)(QUEX_GNAME_LIB(Converter)* me)
+{ (void)me; return 0; }
+
+void 
+QUEX_NAME_LIB(Converter_UTF8_stomach_clear)(QUEX_GNAME_LIB(Converter)* me)
+{ (void)me; }
+
+void 
+QUEX_NAME_LIB(Converter_UTF8_destruct)(QUEX_GNAME_LIB(Converter)* me)
+{ (void)me; }
+
+void 
+QUEX_NAME_LIB(Converter_UTF8_print_this)(QUEX_GNAME_LIB(Converter)* alter_ego)
+{
+    QUEX_NAME_LIB(Converter_UTF8)* me = (QUEX_NAME_LIB(Converter_UTF8)*)alter_ego;
+
+    QUEX_DEBUG_PRINT("        type:                 UTF8, native;\n");
+    QUEX_DEBUG_PRINT1("        code_point_max:       0x%X;\n", (int)me->code_point_max);
+}
+
+QUEX_NAMESPACE_QUEX_CLOSE
+
+#endif /*  QUEX_INCLUDE_GUARD__QUEX__CONVERTER__UTF__CONVERTER_UTF8_I */
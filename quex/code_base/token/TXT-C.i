@@ -47,6 +47,7 @@ $$COPY$$
     __quex_assert(__this->id == __That->id);
     $$<token-stamp-line>   __quex_assert(__this->line_n   == __That->line_n);$$
     $$<token-stamp-column> __quex_assert(__this->column_n == __That->column_n);$$
+    $$<count-lazy>         __quex_assert(__this->lexatom_index == __That->lexatom_index);$$
 }
 
 
@@ -0,0 +1,153 @@
+/* -*- C++ -*- vim: set syntax=cpp:
+ * PURPOSE: Columnar token sink ('--token-columns').
+ *
+ * The analyzer appends to a token column object handed to 'receive_columns()'.
+ * The caller processes the rows as a block, or flushes them into a binary file
+ * with 'TokenColumns_write()'. Then, 'TokenColumns_reset()' makes space for
+ * the next block.
+ *
+ * (C) Frank-Rene Schaefer                                                    */
+#ifndef QUEX_INCLUDE_GUARD__TOKEN__TOKEN_COLUMNS_I
+#define QUEX_INCLUDE_GUARD__TOKEN__TOKEN_COLUMNS_I
+
+$$INC: token/TokenColumns$$
+$$INC: quex/MemoryManager$$
+
+QUEX_NAMESPACE_MAIN_OPEN
+
+QUEX_INLINE bool
+QUEX_NAME(TokenColumns_construct)(QUEX_NAME(TokenColumns)* me, size_t Capacity)
+/* Allocate columns for 'Capacity' rows.
+ *
+ * RETURNS: true, for success. false, if memory could not be allocated.      */
+{
+    me->n        = 0;
+    me->capacity = Capacity;
+    me->id       = (QUEX_TYPE_TOKEN_ID*)QUEX_GNAME_LIB(MemoryManager_allocate)(
+                                     Capacity * sizeof(QUEX_TYPE_TOKEN_ID),
+                                     E_MemoryObjectType_TOKEN_COLUMNS);
+    me->offset   = (size_t*)QUEX_GNAME_LIB(MemoryManager_allocate)(
+                                     Capacity * sizeof(size_t),
+                                     E_MemoryObjectType_TOKEN_COLUMNS);
+    me->length   = (size_t*)QUEX_GNAME_LIB(MemoryManager_allocate)(
+                                     Capacity * sizeof(size_t),
+                                     E_MemoryObjectType_TOKEN_COLUMNS);
+$$<token-stamp-line>-----------------------------------------------------------
+    me->line_n   = (QUEX_TYPE_TOKEN_LINE_N*)QUEX_GNAME_LIB(MemoryManager_allocate)(
+                                     Capacity * sizeof(QUEX_TYPE_TOKEN_LINE_N),
+                                     E_MemoryObjectType_TOKEN_COLUMNS);
+$$-----------------------------------------------------------------------------
+$$<token-stamp-column>---------------------------------------------------------
+    me->column_n = (QUEX_TYPE_TOKEN_COLUMN_N*)QUEX_GNAME_LIB(MemoryManager_allocate)(
+                                     Capacity * sizeof(QUEX_TYPE_TOKEN_COLUMN_N),
+                                     E_MemoryObjectType_TOKEN_COLUMNS);
+$$-----------------------------------------------------------------------------
+$$<token-repetition>-----------------------------------------------------------
+    me->repetition_n = (size_t*)QUEX_GNAME_LIB(MemoryManager_allocate)(
+                                     Capacity * sizeof(size_t),
+                                     E_MemoryObjectType_TOKEN_COLUMNS);
+$$-----------------------------------------------------------------------------
+
+    if(    ! me->id || ! me->offset || ! me->length
+        $$<token-stamp-line>   || ! me->line_n$$
+        $$<token-stamp-column> || ! me->column_n$$
+        $$<token-repetition>   || ! me->repetition_n$$
+      ) {
+        QUEX_NAME(TokenColumns_destruct)(me);
+        return false;
+    }
+    return true;
+}
+
+QUEX_INLINE void
+QUEX_NAME(TokenColumns_destruct)(QUEX_NAME(TokenColumns)* me)
+{
+    if( me->id ) {
+        QUEX_GNAME_LIB(MemoryManager_free)((void*)me->id, E_MemoryObjectType_TOKEN_COLUMNS);
+    }
+    if( me->offset ) {
+        QUEX_GNAME_LIB(MemoryManager_free)((void*)me->offset, E_MemoryObjectType_TOKEN_COLUMNS);
+    }
+    if( me->length ) {
+        QUEX_GNAME_LIB(MemoryManager_free)((void*)me->length, E_MemoryObjectType_TOKEN_COLUMNS);
+    }
+$$<token-stamp-line>-----------------------------------------------------------
+    if( me->line_n ) {
+        QUEX_GNAME_LIB(MemoryManager_free)((void*)me->line_n, E_MemoryObjectType_TOKEN_COLUMNS);
+    }
+    me->line_n   = (QUEX_TYPE_TOKEN_LINE_N*)0;
+$$-----------------------------------------------------------------------------
+$$<token-stamp-column>---------------------------------------------------------
+    if( me->column_n ) {
+        QUEX_GNAME_LIB(MemoryManager_free)((void*)me->column_n, E_MemoryObjectType_TOKEN_COLUMNS);
+    }
+    me->column_n = (QUEX_TYPE_TOKEN_COLUMN_N*)0;
+$$-----------------------------------------------------------------------------
+$$<token-repetition>-----------------------------------------------------------
+    if( me->repetition_n ) {
+        QUEX_GNAME_LIB(MemoryManager_free)((void*)me->repetition_n, E_MemoryObjectType_TOKEN_COLUMNS);
+    }
+    me->repetition_n = (size_t*)0;
+$$-----------------------------------------------------------------------------
+    me->id       = (QUEX_TYPE_TOKEN_ID*)0;
+    me->offset   = (size_t*)0;
+    me->length   = (size_t*)0;
+    me->n        = 0;
+    me->capacity = 0;
+}
+
+QUEX_INLINE void
+QUEX_NAME(TokenColumns_reset)(QUEX_NAME(TokenColumns)* me)
+{ me->n = 0; }
+
+QUEX_INLINE bool
+QUEX_NAME(TokenColumns_is_full)(QUEX_NAME(TokenColumns)* me)
+{ return me->n >= me->capacity; }
+
+QUEX_INLINE bool
+QUEX_NAME(TokenColumns_is_terminated)(QUEX_NAME(TokenColumns)* me)
+/* RETURNS: true, if the last row is the TERMINATION token.                  */
+{ return me->n && me->id[me->n - 1] == QUEX_SETTING_TOKEN_ID_TERMINATION; }
+
+$$<std-lib && not-tiny-std-lib>------------------------------------------------
+QUEX_INLINE bool
+QUEX_NAME(TokenColumns_write)(QUEX_NAME(TokenColumns)* me, __QUEX_STD_FILE* fh)
+/* Append the rows as a block to the binary file 'fh'. A block consists of
+ * the number of rows (size_t), followed by the columns one after the other
+ * in the order of the struct's members. All in native byte order. Rows
+ * remain in place, i.e. 'TokenColumns_reset()' must be called separately.
+ *
+ * RETURNS: true, for success. false, if writing failed.                     */
+{
+    const size_t N = me->n;
+
+    if(    QUEX_GSTD(fwrite)((const void*)&me->n,     sizeof(size_t),             1, fh) != 1
+        || QUEX_GSTD(fwrite)((const void*)me->id,     sizeof(QUEX_TYPE_TOKEN_ID), N, fh) != N
+        || QUEX_GSTD(fwrite)((const void*)me->offset, sizeof(size_t),             N, fh) != N
+        || QUEX_GSTD(fwrite)((const void*)me->length, sizeof(size_t),             N, fh) != N ) {
+        return false;
+    }
+$$-----------------------------------------------------------------------------
+$$<std-lib && not-tiny-std-lib && token-stamp-line>----------------------------
+    if( QUEX_GSTD(fwrite)((const void*)me->line_n, sizeof(QUEX_TYPE_TOKEN_LINE_N), N, fh) != N ) {
+        return false;
+    }
+$$-----------------------------------------------------------------------------
+$$<std-lib && not-tiny-std-lib && token-stamp-column>--------------------------
+    if( QUEX_GSTD(fwrite)((const void*)me->column_n, sizeof(QUEX_TYPE_TOKEN_COLUMN_N), N, fh) != N ) {
+        return false;
+    }
+$$-----------------------------------------------------------------------------
+$$<std-lib && not-tiny-std-lib && token-repetition>----------------------------
+    if( QUEX_GSTD(fwrite)((const void*)me->repetition_n, sizeof(size_t), N, fh) != N ) {
+        return false;
+    }
+$$-----------------------------------------------------------------------------
+$$<std-lib && not-tiny-std-lib>------------------------------------------------
+    return true;
+}
+$$-----------------------------------------------------------------------------
+
+QUEX_NAMESPACE_MAIN_CLOSE
+
+#endif /* QUEX_INCLUDE_GUARD__TOKEN__TOKEN_COLUMNS_I */
@@ -19,6 +19,7 @@ $$INC: quex/MemoryManager$$
 /* NOTE: QUEX_TYPE_TOKEN must be defined at this place!                       */
 
 $$INC: token/TokenQueue$$
+$$INC: <token-columns> token/TokenColumns.i$$
 
 QUEX_NAMESPACE_MAIN_OPEN
 
@@ -29,6 +30,7 @@ $$-----------------------------------------------------------------------------
 
 QUEX_INLINE void             
 QUEX_NAME(TokenQueue_push_core)(QUEX_NAME(TokenQueue)* me, QUEX_TYPE_TOKEN_ID Id);
+$$<token-columns> QUEX_INLINE void QUEX_NAME(TokenQueue_push_column)(QUEX_NAME(TokenQueue)* me, QUEX_TYPE_TOKEN_ID Id);$$
 
 QUEX_INLINE bool
 QUEX_NAME(TokenQueue_construct)(QUEX_NAME(TokenQueue)* me, 
@@ -57,6 +59,7 @@ QUEX_NAME(TokenQueue_construct)(QUEX_NAME(TokenQueue)* me,
     }
     QUEX_NAME(TokenQueue_init)(me, memory, memory_end); 
     me->the_lexer = lexer;
+    $$<token-columns> me->columns = (QUEX_NAME(TokenColumns)*)0;$$
     return true;
 }
 
@@ -85,6 +88,7 @@ QUEX_NAME(TokenQueue_resources_absent_mark)(QUEX_NAME(TokenQueue)* me)
     me->read_iterator  = (QUEX_TYPE_TOKEN*)0; 
     me->write_iterator = (QUEX_TYPE_TOKEN*)0; 
     me->the_lexer      = (QUEX_TYPE_ANALYZER*)0; 
+    $$<token-columns> me->columns = (QUEX_NAME(TokenColumns)*)0;$$
 }
 
 QUEX_INLINE bool
@@ -136,7 +140,10 @@ QUEX_NAME(TokenQueue_memory_get)(QUEX_NAME(TokenQueue)* me,
 
 QUEX_INLINE bool 
 QUEX_NAME(TokenQueue_is_full)(QUEX_NAME(TokenQueue)* me) 
-{ return me->write_iterator >= me->end; }
+{ 
+    $$<token-columns> if( me->columns ) return QUEX_NAME(TokenColumns_is_full)(me->columns);$$
+    return me->write_iterator >= me->end; 
+}
 
 QUEX_INLINE bool 
 QUEX_NAME(TokenQueue_is_empty)(QUEX_NAME(TokenQueue)* me)
@@ -159,6 +166,12 @@ QUEX_INLINE void
 QUEX_NAME(TokenQueue_push_core)(QUEX_NAME(TokenQueue)* me,
                                 QUEX_TYPE_TOKEN_ID     Id)
 {
+$$<token-columns>--------------------------------------------------------------
+    if( me->columns ) {
+        QUEX_NAME(TokenQueue_push_column)(me, Id);
+        return;
+    }
+$$-----------------------------------------------------------------------------
     if( QUEX_NAME(TokenQueue_is_full)(me) ) {
         me->the_lexer->error_code = E_Error_Token_QueueOverflow;
         return;
@@ -167,11 +180,42 @@ QUEX_NAME(TokenQueue_push_core)(QUEX_NAME(TokenQueue)* me,
 
     $$<token-stamp-line>   me->write_iterator->line_n   = me->the_lexer->counter._line_number_at_begin;$$
     $$<token-stamp-column> me->write_iterator->column_n = me->the_lexer->counter._column_number_at_begin;$$
+    $$<count-lazy>         me->write_iterator->lexatom_index = (size_t)(  me->the_lexer->buffer.input.lexatom_index_begin 
+                                                                        + (me->the_lexer->buffer._lexeme_start_p - me->the_lexer->buffer.content_begin(&me->the_lexer->buffer)));$$
 
     me->write_iterator->id = Id;              
     ++(me->write_iterator);       
 }
 
+$$<token-columns>--------------------------------------------------------------
+QUEX_INLINE void             
+QUEX_NAME(TokenQueue_push_column)(QUEX_NAME(TokenQueue)* me,
+                                  QUEX_TYPE_TOKEN_ID     Id)
+/* Append a row to the token columns instead of a token to the queue. Offset
+ * and length are those of the current lexeme--regardless of the text that
+ * may have been passed along with the token. No text is copied.             */
+{
+    QUEX_NAME(TokenColumns)* columns = me->columns;
+    QUEX_NAME(Buffer)*       buffer  = &me->the_lexer->buffer;
+    const size_t             Row     = columns->n;
+
+    if( QUEX_NAME(TokenColumns_is_full)(columns) ) {
+        me->the_lexer->error_code = E_Error_Token_QueueOverflow;
+        return;
+    }
+    columns->id[Row]     = Id;
+    columns->offset[Row] = (size_t)(  buffer->input.lexatom_index_begin 
+                                    + (buffer->_lexeme_start_p - buffer->content_begin(buffer)));
+    columns->length[Row] = (size_t)(buffer->_read_p - buffer->_lexeme_start_p);
+$$-----------------------------------------------------------------------------
+$$<token-columns && token-stamp-line>   columns->line_n[Row]   = me->the_lexer->counter._line_number_at_begin;$$
+$$<token-columns && token-stamp-column> columns->column_n[Row] = me->the_lexer->counter._column_number_at_begin;$$
+$$<token-columns && token-repetition>   columns->repetition_n[Row] = 1;$$
+$$<token-columns>--------------------------------------------------------------
+    columns->n = Row + 1;
+}
+$$-----------------------------------------------------------------------------
+
 $$<token-take-text>------------------------------------------------------------
 QUEX_INLINE void             
 QUEX_NAME(TokenQueue_push_text)(QUEX_NAME(TokenQueue)* me,
@@ -181,6 +225,14 @@ QUEX_NAME(TokenQueue_push_text)(QUEX_NAME(TokenQueue)* me,
 /* Push a token and set its 'text' member.                                    */
 {
     QUEX_NAME(TokenQueue_assert_before_sending)(me);
+$$-----------------------------------------------------------------------------
+$$<token-take-text && token-columns>-------------------------------------------
+    if( me->columns ) {
+        QUEX_NAME(TokenQueue_push)(me, Id);   /* Token columns carry no text. */
+        return;
+    }
+$$-----------------------------------------------------------------------------
+$$<token-take-text>------------------------------------------------------------
     QUEX_GNAME_TOKEN(take_text)(me->write_iterator, BeginP, EndP);
     QUEX_NAME(TokenQueue_push)(me, Id);
 }
@@ -213,6 +265,17 @@ QUEX_NAME(TokenQueue_push_repeated)(QUEX_NAME(TokenQueue)* me,
     __quex_assert(RepetitionN != 0);        
     __quex_assert(QUEX_TOKEN_ID_IS_REPEATABLE(Id));
 
+$$-----------------------------------------------------------------------------
+$$<token-repetition && token-columns>------------------------------------------
+    if( me->columns ) {
+        QUEX_NAME(TokenQueue_push_column)(me, Id);
+        if( me->the_lexer->error_code == E_Error_None ) {
+            me->columns->repetition_n[me->columns->n - 1] = RepetitionN;
+        }
+        return;
+    }
+$$-----------------------------------------------------------------------------
+$$<token-repetition>-----------------------------------------------------------
     me->write_iterator->QUEX_TOKEN_MEMBER_REPETITION_N = RepetitionN;
     QUEX_NAME(TokenQueue_push_core)(me, Id);
 }
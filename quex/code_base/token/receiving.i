@@ -63,6 +63,105 @@ QUEX_NAME(MF_receive)(QUEX_TYPE_ANALYZER* me, QUEX_TYPE_TOKEN** result_pp)
     *result_pp = QUEX_NAME(TokenQueue_pop)(&me->_token_queue);
 }
 
+QUEX_INLINE size_t
+QUEX_NAME(MF_receive_n)(QUEX_TYPE_ANALYZER* me, 
+                        QUEX_TYPE_TOKEN*    token_array, 
+                        size_t              N)
+/* Receive up to 'N' tokens into 'token_array' at once. The array temporarily
+ * replaces the token queue's memory. So, the analyzer writes the tokens 
+ * directly into it and does not return before it is full, or the stream
+ * ended. The token objects in 'token_array' must have been constructed. They
+ * remain owned by the caller. As with the token queue's size, 'N' must be
+ * large enough for the tokens that a single pattern match may send.
+ *
+ * A repeated token occupies one element carrying its repetition number. On
+ * error, the tokens found before are kept. The TERMINATION token follows
+ * with the next call.
+ *
+ * RETURNS: Number of tokens received. The stream ended, if the last one is
+ *          the TERMINATION token.                                            */
+{
+    QUEX_NAME(TokenQueue)* queue       = &me->_token_queue;
+    QUEX_TYPE_TOKEN* const QueueBegin  = queue->begin;
+    QUEX_TYPE_TOKEN* const QueueEnd    = queue->end;
+    QUEX_TYPE_TOKEN*       token_p;
+    QUEX_TYPE_TOKEN*       last_p;
+    size_t                 n           = 0;
+
+    /* Tokens remaining from previous 'receive()' calls come first.           */
+    while( n != N ) {
+        token_p = QUEX_NAME(remaining_token_pop)(me);
+        if( ! token_p ) break;
+        QUEX_GNAME_TOKEN(copy)(&token_array[n], token_p);
+        ++n;
+        if( token_p->id == QUEX_SETTING_TOKEN_ID_TERMINATION ) return n;
+    }
+    if( n == N ) return n;
+
+    /* Let the analyzer fill the remainder of 'token_array'.                  */
+    QUEX_NAME(TokenQueue_init)(queue, &token_array[n], &token_array[N]);
+    do {
+        me->current_analyzer_function(me);
+
+        QUEX_NAME(TokenQueue_assert_after_sending)(queue);
+
+        if( me->error_code != E_Error_None ) break;
+        last_p = QUEX_NAME(TokenQueue_last_token)(queue);
+
+    } while(    ! QUEX_NAME(TokenQueue_is_full)(queue) 
+             && ( ! last_p || last_p->id != QUEX_SETTING_TOKEN_ID_TERMINATION) );
+
+    n += (size_t)(queue->write_iterator - queue->begin);
+
+    QUEX_NAME(TokenQueue_init)(queue, QueueBegin, QueueEnd);
+    return n;
+}
+
+$$<token-columns>--------------------------------------------------------------
+QUEX_INLINE size_t
+QUEX_NAME(MF_receive_columns)(QUEX_TYPE_ANALYZER*      me,
+                              QUEX_NAME(TokenColumns)* columns)
+/* Append tokens as rows to 'columns' until it is full, or the stream ended.
+ * Only id, lexeme position and length, and the line and column stamps are
+ * stored--no token objects are filled and no text is copied. The caller
+ * hands 'columns' over as a block, or writes it with 'TokenColumns_write()',
+ * and resets it before the next call.
+ *
+ * Tokens remaining in the token queue from 'receive()' calls cannot be
+ * turned into rows. So, the two may only be mixed if the queue is empty.
+ *
+ * On error, a TERMINATION row is appended, unless the last row is already
+ * TERMINATION. If 'columns' is full, it replaces the last row of this call.
+ *
+ * RETURNS: Number of rows appended. The stream ended, if the last row is the
+ *          TERMINATION token.                                                */
+{
+    const size_t RowN = columns->n;
+
+    __quex_assert(QUEX_NAME(TokenQueue_is_empty)(&me->_token_queue));
+
+    me->_token_queue.columns = columns;
+    while(    ! QUEX_NAME(TokenColumns_is_full)(columns)
+           && ! QUEX_NAME(TokenColumns_is_terminated)(columns) ) {
+        me->current_analyzer_function(me);
+
+        if( me->error_code != E_Error_None ) {
+            if( ! QUEX_NAME(TokenColumns_is_terminated)(columns) ) {
+                /* As 'receive()' drops queued tokens, the last row gives way
+                 * to TERMINATION if there is no space left.                  */
+                if( QUEX_NAME(TokenColumns_is_full)(columns) ) --(columns->n);
+                QUEX_NAME(TokenQueue_push_column)(&me->_token_queue, 
+                                                  QUEX_SETTING_TOKEN_ID_TERMINATION);
+            }
+            break;
+        }
+    }
+    me->_token_queue.columns = (QUEX_NAME(TokenColumns)*)0;
+
+    return columns->n - RowN;
+}
+$$-----------------------------------------------------------------------------
+
 QUEX_INLINE QUEX_TYPE_TOKEN*
 QUEX_NAME(receive_from_chunk)(QUEX_TYPE_ANALYZER*    me, 
                               bool                   EndOfChunkF, 
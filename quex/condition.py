@@ -29,12 +29,16 @@ def do(Condition):
         return bool(Setup.count_line_number_f)
     elif Condition == "count-column":
         return bool(Setup.count_column_number_f) or bool(required_support_indentation_count())
+    elif Condition == "count-lazy":
+        return Setup.count_lazy_f
     elif Condition == "token-stamp-line":
         return token_db.support_token_stamp_line_n()
     elif Condition == "token-stamp-column":
         return token_db.support_token_stamp_column_n()
     elif Condition == "token-take-text":
         return token_db.support_take_text()
+    elif Condition == "token-columns":
+        return Setup.token_columns_f
     elif Condition == "token-repetition":
         return token_db.support_repetition()
     elif Condition == "token-class-only":
@@ -73,6 +77,8 @@ def do(Condition):
         return Setup.computed_gotos_f
     elif Condition == "memory-management-extern":
         return Setup.memory_management_extern_f
+    elif Condition == "statistics":
+        return Setup.profile_generate_f
     elif Condition == "unit-test":
         return Setup.unit_test_f
     else:                                                                      
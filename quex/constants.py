@@ -165,6 +165,7 @@ class E_Op (QuexEnum):
     IndentationBadHandlerCall = auto()
     Decrement = auto()
     InputPDereference = auto()
+    InputPSkipCharacterSet = auto()
     Increment = auto()
     LexemeResetTerminatingZero = auto()
     LineCountAdd = auto()
@@ -8,11 +8,13 @@ from   quex.input.code.core                      import CodeUser
 #                                                
 from   quex.engine.misc.tools                    import flatten
 import quex.engine.misc.error                    as     error
+import quex.engine.misc.phase_stats              as     phase_stats
 from   quex.engine.misc.file_operations          import write_safely_and_close
 from   quex.input.files.specifier.mode_db        import ModeDb_Builder
 #
 import quex.input.files.consistency_check        as     consistency_check
 import quex.output.core.engine                   as     engine_generator
+from   quex.output.core.manifest                 import Manifest
 import quex.output.analyzer.core                 as     analyzer_class
 import quex.output.analyzer.adapt                as     adapt
 import quex.output.analyzer.configuration        as     configuration 
@@ -36,6 +38,9 @@ def do():
        a separate state machine that is stuck into a virtual function
        of a class derived from class 'quex_mode'.
     """
+    if Setup.stats_phases_f:
+        phase_stats.enable()
+
     if Setup.language == "DOT": 
         return do_plot()
     elif Setup.converter_only_f:
@@ -57,6 +62,9 @@ def do():
         _generate(mode_db)
         _show_name_spaces()
 
+    if Setup.stats_phases_f:
+        phase_stats.report(Setup.output_phase_stats_file)
+
 def _parse_modes_and_build(InputFileList):
     mode_parsed_db, \
     user_defined_initial_mode = quex_file_parser.do(InputFileList)
@@ -209,10 +217,16 @@ def _get_analyzers(mode_db):
 def _analyzer_functions_get(ModeDB):
     mode_name_list = list(ModeDB.keys())  
 
-    code = flatten( 
-        engine_generator.do_with_counter(mode, mode_name_list) for mode in ModeDB.values() 
+    if Setup.incremental_f: manifest = Manifest(Setup.output_manifest_file)
+    else:                   manifest = None
+
+    code = flatten(
+        engine_generator.do_mode_list(list(ModeDB.values()), mode_name_list, 
+                                      Setup.job_n, manifest)
     )
 
+    if manifest is not None: manifest.write()
+
     code.append(
         engine_generator.comment_match_behavior(iter(ModeDB.values()))
     )
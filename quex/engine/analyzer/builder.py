@@ -11,6 +11,7 @@ _______________________________________________________________________________
 """
 from   quex.engine.analyzer.door_id_address_label   import DialDB
 import quex.engine.analyzer.trace_analysis.core                    as trace_analysis
+import quex.engine.analyzer.examine.dataflow                       as dataflow_analysis
 import quex.engine.analyzer.trace_analysis.position_register_map   as position_register_map
 from   quex.engine.analyzer.core                    import FSM
 from   quex.engine.analyzer.state.core              import ReloadState
@@ -26,6 +27,7 @@ import quex.engine.state_machine.construction.combination as     combination
 from   quex.engine.state_machine.core               import DFA
 import quex.engine.state_machine.algebra.reverse    as     reverse
 import quex.engine.misc.error                       as     error
+import quex.engine.misc.phase_stats                 as     phase_stats
 
 from   quex.engine.misc.tools                       import typed
 import quex.output.transform_to_encoding            as     transform_to_encoding
@@ -81,6 +83,12 @@ class FSM_Builder:
            OnAfterReload=None, OnReloadFailureDoorId=None):
         """ReloadStateExtern is only to be specified if the analyzer needs
         to be embedded in another one.
+
+        TraceAnalysisF: False      -- no analysis; acceptance and input positions
+                                      are stored and restored in any case.
+                        True       -- analysis as chosen by '--trace-analysis'.
+                        "paths"    -- walk along the paths through the DFA.
+                        "dataflow" -- fixed point of per-state summaries.
         """
         builder = cls(SM, EngineType, dial_db) \
            .analyse_and_prepare_state_entries_and_drop_outs(SM, EngineType, OnBeforeEntry, TraceAnalysisF) 
@@ -114,7 +122,8 @@ class FSM_Builder:
             self.__prepare_entries_and_drop_out_without_position_recovery(EngineType, SM,
                                                  operation_list_on_drop_out.do_backward_pre_context)
         elif TraceAnalysisF:
-            state_info_db = trace_analysis.do(SM, result._to_db)
+            with phase_stats.phase("trace analysis"):
+                state_info_db = _trace_analysis(TraceAnalysisF).do(SM, result._to_db)
             self.__prepare_entries_and_drop_out(EngineType, state_info_db)
             # (*) Position Register Map (Used in 'optimizer.py')
             if EngineType.requires_position_register_map():
@@ -394,7 +403,8 @@ class FSM_Builder:
 
     def find_and_construct_mega_states(self):
         result = self.__r
-        mega_state_analyzer.do(result)
+        with phase_stats.phase("mega-state analysis"):
+            mega_state_analyzer.do(result)
         # Prepare Reload:
         # (Null-operation, in case no reload required.)
         # TransitionMap:                  On BufferLimitCode --> ReloadState
@@ -404,6 +414,16 @@ class FSM_Builder:
 
         return self
 
+def _trace_analysis(TraceAnalysisF):
+    """RETURNS: Module that implements the trace analysis selected by 
+                'TraceAnalysisF'. Both deliver the same 'TA_StateInfoDb'.
+    """
+    if TraceAnalysisF is True: analysis_type = Setup.trace_analysis_type
+    else:                      analysis_type = TraceAnalysisF
+
+    if analysis_type == "dataflow": return dataflow_analysis
+    else:                           return trace_analysis
+
 def _prepare(SmOrSmList, StateMachineId, ReverseF, AlllowInitStateAcceptF, CutF):
     def _reverse(sm):
         backup_id = sm.get_id()
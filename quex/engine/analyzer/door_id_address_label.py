@@ -182,6 +182,20 @@ class DialDB(object):
     def new_address(self):
         return int(next(self.__address_i))
 
+    @staticmethod
+    def address_counter_snapshot():
+        """RETURNS: The address which is generated next (without consuming it).
+        """
+        address = int(next(DialDB.__address_i))
+        DialDB.address_counter_restore(address)
+        return address
+
+    @staticmethod
+    def address_counter_restore(Address):
+        """Lets the address generation continue at 'Address'.
+        """
+        DialDB.__address_i = itertools.count(start=Address)
+
     def max_door_sub_index(self, StateIndex):
         """RETURN: The greatest door sub index for a given StateIndex. 
                    '-1' if not index has been used yet.
@@ -0,0 +1,362 @@
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+"""
+________________________________________________________________________________
+Dataflow Acceptance Analysis
+
+Determines the same acceptance and position storage decisions as the trace
+analysis ('trace_analysis/core.py'), without walking along the paths through
+the state machine. Instead, every state receives a summary of all paths that
+guide to it. The summaries are the fixed point of
+
+           V(s) = T(s, join(V(p) for all predecessors 'p' of 's'))
+
+where 'T(s, X)' applies the acceptance and position storage operations of 's'
+to the summary 'X'. The summary of a state contains:
+
+    .sequence_set: set of acceptance sequences, i.e. tuples of acceptance
+                   ids in the order of precedence. If there is only one, the
+                   acceptance at drop-out is uniform.
+
+    .accept_db:    acceptance id --> (accepting state index set,
+                                      positioning state index set,
+                                      transition number since positioning)
+
+    .storage_db:   acceptance id --> (positioning state index set,
+                                      transition number since positioning)
+
+The join of two transition numbers is the number, if both are the same, and
+'E_TransitionN.VOID' else. When a loop is passed, the number differs from the
+number before. Thus, it becomes 'VOID' as in the trace analysis, where a loop
+on the path since positioning voids the number.
+
+The operations of a state apply to all paths through it in the same way. So,
+'T(s, X)' distributes over the join and the fixed point equals the join over
+the results of all paths.
+
+States are considered by strongly connected components (SCC) in topological
+order. A state outside a loop is computed once. The states of an SCC are
+iterated until nothing changes. Since sets only grow and a transition number
+changes at most twice, the number of iterations is bounded.
+________________________________________________________________________________
+(C) 2020 Frank-Rene Schaefer
+ABSOLUTELY NO WARRANTY
+________________________________________________________________________________
+"""
+from   quex.engine.operations.se_operations        import SeAccept, \
+                                                          SeStoreInputPosition
+from   quex.engine.analyzer.trace_analysis.core    import TA_StateInfo, \
+                                                          TA_StateInfoDb, \
+                                                          T_RestorePosition
+from   quex.constants                              import E_IncidenceIDs, \
+                                                          E_TransitionN
+
+from   collections import defaultdict
+
+def do(SM, ToDb):
+    """Analyze the state machine graph of 'SM'.
+
+    RETURNS: TA_StateInfoDb -- as 'trace_analysis.core.do()'.
+    """
+    from_db  = SM.get_from_db()
+    op_db    = dict((si, _StateOp(state)) for si, state in SM.states.items())
+    scc_list = _get_scc_list(SM, ToDb)
+
+    summary_db = {}
+    for scc in reversed(scc_list):
+        _fix_point(scc, SM.init_state_index, op_db, from_db, ToDb, summary_db)
+
+    return _get_state_info_db(SM, ToDb, op_db, scc_list, summary_db)
+
+class _StateOp(object):
+    """Acceptance and position storage operations of a state.
+
+    .kill_f:        True, if an unconditional acceptance deletes all previous
+                    acceptances (philosophy of longest match).
+    .accept_list:   list of (acceptance id, restore position flag) of the
+                    acceptances that remain after the state's own operations,
+                    in order of precedence.
+    .prefix:        acceptance ids of '.accept_list'.
+    .store_id_list: acceptance ids for which the input position is stored.
+    """
+    __slots__ = ("kill_f", "accept_list", "prefix", "store_id_list")
+    def __init__(self, State):
+        self.kill_f      = False
+        self.accept_list = []
+        for cmd in sorted(State.single_entry.get_iterable(SeAccept),
+                          key=lambda x: x.acceptance_id(), reverse=True):
+            if not cmd.acceptance_condition_set():
+                self.kill_f = True
+                del self.accept_list[:]
+            self.accept_list.insert(0, (cmd.acceptance_id(),
+                                        cmd.restore_position_register_f()))
+
+        self.prefix        = tuple(acceptance_id for acceptance_id, dummy in self.accept_list)
+        self.store_id_list = [
+            cmd.acceptance_id()
+            for cmd in State.single_entry.get_iterable(SeStoreInputPosition)
+        ]
+
+class _Summary(object):
+    """Summary of all paths from the init state to a state.
+    """
+    __slots__ = ("sequence_set", "accept_db", "storage_db")
+    def __init__(self, SequenceSet, AcceptDb, StorageDb):
+        self.sequence_set = SequenceSet
+        self.accept_db    = AcceptDb
+        self.storage_db   = StorageDb
+
+    @classmethod
+    def before_entry(cls, InitStateIndex):
+        """Summary before the init state is entered: 'failure' is accepted. The
+        input position is set to 'lexeme start + 1'.
+        """
+        init_set = frozenset([InitStateIndex])
+        return cls(set([(E_IncidenceIDs.MATCH_FAILURE,)]),
+                   { E_IncidenceIDs.MATCH_FAILURE: (init_set, init_set,
+                                                    E_TransitionN.LEXEME_START_PLUS_ONE) },
+                   {})
+
+    def join(self, Other):
+        self.sequence_set.update(Other.sequence_set)
+
+        for acceptance_id, other in Other.accept_db.items():
+            mine = self.accept_db.get(acceptance_id)
+            if mine is None:
+                self.accept_db[acceptance_id] = other
+            else:
+                self.accept_db[acceptance_id] = (mine[0] | other[0], mine[1] | other[1],
+                                                 _join_transition_n(mine[2], other[2]))
+
+        for acceptance_id, other in Other.storage_db.items():
+            mine = self.storage_db.get(acceptance_id)
+            if mine is None:
+                self.storage_db[acceptance_id] = other
+            else:
+                self.storage_db[acceptance_id] = (mine[0] | other[0],
+                                                  _join_transition_n(mine[1], other[1]))
+
+    def transfer(self, StateIndex, Op):
+        """RETURNS: Summary after the state 'StateIndex' with operations 'Op'
+                    has been entered.
+        """
+        if Op.kill_f:
+            sequence_set = set([ Op.prefix ])
+            previous_db  = {}
+        else:
+            sequence_set = set(
+                Op.prefix + tuple(x for x in sequence if x not in Op.prefix)
+                for sequence in self.sequence_set
+            )
+            previous_db  = self.accept_db
+
+        storage_db = dict(
+            (acceptance_id, (positioning_set, _increment(transition_n)))
+            for acceptance_id, (positioning_set, transition_n) in self.storage_db.items()
+        )
+
+        # Acceptances of the state come first--they have the highest precedence.
+        this_set  = frozenset([StateIndex])
+        accept_db = {}
+        for acceptance_id, restore_position_f in Op.accept_list:
+            if restore_position_f:
+                positioning_set, transition_n = storage_db[acceptance_id]
+            else:
+                positioning_set, transition_n = this_set, 0
+            accept_db[acceptance_id] = (this_set, positioning_set, transition_n)
+
+        accept_db.update(
+            (acceptance_id, (accepting_set, positioning_set, _increment(transition_n)))
+            for acceptance_id, (accepting_set, positioning_set, transition_n) in previous_db.items()
+            if acceptance_id not in accept_db
+        )
+
+        for acceptance_id in Op.store_id_list:
+            storage_db[acceptance_id] = (this_set, 0)
+
+        return _Summary(sequence_set, accept_db, storage_db)
+
+    def __eq__(self, Other):
+        if Other is None: return False
+        return     self.sequence_set == Other.sequence_set \
+               and self.accept_db    == Other.accept_db    \
+               and self.storage_db   == Other.storage_db
+
+    def __ne__(self, Other):
+        return not self.__eq__(Other)
+
+def _increment(TransitionN):
+    if isinstance(TransitionN, int): return TransitionN + 1
+    else:                            return TransitionN
+
+def _join_transition_n(A, B):
+    if A == B: return A
+    else:      return E_TransitionN.VOID
+
+def _fix_point(SCC, InitStateIndex, OpDb, FromDb, ToDb, summary_db):
+    """Computes the summaries of the states in the strongly connected component
+    'SCC'. The summaries of all predecessors outside 'SCC' are available.
+
+    ADAPTS: summary_db
+    """
+    scc_set  = set(SCC)
+    worklist = list(SCC)
+    todo_set = set(SCC)
+    while worklist:
+        si = worklist.pop()
+        todo_set.remove(si)
+
+        entry = None
+        if si == InitStateIndex:
+            entry = _Summary.before_entry(InitStateIndex)
+        for from_si in sorted(FromDb[si]):
+            summary = summary_db.get(from_si)
+            if summary is None:  continue
+            elif entry is None:  entry = _Summary(set(summary.sequence_set),
+                                                  dict(summary.accept_db),
+                                                  dict(summary.storage_db))
+            else:                entry.join(summary)
+
+        if entry is None: continue  # No predecessor has been determined, yet.
+
+        new_summary = entry.transfer(si, OpDb[si])
+        if new_summary == summary_db.get(si): continue
+        summary_db[si] = new_summary
+
+        for target_si in ToDb[si]:
+            if target_si not in scc_set or target_si in todo_set: continue
+            worklist.append(target_si)
+            todo_set.add(target_si)
+
+def _get_scc_list(SM, ToDb):
+    """Tarjan's algorithm with an explicit stack.
+
+    RETURNS: list of strongly connected components (lists of state indices) in
+             reverse topological order. That is, a component appears after
+             all components that it reaches.
+    """
+    index_db   = {}
+    lowlink_db = {}
+    stack      = []
+    on_stack   = set()
+    result     = []
+    for root in SM.states.keys():
+        if root in index_db: continue
+        work = [ (root, iter(sorted(ToDb[root]))) ]
+        index_db[root] = lowlink_db[root] = len(index_db)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            si, target_iterable = work[-1]
+            for target_si in target_iterable:
+                if target_si not in index_db:
+                    index_db[target_si] = lowlink_db[target_si] = len(index_db)
+                    stack.append(target_si)
+                    on_stack.add(target_si)
+                    work.append((target_si, iter(sorted(ToDb[target_si]))))
+                    break
+                elif target_si in on_stack:
+                    lowlink_db[si] = min(lowlink_db[si], index_db[target_si])
+            else:
+                work.pop()
+                if work:
+                    parent_si = work[-1][0]
+                    lowlink_db[parent_si] = min(lowlink_db[parent_si], lowlink_db[si])
+                if lowlink_db[si] != index_db[si]: continue
+                scc = []
+                while 1 + 1 == 2:
+                    member_si = stack.pop()
+                    on_stack.remove(member_si)
+                    scc.append(member_si)
+                    if member_si == si: break
+                result.append(scc)
+    return result
+
+def _get_reach_db(SM, ToDb, SCC_List):
+    """RETURNS: map: state index --> bit mask of the states that can be reached
+                                     from it (including itself).
+
+    Bit 'i' stands for the 'i'-th state in 'SM.states'. The states of an SCC
+    share the same mask.
+    """
+    bit_db  = dict((si, 1 << i) for i, si in enumerate(SM.states.keys()))
+    reach_db = {}
+    for scc in SCC_List:
+        mask = 0
+        for si in scc:
+            mask |= bit_db[si]
+            for target_si in ToDb[si]:
+                mask |= reach_db.get(target_si, 0)
+        for si in scc:
+            reach_db[si] = mask
+    return bit_db, reach_db
+
+def _get_state_info_db(SM, ToDb, OpDb, SCC_List, SummaryDb):
+    """Derives the storing and restoring of acceptance and input positions from
+    the summaries of all states.
+
+    RETURNS: TA_StateInfoDb
+    """
+    bit_db, reach_db = _get_reach_db(SM, ToDb, SCC_List)
+
+    # Position storage: A position that is restored from a register must be
+    # stored upon the transitions from the positioning state to the states
+    # that lie on a path to the restoring state.
+    store_position_db = defaultdict(dict)
+    for si, summary in sorted(SummaryDb.items()):
+        si_bit = bit_db[si]
+        for acceptance_id, (accepting_set, positioning_set, transition_n) in summary.accept_db.items():
+            if transition_n != E_TransitionN.VOID: continue
+            for positioning_si in positioning_set:
+                sub_db = store_position_db[positioning_si]
+                if acceptance_id not in sub_db: sub_db[acceptance_id] = set()
+                sub_db[acceptance_id].update(
+                    target_si for target_si in ToDb[positioning_si]
+                    if target_si != positioning_si and reach_db[target_si] & si_bit
+                )
+
+    # Acceptance storage: If the acceptance is not uniform, it is restored.
+    # All states where one of the acceptances occurred must store it.
+    acceptance_storing_si_set = set()
+    for summary in SummaryDb.values():
+        if len(summary.sequence_set) == 1: continue
+        for accepting_set, positioning_set, transition_n in summary.accept_db.values():
+            acceptance_storing_si_set.update(accepting_set)
+
+    def _state_info(si, summary):
+        if si in acceptance_storing_si_set:
+            store_acceptance_sequence = list(OpDb[si].prefix)
+            if si == SM.init_state_index and not OpDb[si].kill_f:
+                store_acceptance_sequence.append(E_IncidenceIDs.MATCH_FAILURE)
+            store_acceptance_sequence = tuple(sorted(store_acceptance_sequence))
+        else:
+            store_acceptance_sequence = ()
+
+        if len(summary.sequence_set) == 1:
+            restore_acceptance_sequence = next(iter(summary.sequence_set))
+        else:
+            restore_acceptance_sequence = None
+
+        restore_position_db = dict(
+            (acceptance_id, T_RestorePosition(set(positioning_set), transition_n))
+            for acceptance_id, (accepting_set, positioning_set, transition_n) in summary.accept_db.items()
+        )
+
+        return TA_StateInfo(store_acceptance_sequence, store_position_db[si],
+                            restore_acceptance_sequence, restore_position_db)
+
+    return TA_StateInfoDb(((si, _state_info(si, SummaryDb[si])) for si in SM.states.keys()),
+                          _get_acceptance_condition_db(SM))
+
+def _get_acceptance_condition_db(SM):
+    """RETURNS: map: acceptance id --> acceptance condition set
+    """
+    failure = SeAccept(E_IncidenceIDs.MATCH_FAILURE)
+    result  = { failure.acceptance_id(): failure.acceptance_condition_set() }
+    result.update(
+        (cmd.acceptance_id(), cmd.acceptance_condition_set())
+        for state in SM.states.values()
+        for cmd in state.single_entry.get_iterable(SeAccept)
+    )
+    return result
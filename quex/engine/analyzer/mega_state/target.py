@@ -76,10 +76,15 @@ class TargetByStateKey(object):
                 same combination.
             (2) Lets determine the number of different schemes in the 
                 transition map, later.
+
+        Inside a transition map, equal schemes are the identical object (see
+        'TransitionMap.relate_to_TargetByStateKeys()'). Thus, the identities
+        of the schemes suffice as key. So does a 'scheme_pair_db' maintain the
+        identity of equal schemes in the combined transition map.
         """
         result = TargetByStateKey()
         if scheme_pair_db is not None:
-            key    = (A.__scheme, B.__scheme)
+            key    = (id(A.__scheme), id(B.__scheme))
             scheme = scheme_pair_db.get(key)
             if scheme is None:
                 scheme = A.__scheme + B.__scheme
@@ -127,6 +132,10 @@ class TargetByStateKey(object):
     def uniform_door_id(self):
         return self.__uniform_door_id
 
+    @property
+    def scheme(self):
+        return self.__scheme
+
     def drop_out_f(self):
         if self.__uniform_door_id is not None: 
             return self.__uniform_door_id.state_index == E_StateIndices.DROP_OUT
@@ -5,12 +5,10 @@
 from   quex.engine.analyzer.mega_state.template.state     import TemplateState, \
                                                                  PseudoTemplateState
 from   quex.engine.analyzer.mega_state.template.candidate import TemplateStateCandidate
-from   quex.engine.misc.tools import delete_if
-
 from   quex.constants  import E_Compression
 
 from   itertools       import islice
-from   operator        import attrgetter
+import heapq
 
 def do(TheAnalyzer, MinGain, CompressionType, AvailableStateIndexList):
     """TEMPLATE COMPRESSION ____________________________________________________
@@ -94,7 +92,9 @@ def do(TheAnalyzer, MinGain, CompressionType, AvailableStateIndexList):
        A list of TemplateStateCandidate-s. A candidate represents the possible
        combination of two states from the 'elects'. A candidate contains
        information about the possible gain which could be expected from
-       combining two particular states from the 'elect_db'.
+       combining two particular states from the 'elect_db'. Candidates are
+       only computed for states which share a target or the borders of 
+       their transition map (see 'SimilarityIndex').
 
     To support the homogeneity of the algorithm all FSM_State-s are
     translated into PseudoTemplateState-s prior the analysis procedure.
@@ -142,62 +142,33 @@ class CandidateList(list):
     to be combined can be FSM_State-s (i.e. PseudoTemplateState-s) or 
     TemplateState-s. For each possible combination a 'gain' needs to be computed.
     This happens during the construction of a 'TemplateStateCandidate'. This
-    list maintains all candidates that provide a minimum gain in a sorted 
-    order. Thus '.pop_best()' allows to get the best possible combination.
-    If '.pop_best()'. returns None, then there is no combination candidate that
+    list maintains all candidates that provide a minimum gain in a heap. Thus 
+    '.pop_best()' allows to get the best possible combination. If 
+    '.pop_best()'. returns None, then there is no combination candidate that
     provides the minimum gain.
+
+    Candidates are only computed for states which are similar according to
+    the 'SimilarityIndex'. Candidates which relate to states that have been
+    combined already are not deleted from the heap. They are dropped when
+    they appear on top of it.
     ___________________________________________________________________________
     """
     def __init__(self, TheElectDB, UniformityF, MinGain):
-        """Compute TemplateStateCandidate-s for each possible combination of 
-           two states in the '__elect_db'. If the gain of a combination is less 
-           that 'self.__min_gain' then it is not considered.
+        """Compute TemplateStateCandidate-s for each pair of similar states in
+           the '__elect_db'. If the gain of a combination is less than
+           'self.__min_gain' then it is not considered.
         """
         self.__min_gain              = MinGain
         self.__uniformity_required_f = UniformityF
-        state_list = list(TheElectDB.values())
-        L          = len(state_list)
-
-        def bad_company_announcement(A, B):
-            A.bad_company_add(B.index)  # Make a note, that it makes not sense
-            B.bad_company_add(A.index)  # to try ony of the two again together.
-
-        # Pre-allocate the result array to avoid frequent allocations
-        #
-        # NOTE: L * (L - 1) is always even, i.e. dividable by 2.
-        #       Proof:
-        #       (a) L even = k * 2:     -> k * 2 ( k * 2 - 1 )            = k * k * 4 - k * 2
-        #                                = even - even = even
-        #       (b) L odd  = k * 2 + 1: -> (k * 2 + 1) * ( k * 2 + 1 - 1) = k * k * 4 + k * 2
-        #                                = even + even = even
-        # 
-        #       => division by two without remainder 
-        MaxSize = (L * (L - 1)) >> 1 # Divide by two with the result as integer
-        result  = [None] * MaxSize
-        n       = 0
-        for i, i_state in enumerate(state_list):
-            for k_state in islice(state_list, i + 1, None):
-
-                if     self.__uniformity_required_f                                               \
-                   and (   i_state.uniform_DropOut           != k_state.uniform_DropOut           \
-                        or i_state.uniform_entry_OpList != k_state.uniform_entry_OpList): 
-                    bad_company_announcement(i_state, k_state)
-                    continue
-
-                candidate = TemplateStateCandidate(i_state, k_state)
-
-                if candidate.gain >= self.__min_gain:
-                    result[n] = candidate
-                    n += 1
-                else:
-                    bad_company_announcement(i_state, k_state)
-
-        if n != MaxSize:
-            del result[n:]
-
-        # Sort according to delta cost
-        self.extend(result)
-        self.sort(key=attrgetter("gain")) # 'best' must be at end
+        self.__index                 = SimilarityIndex()
+        self.__done_set              = set() # indices of combined states
+        self.__sequence_n            = 0
+
+        for state in TheElectDB.values():
+            self.__index.enter(state, self.__index.key_list(state))
+
+        for state_a, state_b in self.__index.iterable_pairs():
+            self.__enter(state_a, state_b)
 
     def update(self, TheElectDB, NewElect):
         """Adapt the CandidateList to include candidates of combinations with
@@ -206,40 +177,41 @@ class CandidateList(list):
         assert isinstance(NewElect, TemplateState)
         assert NewElect.index not in TheElectDB    # Avoid combination with self.
 
-        # Avoid extensive 'appends' by single allocation (see initial computation)
-        MaxIncrease = len(TheElectDB) 
-        n           = len(self)
-        MaxSize     = len(self) + MaxIncrease
-        self.extend([None] * MaxIncrease)
         ImplementedStateIndexSet = NewElect.implemented_state_index_set()
+        key_list                 = self.__index.key_list(NewElect)
 
-        for state in TheElectDB.values():
-            if self.__uniformity_required_f:
-                # Rely on __eq__ operator (used '=='). '!=' uses __ne__ 
-                if   not (state.drop_out == NewElect.drop_out):    continue
-                elif not (state.entry.is_uniform(NewElect.entry)): continue
-
-
+        for state in self.__index.get_neighbor_list(key_list, TheElectDB):
             # Do not try to combine states that have proven to be 'bad_company'.
             if       state.index in NewElect.bad_company():                                  continue
             elif not NewElect.bad_company().isdisjoint(state.implemented_state_index_set()): continue
             elif not state.bad_company().isdisjoint(ImplementedStateIndexSet):               continue
             # IMPOSSIBLE: NewElect.index in state.bad_company() 
             #             because when 'state' was created, 'NewElect' did not exist.
-            candidate = TemplateStateCandidate(NewElect, state)
-
-            if candidate.gain >= self.__min_gain:
-                self[n] = candidate
-                n += 1
-            else:
-                # Mention the states for which the other does not combine properly
-                state.bad_company_add(NewElect.index)
-                NewElect.bad_company_add(state.index)
-
-        if n != MaxSize:
-            del self[n:]
-
-        self.sort(key=attrgetter("gain")) # 'best' must be at end
+            self.__enter(NewElect, state)
+
+        self.__index.enter(NewElect, key_list)
+
+    def __enter(self, StateA, StateB):
+        if     self.__uniformity_required_f \
+           and not self.__uniform_f(StateA, StateB):
+            candidate = None
+        else:
+            candidate = TemplateStateCandidate(StateA, StateB)
+
+        if candidate is not None and candidate.gain >= self.__min_gain:
+            # Greatest gain first; with equal gain, the latest candidate first.
+            self.__sequence_n += 1
+            heapq.heappush(self, (- candidate.gain, - self.__sequence_n, candidate))
+        else:
+            # Mention the states for which the other does not combine properly
+            StateA.bad_company_add(StateB.index)
+            StateB.bad_company_add(StateA.index)
+
+    @staticmethod
+    def __uniform_f(StateA, StateB):
+        return     StateA.uniform_entry_OpList.is_uniform() \
+               and StateB.uniform_entry_OpList.is_uniform() \
+               and StateA.uniform_entry_OpList.fit(StateB.uniform_entry_OpList)
 
     def pop_best(self):
         """Determines the two states that result in the greatest gain if they are 
@@ -253,40 +225,113 @@ class CandidateList(list):
                                         greatest gain. 
                  None, if there is no more.
         """
-        if len(self) == 0: return None
-
-        # (*) The entry with the highest gain is at the tail of the list.
-        best = self.pop()
-
-        # (*) Remove any TemplateStateCandidate that combines 'i' or 'k' which
-        #     are now implemented by 'best'. No other candidate that combines
-        #     'i' and 'k' shall get a chance.
-        # 
-        # If 'i' or 'k' refer to an FSM_State, then any combination where 'i'
-        # or 'k' is involved is removed from the candidate list. The 'best', let it 
-        # have state index 'p', is the only state that contains now 'i' and 'k'. Any
-        # state, with index 'q', that combines with it does not contain 'i' and 
-        # 'k'. And, on the event of combining 'p' and other 'q' all other combinations
-        # related to 'p' are deleted, thus all other combinations that contain
-        # 'i' and 'k' are impossible.
-        #
-        # => The consideration of 'implemented_state_index_set' is not necessary.
-        self.__delete_references(best.state_a.index, best.state_b.index)
-
-        return best
-
-    def __delete_references(self, I, K):
-        """Delete all related entries in the 'CandidateList' that relate to
-        states I and K. This function is used after the decision has been made
-        that I and K are combined into a TemplateState. None of them can be
-        combined with another state anymore.
-        """
+        while self:
+            best = heapq.heappop(self)[2]
+
+            # (*) Any TemplateStateCandidate that combines 'i' or 'k' which
+            #     are implemented by a former 'best' is no longer valid. No other
+            #     candidate that combines 'i' and 'k' shall get a chance.
+            #
+            # A TemplateState that implements 'i' or 'k' has a new state index.
+            # State indices are never reused. So, the indices of 'best' tell
+            # whether it is still valid.
+            if   best.state_a.index in self.__done_set: continue
+            elif best.state_b.index in self.__done_set: continue
+
+            self.__done_set.add(best.state_a.index)
+            self.__done_set.add(best.state_b.index)
+            return best
+
+        return None
+
+class SimilarityIndex(dict):
+    """________________________________________________________________________
 
-        done_set = (I, K)
+    Maps a 'similarity key' to the list of states that carry it. States which
+    carry the same key are likely to combine with gain:
 
-        delete_if(self, 
-                  lambda entry: entry.state_a.index in done_set or entry.state_b.index in done_set)
-        return 
+       ("borders", list of interval borders of the transition map):
+
+           The same borders result in a combined transition map with no 
+           additional intervals.
+
+       ("target", target state index): 
+
+           A common target may result in intervals with uniform targets.
+
+    Only states of the same key are considered for combination. Of those, 
+    each state is paired with at most 'NEIGHBOR_N' others per key. When a new
+    state enters, it is paired with at most 'NEIGHBOR_N' states in total,
+    those of the same borders first. Thus, the number of candidates remains 
+    linear in the number of states.
+    ___________________________________________________________________________
+    """
+    NEIGHBOR_N = 8
+
+    def __init__(self):
+        self.__target_key_list_db = {}  # state index --> keys of its targets
+
+    def key_list(self, State):
+        """RETURNS: List of keys of 'State'. The key of the borders comes first.
+
+        The targets of a TemplateState are the targets of the implemented 
+        states. They are not determined from the (large) target schemes.
+        """
+        border_list = [ interval.begin for interval, target in State.transition_map ]
+        if isinstance(State, TemplateState):
+            target_key_list = list(dict.fromkeys(
+                key
+                for state_index in State.state_index_sequence()
+                for key in self.__target_key_list_db[state_index]
+            ))
+        else:
+            target_key_list = list(dict.fromkeys(
+                ("target", door_id.state_index)
+                for interval, target in State.transition_map
+                for door_id in target.iterable_door_id_scheme()
+                if not door_id.drop_out_f()
+            ))
+            self.__target_key_list_db[State.index] = target_key_list
+        return [("borders", tuple(border_list))] + target_key_list
+
+    def enter(self, State, KeyList):
+        for key in KeyList:
+            self.setdefault(key, []).append(State)
+
+    def iterable_pairs(self):
+        """YIELDS: Pairs of states of the same key--each pair only once.
+        """
+        done_set = set()
+        for state_list in self.values():
+            for i, state_a in enumerate(state_list):
+                for state_b in islice(state_list, i + 1, i + 1 + self.NEIGHBOR_N):
+                    pair = (state_a.index, state_b.index)
+                    if pair in done_set: continue
+                    done_set.add(pair)
+                    yield state_a, state_b
+
+    def get_neighbor_list(self, KeyList, TheElectDB):
+        """RETURNS: List of at most 'NEIGHBOR_N' states from 'TheElectDB' which 
+                    carry a key from 'KeyList'. 
+        """
+        result   = []
+        done_set = set()
+        for key in KeyList:
+            state_list = self.get(key)
+            if state_list is None: continue
+            # States which are no longer elected are deleted on the fly.
+            alive_list = []
+            for i, state in enumerate(state_list):
+                if state.index not in TheElectDB: continue
+                alive_list.append(state)
+                if state.index in done_set:       continue
+                done_set.add(state.index)
+                result.append(state)
+                if len(result) == self.NEIGHBOR_N: 
+                    state_list[:i+1] = alive_list
+                    return result
+            state_list[:] = alive_list
+        return result
 
 class ElectDB(dict):
     """________________________________________________________________________
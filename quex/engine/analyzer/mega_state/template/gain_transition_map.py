@@ -6,7 +6,6 @@
 from   quex.engine.analyzer.mega_state.target import TargetByStateKey
 from   quex.engine.analyzer.state.transition_map    import TransitionMap       
 
-from   itertools import chain
 
 def do(ATm, AStateN, ASchemeN, BTm, BStateN, BSchemeN):
     """*Tm      -- transition map.
@@ -36,7 +35,7 @@ def _transition_cost_combined(TM_A, TM_B, ImplementedStateN):
     for begin, end, a_target, b_target in TransitionMap.izip(TM_A, TM_B):
         interval_n += 1
         if     a_target.uniform_door_id is not None \
-           and a_target.uniform_door_id == a_target.uniform_door_id:
+           and a_target.uniform_door_id == b_target.uniform_door_id:
             uniform_target_n += 1
         else:
             update_scheme_set(scheme_set, a_target, b_target)
@@ -82,9 +81,6 @@ def update_scheme_set(scheme_set, TA, TB):
     combination of transition maps. The number of different schemes is used
     to determine the cost a combination of transition maps.
 
-    NOTE: The use of 'hash' has the potential to miss a non-equal occurrence.
-          The value is only for metrics. So its no great deal.
-
     RETURNS: True  -- if size remains the same
              False -- if size increases (scheme was new)
     """
@@ -96,13 +92,7 @@ def update_scheme_set(scheme_set, TA, TB):
         if TA.uniform_door_id == TB.uniform_door_id:
             return False
 
-    my_hash = 0x5A5A5A5A
-    prime   = 1299827  # Use a huge prime number for deterministic randomization
-    for i, x in enumerate(chain(TA.iterable_door_id_scheme(), 
-                                TB.iterable_door_id_scheme())):
-        my_hash ^= hash(x) * i
-        my_hash ^= prime
-
+    # Equal schemes are identical objects (see 'from_2_TargetByStateKeys()').
     size_before = len(scheme_set)
-    scheme_set.add(my_hash)
+    scheme_set.add((id(TA.scheme), id(TB.scheme)))
     return size_before == len(scheme_set)
@@ -97,8 +97,12 @@ class Entry(object):
     def absorb(self, Other):
         """Absorbs all, but the 'reload transitions'.
         """
+        # Independence of OpList-s (see 'enter()') checked by a single set.
+        command_list_id_set = set(id(action.command_list) for action in self.__db.values())
         for tid, action in Other.__db.items():
-            self.enter(tid.target_state_index, tid.source_state_index, action)
+            assert id(action.command_list) not in command_list_id_set
+            command_list_id_set.add(id(action.command_list))
+            self.__enter(tid.target_state_index, tid.source_state_index, action)
 
         if self.__largest_used_door_sub_index < Other.__largest_used_door_sub_index:
             self.__largest_used_door_sub_index = Other.__largest_used_door_sub_index
@@ -115,7 +119,9 @@ class Entry(object):
         #!! DO NOT EVEN THINK ABOUT DELETING THIS ASSERT
         assert all(id(TheAction.command_list) != id(action.command_list) 
                    for transition_id, action in self.__db.items())
+        return self.__enter(ToStateIndex, FromStateIndex, TheAction)
 
+    def __enter(self, ToStateIndex, FromStateIndex, TheAction):
         trigger_id    = self.__get_trigger_id(ToStateIndex, FromStateIndex)
         transition_id = TransitionID(ToStateIndex, FromStateIndex, trigger_id)
         self.__db[transition_id] = TheAction
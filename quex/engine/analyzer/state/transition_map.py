@@ -141,11 +141,17 @@ class TransitionMap(list):
         """ASSUME: The transition map targets DoorID-s. 
         
         Then the internal DoorID-s are translated into TargetByStateKey objects.
+        Intervals with the same DoorID share the same TargetByStateKey object.
         """
+        target_db = {}  # DoorID --> TargetByStateKey
         def relate(TargetDoorId):
-            transition_id = TransitionID(TargetDoorId.state_index, StateIndex, TriggerId=0)
-            door_id       = TargetDoorId
-            return TargetByStateKey.from_transition(transition_id, door_id)
+            target = target_db.get(TargetDoorId)
+            if target is None:
+                transition_id = TransitionID(TargetDoorId.state_index, StateIndex, TriggerId=0)
+                door_id       = TargetDoorId
+                target        = TargetByStateKey.from_transition(transition_id, door_id)
+                target_db[TargetDoorId] = target
+            return target
 
         return self.__class__.from_iterable(self, relate)
 
@@ -13,6 +13,9 @@ from   quex.constants                                 import E_R
 import quex.blackboard as blackboard
 from   quex.blackboard import setup as Setup
 
+# Maximum number of intervals for which a fast skip loop is generated.
+SKIP_INTERVAL_N_MAX = 8
+
 def dfa_code_list_to_analyzer(DfaCodeList, DfaIndex, OnReloadFailureDoorId, ReloadState, 
                               dial_db, OnBeforeEntry=None, OnBeforeReload=None, Engine=None,
                               ForgetLexemeUponReloadF=False, ModeName=None):
@@ -55,6 +58,48 @@ def dfa_code_list_to_analyzer(DfaCodeList, DfaIndex, OnReloadFailureDoorId, Relo
     assert analyzer.state_machine_id == DfaIndex
     return analyzer, register_set
 
+def insert_fast_skip(analyzer):
+    """A state that loops on itself without any operation other than the 
+    increment and the dereferencing of the input pointer iterates over a 
+    character set, one lexatom at a time. In such a state, 'InputPSkipCharacterSet'
+    skips the lexatoms of the loop's set all at once (possibly vectorized).
+    It stops at the first lexatom outside the set, at the latest at the buffer
+    limit code. The transition map then continues as usual--also into reload.
+
+    'LoopRestartP = InputP' (for encodings with multi-lexatom characters) 
+    does not hinder, since it only depends on the position where the loop
+    stops. Characters of more than one lexatom (e.g. non-ASCII in UTF-8) do 
+    not loop on a single state. Thus, only sets of characters represented by
+    single code units are subject to fast skipping.
+    """
+    plain_head     = [ Op.Increment(E_R.InputP), Op.InputPDereference() ]
+    loop_restart_p = Op.Assign(E_R.LoopRestartP, E_R.InputP)
+
+    def is_plain(CL):
+        return     CL[:2] == plain_head \
+               and all(op == loop_restart_p for op in CL[2:])
+
+    for si in analyzer.non_mega_state_index_set:
+        state = analyzer.state_db[si]
+        plain_door_id_set = set(
+            action.door_id for action in state.entry.values()
+            if is_plain(action.command_list)
+        )
+        interval_list = [
+            (interval.begin, interval.end) 
+            for interval, door_id in state.transition_map
+            if door_id in plain_door_id_set and door_id.state_index == si
+        ]
+        if not interval_list or len(interval_list) > SKIP_INTERVAL_N_MAX: continue
+
+        interval_tuple = tuple(interval_list)
+        for action in state.entry.values():
+            if not is_plain(action.command_list): continue
+            action.command_list = OpList.from_iterable(
+                [ Op.Increment(E_R.InputP), Op.InputPSkipCharacterSet(interval_tuple) ]
+                + [ op.clone() for op in action.command_list[1:] ]
+            )
+
 def _get_on_before_reload_OpList(ModeName, UseLoopRestartF):
     register_set = set()
     if blackboard.required_counter():
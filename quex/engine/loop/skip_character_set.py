@@ -18,7 +18,8 @@ from   quex.engine.counter                        import CountActionMap
 from   quex.engine.misc.tools                     import typed
 from   quex.engine.loop.common                    import insertCountCmdList, \
                                                          dfa_code_list_to_analyzer, \
-                                                         dfa_code_list_terminals
+                                                         dfa_code_list_terminals, \
+                                                         insert_fast_skip
                                                          
 from   quex.blackboard import Lng
 from   quex.constants  import E_R, \
@@ -85,6 +86,9 @@ def do(ModeName, CaMap, CharacterSet, ReloadState, dial_db,
     if multi_step_character_set_list and EnforceConstCountTermsF:
         register_set.add(E_R.CountReferenceP)
 
+    if engine_type is None or not engine_type.is_CHARACTER_COUNTER():
+        insert_fast_skip(analyzer)
+
     return [ analyzer ], \
            dfa_code_list_terminals(dfa_code_list, dial_db), \
            multi_step_character_set_list + single_step_character_set_list, \
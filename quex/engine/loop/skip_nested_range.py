@@ -25,7 +25,8 @@ from   quex.engine.analyzer.terminal.factory                import CountCmdFacto
 from   quex.engine.analyzer.door_id_address_label           import DoorID
 from   quex.engine.loop.common                              import dfa_code_list_to_analyzer, \
                                                                    dfa_code_list_terminals, \
-                                                                   insertCountCmdList
+                                                                   insertCountCmdList, \
+                                                                   insert_fast_skip
 from   quex.engine.counter                                  import CountActionMap
 from   quex.engine.operations.operation_list                import Op, OpList
 from   quex.engine.state_machine.cut.operations_on_lexemes  import first_complement
@@ -102,6 +103,7 @@ def do(ModeName, CaMap,
                                                       OnBeforeEntry           = on_before_entry,
                                                       ForgetLexemeUponReloadF = True,
                                                       ModeName                = ModeName)
+    insert_fast_skip(UNTIL_FIRST_analyzer)
 
     reload_state        = UNTIL_FIRST_analyzer.reload_state
     DELIMITER_analyzer, \
@@ -0,0 +1,136 @@
+#! /usr/bin/env python
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+# Micro-benchmark for 'NumberSet' operations.
+#
+# USAGE:  benchmark-number_set.py [file.py]
+#
+# Measures the time per operation for sets of different numbers of intervals.
+# If 'file.py' is given, it must be an alternative implementation of the
+# module 'interval_handling', e.g. the implementation based on lists of
+# 'Interval' objects as of an earlier revision:
+#
+#   > git show 1667720:quex/engine/misc/interval_handling.py > /tmp/old.py
+#   > benchmark-number_set.py /tmp/old.py
+#
+# Then, both implementations are measured on the same input. The number of
+# inputs for which their results differ is reported.
+#_______________________________________________________________________________
+import os
+import sys
+sys.path.insert(0, os.environ["QUEX_PATH"])
+
+import quex.engine.misc.interval_handling as     interval_handling
+
+import importlib.util
+import random
+import timeit
+
+INTERVAL_N_LIST = [1, 4, 16, 256]
+SAMPLE_N        = 200
+
+def load_module(FileName):
+    spec   = importlib.util.spec_from_file_location("alternative", FileName)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def interval_tuple_list(rand, IntervalN):
+    """RETURNS: List of 'IntervalN' random (begin, end) tuples in the range
+                of Unicode code points.
+    """
+    result = []
+    for i in range(IntervalN):
+        begin = rand.randint(0, 0x10FFFF - 100)
+        result.append((begin, begin + rand.randint(1, 100)))
+    return result
+
+def operation_db(Module):
+    NumberSet = Module.NumberSet
+    Interval  = Module.Interval
+    universe  = NumberSet(Interval(0, 0x110000))
+    return {
+        "construct":            lambda A, B, TA: NumberSet.from_tuples(TA),
+        "add_interval":         lambda A, B, TA: A.clone().add_interval(Interval(TA[0][0] + 7, TA[0][1] + 7)),
+        "union":                lambda A, B, TA: A.union(B),
+        "intersection":         lambda A, B, TA: A.intersection(B),
+        "difference":           lambda A, B, TA: A.difference(B),
+        "symmetric_difference": lambda A, B, TA: A.symmetric_difference(B),
+        "get_complement":       lambda A, B, TA: A.get_complement(universe),
+        "has_intersection":     lambda A, B, TA: A.has_intersection(B),
+        "is_superset":          lambda A, B, TA: A.is_superset(B),
+        "contains":             lambda A, B, TA: A.contains(TA[0][0] + 1),
+    }
+
+def prepare(Module, TupleListPairs):
+    NumberSet = Module.NumberSet
+    return [
+        (NumberSet.from_tuples(ta), NumberSet.from_tuples(tb), ta)
+        for ta, tb in TupleListPairs
+    ]
+
+def measure(Function, InputList):
+    def run():
+        for a, b, ta in InputList:
+            Function(a, b, ta)
+    repeat_n = max(1, 20000 // (len(InputList) * len(InputList[0][2])))
+    best     = min(timeit.repeat(run, number=repeat_n, repeat=3))
+    return best / (repeat_n * len(InputList)) * 1e6 # [us]
+
+def result_string(X):
+    if X.__class__.__name__ == "NumberSet": return X.get_string(Option="hex")
+    else:                                  return repr(X)
+
+def count_differences(ModuleA, ModuleB, TupleListPairs):
+    """RETURNS: map: operation name --> number of inputs for which the 
+                results of the two implementations differ.
+    """
+    db_a   = operation_db(ModuleA)
+    db_b   = operation_db(ModuleB)
+    result = {}
+    for input_a, input_b in zip(prepare(ModuleA, TupleListPairs),
+                                prepare(ModuleB, TupleListPairs)):
+        for name in db_a:
+            if name == "add_interval": continue
+            result_a = result_string(db_a[name](*input_a))
+            result_b = result_string(db_b[name](*input_b))
+            if result_a != result_b: result[name] = result.get(name, 0) + 1
+    return result
+
+def main():
+    module_list = [("current", interval_handling)]
+    if len(sys.argv) > 1:
+        module_list.append(("alternative", load_module(sys.argv[1])))
+
+    rand = random.Random(4711)
+    print("%-22s %6s " % ("operation", "N")
+          + " ".join("%14s" % ("%s[us]" % name) for name, module in module_list)
+          + ("   ratio" if len(module_list) > 1 else ""))
+    for interval_n in INTERVAL_N_LIST:
+        pairs = [
+            (interval_tuple_list(rand, interval_n), interval_tuple_list(rand, interval_n))
+            for i in range(SAMPLE_N)
+        ]
+        if len(module_list) > 1:
+            difference_db = count_differences(module_list[0][1], module_list[1][1], pairs)
+        else:
+            difference_db = {}
+
+        input_db = dict((name, prepare(module, pairs)) for name, module in module_list)
+        for operation in operation_db(interval_handling):
+            time_list = [
+                measure(operation_db(module)[operation], input_db[name])
+                for name, module in module_list
+            ]
+            txt = "%-22s %6i " % (operation, interval_n) \
+                  + " ".join("%14.3f" % t for t in time_list)
+            if len(time_list) > 1:
+                txt += "   %5.2f" % (time_list[1] / time_list[0])
+            if operation in difference_db:
+                txt += "   (results differ for %i of %i inputs)" \
+                       % (difference_db[operation], len(pairs))
+            print(txt)
+
+if __name__ == "__main__":
+    main()
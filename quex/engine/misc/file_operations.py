@@ -3,6 +3,7 @@
 #_______________________________________________________________________________
 import os
 import sys
+import re
 
 def open_file_or_die(FileName, Mode="r", Env=None, CodecCheckF=True, Encoding="utf-8-sig"):
     fh = __open_safely(FileName, Mode, Encoding)
@@ -22,15 +23,48 @@ def get_file_content_or_die(FileName, Mode="r"):
     return txt
 
 def write_safely_and_close(FileName, txt):
-    fh = open_file_or_die(FileName, Mode="w", CodecCheckF=False, Encoding="utf-8")
     if os.linesep != "\n": txt = txt.replace("\n", os.linesep)
     # NOTE: According to bug 2813381, maybe due to an error in python,
     #       there appeared two "\r" instead of one "\r\r".
     while txt.find("\r\r") != -1:
         txt = txt.replace("\r\r", "\r")
+
+    # Files that remain the same are not touched, so that build systems
+    # do not consider them as changed.
+    if __is_unchanged(FileName, txt): return
+
+    fh = open_file_or_die(FileName, Mode="w", CodecCheckF=False, Encoding="utf-8")
     fh.write(txt)
     fh.close()
 
+# The only lines that quex stamps with 'time.asctime()': the build date in the
+# configuration file and the date in the header of the token id file.
+__time_stamp_line_re = re.compile(r'^(#\s*define\s+\w*SETTING_BUILD_DATE\s+"| \* DATE: )'
+                                  r'\w{3} \w{3} [ \d]\d \d\d:\d\d:\d\d \d{4}', 
+                                  re.MULTILINE)
+
+def __is_unchanged(FileName, txt):
+    """RETURNS: True, if 'FileName' exists and contains exactly 'txt'--except 
+                for the time stamp on a line that quex stamps (if present).
+    """
+    if not os.path.isfile(FileName): return False
+    try:
+        fh = open(FileName, "rb")
+        old_content = fh.read()
+        fh.close()
+    except OSError:
+        return False
+
+    content = txt.encode("utf-8")
+    if old_content == content: return True
+
+    try:
+        old_txt = old_content.decode("utf-8")
+    except UnicodeDecodeError:
+        return False
+    return    __time_stamp_line_re.sub(r"\1", old_txt, count=1) \
+           == __time_stamp_line_re.sub(r"\1", txt, count=1)
+
 
 count_db = {}
 
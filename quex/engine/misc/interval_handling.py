@@ -14,14 +14,15 @@
 
 
 # import quex.output.languages.core as languages
-from   quex.engine.misc.tools import r_enumerate, \
-                                     quex_chr, \
+from   quex.engine.misc.tools import quex_chr, \
                                      typed, \
                                      flatten
 from   quex.constants         import INTEGER_MAX
 
 from   copy      import copy
 from   itertools import islice
+from   bisect    import bisect_left, \
+                        bisect_right
 
 
 class Interval(object):
@@ -304,13 +305,28 @@ class Interval(object):
             yield i
 
 class NumberSet(object):
-    """Represents an arbitrary set of numbers. The set is described
-       in terms of intervals, i.e. objects of class 'Interval'. This
-       class also provides basic operations such as union, intersection,
-       and difference.
+    """Represents an arbitrary set of numbers. The set is described by a flat,
+       strictly increasing list of borders
+
+                  [ begin_0, end_0, begin_1, end_1, ... ]
+
+       where each pair '[begin_i, end_i)' is an interval of the set. Intervals
+       are never empty and never touch each other. The number 'x' is in the
+       set, if the number of borders '<= x' is odd. Union, intersection, and
+       difference are linear merges of border lists; membership tests are
+       binary searches.
+
+       Objects of class 'Interval' appear only at the interface. They are
+       created upon request (e.g. 'get_intervals()'). Modifying them does not
+       modify the NumberSet.
+
+       NOTE: A plain list of integers is preferred over 'array.array' for the
+             border list. The sets in a lexical analyzer usually consist of
+             few intervals, where element access and construction of arrays
+             is slower than for lists (see 'TESTS/benchmark-number_set.py').
     """
 
-    __slots__ = ('__intervals')
+    __slots__ = ('__borders',)
 
     def __init__(self, Arg = None, ArgumentIsYoursF=False):
         """Arg = list     ==> list of initial intervals
@@ -318,51 +334,45 @@ class NumberSet(object):
            Arg = integer  ==> interval consisting of one number
            """
         arg_type = Arg.__class__
-        
+
         if  arg_type == list:
-            if ArgumentIsYoursF:
-                self.__intervals = Arg
-            else:
-                self.__intervals = []
-                # use 'add_interval' to ensure consistency, i.e. touches, overlaps, etc.
-                for interval in Arg:
-                    self.add_interval(copy(interval))
+            self.__borders = _borders_from_intervals(Arg)
 
         elif  arg_type == Interval:
-            if ArgumentIsYoursF: self.__intervals = [ Arg ] 
-            else:                self.__intervals = [ copy(Arg) ]
+            if Arg.begin < Arg.end: self.__borders = [ Arg.begin, Arg.end ]
+            else:                   self.__borders = []
 
         elif arg_type == NumberSet:
-            if ArgumentIsYoursF:  self.__intervals = Arg.__intervals
-            else:                 self.__intervals = Arg.__clone_intervals()
+            if ArgumentIsYoursF:  self.__borders = Arg.__borders
+            else:                 self.__borders = Arg.__borders[:]
 
         elif arg_type == int:
-            self.__intervals = [ Interval(Arg) ]
+            self.__borders = [ Arg, Arg + 1 ]
 
         elif Arg is None:
-            self.__intervals = []
+            self.__borders = []
 
         else:
             # assert: arg_type in [Interval, NumberSet, int, list] or Arg is None
-            assert False, "#Arg: '%s'" % Arg 
+            assert False, "#Arg: '%s'" % Arg
 
     @staticmethod
     def from_integer(Value):
-        result = NumberSet()
-        result.add_interval(Interval(Value, Value+1))
-        return result
+        return NumberSet.from_range(Value, Value+1)
 
     @staticmethod
     def from_integer_list(ValueList):
-        result = NumberSet()
-        for value in ValueList:
-            result.add_interval(Interval(value, value+1))
+        result  = NumberSet()
+        borders = result.__borders
+        for value in sorted(set(ValueList)):
+            if borders and borders[-1] == value: borders[-1] = value + 1
+            else:                                borders.extend((value, value + 1))
         return result
 
     @staticmethod
     def from_range(Begin, End):
         result = NumberSet()
-        result.add_interval(Interval(Begin, End))
+        if Begin < End: result.__borders = [ Begin, End ]
         return result
 
     @staticmethod
@@ -375,47 +385,28 @@ class NumberSet(object):
     @staticmethod
     def from_IntervalList(IntervalList):
         result = NumberSet()
-        if not IntervalList: return result
-
-        iterable = iter(sorted(IntervalList))
-        prev     = next(iterable)
-        result.__intervals.append(prev)
-        for interval in iterable:
-            if interval.begin <= prev.end: 
-                prev.end = interval.end
-            else:                          
-                prev = interval.clone()
-                result.__intervals.append(prev)
+        result.__borders = _borders_from_intervals(IntervalList)
         return result
 
     @staticmethod
     def from_tuples(TupleList):
-        return NumberSet.from_IntervalList([
-            Interval(x[0], x[1]) for x in TupleList
-        ])
-
-    def __clone_intervals(self):
-        return [ Interval(x.begin, x.end) for x in self.__intervals ]
-
-    def __bisect(self, Value):
-        upper = len(self.__intervals)
-        if upper == 0:
-            return None
-        lower = 0
-        while upper - lower > 1:
-            i = (upper + lower) >> 1
-            if   self.__intervals[i].begin >  Value: upper = i
-            elif self.__intervals[i].end   <= Value: lower = i
-            else:                                    return i
-
-        if     Value >= self.__intervals[lower].begin \
-           and Value <  self.__intervals[lower].end:
-            return lower
-
-        return None
+        result = NumberSet()
+        result.__borders = _borders_from_tuples(TupleList)
+        return result
+
+    @staticmethod
+    def from_border_list(BorderList):
+        """BorderList = strictly increasing list of borders of even length.
+        The list is taken over by the NumberSet.
+        """
+        result = NumberSet()
+        result.__borders = BorderList
+        return result
 
     def clone(self):
-        return NumberSet([Interval(x.begin, x.end) for x in self.__intervals], ArgumentIsYoursF=True)
+        result = NumberSet()
+        result.__borders = self.__borders[:]
+        return result
 
     @typed(Other=Interval)
     def quick_append_interval(self, Other, SortF=True):
@@ -423,304 +414,185 @@ class NumberSet(object):
            Use this function with caution. It is much faster than the 'union' function
            or the function 'add_interval'.
         """
-        assert Other.__class__.__name__ == "Interval"
-        assert not self.__intervals or self.__intervals[-1].end <= Other.begin
-        if not self.__intervals or self.__intervals[0].end != Other.begin:
-            self.__intervals.append(Other)
-        else:
-            self.__intervals[-1].end = Other.end
+        borders = self.__borders
+        assert not borders or borders[-1] <= Other.begin
+        if   Other.begin == Other.end:            return
+        elif borders and borders[-1] == Other.begin: borders[-1] = Other.end
+        else:                                     borders.extend((Other.begin, Other.end))
 
     def quick_append_value(self, Value):
-        x = self.__intervals
-        if len(x) != 0  and x[-1].end == Value: x[-1].end = Value + 1
-        else:                                   x.append(Interval(Value))
+        borders = self.__borders
+        if borders and borders[-1] == Value: borders[-1] = Value + 1
+        else:                                borders.extend((Value, Value + 1))
 
     def add(self, X):
-        self.add_interval(Interval(X, X+1))
-        
+        self.__add_range(X, X+1)
+
     def add_interval(self, X):
         """Adds an interval and ensures that no overlap with existing
-        intervals occurs. Note: the 'touch' test is faster here, because
-        only one interval is checked against.!
-        
-        IDEA: Return the position of the last insertion, so that this
-              function could take it as a hint!
+        intervals occurs.
         """
-        if X.begin == X.end: 
-            return
-        
-        # (1) determine if begin overlaps with the new interval
-        L = len(self.__intervals)
-        if L == 0 or X.begin > self.__intervals[-1].end:
-            self.__intervals.append(Interval(X.begin, X.end))
-            return
+        self.__add_range(X.begin, X.end)
 
-        for i, y in enumerate(self.__intervals):
-            # possible cases:
-            #  (1) [=== X ===]         [=== y ===]             
-            #  
-            #  (2) [=== X ============][=== y ===]
-            #  
-            #  (3) [=== X ==================]
-            #                          [=== y ===]
-            #  
-            #  (4) [=== X =======================]
-            #                          [=== y ===]
-            #  
-            #  (5) [=== X =============================================]
-            #                          [=== y ===]
-            #  
-            #  (6)                     [=== X =========================]
-            #                          [=== y ===]
-            #  
-            #  (7)                     [=== y ===][=== X ==============]
-            #  
-            #  (8)                     [=== y ===]           [=== X ===]
-            #  
-            if X.begin > y.end: 
-                continue                              # filter (8)
-            elif X.end < y.begin: 
-                self.__intervals.insert(i, Interval(X.begin, X.end)) 
-                return                                # filter (1)         --> insert before 'y'
-            else:
-                begin = min(X.begin, y.begin)
-                end   = max(X.end,   y.end)
-                break
-
-        # 'y' intersects with 'X', y is going to 'eat'
-        # delete all intervals which are covered by 'X'
-        if i + 1 < L:
-            for k in range(i+1, L):
-                z = self.__intervals[k]
-                if X.end < z.begin: break
-                end = max(end, z.end)
-            else:
-                k = L 
-            # 'X' does touch 'z', i.e. '__intervals[k]'
-            del self.__intervals[i+1:k] # delete the overlapped intervals
+    def __add_range(self, Begin, End):
+        if Begin >= End: return
+        borders = self.__borders
+        if not borders or Begin > borders[-1]:
+            borders.extend((Begin, End))
+            return
 
-        y.begin = begin  # let 'y' take the new values
-        y.end   = end
+        # i = index of first border >= Begin. If 'i' is odd, 'Begin' lies inside
+        #     (or touches) the interval '[borders[i-1], borders[i])'.
+        # k = index of first border > End. If 'k' is odd, 'End' lies inside
+        #     (or touches) the interval '[borders[k-1], borders[k])'.
+        i = bisect_left(borders, Begin)
+        k = bisect_right(borders, End, i)
+        if i & 1:
+            if k & 1: borders[i:k] = ()
+            else:     borders[i:k] = (End,)
+        else:
+            if k & 1: borders[i:k] = (Begin,)
+            else:     borders[i:k] = (Begin, End)
+
+    def __cut_range(self, Begin, End):
+        if Begin >= End: return
+        borders = self.__borders
+        if not borders or Begin >= borders[-1] or End <= borders[0]: return
+
+        # i = index of first border >= Begin. If 'i' is odd, a part of the
+        #     interval '[borders[i-1], borders[i])' remains below 'Begin'.
+        # k = index of first border > End. If 'k' is odd, a part of the
+        #     interval '[borders[k-1], borders[k])' remains above 'End'.
+        i = bisect_left(borders, Begin)
+        k = bisect_right(borders, End, i)
+        if i & 1:
+            if k & 1: borders[i:k] = (Begin, End)
+            else:     borders[i:k] = (Begin,)
+        else:
+            if k & 1: borders[i:k] = (End,)
+            else:     borders[i:k] = ()
 
     def contains(self, Number):
         """True  => if Number in NumberSet
            False => else
         """
-        return self.__bisect(Number) is not None
+        return bisect_right(self.__borders, Number) & 1 == 1
 
     def contains_only(self, Number):
-        if   len(self.__intervals) != 1: return False
-        x = self.__intervals[0]
-        if x.end - x.begin != 1:         return False
-        return x.begin == Number
+        borders = self.__borders
+        return len(borders) == 2 and borders[0] == Number and borders[1] == Number + 1
 
     def has_size_one(self):
-        if len(self.__intervals) != 1: return False
-        return (self.__intervals[0].end - self.__intervals[0].begin) == 1
+        borders = self.__borders
+        return len(borders) == 2 and borders[1] - borders[0] == 1
 
     def minimum(self):
-        if not self.__intervals: return INTEGER_MAX   # i.e. an absurd value
-        else:                    return self.__intervals[0].begin
+        if not self.__borders: return INTEGER_MAX   # i.e. an absurd value
+        else:                  return self.__borders[0]
 
     def maximum(self):
-        if not self.__intervals:               return -INTEGER_MAX   # i.e. an absurd value
-        elif self.__intervals[-1].size() == 0: return -INTEGER_MAX
-        else:                                  return self.__intervals[0].end - 1
+        if not self.__borders: return -INTEGER_MAX   # i.e. an absurd value
+        else:                  return self.__borders[-1] - 1
 
     def least_greater_bound(self):
-        if len(self.__intervals) == 0: return - INTEGER_MAX # i.e. an absurd value
-        else:                          return self.__intervals[-1].end
+        if not self.__borders: return - INTEGER_MAX # i.e. an absurd value
+        else:                  return self.__borders[-1]
 
     def is_empty(self):
-        if len(self.__intervals) == 0: return True
-        for interval in self.__intervals:
-            if interval.is_empty() == False: return False
-        return True
+        return not self.__borders
 
     def is_all(self):
         """Returns True if this NumberSet covers all numbers, False if not.
-           
-           Note: All intervals should have been added using the function 'add_interval'
-                 Thus no overlapping intervals shall exists. If the set covers all numbers,
-                 then there can only be one interval that 'is_all()'
         """
-        if len(self.__intervals) != 1: return False
-        return self.__intervals[0].is_all()
-            
+        borders = self.__borders
+        return     len(borders) == 2 \
+               and borders[0] == -INTEGER_MAX and borders[1] == INTEGER_MAX
+
     def is_equal(self, Other):
-        """Assume: All intervals are sorted and adjacent intervals are combined.
-        """
-        if len(self.__intervals) != len(Other.__intervals): 
-            return False
-        for interval, other in zip(self.__intervals, Other.__intervals):
-            if   interval.begin != other.begin: return False
-            elif interval.end   != other.end:   return False
-        return True
+        return self.__borders == Other.__borders
 
     def is_superset(self, Other):
         """True  -- if self covers Other
            False -- if not
         """
-        self_intervals  = self.__intervals
-        other_intervals = Other.__intervals
-
-        # Last index of each set
-        Li_self  = len(self_intervals) - 1
-        Li_other = len(other_intervals) - 1
+        A = self.__borders
+        B = Other.__borders
+        if   not B:                           return True
+        elif not A:                           return False
+        elif B[0] < A[0] or B[-1] > A[-1]:    return False
 
-        if Li_self == -1:
-            if Li_other == -1: return True
-            else:              return False
-        elif Li_other == -1:   return True
-
-        # Step in a 'tolerant' manner, i.e. combine adjacent intervals
-        # (Even though, adjacent intervals should have been combined before)
         i = 0
-        k = 0
-        other_begin = other_intervals[0].begin
-
-        while 1 + 1 == 2:
-            # Walk with 'i' in 'self' until we find something that intersects with the 
-            # other interval 'k'.
-            while self_intervals[i].end < other_begin:
-                if i == Li_self: return False
-                i += 1
-
-            if self_intervals[i].begin > other_begin:
-                return False
-
-            elif self_intervals[i].end >= other_intervals[k].end:
-                # Other interval is completely covered, next please.
-                if k == Li_other: return True
-                k += 1
-                other_begin = other_intervals[k].begin
-            else:
-                # The part in 'other' from self_intervals[i].end to other_intervals[k].end
-                # remains to be covered by the next intervals of 'self'.
-                other_begin = self_intervals[i].end
-                if i == Li_self: return False
-                i += 1
+        for k in range(0, len(B), 2):
+            # 'A[i-1] <= begin < A[i]' must be an interval covering 'B[k:k+2]'.
+            i = bisect_right(A, B[k], i)
+            if not (i & 1) or A[i] < B[k+1]: return False
+        return True
 
     def interval_number(self):
         """This value gives some information about the 'complexity' of the number set."""
-        return len(self.__intervals)
+        return len(self.__borders) >> 1
 
     def unite_with(self, Other):
-        Other_type = Other.__class__
-        # assert Other_type == Interval or Other_type == NumberSet, \
-        #       "Error, argument of type %s" % Other.__class__.__name__
-
-        if Other_type == Interval:  
-            self.add_interval(Other)
-            return
-
-        elif not Other.__intervals:
-            return
-
-        elif not self.__intervals:
-            self.__intervals = [
-                copy(other) for other in Other.__intervals
-            ]
+        if Other.__class__ == Interval:
+            self.__add_range(Other.begin, Other.end)
             return
 
-        elif Other.__intervals[0].begin > self.__intervals[-1].end:
-            self.__intervals.extend(
-                copy(other) for other in Other.__intervals
-            )
+        borders       = self.__borders
+        other_borders = Other.__borders
+        if   not other_borders:
             return
-
-        elif Other.__intervals[-1].end < self.__intervals[0].begin:
-            new_intervals = [ copy(other) for other in Other.__intervals ]
-            new_intervals.extend(self.__intervals)
-            self.__intervals = new_intervals
-            return
-
-        # simply add all intervals to one single set
-        for interval in Other.__intervals:
-            self.add_interval(interval)
-            # IDEA: hint = self.add_interval(interval, hint)
+        elif not borders or other_borders[0] > borders[-1]:
+            borders.extend(other_borders)
+        elif other_borders[-1] < borders[0]:
+            self.__borders = other_borders + borders
+        elif len(other_borders) == 2:
+            self.__add_range(other_borders[0], other_borders[1])
+        else:
+            self.__borders = _merge(borders, other_borders, _OP_UNION)
 
     def union(self, Other):
         assert Other.__class__ in (Interval, NumberSet), \
                "Error, argument of type %s" % Other.__class__.__name__
 
-        clone = self.clone() 
+        clone = self.clone()
         clone.unite_with(Other)
 
-        return clone            
+        return clone
 
     def has_intersection(self, Other):
-        assert isinstance(Other, (Interval, NumberSet))
-        if   len(self.__intervals) == 0:                                   return False
-        elif Other.__class__ == NumberSet and len(Other.__intervals) == 0: return False
-
-        self_begin = self.__intervals[0].begin
-        self_end   = self.__intervals[-1].end
-        if isinstance(Other, Interval): 
-            assert False, "Try to delete this code, 'Other' shall be NumberSet!"
-            if Other.end   < self_begin: return False
-            if Other.begin > self_end:   return False
-
-            for y in self.__intervals:
-                # PASTE: Implement Interval::overlap() for performance reasons.
-                if   Other.begin >= y.end:   continue
-                elif Other.end   <= y.begin: break
-                # x.end > y.begin  (lacks condition: x.begin < y.end)
-                # y.end > x.begin  (lacks condition: y.begin < x.end)
-                elif Other.begin < y.end or y.begin < Other.end: return True
-
-            return False
-
-        Other_begin = Other.__intervals[0].begin
-        Other_end   = Other.__intervals[-1].end
-        if   Other_end   < self_begin: return False
-        elif Other_begin > self_end:   return False
-
-        for x in Other.__intervals:
-            if   x.end   < self_begin: continue
-            elif x.begin > self_end:   break
-            for y in self.__intervals:
-                # PASTE: Implement Interval::overlap() for performance reasons.
-                if   x.begin >= y.end:   continue
-                elif x.end   <= y.begin: break
-                # x.end > y.begin  (lacks condition: x.begin < y.end)
-                # y.end > x.begin  (lacks condition: y.begin < x.end)
-                elif x.begin < y.end or y.begin < x.end: return True
+        assert isinstance(Other, NumberSet)
+        A = self.__borders
+        B = Other.__borders
+        if   not A or not B:                   return False
+        elif A[-1] <= B[0] or B[-1] <= A[0]:   return False
+        elif len(A) < len(B):                  A, B = B, A
+
+        # Search each interval of the smaller set in the greater set.
+        L = len(A)
+        i = 0
+        for k in range(0, len(B), 2):
+            # 'A[i-1] <= begin < A[i]'
+            i = bisect_right(A, B[k], i)
+            if   i & 1:          return True  # 'begin' is inside 'A'
+            elif i == L:         return False
+            elif A[i] < B[k+1]:  return True  # 'A' starts before 'end'
         return False
 
     def intersect_with(self, Other):
         assert Other.__class__ == Interval or Other.__class__ == NumberSet
 
-        if Other.__class__ == Interval: Other_intervals = [ Other ]
-        else:                           Other_intervals = Other.__intervals
-        
-        if len(Other_intervals) == 0 or len(self.__intervals) == 0:     
-            self.__intervals = []
-            return 
-
-        # For each interval to remain, it needs at least have an intersection
-        # with one of the other intervals. If such an intersection is found the
-        # interval of concern can be pruned appropriately.
-        Other_min_i = 0
-        result = []
-        for x in self.__intervals:
-            for i, y in enumerate(islice(Other_intervals, Other_min_i, None), Other_min_i):
-                if x.end    < y.begin: continue # not yet reached
-                Other_min_i = i
-                if x.begin >= y.end:   continue # overstepped 
-
-                # Here:                    x.end   
-                #                |---------------------------->
-                #                          x.begin
-                #            <-------------------------|
-                #         
-                #         -------|---------------------|--------
-                #             y.begin                y.end
-                begin = max(x.begin, y.begin)
-                end   = min(x.end, y.end)
-                if begin != end: result.append(Interval(begin, end))
-
-        self.__intervals = result
+        if Other.__class__ == Interval:
+            self.mask(Other.begin, Other.end)
+            return
+
+        borders       = self.__borders
+        other_borders = Other.__borders
+        if not borders or not other_borders:
+            self.__borders = []
+        elif len(other_borders) == 2:
+            self.mask(other_borders[0], other_borders[1])
+        else:
+            self.__borders = _merge(borders, other_borders, _OP_INTERSECTION)
 
     def intersection(self, Other):
         assert Other.__class__ == Interval or Other.__class__ == NumberSet
@@ -736,57 +608,34 @@ class NumberSet(object):
         assert Other_type == Interval or Other_type == NumberSet, \
                "Error, argument of type %s" % Other.__class__.__name__
 
-        if Other_type == Interval:  
-            self.cut_interval(Other)
-            return
-
-        if len(self.__intervals) == 0:
+        if Other_type == Interval:
+            self.__cut_range(Other.begin, Other.end)
             return
 
-        if id(self.__intervals) == id(Other.__intervals):
-            self.__intervals = []
+        borders       = self.__borders
+        other_borders = Other.__borders
+        if not borders or not other_borders:
             return
-
-        Begin = self.__intervals[0].begin
-        End   = self.__intervals[-1].end
-        for interval in Other.__intervals:
-            if interval.end   <= Begin: continue
-            if interval.begin >= End:   break
-            self.cut_interval(interval)
+        elif borders is other_borders:
+            self.__borders = []
+        elif len(other_borders) == 2:
+            self.__cut_range(other_borders[0], other_borders[1])
+        else:
+            self.__borders = _merge(borders, other_borders, _OP_DIFFERENCE)
 
     def cut_lesser(self, Begin):
         """Cuts out any range that is below 'Begin'."""
-        for i, x in enumerate(self.__intervals):
-            if x.end > Begin: break
-        else:
-            del self.__intervals[:]
-            return
-
-        # HERE: '__intervals[i]' is the first interval that 
-        #       intersects with 'Begin-oo'
-        if x.begin < Begin: x.begin = Begin
-
-        if i == 0: return
-
-        # Delete all intervals that where skipped.
-        del self.__intervals[:i]
+        borders = self.__borders
+        i = bisect_right(borders, Begin)
+        if i & 1: borders[:i] = (Begin,)
+        else:     del borders[:i]
 
     def cut_greater_or_equal(self, End):
         """Cuts out any range that is above or equal 'End'."""
-        for i, x in r_enumerate(self.__intervals):
-            if x.begin < End: break
-        else:
-            del self.__intervals[:]
-            return
-
-        # HERE: '__intervals[i]' is the first interval that 
-        #       intersects with 'End-oo'
-        if x.end > End: x.end = End
-
-        if i == len(self.__intervals): return
-
-        # Delete all intervals that where skipped.
-        del self.__intervals[i+1:]
+        borders = self.__borders
+        i = bisect_left(borders, End)
+        if i & 1: borders[i:] = (End,)
+        else:     del borders[i:]
 
     def mask(self, Begin, End):
         """Begin = first element in range to include.
@@ -807,175 +656,76 @@ class NumberSet(object):
            [ ][ ][x][x][x][x][x][x][x][ ][ ][ ][ ][ ]
                     '-------------'
                      |              |
-                   Begin           End   
+                   Begin           End
 
            RETURNS: True, if self covers from Begin to End all characters.
                     False, if not.
         """
-        Begin = max(Begin, -INTEGER_MAX)
-        End   = min(End, INTEGER_MAX)
-        if   len(self.__intervals) != 1:        return False
-        elif self.__intervals[0].begin > Begin: return False
-        elif self.__intervals[0].end < End:     return False
-        else:                                   return True
+        Begin   = max(Begin, -INTEGER_MAX)
+        End     = min(End, INTEGER_MAX)
+        borders = self.__borders
+        if   len(borders) != 2:  return False
+        elif borders[0] > Begin: return False
+        elif borders[1] < End:   return False
+        else:                    return True
 
     def cut(self, Value):
-        self.cut_interval(Interval(Value, Value+1))
+        self.__cut_range(Value, Value+1)
 
     def cut_interval(self, CutInterval):
-        """Adds an interval and ensures that no overlap with existing
-        intervals occurs. Note: the 'touch' test is faster here, because
-        only one interval is checked against.!"""
+        """Removes all numbers of 'CutInterval' from the set."""
         assert CutInterval.__class__ == Interval
-        if CutInterval.is_empty(): return
-        
-        # (*) determine if the interval has any intersection at all
-        if    len(self.__intervals) == 0                          \
-           or CutInterval.begin >  self.__intervals[-1].end       \
-           or CutInterval.end   <= self.__intervals[0].begin:
-            # (the cutting interval cannot cut out anything)
-            return
-
-        Y = CutInterval
-        remainder_low = None
-        remainder_up  = None
-        # (*) find the first interval with which the cutting interval intersects.
-        i = -1
-        for x in self.__intervals:
-            i += 1
-            # (1) an intersecting interval is not yet reached
-            if Y.begin >= x.end:    continue                        
-            # (2) an intersecting interval was never reached
-            #     (the cutting interval cannot cut out anything)
-            elif Y.end < x.begin:   return
-            # (3) INTERSECTION (implicit from above conditions)
-            #     the following conditions are not mutually exclusive.
-            #     from now on it is clear that the loop will be left.
-            # (3a) the cut leaves a 'lower interval'
-            if x.begin < Y.begin:   remainder_low = Interval(x.begin, Y.begin)
-            # (3b) the cut leaves an 'upper interval'
-            if x.end > Y.end:       remainder_up  = Interval(Y.end, x.end)
-            # (3c) the interval has been swallowed completely 
-            #      (both remainders stay empty)
-            insertion_index = i
-            break
-
-        # (*) find the last interval that is concerned with the cut
-        toucher_front = i 
-        toucher_back  = i
-
-        if remainder_up is None and i != len(self.__intervals) - 1:
-            for x in self.__intervals[i+1:]:
-                i += 1
-                # (1) last interval was swallowed complety, current interval has no intersection
-                if Y.end <= x.begin: break
-                # (2) INTERSECTION (implicit)
-                toucher_back = i
-                # (2a) last intersecting interval (probably) not yet reached
-                if Y.end > x.end:   continue
-                # (2b) last cutting leaves an upper interval
-                if Y.end < x.end:    
-                    remainder_up  = Interval(Y.end, x.end)
-                    break
-
-        # Delete all intervals that touched the 'cut interval'
-        del self.__intervals[toucher_front:toucher_back+1]
-
-        # insert the upper remainder first, so that it comes after the lower remainder
-        if remainder_up  is not None: self.__intervals.insert(insertion_index, remainder_up)
-        if remainder_low is not None: self.__intervals.insert(insertion_index, remainder_low)
+        self.__cut_range(CutInterval.begin, CutInterval.end)
 
     def difference(self, Other):
         assert Other.__class__ == Interval or Other.__class__ == NumberSet
 
         clone = self.clone()
-
-        if Other.__class__ == Interval: 
-            clone.cut_interval(Other)
-            return clone
-
-        if len(self.__intervals) == 0:
-            return clone
-
-        Begin = self.__intervals[0].begin
-        End   = self.__intervals[-1].end
-        # note: there should be no internal overlaps according to 'add_interval'
-        for interval in Other.__intervals:
-            if interval.end   <= Begin: continue
-            if interval.begin >= End:   break
-            clone.cut_interval(interval)
-
+        clone.subtract(Other)
         return clone
 
     def symmetric_difference(self, Other):
         """Finds the set of numbers that is either in self or in Other but not
-           in both. This corresponds to the operation 
-           
+           in both. This corresponds to the operation
+
                        (self union Other) - (self intersection Other)
 
            EXAMPLE:
 
               A     [--------------]    [-------]      [------------]
               B               [--------------]
-          
+
               A|B   [---------------------------]      [------------]
               A&B             [----]    [----]
               A^B   [--------]     [----]    [--]      [------------]
         """
-        clone0 = self.clone()
-        clone0.unite_with(Other)
-
-        clone1 = self.clone()
-        clone1.intersect_with(Other)
-        
-        clone0.subtract(clone1)
-        return clone0
+        if Other.__class__ == Interval: Other = NumberSet(Other)
+        result = NumberSet()
+        result.__borders = _merge(self.__borders, Other.__borders,
+                                  _OP_SYMMETRIC_DIFFERENCE)
+        return result
 
     def complement(self, UniversalSet):
-        """Transforms self into NumberSet containing all values which are in 
+        """Transforms self into NumberSet containing all values which are in
         UniversalSet but not in self.
         """
-        if len(self.__intervals) == 0:
-            self.__intervals = UniversalSet.get_intervals()
-            return
-
-        first = self.__intervals[0]
-        if first.begin != -INTEGER_MAX:
-            prev = Interval(-INTEGER_MAX, first.begin)
-            self.__intervals.insert(0, prev)
-            i    = 1
-        else:
-            i    = 0
-
-        prev = self.__intervals[i]
-        if i < len(self.__intervals) - 1:
-            for x in islice(self.__intervals, i+i, None):
-                prev.begin = prev.end
-                prev.end   = x.begin
-                prev       = x
-
-        last = self.__intervals[-1]
-        if last.end == INTEGER_MAX:
-            del self.__intervals[-1]
-        else:
-            last.begin = last.end
-            last.end   = INTEGER_MAX
-
-        self.intersect_with(UniversalSet)
+        self.__borders = _merge(UniversalSet.__borders, self.__borders,
+                                _OP_DIFFERENCE)
 
     def get_complement(self, UniversalSet):
         """RETURNS: NumberSet containing all values X which are in UniversalSet
         but not in self.
         """
-        result = self.clone()
-        result.complement(UniversalSet)
+        result = NumberSet()
+        result.__borders = _merge(UniversalSet.__borders, self.__borders,
+                                  _OP_DIFFERENCE)
         return result
-        
+
     @typed(TrafoInfo=list)
     def transform_by_table(self, TrafoInfo):
-        """Transforms the given NumberSet from into a new NumberSet according 
+        """Transforms the given NumberSet from into a new NumberSet according
        to the given TransformationInfo. The TransformationInfo is a list of
-       elements consisting of 
+       elements consisting of
 
        [ SourceInterval_Begin, SourceInterval_End, TargetInterval_Begin ]
 
@@ -984,123 +734,115 @@ class NumberSet(object):
        entries are sorted with respect to SourceInterval_Begin.
 
         RETURNS: True  transformation is complete.
-                 False transformation failed, number set possibly in 
+                 False transformation failed, number set possibly in
                        inconsistent state!
         """
 
         total_verdict = True
         result        = []
-        for interval in self.__intervals:
+        for interval in self.get_intervals():
             verdict, transformed = interval.transform_by_table(TrafoInfo)
             if verdict == False: total_verdict = False
             result.extend(transformed)
-        result.sort(key=lambda x: x.begin)
-        self.__intervals = result
+        self.__borders = _borders_from_intervals(result)
 
-        self.clean()
         return total_verdict
 
     def clean(self, SortF=True):
         """Combines adjacent and intersecting intervals to one.
-        """
-
-        # (2) Combine adjacent intervals
-        L = len(self.__intervals)
-        if L < 2: return
 
-        new_intervals = []
-        i = 0 
-        current = self.__intervals[0]
-        while i < L - 1:
-            i += 1
-            next = self.__intervals[i]
-
-            if current.end < next.begin: 
-                # (1) no intersection?
-                new_intervals.append(current)
-                current = next
-            else:
-                # (2) intersection:  [xxxxxxxxxxxxxxx]
-                #                              [yyyyyyyyyyyyyyyyy]
-                #          becomes   [xxxxxxxxxxxxxxxxxxxxxxxxxxx]
-                #
-                # => do not append interval i + 1, do not consider i + 1
-                if current.end > next.end:
-                    # no adaptions necessary, simply ignore next interval
-                    pass
-                else:
-                    # adapt upper border of current interval to the end of the next
-                    current.end = next.end
-
-        new_intervals.append(current)
-
-        self.__intervals = new_intervals
+        (The border list never contains adjacent or intersecting intervals.
+         The function is kept for compatibility.)
+        """
+        pass
 
     def __repr__(self):
-        return repr(self.__intervals)
+        return repr(self.get_intervals())
 
     def __cmp__(self, Other):
         assert False, "No comparisons defined for class NumberSet"
 
     def get_intervals(self, PromiseToTreatWellF=False):
-        if PromiseToTreatWellF: return self.__intervals
-        else:                   return self.__clone_intervals()
+        """RETURNS: List of 'Interval' objects which describe the set.
+
+        Since the set is not stored in terms of 'Interval'-s the list is
+        always freshly created. 'PromiseToTreatWellF' is without effect.
+        """
+        borders = self.__borders
+        return [
+            Interval(borders[i], borders[i+1]) for i in range(0, len(borders), 2)
+        ]
+
+    def get_border_list(self, PromiseToTreatWellF=False):
+        """RETURNS: Sorted list of borders '[begin_0, end_0, begin_1, end_1, ...]'.
+
+        If 'PromiseToTreatWellF' is set, the internal list is returned, which
+        must not be modified.
+        """
+        if PromiseToTreatWellF: return self.__borders
+        else:                   return self.__borders[:]
+
+    def iterable_interval_borders(self):
+        """YIELDS: (begin, end) for each interval of the set.
+        """
+        borders = self.__borders
+        return zip(islice(borders, 0, None, 2), islice(borders, 1, None, 2))
 
     def get_number_list(self):
-        """RETURNS: -- List of all numbers which are contained in the number set. 
-                    -- INTEGER_MAX borders, if one border is 'INTEGER_MAX'. The list 
+        """RETURNS: -- List of all numbers which are contained in the number set.
+                    -- INTEGER_MAX borders, if one border is 'INTEGER_MAX'. The list
                        would be too big.
         """
-        if   not self.__intervals:                      
+        borders = self.__borders
+        if   not borders:
             return []
-        elif self.__intervals[0].begin == -INTEGER_MAX or self.__intervals[-1].end == INTEGER_MAX: 
+        elif borders[0] == -INTEGER_MAX or borders[-1] == INTEGER_MAX:
             return [-INTEGER_MAX, INTEGER_MAX-1]
 
         return flatten(
-            range(interval.begin, interval.end)
-            for interval in self.__intervals
+            range(begin, end)
+            for begin, end in self.iterable_interval_borders()
         )
 
     def get_the_only_element(self):
-        if   len(self.__intervals) != 1: return None
-        x = self.__intervals[0]
-        if x.end - x.begin != 1: return None
-        else:                    return x.begin
+        borders = self.__borders
+        if   len(borders) != 2:           return None
+        elif borders[1] - borders[0] != 1: return None
+        else:                             return borders[0]
 
     def get_the_only_interval(self):
-        if len(self.__intervals) != 1: return None
-        else:                          return self.__intervals[0]
+        borders = self.__borders
+        if len(borders) != 2: return None
+        else:                 return Interval(borders[0], borders[1])
 
     def get_string(self, Option="", Delimiter=", "):
-        txt = ""
-        if len(self.__intervals) == 0:
+        if not self.__borders:
             return "<empty NumberSet>"
-        for interval in self.__intervals:
-            txt += interval.get_string(Option, Delimiter) + " "
-        return txt
+        return "".join(
+            interval.get_string(Option, Delimiter) + " "
+            for interval in self.get_intervals()
+        )
 
     def get_PythonCode(self):
         interval_txt = ", ".join(
-            "(0x%04X,0x%04X)" % (intv.begin, intv.end)
-            for intv in self.__intervals
+            "(0x%04X,0x%04X)" % (begin, end)
+            for begin, end in self.iterable_interval_borders()
         )
         return "NumberSet.from_tuples([%s])" % interval_txt
 
     def get_utf8_string(self):
-        msg = ""
-        for interval in self.__intervals:
-            msg += interval.get_utf8_string() + ", "
-        if msg != "": msg = msg[:-2]
-        return msg
+        return ", ".join(
+            interval.get_utf8_string() for interval in self.get_intervals()
+        )
 
     def UT_iterable_integers(self):
-        for interval in self.__intervals:
-            for i in interval.UT_iterable_integers():
+        for begin, end in self.iterable_interval_borders():
+            for i in range(begin, end):
                 yield i
 
     def gnuplot_string(self, y_coordinate):
         txt = ""
-        for interval in self.__intervals:
+        for interval in self.get_intervals():
             txt += interval.gnuplot_string(y_coordinate)
             txt += "\n"
         return txt
@@ -1109,12 +851,10 @@ class NumberSet(object):
         """Checks whether all intervals are lined up propperly. That is, they
         do not touch and they are sorted from low to high.
         """
-        if len(self.__intervals) < 2:
-            return
-        prev = self.__intervals[0]
-        for x in self.__intervals[1:]:
-            assert x.begin > prev.end, "%s" % self.__intervals
-            prev = x
+        borders = self.__borders
+        assert len(borders) % 2 == 0, "%s" % borders
+        for i in range(1, len(borders)):
+            assert borders[i-1] < borders[i], "%s" % borders
 
     def assert_range(self, Minimum, Supremum):
         assert self.minimum()  >= Minimum, \
@@ -1122,6 +862,58 @@ class NumberSet(object):
         assert self.least_greater_bound() <= Supremum, \
                "FAIL: %s <= %s" % (self.least_greater_bound(), Supremum)
 
+# Operations on border lists: 'Op[state]' tells whether the result is 'inside'
+# for a 'state' = (inside A) + 2 * (inside B).
+_OP_UNION                = (False, True,  True,  True)
+_OP_INTERSECTION         = (False, False, False, True)
+_OP_DIFFERENCE           = (False, True,  False, False)
+_OP_SYMMETRIC_DIFFERENCE = (False, True,  True,  False)
+
+def _merge(A, B, Op):
+    """RETURNS: Border list of the set resulting from the operation 'Op'
+                on the sets given by the border lists 'A' and 'B'.
+    """
+    result = []
+    La     = len(A)
+    Lb     = len(B)
+    i      = 0
+    k      = 0
+    state  = 0
+    inside = False
+    while i < La and k < Lb:
+        a = A[i]
+        b = B[k]
+        if   a < b: x = a; state ^= 1; i += 1
+        elif b < a: x = b; state ^= 2; k += 1
+        else:       x = a; state ^= 3; i += 1; k += 1
+        if Op[state] != inside:
+            result.append(x)
+            inside = not inside
+
+    # One list is exhausted, i.e. its set is 'outside'. The remaining borders
+    # of the other list appear in the result, if its set alone is 'inside'.
+    if   i < La:
+        if Op[1]: result.extend(islice(A, i, None))
+    elif k < Lb:
+        if Op[2]: result.extend(islice(B, k, None))
+    return result
+
+def _borders_from_intervals(IntervalList):
+    """RETURNS: Border list of the union of all intervals in 'IntervalList'.
+    """
+    return _borders_from_tuples([ (x.begin, x.end) for x in IntervalList ])
+
+def _borders_from_tuples(TupleList):
+    """RETURNS: Border list of the union of all intervals '[begin, end)' 
+                given as tuples '(begin, end)' in 'TupleList'.
+    """
+    result = []
+    for begin, end in sorted(TupleList):
+        if   begin >= end:                    continue
+        elif not result or begin > result[-1]: result.extend((begin, end))
+        elif end > result[-1]:                result[-1] = end
+    return result
+
 # Range of code points that are covered by Unicode
 def UnicodeInterval():
     return Interval(0x0, 0x110000)
@@ -0,0 +1,78 @@
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+"""Minimal perfect hash for a set of lexatom sequences.
+
+The hash follows the 'hash and displace' scheme (CHD). A first hash 'h' of a
+sequence (FNV-1a over its lexatoms) selects a bucket 'h % R'. Each bucket has
+a displacement 'd' which is chosen at generation time, such that
+
+            slot = mix(h ^ d[h % R]) % N
+
+maps the N sequences to distinct slots in [0, N). Displacements are determined
+for buckets in the order of decreasing size, so that large buckets are placed
+while most slots are still free.
+
+The generated code must compute the identical functions with 32 bit unsigned
+integer arithmetic (see 'Lng.KEYWORD_HASH_DISPATCH()').
+
+(C) Frank-Rene Schaefer
+_______________________________________________________________________________
+"""
+FNV_OFFSET       = 2166136261
+FNV_PRIME        = 16777619
+MIX_FACTOR       = 0x9E3779B1
+MIX_SHIFT        = 15
+DISPLACEMENT_MAX = 0xFFFF
+
+_MASK_32         = 0xFFFFFFFF
+
+def first_hash(Sequence):
+    h = FNV_OFFSET
+    for x in Sequence:
+        h = ((h ^ x) * FNV_PRIME) & _MASK_32
+    return h
+
+def slot(H, Displacement, N):
+    x = ((H ^ Displacement) * MIX_FACTOR) & _MASK_32
+    return (x ^ (x >> MIX_SHIFT)) % N
+
+def do(SequenceList):
+    """RETURNS: [0] displacement list--one displacement per bucket.
+                [1] slot list: slot --> index of sequence in 'SequenceList'.
+
+                None, if no perfect hash could be found.
+    """
+    N      = len(SequenceList)
+    h_list = [ first_hash(sequence) for sequence in SequenceList ]
+    if len(set(h_list)) != N: return None   # Collision of the first hash
+
+    for bucket_n in sorted(set([(N + 3) // 4, (N + 1) // 2, N])):
+        result = _find(h_list, bucket_n)
+        if result is not None: return result
+    return None
+
+def _find(HList, BucketN):
+    N           = len(HList)
+    bucket_list = [ [] for i in range(BucketN) ]
+    for i, h in enumerate(HList):
+        bucket_list[h % BucketN].append(i)
+
+    displacement_list = [ 0 ] * BucketN
+    slot_list         = [ None ] * N
+    for b in sorted(range(BucketN), key=lambda b: (- len(bucket_list[b]), b)):
+        bucket = bucket_list[b]
+        if not bucket: break
+        for d in range(DISPLACEMENT_MAX + 1):
+            slot_set = set(slot(HList[i], d, N) for i in bucket)
+            if     len(slot_set) == len(bucket) \
+               and all(slot_list[s] is None for s in slot_set):
+                break
+        else:
+            return None
+
+        displacement_list[b] = d
+        for i in bucket:
+            slot_list[slot(HList[i], d, N)] = i
+
+    return displacement_list, slot_list
@@ -0,0 +1,253 @@
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+# Phase Statistics (command line option '--stats-phases')
+#
+# Measures wall time, CPU time, and peak memory (via 'tracemalloc') for the
+# phases of the generator pipeline. A phase is entered by
+#
+#       with phase_stats.phase("Hopcroft"):
+#           ...
+#
+# or by decorating a function with '@phase_stats.measured("Hopcroft")'.
+# Measurements are recorded per (phase, mode, pattern). Mode and pattern are
+# either given explicitly, or inherited from enclosing phases, or from an
+# enclosing 'phase_stats.context(Mode=..., Pattern=...)'.
+#
+# Phases may be nested. The 'wall' time of a phase includes the time of nested
+# phases; the 'self' time excludes it. If a phase is entered while it is
+# already active (recursion), only the outermost occurrence is recorded.
+#
+# If the statistics are not enabled, all functions are close to no-ops.
+#_______________________________________________________________________________
+from   contextlib import contextmanager
+import functools
+import json
+import time
+import tracemalloc
+
+# Phase names in pipeline order.
+PHASE_LIST = [
+    "file parsing",
+    "regex snapping",
+    "NFA to DFA",
+    "Hopcroft",
+    "encoding transformation",
+    "trace analysis",
+    "mega-state analysis",
+    "code emission",
+    "source package copy",
+]
+
+class _Record:
+    __slots__ = ("call_n", "wall", "self_wall", "cpu", "peak")
+    def __init__(self):
+        self.call_n    = 0
+        self.wall      = 0.0
+        self.self_wall = 0.0
+        self.cpu       = 0.0
+        self.peak      = 0
+
+    def add(self, Other):
+        self.call_n    += Other.call_n
+        self.wall      += Other.wall
+        self.self_wall += Other.self_wall
+        self.cpu       += Other.cpu
+        self.peak       = max(self.peak, Other.peak)
+
+class _Frame:
+    __slots__ = ("name", "mode", "pattern", "recorded_f",
+                 "wall_0", "cpu_0", "child_wall", "peak")
+    def __init__(self, Name, Mode, Pattern, RecordedF):
+        self.name       = Name
+        self.mode       = Mode
+        self.pattern    = Pattern
+        self.recorded_f = RecordedF
+        self.wall_0     = time.perf_counter()
+        self.cpu_0      = time.process_time()
+        self.child_wall = 0.0
+        self.peak       = 0
+
+_enabled_f = False
+_stack     = []
+_record_db = {}   # (phase, mode, pattern) --> _Record
+
+def enable():
+    global _enabled_f
+    _enabled_f = True
+    if not tracemalloc.is_tracing(): tracemalloc.start()
+
+def is_enabled():
+    return _enabled_f
+
+def reset():
+    """Deletes all records (but keeps the currently active phases)."""
+    _record_db.clear()
+
+@contextmanager
+def _null_context():
+    yield
+
+def phase(Name, Mode=None, Pattern=None):
+    """RETURNS: Context manager that measures the phase 'Name'."""
+    if not _enabled_f: return _null_context()
+    else:              return _phase(Name, Mode, Pattern)
+
+def context(Mode=None, Pattern=None):
+    """RETURNS: Context manager that attributes all phases inside to the
+                given 'Mode' and/or 'Pattern'. Nothing is measured.
+    """
+    if not _enabled_f: return _null_context()
+    else:              return _phase(None, Mode, Pattern)
+
+def measured(Name):
+    """Decorator: each call to the decorated function is measured as phase
+    'Name'.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled_f: return function(*args, **kwargs)
+            with _phase(Name, None, None):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+@contextmanager
+def _phase(Name, Mode, Pattern):
+    outer = _stack[-1] if _stack else None
+    if outer is not None:
+        if Mode    is None: Mode    = outer.mode
+        if Pattern is None: Pattern = outer.pattern
+
+    recorded_f = Name is not None and all(f.name != Name for f in _stack)
+    _fold_peak()
+    frame = _Frame(Name, Mode, Pattern, recorded_f)
+    _stack.append(frame)
+    try:
+        yield frame
+    finally:
+        _fold_peak()
+        _stack.pop()
+        if recorded_f: _record(frame)
+
+def _record(frame):
+    wall = time.perf_counter() - frame.wall_0
+    cpu  = time.process_time() - frame.cpu_0
+
+    record = _record_db.get((frame.name, frame.mode, frame.pattern))
+    if record is None:
+        record = _Record()
+        _record_db[(frame.name, frame.mode, frame.pattern)] = record
+    record.call_n    += 1
+    record.wall      += wall
+    record.self_wall += wall - frame.child_wall
+    record.cpu       += cpu
+    record.peak       = max(record.peak, frame.peak)
+
+    # The time of this phase is not 'self time' of the enclosing phase.
+    for outer in reversed(_stack):
+        if outer.recorded_f: outer.child_wall += wall; break
+
+def _fold_peak():
+    """Passes the peak of traced memory since the last call to all active
+    phases. Then, the peak is reset, so that it can be determined for the
+    time until the next call.
+    """
+    if not tracemalloc.is_tracing(): return
+    dummy, peak = tracemalloc.get_traced_memory()
+    for frame in _stack:
+        if peak > frame.peak: frame.peak = peak
+    if hasattr(tracemalloc, "reset_peak"): tracemalloc.reset_peak()
+
+def export():
+    """RETURNS: Records in a form that can be passed between processes and
+                entered via 'merge()'.
+    """
+    return [
+        (key, (r.call_n, r.wall, r.self_wall, r.cpu, r.peak))
+        for key, r in _record_db.items()
+    ]
+
+def merge(ExportedList):
+    for key, values in ExportedList:
+        other = _Record()
+        other.call_n, other.wall, other.self_wall, other.cpu, other.peak = values
+        record = _record_db.get(key)
+        if record is None: _record_db[key] = other
+        else:              record.add(other)
+
+def get_db():
+    """RETURNS: Dictionary with the lists 'phases', 'modes', and 'patterns'.
+                Each list contains dictionaries with the measurements of a
+                phase in total, per mode, and per pattern, respectively.
+    """
+    def entry(record, **kw):
+        kw.update(calls       = record.call_n,
+                  wall_s      = round(record.wall, 6),
+                  self_wall_s = round(record.self_wall, 6),
+                  cpu_s       = round(record.cpu, 6),
+                  peak_bytes  = record.peak)
+        return kw
+
+    def accumulate(KeyFunction):
+        db = {}
+        for key, record in _record_db.items():
+            new_key = KeyFunction(key)
+            if new_key is None: continue
+            db.setdefault(new_key, _Record()).add(record)
+        return db
+
+    def order(Key):
+        # Key = (phase, [mode, [pattern]]): sort by mode, then phase.
+        name = Key[0]
+        return (tuple(str(x) for x in Key[1:]),
+                PHASE_LIST.index(name) if name in PHASE_LIST else len(PHASE_LIST),
+                name)
+
+    phase_db   = accumulate(lambda key: (key[0],))
+    mode_db    = accumulate(lambda key: (key[0], key[1]) if key[1] is not None else None)
+    pattern_db = accumulate(lambda key: key if key[2] is not None else None)
+
+    return {
+        "phases":   [ entry(phase_db[k], phase=k[0])
+                      for k in sorted(phase_db, key=order) ],
+        "modes":    [ entry(mode_db[k], phase=k[0], mode=k[1])
+                      for k in sorted(mode_db, key=order) ],
+        "patterns": [ entry(pattern_db[k], phase=k[0], mode=k[1], pattern=k[2])
+                      for k in sorted(pattern_db, key=order) ],
+    }
+
+def report(JsonFileName, PatternN=20):
+    """Prints the statistics as table and writes them as JSON into the file
+    'JsonFileName'.
+    """
+    db = get_db()
+    with open(JsonFileName, "w") as fh:
+        json.dump(db, fh, indent=1)
+
+    def line(Name, E):
+        return "%-44s %7i %10.3f %10.3f %10.3f %10.1f" \
+               % (Name[:44], E["calls"], E["wall_s"], E["self_wall_s"], E["cpu_s"],
+                  E["peak_bytes"] / 1024.0 / 1024.0)
+
+    header = "%-44s %7s %10s %10s %10s %10s" \
+             % ("phase", "calls", "wall[s]", "self[s]", "cpu[s]", "peak[MB]")
+    txt = [ header, "-" * len(header) ]
+    txt.extend(line(e["phase"], e) for e in db["phases"])
+
+    if db["modes"]:
+        txt.extend(["", "per mode:", header, "-" * len(header)])
+        txt.extend(line("%s: %s" % (e["mode"], e["phase"]), e) for e in db["modes"])
+
+    if db["patterns"]:
+        slowest = sorted(db["patterns"], key=lambda e: e["wall_s"], reverse=True)[:PatternN]
+        txt.extend(["", "per pattern (%i slowest of %i):" % (len(slowest), len(db["patterns"])),
+                    header, "-" * len(header)])
+        for e in slowest:
+            txt.append(line("%s" % e["pattern"], e))
+            txt.append("    (%s%s)" % (e["phase"], ", mode %s" % e["mode"] if e["mode"] else ""))
+
+    txt.extend(["", "(wall time includes nested phases, self time excludes them)",
+                "JSON: %s" % JsonFileName])
+    print("\n".join(txt))
@@ -1,9 +1,14 @@
 # Project Quex (http://quex.sourceforge.net); License: MIT;
 # (C) 2005-2020 Frank-Rene Schaefer; 
 #_______________________________________________________________________________
-from   quex.input.code.base   import SourceRef
-from   quex.engine.counter    import CountActionMap
-from   quex.engine.misc.tools import typed
+from   quex.input.code.base                      import SourceRef
+from   quex.engine.counter                       import CountActionMap
+from   quex.engine.analyzer.door_id_address_label import DialDB
+import quex.engine.state_machine.index           as     sm_index
+import quex.engine.misc.error                    as     error
+from   quex.engine.misc.tools                    import typed
+
+from   contextlib import contextmanager
 
 class BasicMode:
     """Very basic information about a 'Mode'. Basically, only use the 
@@ -79,7 +84,7 @@ class Mode(BasicMode):
     def __init__(self, Name, Sr, 
                  PatternList, TerminalDb, ExtraAnalyzerList, IncidenceDb,
                  CaMap4RunTimeCounter, ReloadStateForward, RequiredRegisterSet,
-                 dial_db, Documentation, IndentationHandlingF):
+                 dial_db, Documentation, IndentationHandlingF, TheIndexRange=None):
         """Information about a lexical analyzer mode:
         
            Name:        Name of the mode.
@@ -109,6 +114,9 @@ class Mode(BasicMode):
                                addresses.
 
         Documentation: Contains information about entry, exit, and base mode names.
+
+        TheIndexRange: Range of state indices for the mode's code generation.
+                       None, if not generated with '--incremental'.
         """
         assert all(p.incidence_id in TerminalDb for p in PatternList)
 
@@ -127,6 +135,7 @@ class Mode(BasicMode):
         self.ca_map_for_run_time_counter = CaMap4RunTimeCounter # None, if not counter required.
         self.reload_state_forward        = ReloadStateForward
         self.required_register_set       = RequiredRegisterSet
+        self.index_range                 = TheIndexRange
 
         self.__indentation_handling_f    = IndentationHandlingF
 
@@ -145,3 +154,59 @@ class Mode(BasicMode):
         assert self.documentation.base_mode_name_sequence[-1] == self.name
         return self.documentation.base_mode_name_sequence
 
+
+class IndexRange:
+    """Range of state indices and state machine ids from which all allocations
+    on behalf of a particular mode are made (command line option 
+    '--incremental'). The range is determined by the position of the mode's
+    definition. Range 0 is left for allocations outside of modes. Addresses
+    only need to be unique inside a mode's analyzer function, so they start
+    from zero for each mode.
+
+    The state indices and ids in the code of a mode, thus, do not depend on 
+    the content of other modes. The range is entered during parsing, building,
+    and code generation of the mode (see 'index_range_entered()'), where 
+    allocation continues where it stopped the last time.
+    """
+    STATE_INDEX_N      = 1 << 24
+    STATE_MACHINE_ID_N = 1 << 20
+
+    def __init__(self, Name, Ordinal):
+        k = Ordinal + 1
+        self.mode_name = Name
+        self.end       = ((k + 1) * IndexRange.STATE_INDEX_N, 
+                          (k + 1) * IndexRange.STATE_MACHINE_ID_N)
+        self.next      = (k * IndexRange.STATE_INDEX_N, 
+                          k * IndexRange.STATE_MACHINE_ID_N, 
+                          0)
+
+@contextmanager
+def index_range_entered(TheIndexRange):
+    """Allocations of state indices, state machine ids, and addresses inside
+    the context happen in 'TheIndexRange'. If it is None, the current counters
+    are used.
+    """
+    if TheIndexRange is None: 
+        yield
+        return
+
+    outer = (sm_index.snapshot(), DialDB.address_counter_snapshot())
+    if    outer[0][0] >= IndexRange.STATE_INDEX_N \
+       or outer[0][1] >= IndexRange.STATE_MACHINE_ID_N:
+        error.log("Definitions outside modes exceed the range of state indices for\n" + \
+                  "incremental generation. Generate without '--incremental'.")
+
+    sm_index.restore(TheIndexRange.next[:2])
+    DialDB.address_counter_restore(TheIndexRange.next[2])
+    try:
+        yield
+    finally:
+        TheIndexRange.next = sm_index.snapshot() + (DialDB.address_counter_snapshot(),)
+        sm_index.restore(outer[0])
+        DialDB.address_counter_restore(outer[1])
+
+    if    TheIndexRange.next[0] >= TheIndexRange.end[0] \
+       or TheIndexRange.next[1] >= TheIndexRange.end[1]:
+        error.log("Mode '%s' exceeds the range of state indices for incremental\n" \
+                  % TheIndexRange.mode_name + \
+                  "generation. Generate without '--incremental'.")
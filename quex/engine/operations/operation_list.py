@@ -191,6 +191,11 @@ class Op(namedtuple("Op_tuple", ("id", "content", "my_hash", "branch_f"))):
     def InputPDereference():
         return Op(E_Op.InputPDereference)
     
+    @staticmethod
+    def InputPSkipCharacterSet(IntervalTuple):
+        """IntervalTuple: tuple of (begin, end) of the lexatoms to be skipped."""
+        return Op(E_Op.InputPSkipCharacterSet, IntervalTuple)
+
     @staticmethod
     def LexemeResetTerminatingZero():
         return Op(E_Op.LexemeResetTerminatingZero)
@@ -535,6 +540,7 @@ def __configure():
                                               (E_R.PreContextFlags, r), (E_R.PositionRegister, r), (E_R.ThreadOfControl, w), 
                                               (E_R.InputP, r+w))
     c(E_Op.InputPDereference,                None, (E_R.InputP,r), (E_R.Input,w))
+    c(E_Op.InputPSkipCharacterSet,           ("interval_tuple",), (E_R.InputP,r+w), (E_R.Buffer,r))
     c(E_Op.Decrement,                        ("register",), (0,r+w))
     c(E_Op.Increment,                        ("register",), (0,r+w))
     #
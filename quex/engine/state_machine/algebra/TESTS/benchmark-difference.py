@@ -0,0 +1,95 @@
+#! /usr/bin/env python
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+# Benchmark for '\Diff', '\SymDiff', and disjointness checks.
+#
+# USAGE:  benchmark-difference.py
+#
+# Compares the product construction in 'difference', 'symmetric_difference',
+# and 'is_disjoint' against the composition of other algebraic operations:
+#
+#    difference(A, B)           = intersection(A, complement(intersection(A, B)))
+#    symmetric_difference(A, B) = difference(union(A, B), intersection(A, B))
+#    is_disjoint(A, B)          = intersection(A, B) has no acceptance state
+#
+# The results of both implementations are checked for identity.
+#_______________________________________________________________________________
+import os
+import sys
+sys.path.insert(0, os.environ["QUEX_PATH"])
+
+import quex.input.regular_expression.engine                   as regex
+from   quex.engine.state_machine.algebra.intersection         import do as intersection
+from   quex.engine.state_machine.algebra.complement           import do as complement
+from   quex.engine.state_machine.algebra.union                import do as union
+import quex.engine.state_machine.algebra.difference           as difference
+import quex.engine.state_machine.algebra.symmetric_difference as symmetric_difference
+import quex.engine.state_machine.algebra.is_disjoint          as is_disjoint
+import quex.engine.state_machine.algorithm.beautifier         as beautifier
+from   quex.engine.state_machine.check.identity               import do as identity
+
+import time
+
+PAIR_LIST = [
+    ('[a-z]+',                    '"for"|"while"|"if"'),
+    ('[0-9]+("."[0-9]+)?',        '[0-5]+'),
+    ('\\P{ID_Start}\\P{ID_Continue}*', '[a-z]+'),
+    ('\\P{Script=Greek}+x',       '\\P{Alphabetic}+'),
+    ('(\\P{Math}|\\P{Dash})+',     '\\P{Script=Latin}+'),
+    ('"/*"([^*]|"*"+[^*/])*"*"+"/"', '"/*"[a-z]*"*/"'),
+    ('([a-z]{1,6}"_"){1,4}',      '[a-z]+"_"[a-z]+"_"'),
+]
+
+def dfa(Str):
+    return regex.do(Str, {}, AllowNothingIsNecessaryF=True).extract_sm()
+
+def composed_difference(A, B):
+    return intersection([A, complement(intersection([A, B]))])
+
+def composed_symmetric_difference(A, B):
+    return composed_difference(union([A, B]), intersection([A, B]))
+
+def composed_is_disjoint(A, B):
+    if A.is_Empty() or B.is_Empty(): return True
+    return not any(state.is_acceptance()
+                   for state in intersection([A, B]).states.values())
+
+def measure(Function, A, B):
+    """RETURNS: [0] result of 'Function(A, B)'
+                [1] time in milliseconds
+    """
+    repeat_n = 3
+    best     = None
+    for i in range(repeat_n):
+        a, b   = A.clone(), B.clone()
+        t0     = time.perf_counter()
+        result = Function(a, b)
+        t      = time.perf_counter() - t0
+        if best is None or t < best: best = t
+    return result, best * 1e3
+
+def is_same(X, Y):
+    if isinstance(X, bool): return X == Y
+    return identity(beautifier.do(X), beautifier.do(Y))
+
+def main():
+    operation_list = [
+        ("difference",           difference.do, composed_difference),
+        ("symmetric_difference", lambda A, B: symmetric_difference.do([A, B]),
+                                 composed_symmetric_difference),
+        ("is_disjoint",          is_disjoint.do, composed_is_disjoint),
+    ]
+    print("%-22s %-34s %12s %12s %8s" % ("operation", "A", "composed[ms]", "product[ms]", "ratio"))
+    for a_str, b_str in PAIR_LIST:
+        A, B = dfa(a_str), dfa(b_str)
+        for name, product_function, composed_function in operation_list:
+            result_c, time_c = measure(composed_function, A, B)
+            result_p, time_p = measure(product_function, A, B)
+            txt = "%-22s %-34s %12.3f %12.3f %8.2f" \
+                  % (name, a_str[:34], time_c, time_p, time_c / time_p)
+            if not is_same(result_c, result_p): txt += "   RESULTS DIFFER"
+            print(txt)
+
+if __name__ == "__main__":
+    main()
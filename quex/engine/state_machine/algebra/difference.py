@@ -1,12 +1,15 @@
 # Project Quex (http://quex.sourceforge.net); License: MIT;
 # (C) 2005-2020 Frank-Rene Schaefer; 
 #_______________________________________________________________________________
-import quex.engine.state_machine.algebra.intersection as intersection
-import quex.engine.state_machine.algebra.complement   as complement
+import quex.engine.state_machine.algebra.product as product
 
 def do(A, B): 
-    A_and_B     = intersection.do([A, B])
-    not_A_and_B = complement.do(A_and_B)
+    """RETURNS: DFA that matches what is matched by 'A' but not by 'B'.
 
-    # Difference: It only remains in A what is not in A and B.
-    return intersection.do([A, not_A_and_B])
+    A product construction walks along 'A' and 'B' in parallel. If 'B' drops
+    out, the walk continues on 'A' alone. If 'A' drops out, nothing can be 
+    matched anymore.
+    """
+    return product.do([A, B], 
+                      AcceptanceF         = lambda Flags: Flags[0] and not Flags[1],
+                      DropOutTolerantList = (False, True))
@@ -0,0 +1,107 @@
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+"""Product Construction:
+
+      .-------------------------------------------------------------.
+      | A DFA that walks along multiple DFAs in parallel. Whether   |
+      | it accepts is a boolean function of whether the DFAs accept.|
+      '-------------------------------------------------------------'
+
+A state of the product is a 'state setup', i.e. a tuple where
+
+        state_setup[i] = state of 'SM_List[i]' or None
+
+'None' stands for a DFA that has dropped out. Only state setups that are
+reachable from the initial state setup are constructed. With
+
+        all(flags)                    --> intersection
+        flags[0] and not flags[1]     --> difference
+        any(flags) and not all(flags) --> symmetric difference
+
+the product directly implements the algebraic operations, without the
+detour over complements.
+
+(C) 2020 Frank-Rene Schaefer
+___________________________________________________________________________
+"""
+from   quex.engine.state_machine.core                 import DFA
+from   quex.engine.state_machine.state.target_map     import TargetMap
+from   quex.engine.state_machine.state.target_map_ops import get_intersection_line_up_2
+from   quex.engine.state_machine.algebra.intersection import state_index_for_combination
+
+def do(SM_List, AcceptanceF, DropOutTolerantList):
+    """SM_List:             DFAs to be walked in parallel.
+    AcceptanceF:         Function: tuple of acceptance flags --> bool
+                         The flag of a DFA that dropped out is False.
+    DropOutTolerantList: DropOutTolerantList[i] = True, if the product may
+                         continue after 'SM_List[i]' dropped out. If False,
+                         the product drops out together with 'SM_List[i]'.
+
+    A DFA must only be drop-out intolerant, if no lexeme can be accepted
+    after it dropped out.
+
+    RETURNS: DFA implementing the product.
+    """
+    for sm in SM_List:
+        sm.assert_consistency()
+
+    init_state_setup = tuple(sm.init_state_index for sm in SM_List)
+    result           = DFA(AcceptanceF=_acceptance(init_state_setup, SM_List, AcceptanceF))
+
+    worklist       = [ (result.init_state_index, init_state_setup) ]
+    state_setup_db = { init_state_setup: result.init_state_index }
+    void_map       = TargetMap()
+    while worklist:
+        state_index, state_setup = worklist.pop()
+
+        # Line-up of target state setups, where 'None' indicates a drop-out:
+        #
+        #       NumberSet    Target DFA_State Combination
+        #       [0:23]   --> [ State1, State24, None    ]
+        #       [24:60]  --> [ State1, None,    State51 ]
+        #
+        for target_state_setup, trigger_set in _line_up(state_setup, SM_List, void_map):
+            if not all(target_si is not None or DropOutTolerantList[i]
+                       for i, target_si in enumerate(target_state_setup)):
+                continue
+            elif all(target_si is None for target_si in target_state_setup):
+                continue
+
+            target_index, new_f = state_index_for_combination(state_setup_db,
+                                                              target_state_setup)
+
+            acceptance_f = _acceptance(target_state_setup, SM_List, AcceptanceF)
+            result.add_transition(state_index, trigger_set, target_index,
+                                  AcceptanceF = acceptance_f)
+
+            if new_f:
+                worklist.append((target_index, target_state_setup))
+
+    result.delete_hopeless_states()
+    return result
+
+def _line_up(StateSetup, SM_List, VoidMap):
+    """YIELDS: (target state setup, trigger set)
+
+    If only one DFA is left, its transitions are taken over (cloned).
+    """
+    alive_list = [ i for i, si in enumerate(StateSetup) if si is not None ]
+    if len(alive_list) == 1:
+        i            = alive_list[0]
+        target_setup = [ None ] * len(StateSetup)
+        for target_si, trigger_set in SM_List[i].states[StateSetup[i]].target_map.get_map().items():
+            target_setup[i] = target_si
+            yield tuple(target_setup), trigger_set.clone()
+        return
+
+    target_map_list = [
+        SM_List[i].states[si].target_map if si is not None else VoidMap
+        for i, si in enumerate(StateSetup)
+    ]
+    for target_setup, trigger_set in get_intersection_line_up_2(target_map_list):
+        yield target_setup, trigger_set
+
+def _acceptance(StateSetup, SM_List, AcceptanceF):
+    return AcceptanceF(tuple(si is not None and SM_List[i].states[si].is_acceptance()
+                             for i, si in enumerate(StateSetup)))
@@ -1,21 +1,20 @@
 # Project Quex (http://quex.sourceforge.net); License: MIT;
 # (C) 2005-2020 Frank-Rene Schaefer; 
 #_______________________________________________________________________________
-import quex.engine.state_machine.algebra.union        as union
-import quex.engine.state_machine.algebra.intersection as intersection
-import quex.engine.state_machine.algebra.difference   as difference
+import quex.engine.state_machine.algebra.product as product
 
 def do(SM_List):
-    """Result: A state machine that matches what is matched by one of the
-               state machines but by no other.
+    """Result: A state machine that matches what is matched by some of the
+               state machines, but not by all of them.
 
        Formula:
 
                        difference(union(All), intersection(All))
 
+       The formula is implemented by a single product construction which walks
+       along all state machines in parallel.
     """
-    # Difference: It only remains in A what is not in A and B.
-    tmp0 = union.do(SM_List)
-    tmp1 = intersection.do(SM_List)
-    return difference.do(tmp0, tmp1)
+    return product.do(SM_List, 
+                      AcceptanceF         = lambda Flags: any(Flags) and not all(Flags),
+                      DropOutTolerantList = (True,) * len(SM_List))
 
@@ -3,7 +3,8 @@
 #_______________________________________________________________________________
 # (C) 2005-2011 Frank-Rene Schaefer
 import quex.engine.state_machine.index as state_machine_index
-from   itertools   import islice, chain
+import quex.engine.misc.phase_stats    as phase_stats
+from   quex.engine.misc.interval_handling import NumberSet
 from   collections import defaultdict
 
 class HopcroftMinization:
@@ -28,250 +29,68 @@ class HopcroftMinization:
         
                     http://en.wikipedia.org/wiki/DFA_minimization
 
-        The algorithm below adapted the hopcroft algorithm in order to cope
-        with the large trigger sets.
+        (1) Initial Split _____________________________________________________
 
-        (1) Basic Idea of Hopcroft Minimization _______________________________
+            States that must never be combined are separated by their
+            'hopcroft_combinability_key()' (acceptance, pre-contexts, ...).
+            A virtual 'sink' state forms a set of its own. All transitions
+            that are not present in the DFA lead to the sink. Thus, the
+            DFA is complete and two states are distinguished if one of them
+            has a transition where the other has none.
 
-            (i) Define the initial state sets:
+        (2) Refinement ________________________________________________________
 
-                States that accept patterns --> each in the corresponding acceptance state set
-                Non-acceptance states       --> all together in one state set.
+            A 'splitter' is a state set taken from the 'to do' list. For each
+            state 'p' that triggers into the splitter, the 'inverse index'
+            delivers the trigger set on which 'p' enters the splitter. States
+            of a state set that enter the splitter on different trigger sets
+            (or not at all) cannot be equivalent. The state set is split
+            accordingly, i.e. possibly into more than two parts.
 
-                All states are marked 'to do', i.e. to be considered.
+            When a state set is split that is not on the 'to do' list, all
+            parts except the largest one are added to the 'to do' list. If
+            it is on the 'to do' list, all parts are added.
 
-            (ii) Loop over all 'to do' state sets:
+            Only predecessors of the splitter are considered. Since each
+            state enters the 'to do' list at most log(N) times as member of a
+            splitter, the effort is O(T * log(N)) set operations for T
+            transitions and N states.
 
-                 if all states in a state set trigger to the same target state sets,
-                 then they are equivalent. 
+        The trigger sets of the predecessors take the role of the single
+        characters of the alphabet in the textbook algorithm. Splitting by
+        the trigger set on which a state enters the splitter is equivalent to
+        splitting by every character of the alphabet at once.
 
-                 if then, the target state set is 'done', the state set can be 
-                 considered done. (done = delete from 'to do').
-
-                 if not, the state set needs to be split. Add the new one to to do list.
-
-             (iii) Goto (ii) until to do list is empty.
-
-
-        (2) Frank-Rene Schaefer's Adaptations _________________________________
-
-        In many cases, already the difference in target_sets reveals that a
-        state set needs to be split. The term 'homogenous' is defined for the
-        algorithm below:
-
-             homogenous: A state set is homogenous, if and only if all states in the
-                         state set trigger to target states that belong to the
-                         same state set.
-
-        The split is then separated into two repeated phases:
-
-                 (1) Split until all non-homogenous state sets disappear.
-                 (2) Split all states in the current to do list.
-                 Repeat
+        In the result, the state sets in 'state_set_list' and the states in
+        each state set appear in the order of 'DFA.states'.
     """
     def __init__(self, DFA):
         self.sm = DFA
 
-        # (*) Helper Mappings:
-        #     map: state index --> index of the state set that contains it
-        self.map = {} 
-        #    from_map: target index --> from what states the target state is entered
-        self.from_map = dict([(i, []) for i in self.sm.states.keys()])
+        # (*) Inverse index:
+        #     map: target index --> list of (origin index, trigger set)
+        #     The 'sink' (index None) is entered from every state. Instead
+        #     of the complement, the union of all trigger sets is used. Two 
+        #     states have the same complement, if and only if they have the
+        #     same union.
+        self.from_map = dict((i, []) for i in self.sm.states.keys())
+        sink_from_list = []
         for origin_index, state in self.sm.states.items():
-            for target_index in state.target_map.get_map().keys():
-                self.from_map[target_index].append(origin_index)
-        #    to_map: state_index --> list of target states
-        self.to_map = dict([(i, self.sm.states[i].target_map.get_map()) for i in list(self.sm.states.keys())])
-
-        # (*) Initial split 
-        #     --> initial state_set_list
-        self.__todo           = set([])  # state sets to be investigated
-        self.__non_homogenous = set([])  # suspects to trigger to different target state sets
+            for target_index, trigger_set in state.target_map.get_map().items():
+                self.from_map[target_index].append((origin_index, trigger_set))
+            sink_from_list.append((origin_index, 
+                                   state.target_map.get_trigger_set_union()))
+        self.from_map[None] = sink_from_list
+
+        # (*) map: state index --> index of the state set that contains it
+        self.map            = {}
         self.state_set_list = []
-        self.initial_split()
+        self.__todo         = []  # state set indices to be used as splitter
+        self.__todo_set     = set()
 
-        # (*) Run Adapted Hopcroft Minimization
-        #     Split until only equivalent state sets are present
+        self.initial_split()
         self.run()
-
-    def run(self):
-        # It is conceivable (and appears in practise) that target state sets 
-        # which are undone point to each other in loops. Therefore, they can never
-        # be marked undone. Check against this by means of a change flag.
-        change_f = True
-        while len(self.__todo) != 0 and change_f:
-            # (A) Phase: Split all state sets that are non-homogenous, 
-            #            i.e. trigger to different target state sets.
-            while len(self.__non_homogenous) != 0:
-                for i in list(self.__non_homogenous):
-                    self.pre_split(i)
-
-            # (B) Phase: Split all state sets (which are 'homogenous')
-            #            if they trigger to target state sets with different trigger sets.
-            change_f = False
-            for i in list(sorted(self.__todo, key=lambda i: len(self.state_set_list[i]), reverse=True)): 
-                # (See also below after split()) 
-                # if i in self.__non_homogenous: continue
-
-                if self.split(i): 
-                    change_f = True           
-                    # Without a split, there can be no new non-homogenous anyway.
-                    if len(self.__non_homogenous) != 0: break
-
-            # Double Check: All non-homogenouss must be on todo-list.
-            assert self.__non_homogenous.issubset(self.__todo)
-            
-    def pre_split(self, StateSetIndex):
-        """Separate state_set into two state sets:
-
-           (1) The set of states that have the same target state sets,
-               as a arbitrarily chosen prototype := 'homogenous'.
-           (2) Those who differ from the prototype.
-
-           The state set that matches the prototype can be considered 
-           'homogenous' since it triggers for sure to the same target
-           state sets. The prototype is packed into a separate state
-           set. The other states remain in the old state set. 
-
-           If there was a prototype that separated the set then the
-           what does not match the prototype is possibly not-homogenous.
-
-           RETURNS: True  Split happened.
-                          The old state set is possible non-homogenous.
-                    False No split happened.
-                          The old state set and the prototype are
-                          identical.
-        """
-        assert StateSetIndex in self.__todo
-        assert StateSetIndex in self.__non_homogenous
-        state_set = self.state_set_list[StateSetIndex]
-        assert len(state_set) > 1
-
-        # NOTE: Previous experiments have shown, that the split does **not** become
-        #       faster, if all non-homogenous states are identified at once. The overhead
-        #       of the book-keeping is much higher than the benefit. Also, statistics
-        #       have shown that a very large majority of cases results in one or two
-        #       state sets only.
-
-        def get_target_state_set_list(StateIndex):
-            target_list = iter(self.to_map[StateIndex].keys())
-            return set(self.map[i] for i in target_list)
-
-        state_set = self.state_set_list[StateSetIndex]
-        prototype = get_target_state_set_list(state_set[0])
-
-        match_set = [ state_set[0] ] 
-        for state_index in islice(state_set, 1, None):
-            if prototype == get_target_state_set_list(state_index): 
-                match_set.append(state_index)
-
-        # NOW: match_set = homogenous
-        #      remainder = possibly not homogenous
-
-        # To split, or not to split ...
-        if len(match_set) == len(state_set): 
-            self.non_homogenous_remove(StateSetIndex)
-            return False 
-
-        # The match set is now extracted from the original state set
-
-        # -- Delete all states that are put into other sets from the original state set
-        # -- Add the new set to the state_set_list
-        # -- Sets of size == 1: 1. are homogenous (trigger all to the same target state sets).
-        #                       2. cannot be split further => done.
-        self.__extract(StateSetIndex, state_set, match_set)
-        # (by default, the new set is not added to non_homogenous, which is true.)
-
-        # -- Neither the new, nor the old state set can be labeled as 'done' because
-        #    the exact transitions have not been investigated, yet. The only exception
-        #    if len(state_set) == 1, because then it cannot be split anyway.
-        #    if len(match_set) == 1, it is not added to the todo list by __add_state_set().
-        # -- Again, even if the target state sets of the prototype is 'done' it is
-        #    not guaranteed, that all states in the matching set transit on the same
-        #    transitions to the done target sets.
-        if len(state_set) == 1: 
-            self.non_homogenous_remove(StateSetIndex)
-            self.todo_remove(StateSetIndex)
-
-        # -- The state set is split, thus state sets triggering to it may be non-homogenous
-        #    (this may include recursive states, so this has to come after anything above)
-        self.__check_nh_dependencies(chain(match_set, state_set))
-
-    def split(self, StateSetIndex):
-        """RETURNS:  False   if StateSet does not need to be split up any further.
-                     True    if the state set requires a split.
-        """
-        pass#assert StateSetIndex in self.__todo
-        state_set = self.state_set_list[StateSetIndex]
-        #
-        N         = len(state_set)
-        pass#assert N != 0, "DFA_State set of size '0'. List = " + repr(self.state_set_list)
-        # only one state in state set => no change possible
-        if N == 1: 
-            self.todo_remove(StateSetIndex)
-            return False    
-
-        def normalized_map(DB):
-            result = {}
-            for target_index, trigger_map in DB.items():
-                # Target in terms of equivalent state sets
-                target = self.map[target_index]
-                entry  = result.get(target)
-                if entry is None: entry = trigger_map 
-                else:             entry = entry.union(trigger_map)
-                result[target] = entry
-            return result
-
-        # -- choose one arbitrary state (for example state 0) as a prototype
-        #    which is compared against the remaining states in the state set.
-        prototype_i          = state_set[0]
-        prototype_map        = normalized_map(self.to_map[prototype_i])
-        equivalent_state_set = [ prototype_i ] 
-
-        if len(prototype_map) == 0:
-            # If there are no target states, then there can be no split.
-            # The state set is done.
-            self.todo_remove(StateSetIndex)
-            return False
-
-        # Since all state sets are homogenized at the entry of this function
-        # It can be assumed that the prototype contains all target_set indices
-        # Loop over all remaining states from state set
-        for state_index in islice(state_set, 1, None):
-            state_map = normalized_map(self.to_map[state_index])
-            for target in prototype_map.keys():
-                if not prototype_map[target].is_equal(state_map[target]): break
-            else:
-                equivalent_state_set.append(state_index)
-
-        # The transitions have been investigated. Now, we can judge whether 
-        # a state set is done. If all target state sets are done, then 
-        # no further split can happen and the state set itself is done.
-        all_done_f = self.__todo.isdisjoint(list(prototype_map.keys()))  
-
-        if len(equivalent_state_set) == len(state_set): 
-            self.non_homogenous_remove(StateSetIndex)
-            if all_done_f: self.todo_remove(StateSetIndex)
-            return False
-
-        new_index = self.__extract(StateSetIndex, state_set, equivalent_state_set)
-
-        # -- The state set is split, thus state sets triggering to it may be non-homogenous
-        #    (this may include recursive states, even the equivalent state set, 
-        #     so this has to come after anything above)
-        self.__check_nh_dependencies(chain(state_set, equivalent_state_set))
-
-        if len(state_set) == 1: 
-            self.non_homogenous_remove(StateSetIndex)
-            self.todo_remove(StateSetIndex)
-        else:
-            self.non_homogenous_add(StateSetIndex)
-
-        if all_done_f and len(equivalent_state_set) != 1: 
-            # If the new state state is of size one, it has not been added to 'todo' list
-            self.todo_remove(new_index)
-
-        return True
+        self.__sort()
 
     def initial_split(self):
         """Generates initial sets of states. After the initial split, state
@@ -283,78 +102,91 @@ class HopcroftMinization:
 
         determines a key for a state. Two states have the same key, if and only
         if they are combinable during the initial split of hopcroft minimization.
+
+        The sink state set is added last. All initial state sets, except for
+        the largest one, are splitters.
         """
-        distinguisher_db = defaultdict(list)
+        distinguisher_db = defaultdict(set)
         for state_index, state in self.sm.states.items():
             key = state.single_entry.hopcroft_combinability_key()
-            distinguisher_db[key].append(state_index)
+            distinguisher_db[key].add(state_index)
 
-        for state_set in distinguisher_db.values():
-            i = self.__add_state_set(state_set)
-            if len(state_set) != 1: self.non_homogenous_add(i)
+        index_list = [ self.__add_state_set(state_set) 
+                       for state_set in distinguisher_db.values() ]
+        index_list.append(self.__add_state_set(set([None])))
 
-    def todo_add(self, StateSetIndex):
-        self.__todo.add(StateSetIndex)
+        largest_i = max(index_list, key=lambda i: len(self.state_set_list[i]))
+        for i in index_list:
+            if i != largest_i: self.__todo_add(i)
 
-    def todo_remove(self, StateSetIndex):
-        assert StateSetIndex not in self.__non_homogenous
-        self.__todo.remove(StateSetIndex)
+    def run(self):
+        while self.__todo:
+            splitter_i = self.__todo.pop()
+            self.__todo_set.remove(splitter_i)
+            self.split(self.__get_entry_db(splitter_i))
 
-    def non_homogenous_remove(self, StateSetIndex):
-        if StateSetIndex in self.__non_homogenous: 
-            self.__non_homogenous.remove(StateSetIndex)
+    def split(self, EntryDb):
+        """Splits all state sets which contain states from 'EntryDb' so that 
+        in the resulting state sets all states enter the splitter on the same
+        trigger set, or not at all.
 
-    def non_homogenous_add(self, StateSetIndex):
-        self.__non_homogenous.add(StateSetIndex)
+        EntryDb: map: state index --> trigger set on which it enters the splitter.
+        """
+        # Group the entering states by state set and trigger set.
+        # map: state set index --> map: trigger set key --> list of state indices
+        touched_db = defaultdict(lambda: defaultdict(list))
+        for state_index, trigger_set in EntryDb.items():
+            key = tuple(trigger_set.get_border_list(PromiseToTreatWellF=True))
+            touched_db[self.map[state_index]][key].append(state_index)
+
+        for state_set_i, group_db in touched_db.items():
+            state_set = self.state_set_list[state_set_i]
+            if len(state_set) == 1: continue
+
+            group_list = list(group_db.values())
+            if     len(group_list) == 1 \
+               and len(group_list[0]) == len(state_set): 
+                continue # All states enter on the same trigger set.
+
+            # States that do not enter the splitter remain in 'state_set'. If
+            # there are none, the first group remains.
+            if sum(len(group) for group in group_list) == len(state_set):
+                group_list = group_list[1:]
+
+            part_list = [ state_set_i ]
+            for group in group_list:
+                state_set.difference_update(group)
+                part_list.append(self.__add_state_set(set(group)))
+
+            if state_set_i in self.__todo_set:
+                for i in part_list[1:]: self.__todo_add(i)
+            else:
+                largest_i = max(part_list, key=lambda i: len(self.state_set_list[i]))
+                for i in part_list:
+                    if i != largest_i: self.__todo_add(i)
 
-    def __extract(self, MotherIdx, mother_state_set, NewStateSet):
-        # -- Delete states from the mother set
-        for state_index in NewStateSet:
-            del mother_state_set[mother_state_set.index(state_index)]
-
-        # (if all was to be extracted then the mother state set could remain
-        #  and the new state set be represented by the mother_state_set)
-        assert len(mother_state_set) != 0
-
-        # -- Create a new state set in state_set_list
-        return self.__add_state_set(NewStateSet)
-
-    def __check_nh_dependencies(self, StateSetIterable):
-        """If a state set is split, then every state set that triggered to it may be non-homogenous
-           origin_state_list = list of states that trigger to states inside mother_state_set.
-
-           PROPOSAL:
-
-            if len(StateSet) == 1:
-                # (*) This is the short version of the algorithm above, if there is only one state
-                origin_state_list = self.from_map[StateSet[0]]
-                if len(origin_state_list) != 1:
-                    considerable_set  = set([self.map[i] for i in origin_state_list])
-                    for state_set_index in ifilter(lambda x: len(self.state_set_list[x]) != 1, considerable_set):
-                        self.non_homogenous_add(state_set_index)
-                else:
-                    # (*) This is the short version, if there is only one accept command
-                    state_set_index = self.map[origin_state_list[0]]
-                    if len(self.state_set_list[state_set_index]) != 1:
-                        self.non_homogenous_add(state_set_index)
+    def __get_entry_db(self, SplitterIndex):
+        """RETURNS: map: state index --> trigger set on which the state enters
+                    the state set 'SplitterIndex'.
         """
-        # (*) This is the full general version of the dependency check
-        considerable_set = set()
-        for state_index in StateSetIterable:
-            origin_state_list = self.from_map[state_index]
-            considerable_set.update([self.map[i] for i in origin_state_list])
-
-        # Exception: state set is of size 'one', then it cannot be non-homogenous
-        for state_set_index in filter(lambda x: len(self.state_set_list[x]) != 1, considerable_set):
-            # A state_set cannot be 'done' if one of the target state_sets is not done
-            # Such a case, would be caught by the assert inside 'non_homogenous_add'.
-            self.non_homogenous_add(state_set_index)
+        entry_db = defaultdict(list)
+        for target_index in self.state_set_list[SplitterIndex]:
+            for origin_index, trigger_set in self.from_map[target_index]:
+                entry_db[origin_index].append(trigger_set)
+
+        return dict(
+            (origin_index, trigger_set_list[0] if len(trigger_set_list) == 1
+                           else NumberSet.from_union_of_iterable(trigger_set_list))
+            for origin_index, trigger_set_list in entry_db.items()
+        )
+
+    def __todo_add(self, StateSetIndex):
+        self.__todo.append(StateSetIndex)
+        self.__todo_set.add(StateSetIndex)
 
     def __add_state_set(self, NewStateSet):
         """Add a new state set to the pool. Return the 'index' of the
-           newly added member of the pool. If the state set if of size > 1
-           then it is added to the todo-list. If not, it cannot be split
-           and therefore is already done.
+           newly added member of the pool.
         """
         assert len(NewStateSet) != 0
 
@@ -366,11 +198,27 @@ class HopcroftMinization:
         for state_index in NewStateSet:
             self.map[state_index] = new_index
 
-        # Any state set with more than one state needs to be investigated
-        if len(NewStateSet) != 1: self.todo_add(new_index)
-
         return new_index
 
+    def __sort(self):
+        """Removes the sink. Orders the state sets and the states inside them
+        according to the order of states in the DFA.
+        """
+        position_db    = dict((si, i) for i, si in enumerate(self.sm.states.keys()))
+        state_set_list = [
+            sorted(state_set, key=lambda si: position_db[si])
+            for state_set in self.state_set_list if None not in state_set
+        ]
+        state_set_list.sort(key=lambda state_set: position_db[state_set[0]])
+
+        self.state_set_list = state_set_list
+        self.map            = dict(
+            (state_index, i)
+            for i, state_set in enumerate(state_set_list)
+            for state_index in state_set
+        )
+
+@phase_stats.measured("Hopcroft")
 def do(SM, CreateNewStateMachineF=True, Class_StateMachine=None, Class_State=None):
     """Reduces the number of states according to equivalence classes of states. It starts
        with two sets: 
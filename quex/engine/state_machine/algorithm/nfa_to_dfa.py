@@ -5,7 +5,9 @@
 #
 from   quex.engine.state_machine.state.target_map     import TargetMap
 from   quex.engine.state_machine.state.target_map_ops import get_elementary_trigger_sets
+import quex.engine.misc.phase_stats                   as     phase_stats
 
+@phase_stats.measured("NFA to DFA")
 def do(SM, CloneF=True):
     """Creates a deterministic finite automaton (DFA) from a state machine 
     which may be a NFA (non-deterministic finite automaton). 
@@ -0,0 +1,135 @@
+#! /usr/bin/env python
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+# Check for 'pairwise': The single walk per pair of patterns must result in
+# the same consistency check messages as the separate checks 'superset',
+# 'outrun', and 'is_disjoint' applied one after the other.
+#
+# USAGE:  pairwise.py
+#
+# Each grammar is generated twice: once with the combined walk and once with
+# the separate checks plugged into 'pairwise' (the 'baseline'). The messages
+# printed by quex must be the same.
+#_______________________________________________________________________________
+import os
+import sys
+sys.path.insert(0, os.environ["QUEX_PATH"])
+
+import runpy
+import shutil
+import subprocess
+import tempfile
+
+OUTRUN = """
+token { A; B; C; }
+start = M;
+mode M : <skip: [ \\t]> {
+  "alb"|"albertikus" => QUEX_TKN_A;
+  "albert"           => QUEX_TKN_B;
+  "print"            => QUEX_TKN_A;
+  [a-z]+             => QUEX_TKN_C;
+  [0-9]+"."?         => QUEX_TKN_A;
+  [0-9]+"."[0-9]+    => QUEX_TKN_B;
+}
+"""
+
+DOMINATED = """
+token { A; B; }
+start = M;
+mode M {
+  [a-z]+("_"[a-z]+)* => QUEX_TKN_A;
+  "if"|"else"        => QUEX_TKN_B;
+}
+"""
+
+SKIP = """
+token { A; B; }
+start = M;
+mode M : <skip: [ \\t]> {
+  [ \\t]+[a-z]       => QUEX_TKN_A;
+  " "                => QUEX_TKN_B;
+}
+"""
+
+SKIP_RANGE = """
+token { A; B; }
+start = M;
+mode M : <skip_range: "/*" "*/"> {
+  "/"[*a-z]+         => QUEX_TKN_A;
+  [a-z]+             => QUEX_TKN_B;
+}
+"""
+
+CASE_LIST = [
+    # (grammar,  extra command line arguments)
+    (OUTRUN,     ["--warning-on-outrun"]),
+    (OUTRUN,     ["--warning-on-outrun", "--jobs", "2"]),
+    (DOMINATED,  []),                      # dominated pattern
+    (SKIP,       ["--warning-on-outrun"]), # overlap with special pattern
+    (SKIP,       ["--suppress", "3"]),     # outrun and subset of special pattern
+    (SKIP_RANGE, []),                      # overlap with special pattern
+    (SKIP_RANGE, ["--suppress", "3"]),     # outrun of special pattern
+]
+
+def separate_verdicts(High, Low, RelationTuple):
+    """Baseline: a walk of its own for each relation.
+    """
+    import quex.engine.state_machine.check.pairwise      as pairwise
+    import quex.engine.state_machine.check.superset      as superset_check
+    import quex.engine.state_machine.check.outrun        as outrun_checker
+    import quex.engine.state_machine.algebra.is_disjoint as is_disjoint
+    verdict_db = {
+        pairwise.SUPERSET: lambda: superset_check.do(High, Low),
+        pairwise.OUTRUN:   lambda: outrun_checker.do(High, Low),
+        pairwise.OVERLAP:  lambda: not is_disjoint.do(High, Low),
+    }
+    return tuple(verdict_db[relation]() for relation in RelationTuple)
+
+def run_quex(BaselineF, ArgList):
+    """Runs quex in this process. With 'BaselineF', the separate checks
+    replace the combined walk.
+    """
+    if BaselineF:
+        import quex.engine.state_machine.check.pairwise as pairwise
+        pairwise._verdicts = separate_verdicts
+    quex_exe = os.path.join(os.environ["QUEX_PATH"], "quex-exe.py")
+    sys.argv = [ quex_exe ] + ArgList
+    runpy.run_path(quex_exe, run_name="__main__")
+
+def generate(WorkDir, Grammar, ArgList, BaselineF):
+    with open(os.path.join(WorkDir, "grammar.qx"), "w") as fh:
+        fh.write(Grammar)
+    arg_list = ["-i", "grammar.qx", "-o", "Lexer", "--odir", "."] + ArgList
+    result = subprocess.run([sys.executable, os.path.abspath(__file__),
+                             "baseline" if BaselineF else "combined"] + arg_list,
+                            cwd=WorkDir, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, universal_newlines=True)
+    return result.stdout
+
+def main():
+    ok_f = True
+    for grammar, arg_list in CASE_LIST:
+        work_dir = tempfile.mkdtemp(prefix="quex-pairwise-")
+        try:
+            combined = generate(work_dir, grammar, arg_list, BaselineF=False)
+            baseline = generate(work_dir, grammar, arg_list, BaselineF=True)
+        finally:
+            shutil.rmtree(work_dir)
+
+        message_n = len([line for line in combined.splitlines() if "pattern" in line])
+        same_f    = combined == baseline
+        print("%-40s messages: %2i; %s;" % (" ".join(arg_list) or "(default)",
+              message_n, "same" if same_f else "DIFFERENT"))
+        if not same_f:
+            print("combined:\n%s\nbaseline:\n%s" % (combined, baseline))
+        ok_f = ok_f and same_f and message_n != 0
+
+    print("<%s>" % ("OK" if ok_f else "FAIL"))
+    return 0 if ok_f else 1
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in ("baseline", "combined"):
+        run_quex(sys.argv[1] == "baseline", sys.argv[2:])
+    else:
+        sys.exit(main())
@@ -0,0 +1,295 @@
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+# Pairwise Relations between the DFAs of a list
+#
+# Determines for pairs (high, low) of DFAs from a list, where 'high' comes
+# before 'low', the relations
+#
+#     SUPERSET:  'high' matches all lexemes that 'low' matches.
+#     OUTRUN:    'low' may continue matching after 'high' has matched.
+#     OVERLAP:   'high' and 'low' match some common lexemes.
+#
+# The list of pairs is iterated once for all checks, rather than once per
+# check. For each pair, the filters of the requested relations are evaluated.
+# The relations that pass their filter are determined by a single walk along
+# the pairs of states (h, l) that are reached by common lexemes (a product
+# construction without building the product). With 'trigger(s)' being the
+# union of the trigger sets of state 's':
+#
+#     SUPERSET:  fails, if 'trigger(l)' is not covered by 'trigger(h)', or if
+#                'l' is reached as acceptance state while 'h' is not.
+#     OUTRUN:    holds, if after an acceptance of 'high' on the path 'trigger(l)'
+#                is not covered by 'trigger(h)', or 'l' accepts while 'h' does
+#                not. To tell, the walk carries a flag 'high has accepted'.
+#     OVERLAP:   holds, if 'h' and 'l' are both acceptance states.
+#
+# As in 'superset', the acceptance of the initial state of 'low' does not
+# count against SUPERSET. Pairs are marked as done per pair of states, so the
+# relations hold exactly for the lexemes of length >= 1.
+#
+# The walk stops as soon as all requested relations are settled. The filters
+# are cheap conditions which are necessary for a relation to hold:
+#
+#     SUPERSET:  The first lexatoms of 'low' are a subset of those of 'high'.
+#                (This is the first step of the 'superset' check.)
+#     OUTRUN:    'high' accepts the empty lexeme, or the first lexatoms of
+#                'high' and 'low' intersect. (Else, no acceptance of 'high' is
+#                reached on a common path.)
+#     OVERLAP:   Both accept the empty lexeme, or the first lexatoms intersect
+#                and the ranges of lexeme lengths intersect.
+#
+# First lexatom sets are represented as integer bit masks over the elementary
+# intervals of all first lexatom sets. Thus, the filters are a few integer
+# operations per pair.
+#
+# If more than one job is specified, the remaining walks are distributed on
+# a pool of forked worker processes.
+#_______________________________________________________________________________
+from   bisect      import bisect_left
+from   collections import deque
+import concurrent.futures
+import multiprocessing
+
+SUPERSET = "superset"
+OUTRUN   = "outrun"
+OVERLAP  = "overlap"
+
+def do(DfaList, RelationsF, JobN=1):
+    """DfaList:    List of DFAs.
+    RelationsF: Function (i, k) --> tuple of relations to be determined for
+                the pair (DfaList[i], DfaList[k]), where i < k.
+    JobN:       Number of processes that walk the pairs.
+
+    RETURNS: map: relation --> list of pairs (i, k) for which the relation holds.
+             The lists are sorted by (i, k).
+    """
+    summary_list = _get_summaries(DfaList)
+
+    todo_list = []
+    for i, high in enumerate(summary_list):
+        for k in range(i+1, len(summary_list)):
+            relation_tuple = RelationsF(i, k)
+            if not relation_tuple: continue
+            low = summary_list[k]
+            relation_tuple = tuple(
+                relation for relation in relation_tuple
+                if _FILTER_DB[relation](high, low)
+            )
+            if relation_tuple: todo_list.append((i, k, relation_tuple))
+
+    verdict_list = _walk(DfaList, todo_list, JobN)
+
+    result = { SUPERSET: [], OUTRUN: [], OVERLAP: [] }
+    for entry, verdict_tuple in zip(todo_list, verdict_list):
+        i, k, relation_tuple = entry
+        for relation, verdict_f in zip(relation_tuple, verdict_tuple):
+            if verdict_f: result[relation].append((i, k))
+    return result
+
+class _Summary:
+    """Properties of a DFA that are necessary for the pair filters.
+    """
+    __slots__ = ("first_mask", "init_acceptance_f", "empty_f",
+                 "min_length", "max_length")
+    def __init__(self, Dfa):
+        init_state             = Dfa.get_init_state()
+        self.first_mask        = 0  # set by '_get_summaries()'
+        self.init_acceptance_f = init_state.is_acceptance()
+        self.empty_f           = Dfa.is_Empty()
+        self.min_length        = _min_acceptance_distance(Dfa)
+        self.max_length        = _max_path_length(Dfa)
+
+def _get_summaries(DfaList):
+    """RETURNS: list of '_Summary' objects--one for each DFA in 'DfaList'.
+    """
+    summary_list = [ _Summary(dfa) for dfa in DfaList ]
+
+    # Elementary intervals of all first lexatom sets: between two subsequent
+    # borders from 'border_list'.
+    first_set_list = [
+        dfa.get_init_state().target_map.get_trigger_set_union() for dfa in DfaList
+    ]
+    border_list = sorted(set(
+        x for first_set in first_set_list for x in first_set.get_border_list(PromiseToTreatWellF=True)
+    ))
+    for summary, first_set in zip(summary_list, first_set_list):
+        mask = 0
+        for begin, end in first_set.iterable_interval_borders():
+            begin_i = bisect_left(border_list, begin)
+            end_i   = bisect_left(border_list, end)
+            mask   |= ((1 << (end_i - begin_i)) - 1) << begin_i
+        summary.first_mask = mask
+    return summary_list
+
+def _min_acceptance_distance(Dfa):
+    """RETURNS: Length of the shortest lexeme that is accepted.
+                None, if no lexeme is accepted.
+    """
+    distance_db = { Dfa.init_state_index: 0 }
+    worklist    = deque([Dfa.init_state_index])
+    while worklist:
+        si = worklist.popleft()
+        if Dfa.states[si].is_acceptance(): return distance_db[si]
+        for target_si in Dfa.states[si].target_map.get_map().keys():
+            if target_si in distance_db: continue
+            distance_db[target_si] = distance_db[si] + 1
+            worklist.append(target_si)
+    return None
+
+def _max_path_length(Dfa):
+    """RETURNS: Length of the longest path from the initial state. It is an
+                upper limit for the length of accepted lexemes.
+                None, if there is a loop.
+    """
+    length_db = {}         # state index --> longest path from state
+    path      = [ (Dfa.init_state_index, iter(Dfa.states[Dfa.init_state_index].target_map.get_map().keys())) ]
+    on_path   = set([Dfa.init_state_index])
+    while path:
+        si, target_iterable = path[-1]
+        for target_si in target_iterable:
+            if   target_si in on_path:   return None
+            elif target_si in length_db: continue
+            on_path.add(target_si)
+            path.append((target_si, iter(Dfa.states[target_si].target_map.get_map().keys())))
+            break
+        else:
+            path.pop()
+            on_path.remove(si)
+            length_db[si] = max((length_db[target_si] + 1
+                                 for target_si in Dfa.states[si].target_map.get_map().keys()),
+                                default=0)
+    return length_db[Dfa.init_state_index]
+
+def _superset_possible(High, Low):
+    return not (Low.first_mask & ~High.first_mask)
+
+def _outrun_possible(High, Low):
+    return High.init_acceptance_f or (High.first_mask & Low.first_mask)
+
+def _overlap_possible(High, Low):
+    if   High.empty_f or Low.empty_f:                        return False
+    elif High.init_acceptance_f and Low.init_acceptance_f:   return True
+    elif not (High.first_mask & Low.first_mask):             return False
+    elif High.min_length is None or Low.min_length is None:  return False
+
+    # Lexemes of length >= 1 in the intersection of length ranges?
+    begin = max(High.min_length, Low.min_length, 1)
+    for end in (High.max_length, Low.max_length):
+        if end is not None and end < begin: return False
+    return True
+
+_FILTER_DB = {
+    SUPERSET: _superset_possible,
+    OUTRUN:   _outrun_possible,
+    OVERLAP:  _overlap_possible,
+}
+
+def _verdicts(High, Low, RelationTuple):
+    """Determines the relations in 'RelationTuple' between the DFAs 'High' and
+    'Low' by a single walk along the pairs of states reached by common lexemes.
+
+    RETURNS: tuple of booleans--one for each relation in 'RelationTuple'.
+    """
+    superset_f = SUPERSET in RelationTuple # True, until disproven
+    outrun_f   = False                     # False, until proven
+    overlap_f  = False                     # False, until proven
+    open_n     = len(RelationTuple)        # number of unsettled relations
+    trace_f    = OUTRUN in RelationTuple   # trace 'high has accepted'?
+
+    high_trigger_db = {}
+    low_trigger_db  = {}
+    def covered(HighSi, LowSi):
+        high_triggers = high_trigger_db.get(HighSi)
+        if high_triggers is None:
+            high_triggers = High.states[HighSi].target_map.get_trigger_set_union()
+            high_trigger_db[HighSi] = high_triggers
+        low_triggers = low_trigger_db.get(LowSi)
+        if low_triggers is None:
+            low_triggers = Low.states[LowSi].target_map.get_trigger_set_union()
+            low_trigger_db[LowSi] = low_triggers
+        return high_triggers.is_superset(low_triggers)
+
+    init_node = (High.init_state_index, Low.init_state_index, 
+                 trace_f and High.get_init_state().is_acceptance())
+    worklist  = [ init_node ]
+    done_set  = set(worklist)
+    while worklist and open_n:
+        high_si, low_si, accepted_f = worklist.pop()
+        high_state = High.states[high_si]
+        low_state  = Low.states[low_si]
+        high_acceptance_f = high_state.is_acceptance()
+        low_acceptance_f  = low_state.is_acceptance()
+
+        if not overlap_f and high_acceptance_f and low_acceptance_f:
+            overlap_f = True
+            if OVERLAP in RelationTuple: open_n -= 1
+
+        if superset_f or (accepted_f and not outrun_f):
+            covered_f = covered(high_si, low_si)
+            if superset_f and not covered_f:
+                superset_f = False
+                open_n    -= 1
+            if     accepted_f and not outrun_f \
+               and (not covered_f or (low_acceptance_f and not high_acceptance_f)):
+                outrun_f = True
+                open_n  -= 1
+
+        # Follow the path of common trigger sets
+        for low_target_si, low_trigger_set in low_state.target_map.get_map().items():
+            low_target_acceptance_f = Low.states[low_target_si].is_acceptance()
+            for high_target_si, high_trigger_set in high_state.target_map.get_map().items():
+                if not high_trigger_set.has_intersection(low_trigger_set): continue
+                high_target_acceptance_f = High.states[high_target_si].is_acceptance()
+                if superset_f and low_target_acceptance_f and not high_target_acceptance_f:
+                    superset_f = False
+                    open_n    -= 1
+                node = (high_target_si, low_target_si, 
+                        accepted_f or (trace_f and high_target_acceptance_f))
+                if node in done_set: continue
+                done_set.add(node)
+                worklist.append(node)
+
+    verdict_db = { SUPERSET: superset_f, OUTRUN: outrun_f, OVERLAP: overlap_f }
+    return tuple(verdict_db[relation] for relation in RelationTuple)
+
+def _walk(DfaList, TodoList, JobN):
+    """RETURNS: list of verdict tuples--one for each entry in 'TodoList'.
+    """
+    global _job_db
+    if JobN < 2 or len(TodoList) < 2 * JobN or not _job_fork_supported():
+        return [
+            _verdicts(DfaList[i], DfaList[k], relation_tuple)
+            for i, k, relation_tuple in TodoList
+        ]
+
+    _job_db = (DfaList, TodoList, JobN)
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers = JobN,
+                mp_context  = multiprocessing.get_context("fork")) as executor:
+            chunk_list = list(executor.map(_job, range(JobN)))
+    finally:
+        _job_db = None
+
+    # Job 'n' treated the entries n, n + JobN, n + 2*JobN, ...
+    result = [ None ] * len(TodoList)
+    for n, chunk in enumerate(chunk_list):
+        result[n::JobN] = chunk
+    return result
+
+_job_db = None
+
+def _job(JobIndex):
+    """Worker process: walk every 'JobN'-th pair starting at 'JobIndex'. The
+    DFAs and the todo list have been inherited from the parent process by
+    forking.
+    """
+    dfa_list, todo_list, job_n = _job_db
+    return [
+        _verdicts(dfa_list[i], dfa_list[k], relation_tuple)
+        for i, k, relation_tuple in todo_list[JobIndex::job_n]
+    ]
+
+def _job_fork_supported():
+    return "fork" in multiprocessing.get_all_start_methods()
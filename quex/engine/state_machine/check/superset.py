@@ -119,6 +119,17 @@ def do(A, B):
 
     if not superset_f: return False
 
+    return context_do(A, B)
+
+def context_do(A, B):
+    """Considers two patterns 'A' and 'B' where it is known that the core 
+    state machine of 'A' matches a super set of what the core state machine of
+    'B' matches. 
+
+    RETURNS: True  - if A == SUPERSET of B, considering pre-contexts and
+                     acceptance conditions.
+             False - if not
+    """
     # NOW: For the core state machines it holds: 
     #
     #               'core(A)' matches a super set of 'core(B)'.
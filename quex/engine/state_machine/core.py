@@ -391,43 +391,43 @@ class DFA(object):
 
     def epsilon_closure_db(self, AddNoEpsilonStatesF=False):
         """RETURNS: 
-                    state index --> set(epsilon target state indices)
+                    state index --> frozenset(epsilon target state indices)
+
+        The closure of a state contains the state itself and all states that
+        can be reached from it via epsilon transitions. States without epsilon
+        transitions are only reported if 'AddNoEpsilonStatesF' is set.
+
+        All states in a strongly connected component of the epsilon transition
+        graph have the same closure. The same frozenset object is shared among
+        them (see '_epsilon_closure_db()').
         """
-        db = {}
-        occurrence_db = defaultdict(int)
+        successor_db = {}
         for si, state in self.states.items():
             etsi_list = state.target_map.get_epsilon_target_state_index_list()
-            if not etsi_list: 
-                if AddNoEpsilonStatesF: db[si] = set([si])
-                continue
-            db[si] = set(etsi_list)
-            db[si].add(si)
-            for etsi in etsi_list: 
-                occurrence_db[etsi] += 1
-
-        # Expand those with the highest amount of references first.
-        for si, closure in sorted(iter(db.items()), key=lambda x: - occurrence_db[x[0]]):
-            worklist = set(closure)
-            done_set = set([si])
-            while worklist:
-                csi          = worklist.pop()
-                csi_closure  = db.get(csi)
-                done_set.add(csi)
-                if csi_closure is None: continue
-                new_etsi_set = csi_closure.difference(closure)
-                closure.update(new_etsi_set)
-                worklist.update(x for x in new_etsi_set if x not in done_set)
-            # 'closure' (a reference) of 'si' has been updated.
-
-        return db
+            if etsi_list: successor_db[si] = etsi_list
+
+        closure_db = _epsilon_closure_db(successor_db)
+        if AddNoEpsilonStatesF:
+            return dict(
+                (si, closure_db[si] if si in successor_db else frozenset((si,)))
+                for si in self.states.keys()
+            )
+        else:
+            return dict((si, closure_db[si]) for si in successor_db.keys())
 
     def get_epsilon_closure(self, StateIdx):
         """Return all states that can be reached from 'StateIdx' via epsilon
            transition."""
         assert StateIdx in self.states
 
-        result = set([StateIdx])
-        self.__dive_for_epsilon_closure(StateIdx, result)
+        result   = set([StateIdx])
+        worklist = [StateIdx]
+        while worklist:
+            index_list = self.states[worklist.pop()].target_map.get_epsilon_target_state_index_list()
+            for target_index in index_list:
+                if target_index in result: continue
+                result.add(target_index)
+                worklist.append(target_index)
         return result
  
     def acceptance_state_iterable(self):
@@ -934,12 +934,6 @@ class DFA(object):
                 number_set.mask_interval(MaskInterval)
                 if number_set.is_empty(): del target_map[to_si]
 
-    def __dive_for_epsilon_closure(self, state_index, result):
-        index_list = self.states[state_index].target_map.get_epsilon_target_state_index_list()
-        for target_index in filter(lambda x: x not in result, index_list):
-            result.add(target_index)
-            self.__dive_for_epsilon_closure(target_index, result)
-
     def is_DFA_compliant(self):
         for state in list(self.states.values()):
             if state.target_map.is_DFA_compliant() == False: 
@@ -1258,3 +1252,75 @@ def NumberSetSequence_to_NumberSequences(NumberSetSequence):
         # Plug the number settings into the 'open' positions of the 
         # lexatom sequence
         yield _plug(plug_positions, plug_settings, number_sequence)
+
+def _epsilon_closure_db(SuccessorDb):
+    """Computes epsilon closures on the condensation of the epsilon transition
+    graph. Tarjan's algorithm determines the strongly connected components 
+    (SCC) in reverse topological order, i.e. an SCC is complete only after all
+    SCCs that it reaches. Thus, the closure of an SCC is the union of its
+    states and the closures of its successor SCCs, which are all available
+    when the SCC is complete. 
+
+    The graph is traversed with an explicit stack, so that long epsilon chains
+    do not hit the recursion limit.
+
+    SuccessorDb: state index --> list of epsilon target state indices
+
+    RETURNS: state index --> frozenset(epsilon closure state indices)
+
+    The closure of a state contains the state itself. All states of an SCC
+    share the same frozenset object.
+    """
+    closure_db = {}
+    order_db   = {}      # state index --> order of first visit
+    low_db     = {}      # state index --> lowest order reachable in SCC
+    scc_stack  = []      # visited states of SCCs which are not complete
+    on_stack   = set()
+    no_successors = ()
+
+    def visit(si):
+        order_db[si] = low_db[si] = len(order_db)
+        scc_stack.append(si)
+        on_stack.add(si)
+        return (si, iter(SuccessorDb.get(si, no_successors)))
+
+    for root_si in SuccessorDb.keys():
+        if root_si in order_db: continue
+        path = [ visit(root_si) ]
+        while path:
+            si, successor_iterable = path[-1]
+            for target_si in successor_iterable:
+                if target_si not in order_db:
+                    path.append(visit(target_si))
+                    break
+                elif target_si in on_stack:
+                    low_db[si] = min(low_db[si], order_db[target_si])
+            else:
+                path.pop()
+                if path: 
+                    parent_si = path[-1][0]
+                    low_db[parent_si] = min(low_db[parent_si], low_db[si])
+                if low_db[si] != order_db[si]: continue
+
+                # 'si' is the root of a complete SCC.
+                member_list = []
+                while 1 + 1 == 2:
+                    member_si = scc_stack.pop()
+                    on_stack.remove(member_si)
+                    member_list.append(member_si)
+                    if member_si == si: break
+
+                closure  = set(member_list)
+                done_set = set()  # ids of successor closures that are united
+                for member_si in member_list:
+                    for target_si in SuccessorDb.get(member_si, no_successors):
+                        target_closure = closure_db.get(target_si)
+                        if target_closure is None or id(target_closure) in done_set: continue
+                        done_set.add(id(target_closure))
+                        closure.update(target_closure)
+
+                closure = frozenset(closure)
+                for member_si in member_list:
+                    closure_db[member_si] = closure
+
+    return closure_db
@@ -26,3 +26,28 @@ def clear():
     __internal_state_index_counter      = itertools.count(start=0)
     __internal_state_machine_id_counter = itertools.count(start=0)
 
+
+def snapshot():
+    """RETURNS: The values which the state index counter and the state machine
+                id counter deliver next. 
+
+    Together with 'restore()' this allows to run a piece of code which 
+    generates new indices multiple times, always starting from the same 
+    counter values (e.g. code generation for different modes in separate
+    processes).
+    """
+    global __internal_state_index_counter
+    global __internal_state_machine_id_counter
+    result = (int(next(__internal_state_index_counter)), 
+              int(next(__internal_state_machine_id_counter)))
+    restore(result)
+    return result
+
+def restore(Snapshot):
+    """Sets the counters to values previously taken by 'snapshot()'.
+    """
+    global __internal_state_index_counter
+    global __internal_state_machine_id_counter
+    state_index, state_machine_id = Snapshot
+    __internal_state_index_counter      = itertools.count(start=state_index)
+    __internal_state_machine_id_counter = itertools.count(start=state_machine_id)
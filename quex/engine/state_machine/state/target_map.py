@@ -124,10 +124,7 @@ class TargetMap:
         return len(self.__db)
 
     def get_trigger_set_union(self):
-        interval_list = []
-        for trigger_set in self.__db.values():
-            interval_list.extend(trigger_set.get_intervals())
-        return NumberSet.from_IntervalList(interval_list)
+        return NumberSet.from_union_of_iterable(self.__db.values())
 
     def get_drop_out_trigger_set_union(self):
         """This function returns the union of all trigger sets that do not
@@ -248,12 +245,10 @@ class TargetMap:
         # NOTE: This function only deals with non-epsilon triggers. Empty
         #       ranges in 'history' are dealt with in '.get_trigger_map()'. 
         for target_idx, trigger_set in self.__db.items():
-            interval_list = trigger_set.get_intervals(PromiseToTreatWellF=True)
-            for interval in interval_list: 
+            for begin, end in trigger_set.iterable_interval_borders():
                 # add information about start and end of current interval
-                if interval.is_empty(): continue
-                history.append(history_item(interval.begin, E_Border.BEGIN, target_idx, Key))
-                history.append(history_item(interval.end, E_Border.END, target_idx, Key))
+                history.append(history_item(begin, E_Border.BEGIN, target_idx, Key))
+                history.append(history_item(end, E_Border.END, target_idx, Key))
 
         # (*) sort history according to position
         history.sort(key=attrgetter("position"))
@@ -1,11 +1,13 @@
 # Project Quex (http://quex.sourceforge.net); License: MIT;
 # (C) 2005-2020 Frank-Rene Schaefer; 
 #_______________________________________________________________________________
-from   quex.engine.misc.interval_handling  import NumberSet, Interval
-from   quex.engine.misc.tools              import flatten
+from   quex.engine.misc.interval_handling  import NumberSet
 from   quex.constants import E_Border
 
 from   collections import defaultdict
+from   itertools   import islice
+from   bisect      import bisect_left, \
+                          insort
 
 assert E_Border.BEGIN > E_Border.END
 
@@ -53,59 +55,58 @@ def get_elementary_trigger_sets(TM):
        only T2                 [---)          [----)
        T0, T2                      [---)     [)
        T0, T1, T2                      [-----)
-    """
-    # (*) Accumulate the transitions for all states in the state list.
-    #     transitions to the same target state are combined by union.
-    history = _get_plain_line_up([ TM ])
-
-    # (*) build the elementary subset list 
-    combinations           = {}          # use dictionary for uniqueness
-    current_interval_begin = None
-    current_target_indices = {}          # use dictionary for uniqueness
-    current_target_epsilon_closure = []
-    for item in history:
-        # -- add interval and target indice combination to the data
-        #    (only build interval when current begin is there, 
-        #     when the interval size is not zero, and
-        #     when the epsilon closure of target states is not empty)                   
-        if     current_interval_begin is not None      \
-           and current_interval_begin != item.position \
-           and len(current_target_indices) != 0:
-
-            interval = Interval(current_interval_begin, item.position)
-
-            # key = tuple(current_target_epsilon_closure) 
-            key = tuple(sorted(current_target_epsilon_closure))
-            combination = combinations.get(key)
-            if combination is None:
-                combinations[key] = NumberSet(interval, ArgumentIsYoursF=True)
-            else:
-                combination.unite_with(interval)
-       
-        # -- BEGIN / END of interval:
-        #    add or delete a target state to the set of currently considered target states
-        #    NOTE: More than one state can trigger on the same range to the same target state.
-        #          Thus, one needs to keep track of the 'opened' target states.
-        if item.change == E_Border.BEGIN:
-            if item.target_idx in current_target_indices:
-                current_target_indices[item.target_idx] += 1
-            else:
-                current_target_indices[item.target_idx] = 1
-        else:        # == E_Border.END
-            assert item.target_idx in current_target_indices
-            if current_target_indices[item.target_idx] > 1:
-                current_target_indices[item.target_idx] -= 1
-            else:    
-                del current_target_indices[item.target_idx] 
 
-        # -- re-compute the epsilon closure of the target states
-        current_target_epsilon_closure = current_target_indices
+    The computation is a sweep along the borders of all trigger sets. The 
+    borders are sorted once. While walking along them, the set of currently
+    active targets is maintained. Between two borders, the active targets 
+    are constant and the range is associated with their combination. For 'k' 
+    borders, the effort is O(k log k) plus the effort to build the key of a
+    combination for each of the at most 'k' ranges.
 
-        # -- set the begin of interval to come
-        current_interval_begin = item.position                      
+    RETURNS: map: tuple of sorted target state indices --> NumberSet
+    """
+    # (*) Border events: (position, target state index, +1 = begin / -1 = end)
+    event_list = []
+    for target_si, trigger_set in TM.get_map().items():
+        borders = trigger_set.get_border_list(PromiseToTreatWellF=True)
+        event_list.extend((x, target_si,  1) for x in islice(borders, 0, None, 2))
+        event_list.extend((x, target_si, -1) for x in islice(borders, 1, None, 2))
+    event_list.sort()
+
+    # (*) Sweep: between two positions, the active targets are constant.
+    #     NOTE: More than one interval may trigger to the same target at the 
+    #           same time. Thus, a count of 'opened' intervals is maintained.
+    border_db   = {}   # combination key --> border list
+    active_db   = {}   # target state index --> number of open intervals
+    active_list = []   # sorted list of target state indices in 'active_db'
+    begin       = None
+    L         = len(event_list)
+    i         = 0
+    while i < L:
+        position = event_list[i][0]
+        if active_list:
+            key     = tuple(active_list)
+            borders = border_db.get(key)
+            if   borders is None:       border_db[key] = [begin, position]
+            elif borders[-1] == begin:  borders[-1] = position
+            else:                       borders.extend((begin, position))
+
+        # All events at 'position'
+        while i < L and event_list[i][0] == position:
+            dummy, target_si, delta = event_list[i]
+            count = active_db.get(target_si, 0) + delta
+            if   count == 0: 
+                del active_db[target_si]
+                del active_list[bisect_left(active_list, target_si)]
+            elif count == 1 and delta == 1: 
+                active_db[target_si] = count
+                insort(active_list, target_si)
+            else:
+                active_db[target_si] = count
+            i += 1
+        begin = position
 
-    # (*) create the list of pairs [target-index-combination, trigger_set] 
-    return combinations
+    return _number_set_db(border_db)
 
 def get_intersection_line_up(TargetMapList):
     """Considers a list of target maps which are to be associated to be active
@@ -119,12 +120,12 @@ def get_intersection_line_up(TargetMapList):
     
     RETURNS: map: target_state_setup --> NumberSet
     """
-    result = {}
+    border_db = {}
     for begin, end, target_state_setup in _line_up_iterable(TargetMapList):
         if None in target_state_setup: continue
-        _enter(result, begin, end, target_state_setup)
+        _enter(border_db, begin, end, target_state_setup)
 
-    return result
+    return _number_set_db(border_db)
 
 def get_intersection_line_up_2(TargetMapList):
     """Same as 'get_intersection_line_up()' only that 'None' is setup for 
@@ -132,16 +133,11 @@ def get_intersection_line_up_2(TargetMapList):
 
     YIELDS: pairs (target_state_setup, NumberSet)
     """
-    result = {}
+    border_db = {}
     for begin, end, target_state_setup in _line_up_iterable(TargetMapList):
-        _enter(result, begin, end, target_state_setup)
+        _enter(border_db, begin, end, target_state_setup)
 
-    return iter(result.items())
-
-def _get_plain_line_up(TargetMapList):
-    return sorted(flatten(target_map.get_trigger_set_line_up(Key=i)
-                                        for i, target_map in enumerate(TargetMapList)), 
-                  key=lambda x: (x.position, x.change, x.target_idx))
+    return iter(_number_set_db(border_db).items())
 
 def _line_up_iterable(TargetMapList):
     """YIELDS: (begin, end, target_state_setup)
@@ -150,26 +146,44 @@ def _line_up_iterable(TargetMapList):
     combination is triggered. 
     'target_state_setup[i]' tells where 'TargetMapList[i]' is targetting
     for the given interval.
+
+    The borders of all trigger sets are sorted as plain tuples 
+
+            (position, 0 = end / 1 = begin, i, target state index)
+
+    so that at the same position, the end of an interval is considered 
+    before the begin of the next one.
     """
-    line_up = _get_plain_line_up(TargetMapList)
+    event_list = []
+    for i, target_map in enumerate(TargetMapList):
+        for target_si, trigger_set in target_map.get_map().items():
+            borders = trigger_set.get_border_list(PromiseToTreatWellF=True)
+            event_list.extend((x, 1, i, target_si) for x in islice(borders, 0, None, 2))
+            event_list.extend((x, 0, i, target_si) for x in islice(borders, 1, None, 2))
+    event_list.sort()
 
     target_state_setup = [None] * len(TargetMapList)
     last_begin         = None
-    for item in line_up:
-        if last_begin is not None and last_begin != item.position:
-            yield last_begin, item.position, tuple(target_state_setup)
+    for position, begin_f, i, target_si in event_list:
+        if last_begin is not None and last_begin != position:
+            yield last_begin, position, tuple(target_state_setup)
        
-        if item.change == E_Border.BEGIN:
-            target_state_setup[item.key] = item.target_idx
-        else:        # == E_Border.END
-            target_state_setup[item.key] = None
-
-        last_begin = item.position
-
-def _enter(result, begin, end, target_state_setup):
-    entry = result.get(target_state_setup)
-    if entry is None: result[target_state_setup] = NumberSet.from_range(begin, end)
-    else:             entry.quick_append_interval(Interval(begin, end))
+        if begin_f: target_state_setup[i] = target_si
+        else:       target_state_setup[i] = None
+
+        last_begin = position
+
+def _enter(border_db, begin, end, target_state_setup):
+    borders = border_db.get(target_state_setup)
+    if   borders is None:     border_db[target_state_setup] = [begin, end]
+    elif borders[-1] == begin: borders[-1] = end
+    else:                     borders.extend((begin, end))
+
+def _number_set_db(BorderDb):
+    return dict(
+        (key, NumberSet.from_border_list(borders)) 
+        for key, borders in BorderDb.items()
+    )
 
 # NO USES YET: 'MultiOccurrenceNumberList'
 # Candidate to support list based-indexing for caches.
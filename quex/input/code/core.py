@@ -21,5 +21,21 @@ class CodeUser(CodeFragment):
         result = CodeUser(deepcopy(self.get_code()), self.sr)
         return result
 
+class CodeUserKeyword(CodeUser):
+    """User code of a keyword in a 'keyword_list' with the flag 'h'. Such 
+    keywords are not matched by patterns of their own. They are identified by
+    a perfect hash in the terminal of a subsequent pattern that matches them
+    all (see 'PPTList_Builder.keyword_hash()').
+
+          .keyword_list_sr -- source reference of the 'keyword_list'. It 
+                              identifies the group of keywords.
+    """
+    def __init__(self, Code, SourceReference, KeywordListSr):
+        CodeUser.__init__(self, Code, SourceReference)
+        self.keyword_list_sr = KeywordListSr
+
+    def clone(self):
+        return CodeUserKeyword(deepcopy(self.get_code()), self.sr, self.keyword_list_sr)
+
 CodeUser_NULL = CodeUser([], SourceRef())
 
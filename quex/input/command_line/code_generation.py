@@ -183,6 +183,11 @@ def _line_and_column_counting_consistency(Setup):
         Setup.count_line_number_f   = False
         Setup.count_column_number_f = False
 
+    #   -- lazy counting replaces the counting code in the pattern terminals
+    if Setup.count_lazy_f:
+        Setup.count_line_number_f   = False
+        Setup.count_column_number_f = False
+
     if Setup.__no_token_class_support_token_stamp_f:
         Setup.token_class_support_token_stamp_line_n_f   = False  
         Setup.token_class_support_token_stamp_column_n_f = False 
@@ -414,6 +414,39 @@ GENERATOR MODE (selected options):
   --path-compression      Use template/path compression to reduce code size.
   --no-count-lines, 
   --no-count-columns      Disable line/column counting.
+  --count-lazy            Stamp tokens with their begin position only; line
+                          and column are computed on demand from a newline
+                          index of the buffer. The index holds one entry per
+                          newline; 'line_column_forget()' trims it.
+  --token-columns         Columnar token sink: token id, lexeme position and
+                          length (plus line/column stamps) are appended into
+                          parallel arrays ('receive_columns()').
+  --engine-style [direct|table]
+                          'direct' codes the transition map of each state.
+                          'table' implements transition maps and reload by
+                          compressed tables and an interpreter loop. Smaller
+                          code, but slower analysis. Default: direct.
+  --jobs, -j N            Generate the analyzers of modes and check pattern
+                          pairs for consistency in N parallel processes.
+  --incremental           Reuse the analyzer code of modes which did not change
+                          since the previous run (see '<name>-manifest.json').
+  --dfa-cache DIR         Cache the DFAs of regular expressions in DIR, so 
+                          that subsequent runs do not need to rebuild them.
+  --stats-phases          Report wall time, CPU time, and peak memory of the 
+                          generator's phases per mode and pattern (also in
+                          '<name>-phases.json').
+  --trace-analysis [paths|dataflow]
+                          Analysis of acceptance and input positions at drop-
+                          out. 'paths' walks along the paths through the state
+                          machine. 'dataflow' determines the same for each state
+                          as a fixed point in a bounded number of passes.
+                          Default: paths.
+  --profile-generate      Generate an analyzer that counts the lexatoms which 
+                          appear in each state and saves the counts upon
+                          destruction (in '<name>-statistics.txt').
+  --profile-use FILE      Lay out transition maps according to the counts in 
+                          FILE: frequent intervals are tested first, 
+                          bisections cut at the median of occurrences.
   --language, -l [C|C++|dot]  
                           Language for which code is to be generated. 'dot' 
                           generates 'graphviz' state machine graphs.
@@ -25,6 +25,10 @@ def do(setup, command_line, argv):
         error.log("Character display must be either 'hex' or 'utf8'.\nFound: '%s'" % 
                   setup.character_display)
 
+    if setup.trace_analysis_type not in ("paths", "dataflow"):
+        error.log("Trace analysis must be either 'paths' or 'dataflow'.\nFound: '%s'" % 
+                  setup.trace_analysis_type)
+
     # ensure that options are not specified twice
     for parameter, info in list(SETUP_INFO.items()):
         if type(info) != list: continue
@@ -89,7 +93,15 @@ def do(setup, command_line, argv):
             error.log("Lexeme-converter-only-mode requires explicit definition of the code unit type.\n"
                       "Example: '%s uint8_t'." % _example_flag("__buffer_lexatom_type"))
 
-    
+    if setup.job_n < 1:
+        error.log("The number of jobs (%s) must be at least 1.\n" % _example_flag("job_n")
+                  + "Found: %s." % setup.job_n)
+
+    if setup.dfa_cache_dir and os.path.exists(setup.dfa_cache_dir) \
+       and not os.path.isdir(setup.dfa_cache_dir):
+        error.log("The DFA cache (%s) must be a directory.\n" % _example_flag("dfa_cache_dir")
+                  + "Found file: '%s'." % setup.dfa_cache_dir)
+
     # Check that names are valid identifiers
     if setup.token_id_prefix_plain:
         __check_identifier(setup, "token_id_prefix_plain", "Token prefix")
@@ -102,6 +114,15 @@ def do(setup, command_line, argv):
     __check_file_name(setup, "extern_token_id_file",        "file containing user token ids", 0,
                       CommandLineOption=SETUP_INFO["extern_token_id_file"])
     __check_file_name(setup, "input_mode_files", "quex source file")
+    __check_file_name(setup, "profile_use_file_name", "file containing lexatom statistics")
+
+    error.verify_word_in_list(setup.engine_style, ["direct", "table"],
+                              "Engine style '%s' (%s) is not supported." \
+                              % (setup.engine_style, _example_flag("engine_style")))
+
+    if setup.profile_generate_f and not setup.standard_library_usage_f:
+        error.log("Profile generation (%s) requires the standard library.\n" % _example_flag("profile_generate_f")
+                  + "It cannot be combined with '%s'." % _example_flag("standard_library_usage_f"))
 
     # Internal engine character encoding
     if setup.buffer_encoding.name not in ("utf32", "unicode"):
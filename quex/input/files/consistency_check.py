@@ -4,8 +4,7 @@
 from   quex.input.files.specifier.mode                import Mode_Prep, ModeParsed
 from   quex.input.setup                               import NotificationDB
 import quex.engine.state_machine.check.superset       as     superset_check
-import quex.engine.state_machine.algebra.is_disjoint  as     is_disjoint
-import quex.engine.state_machine.check.outrun         as     outrun_checker
+import quex.engine.state_machine.check.pairwise       as     pairwise
 import quex.engine.misc.error                         as     error
 from   quex.engine.misc.tools                         import typed
 import quex.blackboard                                as     blackboard
@@ -45,80 +44,113 @@ def do(ModePrepList):
         __exit_transitions(mode, ModePrepList, mode_name_list)
 
     for mode in ModePrepList:
+        # (*) All pairwise relations between patterns in one pass.
+        relation_db = _get_pair_relation_db(mode)
+
         # (*) [Optional] Warnings on Outrun
         if Setup.warning_on_outrun_f:
-             _check_low_priority_outruns_high_priority_pattern(mode)
+             _check_low_priority_outruns_high_priority_pattern(mode, relation_db)
 
         # (*) Special Patterns shall not match on same lexemes
         if NotificationDB.error_on_special_pattern_same not in Setup.suppressed_notification_list:
-            _check_match_same(mode, NotificationDB.error_on_special_pattern_same)
+            _check_match_same(mode, relation_db, NotificationDB.error_on_special_pattern_same)
 
         # (*) Special Patterns (skip, indentation, etc.) 
         #     shall not be outrun by another pattern.
         if NotificationDB.error_on_special_pattern_outrun not in Setup.suppressed_notification_list:
-            _check_special_incidence_outrun(mode, NotificationDB.error_on_special_pattern_outrun)
+            _check_special_incidence_outrun(mode, relation_db, NotificationDB.error_on_special_pattern_outrun)
 
         # (*) Special Patterns shall not have common matches with patterns
         #     of higher precedence.
         if NotificationDB.error_on_special_pattern_subset not in Setup.suppressed_notification_list:
-            _check_higher_priority_matches_subset(mode, NotificationDB.error_on_special_pattern_subset)
+            _check_higher_priority_matches_subset(mode, relation_db, NotificationDB.error_on_special_pattern_subset)
 
         # (*) Check for dominated patterns
         if NotificationDB.error_on_dominated_pattern not in Setup.suppressed_notification_list:
-            _check_dominated_pattern(mode, NotificationDB.error_on_dominated_pattern)
+            _check_dominated_pattern(mode, relation_db, NotificationDB.error_on_dominated_pattern)
+
+def _get_pair_relation_db(mode):
+    """Determines the relations between pairs of patterns (high, low) of 'mode'
+    as they are required by the checks below. Only pairs that are subject to a
+    check are considered. 
 
-def _check_special_incidence_outrun(mode, ErrorCode):
-    for high, low in mode.unique_pattern_pair_iterable():
+    RETURNS: map: relation --> list of pairs (high, low) for which the 
+                  relation holds, in the order of 'unique_pattern_pair_iterable()'.
+    """
+    suppressed_list = Setup.suppressed_notification_list
+
+    # Relations for all pairs
+    all_list = []
+    if Setup.warning_on_outrun_f:
+        all_list.append(pairwise.OUTRUN)
+    if NotificationDB.error_on_dominated_pattern not in suppressed_list:
+        all_list.append(pairwise.SUPERSET)
+
+    # Relations for pairs where one pattern is in focus
+    focus_list = list(all_list)
+    for code, relation in ((NotificationDB.error_on_special_pattern_same,    pairwise.OVERLAP),
+                           (NotificationDB.error_on_special_pattern_outrun,  pairwise.OUTRUN),
+                           (NotificationDB.error_on_special_pattern_subset,  pairwise.SUPERSET)):
+        if code not in suppressed_list and relation not in focus_list:
+            focus_list.append(relation)
+
+    all_tuple    = tuple(all_list)
+    focus_tuple  = tuple(focus_list)
+    pattern_list = mode.pattern_list
+    focus_f_list = [ p.pattern_string() in Mode_Prep.focus for p in pattern_list ]
+
+    def relations(i, k):
+        if focus_f_list[i] or focus_f_list[k]: return focus_tuple
+        else:                                  return all_tuple
+
+    index_pair_db = pairwise.do([p.sm for p in pattern_list], relations, Setup.job_n)
+    return dict(
+        (relation, [ (pattern_list[i], pattern_list[k]) for i, k in index_pair_list ])
+        for relation, index_pair_list in index_pair_db.items()
+    )
+
+def _focus_pair_iterable(PairList):
+    """YIELDS: pairs from 'PairList' where one pattern is in focus.
+    """
+    for high, low in PairList:
         if     high.pattern_string() not in Mode_Prep.focus \
            and low.pattern_string()  not in Mode_Prep.focus: 
             continue
-        
-        elif not outrun_checker.do(high.sm, low.sm):                  
-            continue
+        yield high, low
 
+def _check_special_incidence_outrun(mode, RelationDb, ErrorCode):
+    for high, low in _focus_pair_iterable(RelationDb[pairwise.OUTRUN]):
         error.log_consistency_issue(high, low, ExitF=False, 
                         ThisComment  = "has higher precedence but",
                         ThatComment  = "may outrun it",
                         SuppressCode = ErrorCode)
                              
-def _check_higher_priority_matches_subset(mode, ErrorCode):
+def _check_higher_priority_matches_subset(mode, RelationDb, ErrorCode):
     """Checks whether a higher prioritized pattern matches a common subset
        of the ReferenceSM. For special patterns of skipper, etc. this would
        be highly confusing.
     """
-    global special_pattern_list
-    for high, low in mode.unique_pattern_pair_iterable():
-        if     high.pattern_string() not in Mode_Prep.focus \
-           and low.pattern_string() not in Mode_Prep.focus: continue
-
-        if not superset_check.do(high.sm, low.sm):             
-            continue
-
+    for high, low in _focus_pair_iterable(RelationDb[pairwise.SUPERSET]):
         error.log_consistency_issue(high, low, ExitF=True, 
                         ThisComment  = "has higher precedence and",
                         ThatComment  = "matches a subset of",
                         SuppressCode = ErrorCode)
 
-def _check_dominated_pattern(mode, ErrorCode):
-    for high, low in mode.unique_pattern_pair_iterable():
+def _check_dominated_pattern(mode, RelationDb, ErrorCode):
+    for high, low in RelationDb[pairwise.SUPERSET]:
         # 'low' comes after 'high' => 'i' has precedence
-        # Check for domination.
-        if superset_check.do(high, low):
+        # Check for domination. (The core state machine of 'high' matches
+        # a superset of what the core of 'low' matches.)
+        if superset_check.context_do(high, low):
             error.log_consistency_issue(high, low, 
                             ThisComment  = "matches a superset of what is matched by",
                             EndComment   = "The former has precedence and the latter can never match.",
                             ExitF        = True, 
                             SuppressCode = ErrorCode)
 
-def _check_match_same(mode, ErrorCode):
+def _check_match_same(mode, RelationDb, ErrorCode):
     """Special patterns shall never match on some common lexemes."""
-    for high, low in mode.unique_pattern_pair_iterable():
-        if     high.pattern_string() not in Mode_Prep.focus \
-           and low.pattern_string() not in Mode_Prep.focus: continue
-
-        # A superset of B, or B superset of A => there are common matches.
-        if is_disjoint.do(high.sm, low.sm): continue
-
+    for high, low in _focus_pair_iterable(RelationDb[pairwise.OVERLAP]):
         # The 'match what remains' is exempted from check.
         if high.pattern_string() == "." or low.pattern_string() == ".":
             continue
@@ -129,13 +161,12 @@ def _check_match_same(mode, ErrorCode):
                         ExitF        = True,
                         SuppressCode = ErrorCode)
 
-def _check_low_priority_outruns_high_priority_pattern(mode):
+def _check_low_priority_outruns_high_priority_pattern(mode, RelationDb):
     """Warn when low priority patterns may outrun high priority patterns.
     Assume that the pattern list is sorted by priority!
     """
-    for high, low in mode.unique_pattern_pair_iterable():
-        if outrun_checker.do(high.sm, low.sm):
-            error.log_consistency_issue(low, high, ExitF=False, ThisComment="may outrun")
+    for high, low in RelationDb[pairwise.OUTRUN]:
+        error.log_consistency_issue(low, high, ExitF=False, ThisComment="may outrun")
 
 def initial_mode(ModePrepList, initial_mode):
     # (*) Start mode specified?
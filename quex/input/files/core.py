@@ -1,6 +1,7 @@
 # Project Quex (http://quex.sourceforge.net); License: MIT;
 # (C) 2005-2020 Frank-Rene Schaefer; 
 import quex.engine.misc.error                   as     error
+import quex.engine.misc.phase_stats             as     phase_stats
 from   quex.engine.misc.file_operations         import open_file_or_die
 from   quex.engine.misc.file_in                 import EndOfStreamException, \
                                                        check, \
@@ -24,6 +25,7 @@ import quex.blackboard                          as     blackboard
 import quex.token_db                            as     token_db
 from   quex.input.regular_expression.exception  import RegularExpressionException
 
+@phase_stats.measured("file parsing")
 def do(file_list):
     if not file_list and not (Setup.token_class_only_f or Setup.converter_only_f): 
         error.log("No input files.")
@@ -6,11 +6,15 @@ import quex.input.regular_expression.core as     regular_expression
 import quex.input.files.mode_option       as     mode_option
 import quex.input.files.code_fragment     as     code_fragment
 from   quex.input.files.specifier.mode    import ModeParsed
-from   quex.input.code.core               import CodeUser
+from   quex.engine.mode                   import IndexRange, \
+                                                 index_range_entered
+from   quex.input.code.core               import CodeUser, \
+                                                 CodeUserKeyword
 from   quex.input.code.base               import SourceRef
                                           
 import quex.engine.misc.error             as     error
 import quex.engine.misc.similarity        as     similarity
+import quex.engine.misc.phase_stats       as     phase_stats
 from   quex.engine.misc.file_in           import EndOfStreamException, \
                                                  check, \
                                                  check_or_die, \
@@ -45,23 +49,32 @@ def parse(fh, mode_parsed_db):
         error.log("Earlier definition here.",
                   mode_parsed_db[new_mode.name].sr)
 
+    # Modes which are defined before the mode determine its index range.
+    if Setup.incremental_f:
+        new_mode.index_range = IndexRange(mode_name, len(mode_parsed_db))
+
     mode_parsed_db[new_mode.name] = new_mode
 
+    with index_range_entered(new_mode.index_range):
+        _parse_body(fh, new_mode, position)
+
+def _parse_body(fh, new_mode, position):
     # (*) inherited modes / option_db
     skip_whitespace(fh)
     dummy = fh.read(1)
     if dummy not in [":", "{"]:
-        error.log("missing ':' or '{' after mode '%s'" % mode_name, fh)
+        error.log("missing ':' or '{' after mode '%s'" % new_mode.name, fh)
 
     if dummy == ":":
         new_mode.direct_base_mode_name_list = _parse_base_mode_list(fh)
         _parse_option_list(fh, new_mode)
 
     # (*) read in pattern-action pairs and events
-    while not check(fh, "}"): 
-        if check_end_of_file(fh):
-            error.log("End of file reached while parsing mode '%s'." % mode_name, fh, position)
-        _parse_pattern_action_pair(new_mode, fh)
+    with phase_stats.context(Mode=new_mode.name):
+        while not check(fh, "}"): 
+            if check_end_of_file(fh):
+                error.log("End of file reached while parsing mode '%s'." % new_mode.name, fh, position)
+            _parse_pattern_action_pair(new_mode, fh)
 
 def _parse_base_mode_list(fh):
     """RETURNS: List of names of direct base modes.
@@ -299,7 +312,8 @@ def __parse_keyword_list_and_action(new_mode, fh):
                             "l": "make correspondent token identifiers lowercase.",
                             "N": "(default) pass LexemeNull to token contructor.",
                             "L": "pass Lexeme to token constructor.",
-                            "i": "implicit token identifier definition."},
+                            "i": "implicit token identifier definition.",
+                            "h": "identify keywords by a perfect hash in a subsequent identifier pattern."},
                            BadCombinationList=["ul", "NL"])
 
     lexeme_null_f  = "N" in flags
@@ -307,6 +321,8 @@ def __parse_keyword_list_and_action(new_mode, fh):
     implicit_tid_f = "i" in flags
     lowercase_f    = "l" in flags
     uppercase_f    = "u" in flags
+    hash_f         = "h" in flags
+    list_sr        = SourceRef.from_FileHandle(fh, new_mode.name)
 
     skip_whitespace(fh)
     prefix = read_identifier(fh)
@@ -329,6 +345,7 @@ def __parse_keyword_list_and_action(new_mode, fh):
         code    = code_fragment.get_CodeUser_for_token_sending(fh, identifier, position,
                                                                LexemeNullF = lexeme_null_f,
                                                                LexemeF     = lexeme_f)
+        if hash_f: code = CodeUserKeyword(code.get_code(), code.sr, list_sr)
         new_mode.add_pattern_action_pair(pattern, code, fh)
     return True
 
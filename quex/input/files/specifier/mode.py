@@ -12,7 +12,8 @@ from   quex.engine.analyzer.state.core                   import ReloadState
 from   quex.engine.incidence_db                          import IncidenceDB
 from   quex.engine.pattern                               import Pattern           
 from   quex.engine.counter                               import CountActionMap
-from   quex.engine.mode                                  import Mode           
+from   quex.engine.mode                                  import Mode, \
+                                                                index_range_entered
 import quex.engine.misc.error                            as     error
 from   quex.engine.misc.tools                            import typed, flatten
 
@@ -24,7 +25,8 @@ from   itertools   import islice
 class Mode_Builder:
     def __init__(self, parsed_mode):
         self.dial_db = DialDB()
-        self.reload_state_forward = ReloadState(EngineType=engine.FORWARD, dial_db=self.dial_db)
+        with index_range_entered(parsed_mode.index_range):
+            self.reload_state_forward = ReloadState(EngineType=engine.FORWARD, dial_db=self.dial_db)
 
         self.parsed_mode = parsed_mode
         self.__product_Mode_Prep = None
@@ -54,6 +56,10 @@ class Mode_Builder:
         assert BaseModeSequence
         assert BaseModeSequence[-1].name == self.name
 
+        with index_range_entered(self.parsed_mode.index_range):
+            self.__collect_base_mode_information(BaseModeSequence, DerivedModeNameDb)
+
+    def __collect_base_mode_information(self, BaseModeSequence, DerivedModeNameDb):
         # IncidenceDb
         #
         incidence_db = IncidenceDB.from_BaseModeSequence(BaseModeSequence)
@@ -78,6 +84,10 @@ class Mode_Builder:
                                              self.parsed_mode.reprioritization_info_list)
 
     def collect_and_prioritize_patterns(self, mode_prep_db):
+        with index_range_entered(self.parsed_mode.index_range):
+            self.__collect_and_prioritize_patterns(mode_prep_db)
+
+    def __collect_and_prioritize_patterns(self, mode_prep_db):
         # (*) Mode_Prep: pre finalize
         #     All patterns of all modes have been finalized
         #     => collect all patterns and loopers from base modes 
@@ -117,14 +127,16 @@ class Mode_Builder:
         mp = self.__product_Mode_Prep
         assert mp.implemented_f()
 
-        self.__product_Mode = Mode(mp.name, mp.sr, mp.pattern_list, 
-                    self.terminal_db, self.extra_analyzer_list, mp.incidence_db,
-                    CaMap4RunTimeCounter = self.ca_map_for_run_time_counter,
-                    ReloadStateForward   = self.reload_state_forward,
-                    RequiredRegisterSet  = self.required_register_set,
-                    Documentation        = self.doc, 
-                    dial_db              = self.dial_db,
-                    IndentationHandlingF = mp.loopers.indentation_handler is not None)
+        with index_range_entered(self.parsed_mode.index_range):
+            self.__product_Mode = Mode(mp.name, mp.sr, mp.pattern_list, 
+                        self.terminal_db, self.extra_analyzer_list, mp.incidence_db,
+                        CaMap4RunTimeCounter = self.ca_map_for_run_time_counter,
+                        ReloadStateForward   = self.reload_state_forward,
+                        RequiredRegisterSet  = self.required_register_set,
+                        Documentation        = self.doc, 
+                        dial_db              = self.dial_db,
+                        IndentationHandlingF = mp.loopers.indentation_handler is not None,
+                        TheIndexRange        = self.parsed_mode.index_range)
 
 
 class Loopers:
@@ -274,7 +286,8 @@ class ModeParsed:
                  "pattern_action_pair_list",
                  "incidence_db",
                  "reprioritization_info_list",
-                 "deletion_info_list")
+                 "deletion_info_list",
+                 "index_range")
 
     def __init__(self, Name, SourceReference):
         # Register ModeParsed at the mode database
@@ -290,6 +303,9 @@ class ModeParsed:
         self.reprioritization_info_list = []  
         self.deletion_info_list         = [] 
 
+        # Range for state indices, if generated with '--incremental'.
+        self.index_range                = None 
+
     @typed(ThePattern=Pattern_Prep, Action=CodeUser)
     def add_pattern_action_pair(self, ThePattern, TheAction, fh):
         ThePattern.assert_consistency()
@@ -368,7 +384,7 @@ class Mode_Prep:
         entry_mode_name_list.extend(flatten(
             DerivedModeNameDb[mode_name] for mode_name in option_db.value_list("entry")
             if mode_name in DerivedModeNameDb))
-        self.entry_mode_name_list = list(set(entry_mode_name_list))
+        self.entry_mode_name_list = sorted(set(entry_mode_name_list))
 
     def implemented_f(self):
         """If the mode has incidences and/or patterns defined it is free to be 
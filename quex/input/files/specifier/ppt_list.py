@@ -14,6 +14,9 @@ repriorization is implemented. Finaly, a mode's pattern list and terminal
 database is extracted.
 """
 from   quex.input.regular_expression.pattern        import Pattern_Prep
+from   quex.input.code.core                         import CodeUser, \
+                                                           CodeUserKeyword
+from   quex.input.code.base                         import SourceRef
 from   quex.engine.counter                          import CountActionMap
 from   quex.engine.misc.tools                       import do_and_delete_if
 from   quex.engine.pattern                          import Pattern
@@ -30,6 +33,7 @@ import quex.engine.analyzer.door_id_address_label   as     dial
 import quex.engine.misc.error_check                 as     error_check
 from   quex.engine.misc.tools                       import typed
 import quex.engine.misc.error                       as     error
+import quex.engine.misc.perfect_hash                as     perfect_hash
 from   quex.engine.misc.quex_enum                   import QuexEnum
 import quex.engine.loop.skip_character_set          as     skip_character_set
 import quex.engine.loop.skip_nested_range           as     skip_nested_range
@@ -42,6 +46,7 @@ from   collections  import namedtuple
 from   operator     import attrgetter
 
 from   quex.blackboard import setup as Setup, \
+                              Lng, \
                               standard_incidence_db_get_terminal_type, \
                               E_IncidenceIDs
 
@@ -126,6 +131,7 @@ class PPTList_Builder(list):
         builder.collect_match_pattern(mp.base_mode_sequence)
         builder.collect_loopers(mp.loopers, mp.ca_map, reload_state_forward) 
         builder.delete_and_reprioritize(mp.base_mode_sequence)
+        builder.keyword_hash()
         builder.finalize(mp)
 
         return builder.pattern_list, \
@@ -155,12 +161,15 @@ class PPTList_Builder(list):
                 for pap in mode_prep.pattern_action_pair_list:
                     yield mode_hierarchy_index, pap.pattern(), pap.action()
 
-        self.extend(
-            PPT(PatternPriority(mhi, pattern.incidence_id), 
-                pattern, 
-                self.terminal_factory.do_match_pattern(code, pattern))
-            for mhi, pattern, code in pap_iterator(BaseModeSequence)
-        )
+        # Priority objects persist through repriorization => identify user code.
+        self.code_db = {}
+        for mhi, pattern, code in pap_iterator(BaseModeSequence):
+            priority = PatternPriority(mhi, pattern.incidence_id)
+            self.code_db[id(priority)] = code
+            self.append(
+                PPT(priority, pattern, 
+                    self.terminal_factory.do_match_pattern(code, pattern))
+            )
 
     @typed(CaMap=CountActionMap)
     def collect_loopers(self, Loopers, CaMap, ReloadState):
@@ -222,6 +231,88 @@ class PPTList_Builder(list):
         self._assert_incidence_id_consistency([p.incidence_id for dummy, p, t in self])
         #________________
 
+    def keyword_hash(self):
+        """Keywords from a 'keyword_list' with flag 'h' are not matched by 
+        patterns of their own. The first subsequent pattern which matches all
+        of them, the 'carrier' (typically an identifier), matches them instead.
+        Its terminal identifies the keyword by a minimal perfect hash on the 
+        lexeme. The priorities are maintained, if no pattern between a keyword
+        and the carrier matches the keyword. Else, the keywords remain patterns
+        of their own.
+
+        Groups are handled from the lowest to the highest priority. Thus, a
+        group of higher priority dispatches before a group of lower priority
+        that shares the same carrier.
+        """
+        group_db = {}
+        for i, ppt in enumerate(self):
+            code = self.code_db.get(id(ppt.priority))
+            if not isinstance(code, CodeUserKeyword): continue
+            group_db.setdefault(code.keyword_list_sr, []).append(i)
+
+        for sr, index_list in sorted(group_db.items(), key=lambda x: - x[1][-1]):
+            # Positions in 'self' change by deletion. Identify PPTs by priority.
+            priority_set = set(id(self[i].priority) for i in index_list)
+            self._keyword_hash_group(sr, priority_set)
+
+    def _keyword_hash_group(self, Sr, PrioritySet):
+        index_list = [ 
+            i for i, ppt in enumerate(self) if id(ppt.priority) in PrioritySet
+        ]
+        sequence_list = [ self[i].pattern.sm.get_sequence() for i in index_list ]
+        def no_hash(Comment):
+            error.warning("keyword_list: no perfect hash, %s." % Comment, Sr)
+
+        if any(sequence is None or _has_context(self[i].pattern)
+               for i, sequence in zip(index_list, sequence_list)):
+            return no_hash("keywords must be plain strings")
+
+        for carrier_i in range(index_list[-1] + 1, len(self)):
+            carrier = self[carrier_i]
+            if     not _has_context(carrier.pattern) \
+               and all(_may_match(carrier.pattern, sequence) for sequence in sequence_list): 
+                break
+        else:
+            return no_hash("no subsequent pattern matches all keywords")
+
+        for i in range(index_list[0] + 1, carrier_i):
+            if id(self[i].priority) in PrioritySet: continue
+            for k, sequence in zip(index_list, sequence_list):
+                if k < i and _may_match(self[i].pattern, sequence):
+                    return no_hash("pattern '%s' matches keyword" % self[i].pattern.pattern_string())
+
+        if any(not Setup.buffer_encoding.source_set.contains(x) 
+               for sequence in sequence_list for x in sequence):
+            return no_hash("keyword cannot be represented in buffer encoding")
+
+        # Keywords of same lexeme: the first has precedence.
+        # Lexemes are hashed as they appear in the buffer, i.e. encoded.
+        case_db = {}
+        for k, sequence in zip(index_list, sequence_list):
+            lexeme = tuple(
+                x for c in sequence for x in Setup.buffer_encoding.do_single(c)
+            )
+            case_db.setdefault(lexeme, self.code_db[id(self[k].priority)])
+        sequence_list = list(case_db.keys())
+
+        result = perfect_hash.do(sequence_list)
+        if result is None: 
+            return no_hash("hash construction failed")
+        displacement_list, slot_list = result
+
+        carrier_code = self.code_db[id(carrier.priority)]
+        dispatch     = Lng.KEYWORD_HASH_DISPATCH(
+            [ sequence_list[i] for i in slot_list ], 
+            displacement_list, 
+            [ Lng.SOURCE_REFERENCED(case_db[sequence_list[i]]) for i in slot_list ],
+            Lng.SOURCE_REFERENCED(carrier_code)
+        )
+        new_code     = CodeUser([ dispatch ], SourceRef())
+        self.code_db[id(carrier.priority)] = new_code
+        self[carrier_i] = PPT(carrier.priority, carrier.pattern,
+                              self.terminal_factory.do_match_pattern(new_code, carrier.pattern))
+        do_and_delete_if(self, lambda ppt, dummy: id(ppt.priority) in PrioritySet, None)
+
     @staticmethod
     def _adapt_pattern_id_to_priority(ppt_list):
         """Ensure that the incidence-id of each pattern fits the position in 
@@ -641,6 +732,26 @@ class PPTList_Builder(list):
 
         return only_common_f
 
+def _has_context(ThePattern):
+    """RETURNS: True, if 'ThePattern' has a pre- or post-context.
+    """
+    return    ThePattern.has_pre_context() \
+           or ThePattern.sm_bipd_to_be_reversed is not None \
+           or any(state.input_position_restore_f() or state.acceptance_condition_set()
+                  for state in ThePattern.sm.states.values())
+
+def _may_match(ThePattern, Sequence):
+    """RETURNS: True, if 'ThePattern' may match the lexeme 'Sequence'. For 
+                patterns with context, this is a conservative guess.
+    """
+    sm = ThePattern.sm
+    si = sm.init_state_index
+    for x in Sequence:
+        si = sm.states[si].target_map.get_resulting_target_state_index(x)
+        if si is None: return False
+
+    return sm.states[si].is_acceptance() or _has_context(ThePattern)
+
 def check_indentation_setup(isetup):
     """None of the elements 'comment', 'newline', 'newline_suppressor' should 
        not match some subsets of each other. Otherwise, the behavior would be 
@@ -2,10 +2,12 @@
 # (C) 2005-2020 Frank-Rene Schaefer; 
 #_______________________________________________________________________________
 import quex.engine.misc.error                   as     error
+import quex.engine.misc.phase_stats             as     phase_stats
 from   quex.engine.misc.unistream               import UniStream
 from   quex.engine.misc.file_in                 import EndOfStreamException, \
                                                        check_end_of_file
 from   quex.engine.state_machine.core           import DFA 
+from   quex.input.code.base                     import SourceRef
 from   quex.input.regular_expression.exception  import RegularExpressionException
 import quex.blackboard                          as     blackboard
 import quex.input.regular_expression.engine     as     regex
@@ -59,11 +61,12 @@ def __core(sh, AllowNothingIsNecessaryF, Terminator, AllowLogicOrAfterPostContex
     """
     start_position = sh.tell()
     try:
-        result = regex.do(sh, blackboard.shorthand_db, 
-                          AllowNothingIsNecessaryF = AllowNothingIsNecessaryF,
-                          SpecialTerminator        = Terminator,
-                          AllowLogicOrAfterPostContextF = AllowLogicOrAfterPostContextF,
-                          AllowEmptyF = AllowEmptyF)
+        with phase_stats.phase("regex snapping", Pattern=__stats_label(sh)):
+            result = regex.do(sh, blackboard.shorthand_db, 
+                              AllowNothingIsNecessaryF = AllowNothingIsNecessaryF,
+                              SpecialTerminator        = Terminator,
+                              AllowLogicOrAfterPostContextF = AllowLogicOrAfterPostContextF,
+                              AllowEmptyF = AllowEmptyF)
         if result is None:
             if check_end_of_file(sh):
                 raise EndOfStreamException()
@@ -76,6 +79,18 @@ def __core(sh, AllowNothingIsNecessaryF, Terminator, AllowLogicOrAfterPostContex
 
     return result
 
+def __stats_label(sh):
+    """RETURNS: Name under which the regular expression at the current stream
+                position appears in the phase statistics ('--stats-phases').
+                None, if no statistics are collected.
+    """
+    if not phase_stats.is_enabled(): return None
+    sr       = SourceRef.from_FileHandle(sh)
+    position = sh.tell()
+    txt      = sh.readline().strip()
+    sh.seek(position)
+    return "%s:%i: %s" % (sr.file_name, sr.line_n, txt[:40])
+
 def __check(pattern, AllowPreContextF, AllowPostContextF, sh, pos, Name):
     if pattern is not None:
         if     pattern.pre_context_trivial_begin_of_line_f \
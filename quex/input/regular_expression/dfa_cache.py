@@ -0,0 +1,244 @@
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+# Persistent DFA Cache (command line option '--dfa-cache DIR')
+#
+# Parsing a regular expression involves the construction of NFAs, their
+# transformation into DFAs, and Hopcroft minimization. For lexical analyzers
+# with many patterns, this dominates the time to generate the analyzer. Most
+# of the patterns, though, remain the same from one run to the next.
+#
+# The cache stores the DFAs which result from parsing a regular expression
+# in a directory. An entry is addressed by a fingerprint of everything that
+# determines the parse result:
+#
+#   -- The text of the line starting from the regular expression, plus the
+#      next characters following the line. The parser may look beyond the
+#      end of the regular expression (e.g. checking for '/' or '|'), but an
+#      entry is only stored if the regular expression ended inside the line.
+#   -- The definitions of the shorthands ('define' section) that are
+#      referenced in that text, recursively.
+#   -- The buffer encoding and the setup flags that influence the parser.
+#   -- The version of quex and of the cache format.
+#
+# Upon a hit, the stream is positioned right behind the regular expression.
+# The generated code must not depend on the state of the cache. Thus, a hit
+# must leave the same state indices and state machine ids as a parse. An 
+# entry stores the values of the index counters before and after the parse.
+# Upon load, the stored indices are shifted onto the current counter values
+# and the counters are set to where the parse would have left them. Computing
+# the key does not consume any index.
+#_______________________________________________________________________________
+from   quex.input.regular_expression.macro import PatternShorthand
+from   quex.engine.misc.file_in            import skip_whitespace
+from   quex.engine.misc.file_operations    import read_between_positions
+from   quex.DEFINITIONS                    import QUEX_VERSION
+from   quex.blackboard                     import setup as Setup
+import quex.engine.state_machine.index     as     state_machine_index
+from   quex.engine.operations.se_operations import SeAccept, SeStoreInputPosition
+
+from   collections import namedtuple
+import hashlib
+import pickle
+import os
+import re
+
+CACHE_FORMAT_VERSION = 3
+LOOKAHEAD_N          = 8   # >= length of the longest word the parser checks
+                           # for behind a regular expression ('<<EOS>>').
+
+CacheKey = namedtuple("CacheKey", ("digest", "start_position", "line", "counter"))
+
+_shorthand_reference_re = re.compile(r"\{\s*(\w+)")
+_fingerprint_db         = {}
+
+def key(stream, PatternDict, SpecialTerminator):
+    """RETURNS: CacheKey for the regular expression starting at the current
+                position of 'stream'.
+                None, if no cache directory is specified.
+
+    The stream position remains unchanged.
+    """
+    if not Setup.dfa_cache_dir: return None
+
+    # Shorthand fingerprints clone DFAs => restore the index counters.
+    counter        = state_machine_index.snapshot()
+    start_position = stream.tell()
+    line           = stream.readline()
+    skip_whitespace(stream)
+    lookahead      = stream.read(LOOKAHEAD_N)
+    stream.seek(start_position)
+
+    txt = [
+        "%s:%s" % (QUEX_VERSION, CACHE_FORMAT_VERSION),
+        Setup.buffer_encoding.name,
+        Setup.buffer_encoding.source_set.get_string(Option="hex"),
+        repr(Setup.pre_context_begin_of_line_implies_begin_of_stream_f),
+        repr(Setup.post_context_end_of_line_implies_end_of_stream_f),
+        repr(SpecialTerminator),
+        line,
+        lookahead,
+    ]
+    txt.extend(_shorthand_fingerprints(line, PatternDict, set()))
+
+    state_machine_index.restore(counter)
+
+    digest = hashlib.sha1("\0".join(txt).encode("utf8")).hexdigest()
+    return CacheKey(digest, start_position, line, counter)
+
+def load(stream, Key):
+    """RETURNS: [0] pre-context DFA (or None)
+                [1] core DFA
+                [2] post-context DFA (or None)
+                for the given 'Key'. None, if no valid entry is present.
+
+    Upon success, the stream is positioned behind the regular expression.
+    """
+    if Key is None: return None
+
+    try:
+        with open(_file_name(Key), "rb") as fh:
+            char_n, begin, end, pre, core, post = pickle.load(fh)
+    except Exception:
+        # Missing, truncated, or outdated cache files are simply ignored.
+        return None
+
+    stream.seek(Key.start_position)
+    stream.read(char_n)
+
+    # Indices as if the parse had started with the current counter values.
+    si_delta = Key.counter[0] - begin[0]
+    id_delta = Key.counter[1] - begin[1]
+    result   = tuple(_shifted_clone(dfa, si_delta, id_delta) for dfa in (pre, core, post))
+    state_machine_index.restore((end[0] + si_delta, end[1] + id_delta))
+    return result
+
+def store(stream, Key, Pre, Core, Post):
+    """Stores the result of a parse (started at 'Key.start_position') in the
+    cache. The stream must be positioned behind the parsed regular expression.
+    """
+    if Key is None or Core is None: return
+
+    end_position = stream.tell()
+    consumed     = read_between_positions(stream, Key.start_position, end_position)
+    stream.seek(end_position)
+
+    # The parse result is only determined by the key, if the regular
+    # expression did not reach beyond the line that was used for the key.
+    if not Key.line.startswith(consumed): return
+
+    # Only indices allocated during the parse can be shifted upon load.
+    begin = Key.counter
+    end   = state_machine_index.snapshot()
+    if not all(_indices_in_range(dfa, begin, end) for dfa in (Pre, Core, Post)): 
+        return
+
+    file_name = _file_name(Key)
+    tmp_name  = "%s.%i.tmp" % (file_name, os.getpid())
+    try:
+        if not os.path.isdir(Setup.dfa_cache_dir): os.makedirs(Setup.dfa_cache_dir)
+        with open(tmp_name, "wb") as fh:
+            pickle.dump((len(consumed), begin, end, Pre, Core, Post), fh, 
+                        pickle.HIGHEST_PROTOCOL)
+        # Atomic replacement: concurrent runs never see half written files.
+        os.replace(tmp_name, file_name)
+    except OSError:
+        # A cache that cannot be written is not an error.
+        if os.path.exists(tmp_name): os.remove(tmp_name)
+
+def _file_name(Key):
+    return os.path.join(Setup.dfa_cache_dir, "%s.dfa" % Key.digest)
+
+def _shifted_clone(Dfa, SiDelta, IdDelta):
+    """RETURNS: Clone of 'Dfa' where state indices are shifted by 'SiDelta', 
+                and state machine ids (DFA id, acceptance conditions) are 
+                shifted by 'IdDelta'. Acceptance ids are not specific (see
+                '_indices_in_range()') and remain as they are.
+    """
+    if Dfa is None: return None
+
+    def shift(Id):
+        if isinstance(Id, int): return Id + IdDelta
+        else:                   return Id
+
+    acceptance_id_set, condition_id_set = _id_sets(Dfa)
+    return Dfa.clone(ReplDbStateIndex = dict((si, si + SiDelta) for si in Dfa.states),
+                     ReplDbPreContext = dict((x, shift(x)) for x in condition_id_set),
+                     StateMachineId   = shift(Dfa.get_id()))
+
+def _indices_in_range(Dfa, Begin, End):
+    """RETURNS: True, if all state indices and state machine ids in 'Dfa' have
+                been allocated between the counter snapshots 'Begin' and 'End',
+                and no acceptance id is a state machine id.
+    """
+    if Dfa is None: return True
+
+    acceptance_id_set, condition_id_set = _id_sets(Dfa)
+    id_list = [ 
+        x for x in condition_id_set | set([Dfa.get_id()]) if isinstance(x, int) 
+    ]
+    return    not any(isinstance(x, int) for x in acceptance_id_set) \
+           and all(Begin[0] <= si < End[0] for si in Dfa.states) \
+           and all(Begin[1] <= x  < End[1] for x  in id_list)
+
+def _id_sets(Dfa):
+    """RETURNS: [0] Set of acceptance ids that appear in 'Dfa'.
+                [1] Set of acceptance condition ids that appear in 'Dfa'.
+    """
+    acceptance_id_set = set()
+    condition_id_set  = set()
+    for state in Dfa.states.values():
+        for cmd in state.single_entry.get_iterable(SeAccept):
+            acceptance_id_set.add(cmd.acceptance_id())
+            condition_id_set.update(cmd.acceptance_condition_set())
+        for cmd in state.single_entry.get_iterable(SeStoreInputPosition):
+            acceptance_id_set.add(cmd.acceptance_id())
+    return acceptance_id_set, condition_id_set
+
+def _shorthand_fingerprints(Txt, PatternDict, done_set):
+    """RETURNS: List of fingerprints of all shorthands referenced in 'Txt'
+                (as '{NAME...'), including the shorthands that are referenced
+                by macros.
+
+    Any '{identifier' is considered a potential reference. Non-references
+    (e.g. '\\P{Script=Greek}') only cause an unnecessary entry in the list.
+    """
+    result = []
+    for name in _shorthand_reference_re.findall(Txt):
+        if name in done_set: continue
+        done_set.add(name)
+        shorthand = PatternDict.get(name)
+        if shorthand is None:
+            result.append("%s:<undefined>" % name)
+            continue
+
+        result.append("%s:%s" % (name, _fingerprint(shorthand)))
+        macro = shorthand.get_MacroCall()
+        if macro is not None:
+            result.extend(_shorthand_fingerprints(macro.source_txt, PatternDict, done_set))
+    return result
+
+def _fingerprint(Shorthand):
+    """RETURNS: String which describes the value of the given shorthand.
+
+    Fingerprints are computed once per shorthand object. The object is kept
+    in the database, so that its 'id()' cannot be reused by another object.
+    """
+    assert isinstance(Shorthand, PatternShorthand)
+    entry = _fingerprint_db.get(id(Shorthand))
+    if entry is not None: return entry[1]
+
+    macro   = Shorthand.get_MacroCall()
+    integer = Shorthand.get_integer()
+    dfa     = Shorthand.get_DFA()
+    if   macro is not None:
+        txt = "macro(%s):%s" % (repr(macro.argument_list), macro.source_txt)
+    elif integer is not None:
+        txt = "integer:%i" % integer
+    elif dfa is not None:
+        txt = "dfa:%s" % dfa.get_string(NormalizeF=True, Option="hex")
+    else:
+        txt = "<none>"
+
+    _fingerprint_db[id(Shorthand)] = (Shorthand, txt)
+    return txt
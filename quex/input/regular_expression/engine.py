@@ -51,6 +51,7 @@ import quex.input.regular_expression.traditional_character_set  as     tradition
 from   quex.input.regular_expression.macro                      import PatternShorthand
 import quex.input.regular_expression.property                   as     unicode_property
 from   quex.input.regular_expression.pattern                    import Pattern_Prep
+import quex.input.regular_expression.dfa_cache                  as     dfa_cache
 import quex.input.regular_expression.snap_backslashed_character as     snap_backslashed_character
 from   quex.input.regular_expression.snap_backslashed_character import __parse_hex_number
 from   quex.input.regular_expression.debug                      import __debug_entry, \
@@ -129,7 +130,13 @@ def do(UTF8_String_or_Stream, PatternDict,
 
     # -- MAIN: transform the pattern into a state machine
     sr = SourceRef.from_FileHandle(stream)
-    pre, core, post = snap_conditional_expression(stream, PatternDict)
+    cache_key = dfa_cache.key(stream, PatternDict, SPECIAL_TERMINATOR)
+    cached    = dfa_cache.load(stream, cache_key)
+    if cached is not None:
+        pre, core, post = cached
+    else:
+        pre, core, post = snap_conditional_expression(stream, PatternDict)
+        dfa_cache.store(stream, cache_key, pre, core, post)
 
     if core is None: 
         stream.seek(initial_position)
@@ -194,6 +194,8 @@ class QuexSetup:
         self.output_configuration_file = self.prepare_file_name("-configuration", E_Files.HEADER)
         self.output_configuration_file_cmake = "%s.in" % self.output_configuration_file
         self.output_token_id_file      = self.prepare_file_name("-token_ids",     E_Files.HEADER)
+        self.output_manifest_file      = self.get_file_reference("%s-manifest.json" % self.output_file_stem)
+        self.output_phase_stats_file   = self.get_file_reference("%s-phases.json" % self.output_file_stem)
         if self.extern_token_id_file:
             self.output_token_id_file_ref = self.extern_token_id_file
         else:
@@ -253,8 +255,11 @@ SETUP_INFO = {
     "converter_only_f":               [["--converter-only", "--co"],           SetupParTypes.FLAG],
     "converter_source_name":          [["--converter-source-name", "--csn"],  ""],
     "count_column_number_f":          [["--no-count-columns", "--ncc"],        SetupParTypes.NEGATED_FLAG],
+    "count_lazy_f":                   [["--count-lazy"],                       SetupParTypes.FLAG],
     "count_line_number_f":            [["--no-count-lines", "--ncl"],          SetupParTypes.NEGATED_FLAG],
+    "dfa_cache_dir":                  [["--dfa-cache"],                        ""],
     "dos_carriage_return_newline_f":  [["--no-DOS"],                           SetupParTypes.NEGATED_FLAG],
+    "engine_style":                   [["--engine-style"],                     "direct"],
     "extern_token_class_file":        [["--token-class-file"],                 ""],
     "extern_token_id_file_show_f":    [["--foreign-token-id-file-show"],       SetupParTypes.FLAG],
     "extern_token_id_specification":  [["--foreign-token-id-file"],            SetupParTypes.LIST],  
@@ -264,8 +269,10 @@ SETUP_INFO = {
     "implement_lib_lexeme_f":         [["--no-lib-lexeme", "--nll"],         SetupParTypes.NEGATED_FLAG],
     "implement_lib_quex_f":           [["--no-lib-quex", "--nlq"],           SetupParTypes.NEGATED_FLAG],
     "indentation_stack_size":         [["--indentation-stack-size", "--indss" ], 1024],
+    "incremental_f":                  [["--incremental"],                      SetupParTypes.FLAG],
     "input_mode_files":               [["-i"],                                 SetupParTypes.LIST],
     "insight_f":                      [["--insight"],                          SetupParTypes.FLAG],
+    "job_n":                          [["--jobs", "-j"],                       1],
     "language":                       [["--language", "-l"],                 "C++"],
     "memory_management_extern_f":     [["--extern-memory-management", "--emm"], SetupParTypes.FLAG],
     "mode_stack_size":                [["--mode-stack-size",        "--mss" ],   64],
@@ -274,10 +281,13 @@ SETUP_INFO = {
     "output_directory":               [["--output-directory", "--odir"],     ""],
     "output_file_naming_scheme":      [["--file-extension-scheme", "--fes"], ""],
     "path_limit_code":                [["--path-termination"],                 0x1],
+    "profile_generate_f":             [["--profile-generate"],                 SetupParTypes.FLAG],
+    "profile_use_file_name":          [["--profile-use"],                      ""],
     "post_context_end_of_line_implies_end_of_stream_f":    [["--not-eol-is-eos", "--neie"], SetupParTypes.NEGATED_FLAG],
     "pre_context_begin_of_line_implies_begin_of_stream_f": [["--not-bol-is-bos", "--nbib"], SetupParTypes.NEGATED_FLAG],
     "quex_lib":                       [["--ql", "--quex-lib"],                 ""],    
     "show_name_spaces_f":             [["--show-name-spaces", "--sns"],      SetupParTypes.FLAG],
+    "stats_phases_f":                 [["--stats-phases"],                     SetupParTypes.FLAG],
     "standard_library_tiny_f":        [["--tiny-stdlib",  "--tsl"],            SetupParTypes.FLAG],
     "standard_library_usage_f":       [["--no-stdlib", "--nostdlib", "--nsl"], SetupParTypes.NEGATED_FLAG],
     "suppressed_notification_list":   [["--suppress", "-s"],                   SetupParTypes.INT_LIST],
@@ -291,8 +301,10 @@ SETUP_INFO = {
     "token_id_type":                  [["--token-id-type"],                  ""],
     "token_line_n_type":              [["--token-line-n-type"],              ""],
     "token_column_n_type":            [["--token-column-n-type"],            ""],
+    "token_columns_f":                [["--token-columns"],                  SetupParTypes.FLAG],
     "token_queue_size":               [["--token-queue-size"],               64],
     "token_repetition_n_member_name": [["--token-repetition-n-member-name", "--trnmn"], ""],
+    "trace_analysis_type":            [["--trace-analysis"],                 "paths"],
     "unit_test_f":                    [["--unit-test"],                      SetupParTypes.NEGATED_FLAG],
     "user_application_version_id":    [["--version-id"],                     "0.0.0-pre-release"],
     #
@@ -336,6 +348,8 @@ SETUP_INFO = {
     "output_header_file":                        None,
     "output_configuration_file":                 None,
     "output_code_file":                          None,
+    "output_manifest_file":                      None,
+    "output_phase_stats_file":                   None,
     "output_file_stem":                          "",
     "output_token_id_file":                      None,
     "output_token_class_file_implementation":    None,
@@ -693,15 +707,22 @@ DOC = {
     "compression_path_f":             ("Activate path compression.", ""),
     "compression_path_uniform_f":     ("Activate path compression with constraint of uniformity.", ""),
     "count_column_number_f":          ("Activate column number counting.", ""),
+    "count_lazy_f":                   ("Do not count per pattern. Stamp tokens with the lexatom index of their begin and compute line and column numbers on demand from a newline index of the buffer. The index grows with the number of lines, unless positions before a given lexatom index are released with 'line_column_forget()'.", ""),
     "count_line_number_f":            ("Activate line number counting.", ""),
     "character_display":              ("", ""),
     "path_limit_code":                ("", ""),
+    "profile_generate_f":             ("Generate an analyzer that counts the lexatoms per state and interval of its transition map and saves the counts upon destruction.", ""),
+    "profile_use_file_name":          ("Lay out transition maps according to the lexatom counts from the given file (produced by an analyzer generated with '--profile-generate').", ""),
+    "dfa_cache_dir":                  ("Directory where DFAs of parsed regular expressions are cached.", ""),
     "dos_carriage_return_newline_f":  ("", ""),
+    "engine_style":                   ("Implementation of transition maps: 'direct' (coded) or 'table' (comb-vector compressed tables).", ""),
     "string_accumulator_f":           ("", ""),
     "converter_iconv_f":              ("Use 'iconv' library for character conversions.", ""),
     "converter_icu_f":                ("Use 'icu' library for character conversions.", ""),
     "include_stack_support_f":        ("", ""),
+    "incremental_f":                  ("Reuse analyzer code of unchanged modes from the previous run.", ""),
     "input_mode_files":               ("", ""),
+    "job_n":                          ("Number of processes generating mode analyzers and checking pattern pairs for consistency in parallel.", ""),
     "extern_token_class_file":               ("", ""),
     "token_class":                    ("", ""),
     "token_class_only_f":             ("", ""),
@@ -709,6 +730,8 @@ DOC = {
     "token_id_type":                  ("", ""),
     "token_id_prefix":                ("", ""),
     "token_queue_size":               ("", ""),
+    "token_columns_f":                ("Implement a columnar token sink. Token id, lexeme position, lexeme length, and the line and column stamps of the token type are appended into parallel arrays instead of token objects.", ""),
+    "trace_analysis_type":            ("Analysis of acceptance and input positions: 'paths' or 'dataflow'.", ""),
     "token_policy":                   ("", ""),
     "token_memory_management_by_user_f": ("", ""),
     "mode_transition_check_f":        ("", ""),
@@ -719,6 +742,7 @@ DOC = {
     "post_categorizer_f":             ("", ""),
     "output_directory":               ("", ""),
     "show_name_spaces_f":             ("", ""),
+    "stats_phases_f":                 ("Report time and memory consumption of generator phases.", ""),
     "single_mode_analyzer_f":         ("", ""),
     "state_entry_analysis_complexity_limit": ("", ""),
     "user_application_version_id":           ("", ""),
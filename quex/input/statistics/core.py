@@ -1,15 +1,32 @@
 # Project Quex (http://quex.sourceforge.net); License: MIT;
-# (C) 2005-2020 Frank-Rene Schaefer; 
+# (C) 2005-2020 Frank-Rene Schaefer;
 #_______________________________________________________________________________
+"""Lexatom statistics of states, as they are saved by an analyzer that has
+been generated with '--profile-generate'. For each state, the statistics
+file contains the borders of the intervals of its transition map and the
+number of lexatoms that appeared in each interval:
+
+        {
+        mode: MODE_NAME;
+        state: STATE_INDEX; {
+        boundary_0 boundary_1 ... boundary_N-1 ;
+        counter_0  counter_1  ... counter_N-1 counter_N ;
+        }
+        }
+
+where 'counter_i' counts the lexatoms 'C' with 'boundary_i-1 <= C < boundary_i'.
+The statistics are used with '--profile-use' to lay out transition maps.
 """
-"""
-import quex.engine.misc.error as     error
-from quex.engine.misc.file_in import read_until_letter, skip_whitespace, check_or_die, read_integer
-from quex.blackboard          import setup as Setup
+import quex.engine.misc.error           as     error
+from   quex.engine.misc.file_in         import read_until_letter, \
+                                               skip_whitespace, \
+                                               check_or_die, \
+                                               check_end_of_file, \
+                                               read_integer
+from   quex.engine.misc.file_operations import open_file_or_die
+from   quex.blackboard                  import setup as Setup
 
-from bisect import bisect_left
-from itertools import islice
-from exception import EndOfStreamException
+from   bisect import bisect_right
 
 class StateStatistics:
     def __init__(self, ModeName, StateIndex, BoundaryList, CounterList):
@@ -20,26 +37,47 @@ class StateStatistics:
 
         # The buffer limit code is not a character that has something to do
         # with the language, it is something that might appear in any state
-        # as soon as a buffer limit is reached. 
+        # as soon as a buffer limit is reached.
         # => Exclude its occurence from any state-specific consideration
         self.blc   = Setup.buffer_limit_code
         self.blc_i = self.get_boundary_index(self.blc)
-        self.counter_list[self.blc_i] = 0
+        if self.blc_i < len(self.counter_list):
+            self.counter_list[self.blc_i] = 0
+
+    def fit(self, TM):
+        """RETURNS: True, if the statistics have been taken on a transition map
+                          with the same intervals as 'TM'.
+                    False, else.
+        """
+        if len(self.counter_list) != len(self.boundary_list) + 1: return False
+        return self.boundary_list == [ interval.begin for interval, target in TM[1:] ]
+
+    def get_count_list(self, TM):
+        """TM is the transition map on which the statistics have been taken--or
+        a part of it.
 
-    def get_outstanding_character(self, transition_list, AC):
+        RETURNS: list of the number of occurrences of lexatoms--one for each
+                 interval of 'TM'.
+        """
+        return [
+            self.counter_list[self.get_boundary_index(interval.begin)]
+            for interval, target in TM
+        ]
+
+    def get_outstanding_character(self, TM, AC):
         """An 'outstanding' character is considered to be a character that
            appears so exceptionally often that it is worth to implement a
-           special test for it before the whole transition map. 
-           
+           special test for it before the whole transition map.
+
                if( input == outstanding_char ) {
                    goto ...;
-               } else { 
+               } else {
                    ... remaining transition map ...
                }
-           
+
            This means that for all other characters the cost increases by one
            comparison, but for the character itself the cost decreases down to
-           a single comparison. 
+           a single comparison.
 
                 (1)  Cost0 = N * AC
 
@@ -61,9 +99,9 @@ class StateStatistics:
 
                 (5)        - N > No * (- (AC )
 
-                (6)                N  
+                (6)                N
                             No > -----
-                                   AC 
+                                   AC
 
            Enequation (6) is now the requirement for an outstanding character.
            Note, that the average cost for classification 'AC' may vary
@@ -73,77 +111,75 @@ class StateStatistics:
            cost would be 'log2(number of intervals)'.
 
            RETURNS: None - if there is no outstanding character.
-                    int  - index of the outstanding character interval in 
-                           transition_list.
+                    int  - index of the outstanding character interval in
+                           transition map 'TM'.
         """
         assert AC != 0
 
-        i_begin = self.get_boundary_index(transition_list[0][0].begin)
-        
-        # Determine total amount of appearances
-        i_end = i_begin + len(transition_list)
-
-        total_count = 0
-        max_count   = -1
-        max_i       = -1
-        for i, count in enumerate(islice(self.counter_list, i_begin, i_end)):
+        count_list  = self.get_count_list(TM)
+        total_count = sum(count_list)
+        max_count   = 0
+        max_i       = None
+        for i, count in enumerate(count_list):
             # The interval's size must be '1' to be a single character
-            if transition_list[i].end > transition_list[i].begin + 1: continue
-            total_count += count
-            if count > max_count: max_count = count; max_i = i;
-        
+            if TM[i][0].size() != 1: continue
+            if count > max_count: max_count = count; max_i = i
+
         if max_count <= (total_count / AC): return None
         else:                               return max_i
 
-    def get_bisectioning_cost(self, transition_list):
-        L = len(transition_list)
-        if L == 0: return 0
-        if L <= 2: return L - 1
-        i = self.get_cut(transition_list)
-        return   self.get_bisectioning_cost(transition_list[:i]) \
-               + self.get_bisectioning_cost(transition_list[i:])
-
-    def get_cut(self, transition_list):
-        i_begin      = self.get_boundary_index(transition_list[0][0].begin)
-        i_end        = len(transition_list) - 1
-        total        = sum(islice(self.counter_list, i_begin, i_end))
-        total_by_two = total / 2.0
+    def get_cut(self, TM):
+        """RETURNS: Index 'i' so that 'TM[:i]' and 'TM[i:]' are met by about the
+                    same number of lexatoms.
+                    None, if no lexatoms appeared in 'TM'.
+        """
+        count_list   = self.get_count_list(TM)
+        total_by_two = sum(count_list) / 2.0
+        if total_by_two == 0: return None
 
         sum_count = 0
-        for i, count in enumerate(islice(self.counter_list, i_begin, i_end)):
+        for i, count in enumerate(count_list[:-1]):
+            if sum_count + count > total_by_two:
+                # Cut before or after the interval 'i', whatever is closer to
+                # the middle.
+                if total_by_two - sum_count < sum_count + count - total_by_two:
+                    return max(1, i)
+                else:
+                    return i + 1
             sum_count += count
-            if sum_count > total_by_two: break
-        return i
+        return len(count_list) - 1
 
     def get_boundary_index(self, Boundary):
-        i_begin = bisect_left(self.boundary_list, Boundary)
-
-        if Boundary != self.boundary_list[i_begin]: self.on_error()
-        return i_begin
+        """RETURNS: Index of the counter of the interval that contains 'Boundary'.
+        """
+        return bisect_right(self.boundary_list, Boundary)
 
     def on_error(self):
-        error.log("Statistics of state %i in mode %s do not fit analyzer structure." \
-                  % (self.state_index, self.mode_name))
+        error.warning("Statistics of state %i in mode %s do not fit analyzer structure." \
+                      % (self.state_index, self.mode_name))
 
 def do(Filename):
-    fh = open(Filename, "r")
+    """RETURNS: map: (mode name, state index) --> StateStatistics
+    """
+    fh = open_file_or_die(Filename, "r")
 
     db = {}
-    try:
-        while 1 + 1 == 2:
-            state_index, statistics = parse_state_statistics(fh)
-            db[state_index] = statistics
-    except EndOfStreamException as x:
-        x
-        return db
-    
+    while 1 + 1 == 2:
+        skip_whitespace(fh)
+        if check_end_of_file(fh): break
+        statistics = parse_state_statistics(fh)
+        db[(statistics.mode_name, statistics.state_index)] = statistics
+
+    fh.close()
+    return db
+
 def parse_state_statistics(fh):
     skip_whitespace(fh)
     check_or_die(fh, "{")
 
     check_or_die(fh, "mode:")
     skip_whitespace(fh)
-    mode_name = read_until_letter(fh, ";")
+    mode_name = read_until_letter(fh, ";").strip()
 
     check_or_die(fh, "state:")
     skip_whitespace(fh)
@@ -159,8 +195,8 @@ def parse_state_statistics(fh):
     check_or_die(fh, "}")
     check_or_die(fh, "}")
 
-    def help(X): list(map(lambda x: int(x), X.strip().split()))
+    def help(X): return [ int(x) for x in X.strip().split() ]
 
-    return StateStatistics(mode_name, state_index, 
-                           help(boundary_list_str), 
+    return StateStatistics(mode_name, state_index,
+                           help(boundary_list_str),
                            help(counter_list_str))
@@ -71,6 +71,7 @@ def declare_member_functions(Txt):
         decl_txt = decl_txt.replace("QUEX_NAME_Converter_", "QUEX_GNAME_LIB(Converter)")
         decl_txt = decl_txt.replace("QUEX_NAME_ByteLoader_", "QUEX_NAME_LIB(ByteLoader)")
         decl_txt = decl_txt.replace("QUEX_NAME_callback_on_token_type_", "QUEX_NAME(callback_on_token_type)")
+        decl_txt = decl_txt.replace("QUEX_NAME_TokenColumns_", "QUEX_NAME(TokenColumns)")
         txt.append(decl_txt)
         last_i = end_i
         signature_list.append(signature)
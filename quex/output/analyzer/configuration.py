@@ -49,6 +49,10 @@ def do(ModeDb):
         ("MODE_STACK_SIZE",                        "(size_t)%s" % mode_stack_size), 
         ("TOKEN_QUEUE_SIZE",                       "(size_t)%s" % repr(Setup.token_queue_size)),
     ]
+    if Setup.profile_generate_f:
+        adaptable_list.append(
+            ("STATISTICS_FILE_NAME",               '"%s-statistics.txt"' % Setup.analyzer_class_name)
+        )
     immutable_list = [
         ("VERSION",                         '"%s"' % QUEX_VERSION),
         ("ANALYZER_VERSION",                '"%s"' % Setup.user_application_version_id),
@@ -0,0 +1,149 @@
+#! /usr/bin/env python
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+# Benchmark for '--engine-style direct' versus '--engine-style table'.
+#
+# USAGE:  benchmark-engine_style.py [KeywordN [InputMegaByteN]]
+#
+# A lexer with 'KeywordN' keywords, identifiers, numbers, and operators is
+# generated in both engine styles and compiled with 'gcc -O2'. For each style,
+# the size of the text and data segments of the compiled analyzer and the
+# throughput on a generated input of 'InputMegaByteN' mega bytes is reported.
+# The token sequences of both styles are checked for identity.
+#
+# Requires 'gcc' and 'size' (binutils).
+#_______________________________________________________________________________
+import os
+import sys
+sys.path.insert(0, os.environ["QUEX_PATH"])
+
+import random
+import shutil
+import subprocess
+import tempfile
+import time
+
+MAIN_C = """
+#include <stdio.h>
+#include <stdint.h>
+#include "Lexer.h"
+
+int main(int argc, char** argv) {
+    Lexer        lex;
+    Lexer_Token* token;
+    size_t       n        = 0;
+    uint32_t     checksum = 0;
+    Lexer_from_file_name(&lex, argv[1], NULL);
+    do {
+        lex.receive(&lex, &token);
+        checksum = checksum * 31 + (uint32_t)token->id;
+        ++n;
+    } while( token->id != QUEX_TKN_TERMINATION );
+    printf("%zu %u\\n", n, (unsigned)checksum);
+    Lexer_destruct(&lex);
+    return 0;
+}
+"""
+
+def keyword_list(KeywordN):
+    random.seed(4711)
+    result = set()
+    while len(result) < KeywordN:
+        result.add("".join(random.choice("abcdefghijklmnopqrstuvwxyz")
+                           for i in range(random.randint(2, 10))))
+    return sorted(result)
+
+def grammar(KeywordList):
+    return "\n".join([
+        "token { ID; NUM; OP; KW; }",
+        "mode MAIN : <skip: [ \\t\\n]> {",
+    ] + [
+        "  \"%s\" => QUEX_TKN_KW;" % keyword for keyword in KeywordList
+    ] + [
+        "  [_a-zA-Z][_a-zA-Z0-9]*      => QUEX_TKN_ID;",
+        "  [0-9]+(\".\"[0-9]+)?        => QUEX_TKN_NUM;",
+        "  \"+\"|\"-\"|\"*\"|\"/\"|\"==\"|\"=\"|\"<=\"|\"<\" => QUEX_TKN_OP;",
+        "}",
+        "start = MAIN;",
+        ""
+    ])
+
+def input_text(KeywordList, ByteN):
+    random.seed(815)
+    word_list = KeywordList + [ "x_%i" % i for i in range(100) ] \
+                            + [ "%i.%i" % (i, i * 7) for i in range(50) ] \
+                            + [ "+", "==", "<=", "/" ]
+    txt  = []
+    size = 0
+    while size < ByteN:
+        line  = " ".join(random.choice(word_list) for i in range(12)) + "\n"
+        size += len(line)
+        txt.append(line)
+    return "".join(txt)
+
+def build(Directory, EngineStyle):
+    """RETURNS: Path to the compiled lexer."""
+    subprocess.check_call([sys.executable,
+                           os.path.join(os.environ["QUEX_PATH"], "quex-exe.py"),
+                           "-i", "grammar.qx", "-o", "Lexer", "-l", "C",
+                           "--odir", ".", "--engine-style", EngineStyle],
+                          cwd=Directory, stdout=subprocess.DEVNULL)
+    subprocess.check_call(["gcc", "-O2", "-I.", "-DQUEX_OPTION_ASSERTS_DISABLED_EXT",
+                           "-c", "Lexer.c", "-o", "Lexer.o"],
+                          cwd=Directory, stderr=subprocess.DEVNULL)
+    subprocess.check_call(["gcc", "-O2", "-I.", "-DQUEX_OPTION_ASSERTS_DISABLED_EXT",
+                           "-o", "lexer", "main.c", "Lexer.o"],
+                          cwd=Directory, stderr=subprocess.DEVNULL)
+    return os.path.join(Directory, "lexer")
+
+def segment_size(ObjectFile):
+    """RETURNS: [0] size of the text segment
+                [1] size of the data segments
+    """
+    output = subprocess.check_output(["size", ObjectFile]).decode().splitlines()
+    text, data, bss = [ int(x) for x in output[1].split()[:3] ]
+    return text, data + bss
+
+def run(Executable, InputFile):
+    """RETURNS: [0] output (token number and checksum)
+                [1] best time of some repetitions in seconds
+    """
+    repeat_n = 5
+    best     = None
+    for i in range(repeat_n):
+        t0     = time.perf_counter()
+        output = subprocess.check_output([Executable, InputFile]).decode()
+        t      = time.perf_counter() - t0
+        if best is None or t < best: best = t
+    return output, best
+
+def main():
+    keyword_n     = int(sys.argv[1])   if len(sys.argv) > 1 else 200
+    mega_byte_n   = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+    keywords      = keyword_list(keyword_n)
+    work_dir      = tempfile.mkdtemp(prefix="benchmark-engine_style-")
+    input_file    = os.path.join(work_dir, "input.txt")
+    with open(input_file, "w") as fh:
+        fh.write(input_text(keywords, int(mega_byte_n * 1e6)))
+
+    print("keywords: %i; input: %.1f MB" % (keyword_n, mega_byte_n))
+    print("%-8s %10s %10s %10s %12s" % ("style", "text[B]", "data[B]", "time[s]", "MB/s"))
+    output_db = {}
+    for style in ("direct", "table"):
+        directory = os.path.join(work_dir, style)
+        os.mkdir(directory)
+        with open(os.path.join(directory, "grammar.qx"), "w") as fh: fh.write(grammar(keywords))
+        with open(os.path.join(directory, "main.c"), "w") as fh:     fh.write(MAIN_C)
+
+        executable       = build(directory, style)
+        text, data       = segment_size(os.path.join(directory, "Lexer.o"))
+        output_db[style], t = run(executable, input_file)
+        print("%-8s %10i %10i %10.3f %12.1f" % (style, text, data, t, mega_byte_n / t))
+
+    if output_db["direct"] != output_db["table"]:
+        print("TOKEN SEQUENCES DIFFER")
+    shutil.rmtree(work_dir)
+
+if __name__ == "__main__":
+    main()
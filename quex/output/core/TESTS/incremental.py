@@ -0,0 +1,76 @@
+#! /usr/bin/env python
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+# Check for '--incremental': Editing one mode must leave the manifest entry,
+# i.e. the input hash and the generated code, of an unrelated mode untouched.
+#
+# USAGE:  incremental.py
+#
+# A grammar with modes 'ONE' and 'TWO' is generated. Then, a pattern of 'ONE'
+# is changed in place (without changing line numbers) and it is generated
+# again into the same directory. 'ONE' must have changed, 'TWO' must not.
+#_______________________________________________________________________________
+import os
+import sys
+sys.path.insert(0, os.environ["QUEX_PATH"])
+
+import json
+import shutil
+import subprocess
+import tempfile
+
+GRAMMAR = """
+define {
+  DIGIT  [0-9]
+  ID     [a-zA-Z_][a-zA-Z_0-9]*
+}
+token { ID; NUM; KW; OP; }
+start = ONE;
+mode ONE : <skip: [ \\t\\n]> {
+  %s => QUEX_TKN_KW(Lexeme);
+  {ID}                    => QUEX_TKN_ID(Lexeme);
+  "\\""                   => GOTO(TWO);
+}
+mode TWO : <skip: [ \\t]> {
+  {DIGIT}+                => QUEX_TKN_NUM(Lexeme);
+  "a"/"b"                 => QUEX_TKN_OP;
+  ^"x"                    => QUEX_TKN_KW;
+  "\\""                   => GOTO(ONE);
+}
+"""
+
+def generate(WorkDir, Keywords):
+    with open(os.path.join(WorkDir, "grammar.qx"), "w") as fh:
+        fh.write(GRAMMAR % Keywords)
+    subprocess.check_call([sys.executable,
+                           os.path.join(os.environ["QUEX_PATH"], "quex-exe.py"),
+                           "-i", "grammar.qx", "-o", "Lexer", "--odir", ".",
+                           "--incremental"],
+                          cwd=WorkDir, stdout=subprocess.DEVNULL)
+    with open(os.path.join(WorkDir, "Lexer-manifest.json")) as fh:
+        return json.load(fh)["modes"]
+
+def main():
+    work_dir = tempfile.mkdtemp(prefix="quex-incremental-")
+    try:
+        before = generate(work_dir, '"if"|"else"        ')
+        after  = generate(work_dir, '"if"|"else"|"while"')
+    finally:
+        shutil.rmtree(work_dir)
+
+    ok_f = True
+    for mode_name, expected_change_f in (("ONE", True), ("TWO", False)):
+        hash_changed_f = before[mode_name]["hash"] != after[mode_name]["hash"]
+        code_changed_f = before[mode_name]["code"] != after[mode_name]["code"]
+        print("%s: hash %s; code %s;" % (mode_name,
+              "changed" if hash_changed_f else "unchanged",
+              "changed" if code_changed_f else "unchanged"))
+        if expected_change_f: ok_f = ok_f and hash_changed_f
+        else:                 ok_f = ok_f and not (hash_changed_f or code_changed_f)
+
+    print("<%s>" % ("OK" if ok_f else "FAIL"))
+    return 0 if ok_f else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
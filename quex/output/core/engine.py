@@ -3,18 +3,26 @@
 #_______________________________________________________________________________
 # (C) Frank-Rene Schaefer
 #______________________________________________________________________________
-from   quex.engine.analyzer.door_id_address_label import get_plain_strings
+from   quex.engine.analyzer.door_id_address_label import get_plain_strings, \
+                                                         DialDB
+import quex.engine.state_machine.index            as     sm_index
+from   quex.engine.mode                           import index_range_entered
+import quex.output.core.manifest                  as     manifest
+import quex.engine.misc.phase_stats               as     phase_stats
 from   quex.engine.misc.tools                     import all_isinstance, \
                                                          typed, \
                                                          flatten
 from   quex.output.core.variable_db               import variable_db
 import quex.output.core.base                      as     generator
 import quex.output.counter.run_time               as     run_time_counter
+import quex.output.core.state.transition_map.two_level_table as two_level_table
 
 from   quex.blackboard import setup as Setup, \
                               Lng
 from   quex.constants  import E_IncidenceIDs
 from   operator import attrgetter
+import concurrent.futures
+import multiprocessing
 
 @typed(ModeNameList = [str])
 def do(Mode, ModeNameList):
@@ -30,7 +38,109 @@ def do(Mode, ModeNameList):
 
     return function_txt
 
+def do_mode_list(ModeList, ModeNameList, JobN=1, TheManifest=None):
+    """RETURNS: List of code fragment lists--one for each mode in 'ModeList'
+                in the order of 'ModeList'.
+
+    Code generation for one mode does not depend on the code generation of 
+    another mode. This is ensured by:
+
+       -- Determining the modes that implement the default counters beforehand.
+       -- Starting the generation of each mode with the same state index,
+          state machine id, and address counter values. With '--incremental'
+          each mode continues in its own index range (see 'IndexRange'), so 
+          that its code does not depend on the content of other modes.
+
+    If 'JobN' > 1, the modes are generated in a process pool of 'JobN' worker
+    processes. The workers are forked, so that each one works on a private 
+    copy of the global state (setup, token_db, mode_db, index counters). The
+    result is identical to the result of a serial run.
+
+    If 'TheManifest' is given, the code of modes whose inputs did not change
+    since the previous run is taken from the manifest. Only the remaining 
+    modes are generated.
+    """
+    run_time_counter.prepare(ModeList)
+    counter_snapshot = (sm_index.snapshot(), DialDB.address_counter_snapshot())
+
+    if TheManifest is None:
+        return _do_mode_list(ModeList, ModeNameList, JobN, counter_snapshot)
+
+    hash_list = [
+        manifest.mode_hash(mode, ModeNameList, 
+                           run_time_counter.implementing_mode_name(mode))
+        for mode in ModeList
+    ]
+    code_list = [
+        TheManifest.get_code(mode.name, mode_hash)
+        for mode, mode_hash in zip(ModeList, hash_list)
+    ]
+    todo_list = [ 
+        mode for mode, code in zip(ModeList, code_list) if code is None 
+    ]
+    new_code_iterable = iter(_do_mode_list(todo_list, ModeNameList, JobN, 
+                                           counter_snapshot))
+    code_list = [
+        code if code is not None else next(new_code_iterable) 
+        for code in code_list
+    ]
+
+    for mode, mode_hash, code in zip(ModeList, hash_list, code_list):
+        TheManifest.enter(mode.name, mode_hash, code)
+    return code_list
+
+def _do_mode_list(ModeList, ModeNameList, JobN, CounterSnapshot):
+    global _job_db
+    if JobN < 2 or len(ModeList) < 2 or not _job_fork_supported():
+        return [ 
+            _do_mode(Mode, ModeNameList, CounterSnapshot) for Mode in ModeList 
+        ]
+
+    _job_db = (ModeList, ModeNameList, CounterSnapshot)
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers = min(JobN, len(ModeList)),
+                mp_context  = multiprocessing.get_context("fork")) as executor:
+            # 'map()' delivers the results in the order of the mode list.
+            result = list(executor.map(_job, range(len(ModeList))))
+    finally:
+        _job_db = None
+
+    if not phase_stats.is_enabled(): 
+        return result
+
+    # Workers report their phase statistics along with the code.
+    for code, stats in result:
+        phase_stats.merge(stats)
+    return [ code for code, stats in result ]
+
+_job_db = None
+
+def _job(ModeIndex):
+    """Worker process: generate code for the mode at 'ModeIndex'. The mode 
+    list has been inherited from the parent process by forking.
+    """
+    mode_list, mode_name_list, counter_snapshot = _job_db
+    if not phase_stats.is_enabled():
+        return _do_mode(mode_list[ModeIndex], mode_name_list, counter_snapshot)
+
+    # Records inherited from the parent process are reported by the parent.
+    phase_stats.reset()
+    code = _do_mode(mode_list[ModeIndex], mode_name_list, counter_snapshot)
+    return code, phase_stats.export()
+
+def _job_fork_supported():
+    return "fork" in multiprocessing.get_all_start_methods()
+
+def _do_mode(Mode, ModeNameList, CounterSnapshot):
+    sm_index.restore(CounterSnapshot[0])
+    DialDB.address_counter_restore(CounterSnapshot[1])
+    with index_range_entered(Mode.index_range), \
+         phase_stats.phase("code emission", Mode=Mode.name):
+        return do_with_counter(Mode, ModeNameList)
+
 def do_with_counter(Mode, ModeNameList):
+    two_level_table.definitions_init()
     txt = []
     if Mode.ca_map_for_run_time_counter is not None:
         variable_db.init()
@@ -42,7 +152,8 @@ def do_with_counter(Mode, ModeNameList):
     analyzer_txt = do(Mode, ModeNameList)
     assert isinstance(analyzer_txt, list)
     txt.extend(analyzer_txt)
-    return txt
+    # Tables are defined outside the functions and before their use.
+    return two_level_table.definitions_get() + txt
 
 def do_core(Mode):
     """Produces main code for an analyzer function which can detect patterns given in
@@ -0,0 +1,202 @@
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+# Incremental Regeneration (command line option '--incremental')
+#
+# The manifest file in the output directory records for each mode a hash of
+# all inputs to its analyzer function together with the generated code. On
+# rerun, the code of a mode whose hash did not change is taken from the
+# manifest instead of being regenerated.
+#
+# The hash of a mode covers:
+#
+#   -- The complete 'Mode' object as it results from 'ModeDb_Builder', i.e.
+#      patterns (DFAs), terminals with user code and source references,
+#      incidence handlers, loopers, counters, and the base mode chain.
+#      This includes the mode's index range and the counter values from which
+#      its code generation starts.
+#   -- The names of all modes and the mode that implements the mode's
+#      default counter.
+#   -- The command line and the quex version.
+#
+# With '--incremental' each mode allocates state indices and state machine ids
+# from its own range (see 'IndexRange'). The values inside the 'Mode' object
+# do not depend on other modes, except for its base modes. Thus, changing
+# a mode does not change the hash of unrelated modes.
+#
+# Files which remain the same are not touched on disk at all (see
+# 'write_safely_and_close()'), so that build systems do not recompile them.
+#_______________________________________________________________________________
+from   quex.engine.misc.file_operations import open_file_or_die, \
+                                               write_safely_and_close
+from   quex.DEFINITIONS                 import QUEX_VERSION
+from   quex.input.setup                 import SETUP_INFO
+from   quex.input.code.base             import SourceRef
+from   quex.blackboard                  import setup as Setup
+
+import hashlib
+import json
+import os
+import types
+from   enum import Enum
+
+MANIFEST_FORMAT_VERSION = 2
+
+class Manifest:
+    """Maps: mode name --> (hash of mode's inputs, generated code fragments)
+    """
+    def __init__(self, FileName):
+        self.file_name = FileName
+        self.__old_db  = self.__load(FileName)
+        self.__new_db  = {}
+
+    def get_code(self, ModeName, Hash):
+        """RETURNS: List of code fragments generated for 'ModeName' in the
+                    previous run, if its input hash was 'Hash'.
+                    None, else.
+        """
+        entry = self.__old_db.get(ModeName)
+        if entry is None or entry["hash"] != Hash: return None
+        return entry["code"]
+
+    def enter(self, ModeName, Hash, CodeFragmentList):
+        self.__new_db[ModeName] = { "hash": Hash, "code": CodeFragmentList }
+
+    def write(self):
+        content = json.dumps({
+            "format":  MANIFEST_FORMAT_VERSION,
+            "version": QUEX_VERSION,
+            "modes":   self.__new_db,
+        }, indent=1, sort_keys=True)
+        write_safely_and_close(self.file_name, content)
+
+    @staticmethod
+    def __load(FileName):
+        if not os.path.isfile(FileName): return {}
+        try:
+            content = json.load(open_file_or_die(FileName, "r", Encoding="utf-8"))
+        except ValueError:
+            return {}
+        if    content.get("format")  != MANIFEST_FORMAT_VERSION \
+           or content.get("version") != QUEX_VERSION:
+            return {}
+        return content.get("modes", {})
+
+def mode_hash(Mode, ModeNameList, CounterModeName):
+    """RETURNS: Hash (hex string) over everything that determines the
+                analyzer function of 'Mode'.
+    """
+    assert Mode.index_range is not None
+    sha = hashlib.sha1()
+    _Fingerprinter(sha).do((QUEX_VERSION, _setup_option_db(), ModeNameList, 
+                            CounterModeName, Mode))
+    return sha.hexdigest()
+
+def _setup_option_db():
+    """RETURNS: map: option name --> value, for all options that may have an
+                influence on generated code.
+
+    The lexatom statistics of '--profile-use' influence the code by their
+    content, not only by the file name.
+    """
+    db = dict(
+        (name, value) for name, value in Setup.__dict__.items()
+        if     type(SETUP_INFO.get(name)) == list 
+           and name not in _SETUP_OPTIONS_WITHOUT_INFLUENCE
+    )
+    if Setup.profile_use_file_name:
+        with open(Setup.profile_use_file_name, "rb") as fh:
+            db["profile_use_file_name"] = hashlib.sha1(fh.read()).hexdigest()
+    return db
+
+_SETUP_OPTIONS_WITHOUT_INFLUENCE = ("job_n", "dfa_cache_dir", "incremental_f", 
+                                    "stats_phases_f")
+
+# Attributes that cache values of Python's 'hash()'. They depend on the
+# 'PYTHONHASHSEED' and carry no information of their own.
+_VOLATILE_ATTRIBUTE_NAMES = ("my_hash",)
+
+class _Fingerprinter:
+    """Feeds a deterministic description of an object graph into a hash
+    object. Deterministic means: independent of memory addresses and of the
+    iteration order of sets (which depends on 'PYTHONHASHSEED').
+
+    Objects which are met a second time are represented by a back reference.
+    Functions, classes, and modules are represented by their names only.
+    """
+    def __init__(self, Sha):
+        self.sha     = Sha
+        self.done_db = {}   # id(object) --> index of first occurrence
+        self.keep    = []   # keep objects alive, so that ids remain unique
+
+    def do(self, X):
+        sha = self.sha
+        if X is None or isinstance(X, (bool, int, float, str, bytes)):
+            sha.update(("%s:%r;" % (type(X).__name__, X)).encode("utf-8"))
+            return
+        elif isinstance(X, Enum):
+            sha.update(("E:%s.%s;" % (type(X).__name__, X.name)).encode("utf-8"))
+            return
+        elif isinstance(X, (type, types.FunctionType, types.BuiltinFunctionType,
+                            types.MethodType, types.ModuleType)):
+            sha.update(("N:%s;" % getattr(X, "__qualname__", getattr(X, "__name__", "?"))).encode("utf-8"))
+            return
+
+        index = self.done_db.get(id(X))
+        if index is not None:
+            sha.update(("@%i;" % index).encode("utf-8"))
+            return
+        self.done_db[id(X)] = len(self.done_db)
+        self.keep.append(X)
+
+        sha.update(("<%s:" % type(X).__qualname__).encode("utf-8"))
+        if isinstance(X, SourceRef):
+            # Code refers to lines, the position in the file is irrelevant.
+            # Edits in front of a mode change positions, but not lines.
+            for value in (X.file_f, X.file_name, X.line_n, X.mode_name):
+                self.do(value)
+        elif isinstance(X, tuple) and hasattr(X, "_fields"):
+            # namedtuple
+            for name, value in zip(X._fields, X):
+                if name in _VOLATILE_ATTRIBUTE_NAMES: continue
+                sha.update(("%s=" % name).encode("utf-8"))
+                self.do(value)
+        elif isinstance(X, (list, tuple)):
+            for element in X: self.do(element)
+        elif isinstance(X, (set, frozenset)):
+            for digest in sorted(_independent_digest(element) for element in X):
+                sha.update(digest.encode("utf-8"))
+        elif isinstance(X, dict):
+            key_list = sorted(((_independent_digest(key), key) for key in X.keys()),
+                              key=lambda x: x[0])
+            for digest, key in key_list:
+                sha.update(digest.encode("utf-8"))
+                self.do(X[key])
+        else:
+            for name, value in _attribute_iterable(X):
+                if name in _VOLATILE_ATTRIBUTE_NAMES: continue
+                sha.update(("%s=" % name).encode("utf-8"))
+                self.do(value)
+        sha.update(b">")
+
+def _independent_digest(X):
+    """Digest of a hashable object (set element, dictionary key) independent
+    of the context in which it appears.
+    """
+    sha = hashlib.sha1()
+    _Fingerprinter(sha).do(X)
+    return sha.hexdigest()
+
+def _attribute_iterable(X):
+    """YIELDS: (name, value) for all attributes in '__dict__' and '__slots__'.
+    """
+    if hasattr(X, "__dict__"):
+        for name in sorted(X.__dict__):
+            yield name, X.__dict__[name]
+    for cls in type(X).__mro__:
+        slots = getattr(cls, "__slots__", ())
+        if isinstance(slots, str): slots = (slots,)
+        for name in slots:
+            if name.startswith("__") and not name.endswith("__"):
+                name = "_%s%s" % (cls.__name__.lstrip("_"), name)
+            if hasattr(X, name): yield name, getattr(X, name)
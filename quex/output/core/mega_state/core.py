@@ -8,6 +8,7 @@ import quex.output.core.state.transition_map.core  as transition_block
 import quex.output.core.state.entry            as     entry_coder
 import quex.output.core.mega_state.template    as     template
 import quex.output.core.mega_state.path_walker as     path_walker
+from   quex.blackboard                 import Lng
 
 class Handler:
     def __init__(self, TheState):
@@ -69,7 +70,8 @@ def do(txt, TheState, TheAnalyzer):
 
     # (*) Transition Map ______________________________________________________
     tm = MegaState_relate_to_transition_code(TheState, TheAnalyzer, specific.state_key_str)
-    transition_block.do(txt, tm)
+    transition_block.do(txt, tm, 
+                        ProfileKey=(Lng.debug_unit_name_get(), TheState.index))
 
     # (*) Stuff to be pasted after transition map
     txt.extend(post_txt)
@@ -9,18 +9,26 @@ from   quex.engine.analyzer.state.core             import FSM_State
 from   quex.engine.misc.tools                      import typed, \
                                                           none_isinstance, \
                                                           none_is_None
+from   quex.blackboard                             import Lng
 
 @typed(TheState=FSM_State, TheAnalyzer=FSM)
-def do(code, TheState, TheAnalyzer):
+def do(code, TheState, TheAnalyzer, TheTable=None):
+    """TheTable -- TransitionTable that implements the transition maps of
+                  some states ('--engine-style table'), or None.
+    """
 
     # (*) Entry _______________________________________________________________
     txt, post_txt = entry.do(TheState)
 
     # (*) Transition Map ______________________________________________________
-    tm = relate_to_TransitionCode(TheState.transition_map, 
-                                  TheState.entry.dial_db)
+    if TheTable is not None and TheState.index in TheTable:
+        txt.extend(TheTable.code_entry(TheState.index))
+    else:
+        tm = relate_to_TransitionCode(TheState.transition_map, 
+                                      TheState.entry.dial_db)
 
-    transition_block.do(txt, tm)
+        transition_block.do(txt, tm, 
+                            ProfileKey=(Lng.debug_unit_name_get(), TheState.index))
 
     # (*) Post-state entry to init state (if necessary)
     txt.extend(post_txt) 
@@ -0,0 +1,81 @@
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+from   quex.output.core.variable_db import variable_db
+from   quex.blackboard              import Lng
+
+# Bitmaps of no more than this number of bits are implemented as a constant.
+# Larger bitmaps are implemented as static arrays of bytes.
+BITMAP_WORD_BIT_N = 32
+
+class Bitmap(object):
+    __slots__ = ("begin", "end", "range_check_f", "target", "interval_list", "remainder")
+
+    def __init__(self, Begin, End, RangeCheckF, Target, IntervalList, Remainder):
+        """Begin, End     -- range of lexatoms [Begin, End) covered by the bitmap.
+           RangeCheckF    -- True, if 'input' may lie outside [Begin, End).
+           Target         -- code to be executed for lexatoms in the bitmap.
+           IntervalList   -- intervals of lexatoms in the bitmap.
+           Remainder      -- structure that implements the transition map for
+                             lexatoms not in the bitmap.
+        """
+        self.begin         = Begin
+        self.end           = End
+        self.range_check_f = RangeCheckF
+        self.target        = Target
+        self.interval_list = IntervalList
+        self.remainder     = Remainder
+
+    def implement(self):
+        """A set of scattered intervals with the same target is identified by a
+        single bit test, for example
+
+                if( (input - Begin) < Size && ((Word >> (input - Begin)) & 1) ) 
+
+        rather than by a sequence of comparisons. A bitmap of more than
+        'BITMAP_WORD_BIT_N' bits is a static array of bytes.
+        """
+        bit_set = set()
+        for interval in self.interval_list:
+            bit_set.update(range(interval.begin - self.begin, interval.end - self.begin))
+
+        size = self.end - self.begin
+        if size <= BITMAP_WORD_BIT_N:
+            word       = sum(1 << i for i in bit_set)
+            array_name = None
+        else:
+            word       = None
+            array_name = _require_array([
+                sum(1 << k for k in range(8) if i * 8 + k in bit_set)
+                for i in range((size + 7) // 8)
+            ])
+
+        txt = [
+            Lng.IF_INPUT_IN_BITMAP(self.begin, size, self.range_check_f, word, array_name),
+            "%s\n" % Lng.TRANSITION_MAP_TARGET(None, self.target),
+            "%s\n" % Lng.ELSE_FOLLOWS
+        ]
+        txt.extend(
+            self.remainder.implement()
+        )
+        txt.append(
+            "%s\n" % Lng.END_IF
+        )
+        return txt
+
+def _require_array(ByteList):
+    """RETURNS: Name of a static array that contains the bytes in 'ByteList'.
+                Bitmaps of same content share the same array.
+    """
+    initial = "{ %s }" % ", ".join("0x%02X" % x for x in ByteList)
+    bitmap_list = [
+        variable for variable in variable_db.get().values()
+        if variable.name.startswith("bitmap_")
+    ]
+    for variable in bitmap_list:
+        if variable.initial_value == initial: return variable.name
+
+    return variable_db.require_array("bitmap_%i",
+                                     ElementN = len(ByteList),
+                                     Initial  = initial,
+                                     Index    = len(bitmap_list))
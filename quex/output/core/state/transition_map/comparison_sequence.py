@@ -7,9 +7,13 @@ from   quex.blackboard import setup as Setup, \
                               Lng
 
 class ComparisonSequence(object):
-    __slots__ = ("sub_map")
-    def __init__(self, SubMap):
-        self.sub_map = SubMap
+    __slots__ = ("sub_map", "count_list")
+    def __init__(self, SubMap, CountList=None):
+        """CountList -- number of lexatoms that appeared in each interval of 
+                        'SubMap' (from '--profile-use'), or None.
+        """
+        self.sub_map    = SubMap
+        self.count_list = CountList
 
     def implement(self):
         L = len(self.sub_map)
@@ -31,7 +35,30 @@ class ComparisonSequence(object):
         # The 'BLC' might actually no longer occur in the optimized map. Thus, 
         # search for it in the original transition map.
         blc_index = TransitionMap.bisect(self.sub_map, Setup.buffer_limit_code)
-        if blc_index is not None and blc_index < L / 2:
+        reverse_f = blc_index is not None and blc_index < L / 2
+
+        if self.count_list is not None and any(self.count_list):
+            count_db = dict(
+                (interval.begin, count)
+                for (interval, target), count in zip(self.sub_map, self.count_list)
+            )
+            if default is not None:
+                # Only single lexatoms are checked before the 'else' case. 
+                # => Any sequence is possible; most frequent lexatoms first.
+                #    (Stable sort: equal counts remain in the BLC-last order.)
+                if reverse_f: tm.reverse()
+                tm.sort(key=lambda x: - count_db[x[0].begin])
+                reverse_f = False
+            else:
+                # Check the intervals from the end where the frequent lexatoms
+                # are.
+                count_list    = [ count_db[interval.begin] for interval, code in tm ]
+                forward_cost  = ComparisonSequence.get_cost(count_list)
+                backward_cost = ComparisonSequence.get_cost(count_list[::-1])
+                if forward_cost != backward_cost: 
+                    reverse_f = backward_cost < forward_cost
+
+        if reverse_f:
             def get_decision(interval, i, L):
                 if   i == L-1:             return Lng.ELSE_SIMPLE
                 elif interval.size() == 1: return Lng.IF_X("==", interval.begin, i, L)
@@ -47,6 +74,15 @@ class ComparisonSequence(object):
         if default is not None: tm.append(default)
         return Lng.COMPARISON_SEQUENCE(tm, get_decision)
 
+    @staticmethod
+    def get_cost(CountList):
+        """RETURNS: Number of comparisons for the lexatoms counted in 'CountList'
+                    if the intervals are checked in the given sequence. The
+                    last interval is the 'else' case.
+        """
+        L = len(CountList)
+        return sum(count * min(i + 1, L - 1) for i, count in enumerate(CountList))
+
     @staticmethod
     def optimize(tm):
         """Special case: a sequence of intervals where
@@ -2,9 +2,11 @@
 # (C) 2005-2020 Frank-Rene Schaefer; 
 #_______________________________________________________________________________
 import quex.output.core.state.transition_map.solution as     solution
-from   quex.blackboard                                import setup as Setup
+import quex.input.statistics.core                     as     statistics
+from   quex.blackboard                                import setup as Setup, \
+                                                             Lng
 
-def do(txt, TM, AssertBorderF=False):
+def do(txt, TM, AssertBorderF=False, ProfileKey=None):
     """Generate code for transition map 'TM'.
 
                     TM = list of pairs (interval, string)
@@ -17,6 +19,11 @@ def do(txt, TM, AssertBorderF=False):
 
     For state machines, the 'string' must be the code to transit to another
     state.
+
+    'ProfileKey' = (debug unit name, state index) identifies the transition 
+    map in lexatom statistics. With '--profile-generate', code is generated
+    that counts the lexatoms per interval. With '--profile-use', the layout 
+    of the map is adapted to the counts.
     
     RETURNS: Code that implements the map.
     """
@@ -30,10 +37,39 @@ def do(txt, TM, AssertBorderF=False):
     #__________________________________________________________________________
     if AssertBorderF: _assert_consistency(TM)
 
-    structure = solution.do(TM)
+    if ProfileKey is None or len(TM) < 2:
+        state_statistics = None
+    else:
+        if Setup.profile_generate_f: 
+            txt.append(Lng.STATISTICS_STATE_COUNT(ProfileKey[0], ProfileKey[1],
+                                                  [interval.begin for interval, target in TM[1:]]))
+        state_statistics = _get_statistics(ProfileKey, TM)
+
+    structure = solution.do(TM, state_statistics)
 
     txt.extend(structure.implement())
 
+_statistics_db = None
+
+def _get_statistics(ProfileKey, TM):
+    """RETURNS: Lexatom statistics of the transition map 'TM' from the file given
+                by '--profile-use'.
+                None, if there are no statistics for 'TM'.
+    """
+    global _statistics_db
+    if not Setup.profile_use_file_name: return None
+
+    if _statistics_db is None: 
+        _statistics_db = statistics.do(Setup.profile_use_file_name)
+
+    state_statistics = _statistics_db.get(ProfileKey)
+    if state_statistics is None: 
+        return None
+    elif not state_statistics.fit(TM):
+        state_statistics.on_error()
+        return None
+    return state_statistics
+
 def _assert_consistency(TM):
     """Check consistency of the given transition map.
 
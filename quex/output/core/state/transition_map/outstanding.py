@@ -0,0 +1,31 @@
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer; 
+#_______________________________________________________________________________
+from quex.blackboard import Lng
+
+class OutstandingCharacter(object):
+    __slots__ = ("interval", "target", "remainder")
+
+    def __init__(self, Interval, Target, Remainder):
+        """Interval  -- interval of size '1', i.e. the outstanding character.
+           Target    -- code to be executed for the outstanding character.
+           Remainder -- structure that implements the whole transition map.
+        """
+        assert Interval.size() == 1
+        self.interval  = Interval
+        self.target    = Target
+        self.remainder = Remainder
+
+    def implement(self):
+        txt = [
+            Lng.IF_INPUT("==", self.interval.begin),
+            "%s\n" % Lng.TRANSITION_MAP_TARGET(self.interval, self.target),
+            "%s\n" % Lng.ELSE_FOLLOWS
+        ]
+        txt.extend(
+            self.remainder.implement()
+        )
+        txt.append(
+            "%s\n" % Lng.END_IF
+        )
+        return txt
@@ -2,58 +2,209 @@
 # (C) 2005-2020 Frank-Rene Schaefer; 
 #_______________________________________________________________________________
 from   quex.output.core.state.transition_map.bisection           import Bisection
+from   quex.output.core.state.transition_map.bitmap              import Bitmap
 from   quex.output.core.state.transition_map.branch_table        import BranchTable
 from   quex.output.core.state.transition_map.comparison_sequence import ComparisonSequence
+from   quex.output.core.state.transition_map.outstanding         import OutstandingCharacter
+from   quex.output.core.state.transition_map.two_level_table     import TwoLevelTable
 from   quex.engine.analyzer.state.transition_map                 import TransitionMap  
+from   quex.engine.misc.interval_handling                        import Interval
+from   quex.blackboard                                           import setup as Setup
 
 from   quex.engine.misc.quex_enum import QuexEnum
 from   enum import auto
+from   math import log2
 
 class E_Solution(QuexEnum):
     COMPARISON_SEQUENCE = auto()
+    BITMAP              = auto()
     BRANCH_TABLE        = auto()
+    TWO_LEVEL_TABLE     = auto()
     BISECTIONING        = auto()
 
-def do(TM):
-    return get_structure(TM)
+# Cost model: estimated costs of the solutions in units of a comparison with
+# a conditional branch. 
+COST_COMPARISON       = 1.0
+COST_BISECTION        = 0.5   # Nesting; less predictable branches.
+COST_BRANCH_TABLE     = 3.0   # Range check, table load, indirect jump.
+COST_BITMAP           = 1.0   # Load and bit test.
+COST_TWO_LEVEL_TABLE  = 4.0   # Two dependent loads, indirect jump.
+# Size limits (in lexatoms) of the ranges covered by tables.
+BRANCH_TABLE_SIZE_MAX    = 256
+BITMAP_SIZE_MAX          = 256
+TWO_LEVEL_TABLE_SIZE_MAX = 0x110000
+# Two-level tables are only considered for transition maps with at least this
+# number of intervals. Else, the tables would not pay off in terms of size.
+TWO_LEVEL_TABLE_INTERVAL_N_MIN = 64
+
+def do(TM, TheStatistics=None):
+    """TheStatistics -- lexatom statistics of the transition map (see 
+                        'quex.input.statistics.core'), or None.
+
+    With statistics, a character that appears exceptionally often is checked
+    before the transition map is entered.
+    """
+    structure = get_structure(TM, TheStatistics)
+    if TheStatistics is None or not isinstance(structure, Bisection):
+        return structure
+
+    # Average cost of classification by bisectioning: log2(interval number)
+    i = TheStatistics.get_outstanding_character(TM, log2(len(TM)))
+    if i is None: return structure
+
+    interval, target = TM[i]
+    return OutstandingCharacter(interval, target, structure)
 
 def get_solution(TM):
-    """RETURNS: [0] Solution from E_Solution
-                [1] Most often appearing target
+    """Selects the solution with the least estimated cost (see 'get_cost_db()').
+    Upon equal cost, the solution that comes first in 'E_Solution' is chosen.
+
+    RETURNS: [0] Solution from E_Solution
+             [1] BRANCH_TABLE: Most often appearing target.
+                 BITMAP:       Target of the lexatoms in the bitmap.
+                 Else:         None
+    """
+    cost_db = get_cost_db(TM)
+    return min(cost_db.items(), key=lambda x: (x[1][0], x[0].value))[1][1:]
+
+def get_cost_db(TM):
+    """RETURNS: map: solution --> (estimated cost, solution, parameter)
+
+    for all solutions that are feasible for 'TM'. The cost is the average 
+    number of comparisons (with conditional branch) to identify the target
+    of a lexatom, assuming that all intervals are equally likely.
     """
     interval_n = len(TM)
     assert interval_n > 0
 
-    most_often_appearing_target, target_n = TransitionMap.get_target_statistics(TM)
+    result = {
+        E_Solution.COMPARISON_SEQUENCE: (_cost_comparison_sequence(TM), 
+                                         E_Solution.COMPARISON_SEQUENCE, None),
+    }
+    if interval_n == 1: return result
+
+    result[E_Solution.BISECTIONING] = (COST_COMPARISON * log2(interval_n) + COST_BISECTION, 
+                                       E_Solution.BISECTIONING, None)
+
+    # The 'moat' (most often appearing target) is implemented as 'default:'.
+    moat, target_n = TransitionMap.get_target_statistics(TM)
+    if TransitionMap.get_size_of_range_other_targets(TM, moat) < BRANCH_TABLE_SIZE_MAX:
+        result[E_Solution.BRANCH_TABLE] = (COST_BRANCH_TABLE, 
+                                           E_Solution.BRANCH_TABLE, moat)
+
+    if     interval_n >= TWO_LEVEL_TABLE_INTERVAL_N_MIN \
+       and target_n <= 256 \
+       and TM[-1][0].begin - TM[0][0].begin <= TWO_LEVEL_TABLE_SIZE_MAX:
+        cost = COST_TWO_LEVEL_TABLE
+        if TM[-1][0].end - TM[0][0].begin > TWO_LEVEL_TABLE_SIZE_MAX: cost += COST_COMPARISON
+        result[E_Solution.TWO_LEVEL_TABLE] = (cost, E_Solution.TWO_LEVEL_TABLE, None)
+
+    target = _get_bitmap_target(TM)
+    if target is not None:
+        begin, end, range_check_f = _get_bitmap_range(TM, target)
+        remainder = _get_bitmap_remainder(TM, target)
+        cost      =   COST_BITMAP \
+                    + (COST_COMPARISON if range_check_f else 0) \
+                    + min(x[0] for x in get_cost_db(remainder).values())
+        result[E_Solution.BITMAP] = (cost, E_Solution.BITMAP, target)
+
+    return result
+
+def _cost_comparison_sequence(TM):
+    """Considers the simplification by 'ComparisonSequence.optimize()'.
+
+    RETURNS: Average number of comparisons in a sequence for 'TM'.
+    """
+    tm, default = ComparisonSequence.optimize(list(TM))
+    L = len(tm) + (1 if default is not None else 0)
+    # Interval 'i' requires 'i+1' comparisons; the last interval is the 'else'.
+    return COST_COMPARISON * sum(min(i + 1, L - 1) for i in range(L)) / L
+
+def _get_bitmap_target(TM):
+    """A bitmap identifies the lexatoms of a target that appears in multiple
+    intervals of a limited range. Among the candidates, the target with the
+    most intervals is chosen. Bitmaps work only on non-negative lexatoms.
 
-    # If there's only one interval, there's no need to compare, just go!
-    # Otherwise, if there's a very low number of intervals, make a small
-    # comparison list that iterates linearly through the items.
-    if target_n < 4 and interval_n < 6: 
-        return E_Solution.COMPARISON_SEQUENCE, None
+    RETURNS: Target for the bitmap; None, if there is none.
+    """
+    if Setup.lexatom.type_range.begin != 0: return None
+
+    db = {}
+    for interval, target in TM:
+        entry = db.get(target)
+        if entry is None: db[target] = [interval.begin, interval.end, 1]
+        else:             entry[1] = interval.end; entry[2] += 1
+    if len(db) < 2: return None
+
+    best = None
+    for target, entry in db.items():
+        begin, end, n = entry
+        if   n < 2:                              continue
+        elif end - begin > BITMAP_SIZE_MAX:      continue
+        elif best is not None and n <= best[1]:  continue
+        best = (target, n)
+    return best[0] if best is not None else None
+
+def _get_bitmap_range(TM, Target):
+    """If the whole range of 'TM' fits into the bitmap, then no range check is
+    required. Else, the bitmap covers the range of 'Target'.
+
+    RETURNS: [0] begin of the bitmap 
+             [1] end of the bitmap
+             [2] True, if a range check is required; False, else.
+    """
+    begin, end = TM[0][0].begin, TM[-1][0].end
+    if end - begin <= BITMAP_SIZE_MAX: return begin, end, False
 
-    # If the size of character ranges which do not target 'moat' is less
-    # than a certain number, implement the transition as branch table. The
-    # 'moat' is implemented as the 'default:' case.
-    sz_non_moat = TransitionMap.get_size_of_range_other_targets(TM, most_often_appearing_target)
-    if sz_non_moat < 256: 
-        return E_Solution.BRANCH_TABLE, most_often_appearing_target
+    interval_list = [ interval for interval, target in TM if target == Target ]
+    return interval_list[0].begin, interval_list[-1].end, True
 
-    return E_Solution.BISECTIONING, None
+def _get_bitmap_remainder(TM, Target):
+    """The lexatoms in the bitmap never reach the remainder. Their intervals 
+    are associated with the target of the preceding interval, so that they
+    melt with their neighbours.
 
-def get_structure(TM): 
+    RETURNS: Transition map for lexatoms which are not in the bitmap.
+    """
+    result = []
+    for interval, target in TM:
+        if target == Target:
+            if result: target = result[-1][1]
+            else:      continue
+        if result and result[-1][1] == target: 
+            result[-1] = (Interval(result[-1][0].begin, interval.end), target)
+        else:
+            result.append((Interval(interval.begin, interval.end), target))
+
+    # Leading 'Target' intervals have been left out.
+    first_interval, first_target = result[0]
+    result[0] = (Interval(TM[0][0].begin, first_interval.end), first_target)
+    return result
+
+def get_structure(TM, TheStatistics=None): 
     """__dive --> indicate recursion that might be replaced by TreeWalker
     """
-    solution, moat = get_solution(TM)
-
-    if   solution == E_Solution.COMPARISON_SEQUENCE: return ComparisonSequence(TM)
-    elif solution == E_Solution.BRANCH_TABLE:        return BranchTable(TM, moat)
+    solution, target = get_solution(TM)
+
+    if solution == E_Solution.COMPARISON_SEQUENCE: 
+        if TheStatistics is None: return ComparisonSequence(TM)
+        else:                     return ComparisonSequence(TM, TheStatistics.get_count_list(TM))
+    elif solution == E_Solution.BRANCH_TABLE:        
+        return BranchTable(TM, Moat=target)
+    elif solution == E_Solution.TWO_LEVEL_TABLE:
+        return TwoLevelTable(TM)
+    elif solution == E_Solution.BITMAP:
+        begin, end, range_check_f = _get_bitmap_range(TM, target)
+        interval_list = [ interval for interval, x in TM if x == target ]
+        # The remainder's intervals do not fit the statistics.
+        return Bitmap(begin, end, range_check_f, target, interval_list,
+                      get_structure(_get_bitmap_remainder(TM, target)))
 
     # Else, there is nothing left but bisectioning
     # (which is not the worst thing to do)
-    return get_Bisection(TM)
+    return get_Bisection(TM, TheStatistics)
 
-def get_Bisection(TM):
+def get_Bisection(TM, TheStatistics=None):
     """BranchTables and Comparison sequences are considered to be 'better'
     than bisectioning. Thus, this function tries to set the bisectioning value
     so that the two parts are both feasible by either BranchTable or 
@@ -69,14 +220,20 @@ def get_Bisection(TM):
                    branch table            branch table
 
     then, the bisectioning is better done at Q rather than N.
+
+    With statistics, the bisectioning is done so that both parts are met by
+    about the same number of lexatoms. Frequent lexatoms end up in parts with
+    less intervals, i.e. they require less comparisons.
     """
-    L = len(TM) >> 1 # /2, but safe that the result is an integeR
+    L = None
+    if TheStatistics is not None: L = TheStatistics.get_cut(TM)
+    if L is None:                 L = len(TM) >> 1 # /2, but safe that the result is an integeR
     assert L >= 1
 
     tm0 = TM[:L]
     tm1 = TM[L:]
     bisection_value = tm0[-1][0].end
-    low  = get_structure(tm0)
-    high = get_structure(tm1)
+    low  = get_structure(tm0, TheStatistics)
+    high = get_structure(tm1, TheStatistics)
     return Bisection(bisection_value, low, high)
 
@@ -0,0 +1,130 @@
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+"""Two-level lookup tables for transition maps with many intervals.
+
+Large character classes (e.g. '\P{ID_Start}' or '\P{L}') result in transition
+maps with hundreds of intervals. Instead of a deep bisection, the lexatom is
+mapped to a target class by a two-stage table:
+
+        class = leaf[(index[input >> S] << S) + (input & (2^S - 1))]
+
+'index[]' maps a block of 2^S lexatoms to a leaf. Equal blocks share the same
+leaf. The target class selects the target by a switch statement.
+
+The tables are defined outside the analyzer functions. Their names are derived
+from their content, so that states and modes which test the same partition of
+lexatoms share the same tables. Each definition is protected by a guard macro.
+Thus, it appears only once, even if it has been generated for multiple modes.
+
+(C) Frank-Rene Schaefer
+_______________________________________________________________________________
+"""
+from   quex.blackboard import Lng
+
+from   hashlib import md5
+
+# Block sizes (as power of 2) from which the one with the smallest tables is
+# chosen.
+BLOCK_SHIFT_LIST = (5, 6, 7, 8)
+
+class TwoLevelTable(object):
+    __slots__ = ("begin", "end", "range_check_f", "shift", "name",
+                 "class_target_list", "else_target")
+
+    def __init__(self, TM):
+        """The intervals of 'TM' but the last one are implemented by tables.
+        The last interval is the 'else' case of a range check, if the tables
+        do not cover it completely.
+        """
+        class_db = {}
+        self.class_target_list = []
+        for interval, target in TM:
+            if target in class_db: continue
+            class_db[target] = len(self.class_target_list)
+            self.class_target_list.append(target)
+
+        self.begin       = TM[0][0].begin
+        self.else_target = TM[-1][1]
+
+        class_list = []
+        for interval, target in TM[:-1]:
+            class_list.extend([ class_db[target] ] * (interval.end - interval.begin))
+
+        best = None
+        for shift in BLOCK_SHIFT_LIST:
+            index_list, leaf_list = _get_tables(class_list, shift, class_db[self.else_target])
+            byte_n = len(index_list) * _byte_n(len(leaf_list) >> shift) + len(leaf_list)
+            if best is not None and byte_n >= best[0]: continue
+            best = (byte_n, shift, index_list, leaf_list)
+
+        byte_n, self.shift, index_list, leaf_list = best
+        self.end           = self.begin + (len(index_list) << self.shift)
+        self.range_check_f = self.end < TM[-1][0].end
+        self.name          = _register(self.shift, index_list, leaf_list)
+
+    def implement(self):
+        case_list = [
+            (i, Lng.TRANSITION_MAP_TARGET(None, target))
+            for i, target in enumerate(self.class_target_list)
+        ]
+        txt = Lng.BRANCH_TABLE(Lng.TWO_LEVEL_TABLE_LOOKUP(self.name, self.begin, self.shift),
+                               case_list[:-1], CaseFormat="dec",
+                               DefaultConsequence=case_list[-1][1])
+        if not self.range_check_f: return txt
+
+        result = [ Lng.IF_INPUT("<", self.end) ]
+        result.extend(txt)
+        result.extend([
+            "%s\n" % Lng.ELSE_FOLLOWS,
+            "%s\n" % Lng.TRANSITION_MAP_TARGET(None, self.else_target),
+            "%s\n" % Lng.END_IF
+        ])
+        return result
+
+def _get_tables(ClassList, Shift, ElseClass):
+    """RETURNS: [0] index list: block number --> leaf number
+                [1] leaf list:  concatenated leaves of 2^Shift classes.
+    """
+    block_size = 1 << Shift
+    leaf_db    = {}
+    index_list = []
+    leaf_list  = []
+    for begin in range(0, len(ClassList), block_size):
+        block = tuple(ClassList[begin:begin + block_size])
+        if len(block) < block_size:
+            block += (ElseClass,) * (block_size - len(block))
+        leaf_index = leaf_db.get(block)
+        if leaf_index is None:
+            leaf_index     = len(leaf_db)
+            leaf_db[block] = leaf_index
+            leaf_list.extend(block)
+        index_list.append(leaf_index)
+    return index_list, leaf_list
+
+def _byte_n(MaxValue):
+    if   MaxValue < 2**8:  return 1
+    elif MaxValue < 2**16: return 2
+    else:                  return 4
+
+_definition_db = {}
+
+def _register(Shift, IndexList, LeafList):
+    """RETURNS: Name of the tables with the given content.
+    """
+    content = "%i:%s:%s" % (Shift, IndexList, LeafList)
+    name    = "lookup_%s" % md5(content.encode()).hexdigest()[:12]
+    if name not in _definition_db:
+        _definition_db[name] = Lng.TWO_LEVEL_TABLE_DEFINITION(
+            name, "uint%i_t" % (8 * _byte_n(max(IndexList))), IndexList, LeafList
+        )
+    return name
+
+def definitions_init():
+    _definition_db.clear()
+
+def definitions_get():
+    """RETURNS: Definitions of the tables which have been required since the
+                last call to 'definitions_init()'.
+    """
+    return [ _definition_db[name] for name in sorted(_definition_db) ]
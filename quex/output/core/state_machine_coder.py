@@ -4,6 +4,7 @@
 import quex.output.core.state.core      as     state_coder
 import quex.output.core.state.entry     as     entry
 import quex.output.core.mega_state.core as     mega_state_coder
+import quex.output.core.transition_table as   transition_table
 from   quex.blackboard                  import Lng
 
 from   collections import defaultdict
@@ -18,9 +19,13 @@ def do(TheAnalyzer):
     
     assert id(Lng.analyzer) == id(TheAnalyzer)
 
+    # (*) Table driven transition maps ('--engine-style table'), or None.
+    table = transition_table.get(TheAnalyzer)
+
     # (*) Init State must be first!
     txt = []
-    state_coder.do(txt, TheAnalyzer.state_db[TheAnalyzer.init_state_index], TheAnalyzer)
+    state_coder.do(txt, TheAnalyzer.state_db[TheAnalyzer.init_state_index], TheAnalyzer, 
+                   table)
 
     # (*) Second: The drop-out catcher, since it is referenced the most.
     #     (Is implemented entirely by 'entry')
@@ -32,7 +37,11 @@ def do(TheAnalyzer):
 
     # (*) All other (normal) states (sorted by their frequency of appearance)
     for state in remaining_non_mega_state_iterable(TheAnalyzer):
-        state_coder.do(txt, state, TheAnalyzer) 
+        state_coder.do(txt, state, TheAnalyzer, table) 
+
+    # (*) The interpreter loop of the table driven transition maps
+    if table is not None:
+        txt.extend(table.code_loop())
 
     Lng.unregister_analyzer()
     return txt
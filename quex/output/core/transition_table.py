@@ -0,0 +1,433 @@
+# Project Quex (http://quex.sourceforge.net); License: MIT;
+# (C) 2005-2020 Frank-Rene Schaefer;
+#_______________________________________________________________________________
+"""Table driven implementation of transition maps ('--engine-style table').
+
+The transition maps of a forward analyzer's states are implemented by tables.
+A state with a table driven transition map sets the 'table state' and jumps
+into the interpreter loop:
+
+       (state entry)
+       table_state = K;              .------------------------------------.
+       goto LOOP;  -----------.      | LOOP:                              |
+                              '----->|   target = lookup(table_state,     |
+                                     |                   class[input]);   |
+                                     |   if target >= 0:                  |
+                                     |       ++read_p; input = *read_p;   |
+                                     |       table_state = target;        |
+                                     |       goto LOOP;                   |
+                                     | EXIT:                              |
+                                     |   switch( target ) {               |
+                                     |   case -1: goto RELOAD;            |
+                                     |   case -2: goto door 2; ...        |
+                                     |   }                                |
+                                     | RELOADED:                          |
+                                     |   input = *read_p; goto LOOP;      |
+                                     | RELOAD_FAILED:                     |
+                                     |   target = reload_fail[table_state]|
+                                     |   goto EXIT;                       |
+                                     '------------------------------------'
+
+A transition remains inside the loop ('plain transition'), if its door only
+increments the input pointer and dereferences it. Reload is action '-1'. It
+enters the reload state with 'RELOADED' and 'RELOAD_FAILED' as return doors,
+so that the table state is maintained. A failed reload leaves the loop 
+through the state's drop-out. States do not need their own doors to and from
+the reload state--they are deleted. Any other transition (to a door with 
+acceptance or position storage, to drop-out) leaves the loop through a 'goto'
+to the direct-coded door. Doors with the same address share an exit.
+
+The tables:
+
+    class[]    Lexatom --> equivalence class. Lexatoms of a class have the same
+               targets in all table driven states. Lexatoms >= 256 are mapped
+               by a binary search in 'border[]' and 'border_class[]'.
+    base[], check[], next[], default[]
+
+               Comb-vector (row displacement) compressed transition table. The
+               target of 'state' and 'class' is
+
+                   next[base[state] + class],  if check[base[state] + class] == state
+                   default[state],             else.
+
+               Each state's most frequent target is its default. The rows of
+               remaining targets are placed into 'next[]' by first-fit, so that
+               they interleave.
+
+    reload_fail[]  
+               State --> exit upon reload failure, i.e. the state's drop-out.
+
+(C) Frank-Rene Schaefer
+_______________________________________________________________________________
+"""
+from   quex.engine.operations.operation_list import Op, OpList
+from   quex.output.core.variable_db          import variable_db
+from   quex.blackboard                       import setup as Setup, \
+                                                    Lng
+from   quex.constants                        import E_R, \
+                                                    E_Op
+
+from   bisect      import bisect_right
+from   collections import Counter
+
+# Lexatoms below this value are mapped to classes by direct array access.
+CLASS_ARRAY_SIZE = 256
+
+def get(TheAnalyzer):
+    """RETURNS: TransitionTable for the states of 'TheAnalyzer' that profit
+                from a table driven transition map.
+                None, if there are no such states.
+    """
+    if   Setup.engine_style != "table":                    return None
+    elif not TheAnalyzer.engine_type.is_FORWARD():         return None
+    elif TheAnalyzer.engine_type.is_CHARACTER_COUNTER():   return None
+    elif Setup.lexatom.type_range.begin != 0:              return None
+
+    candidate_set = set(
+        si for si in TheAnalyzer.non_mega_state_index_set
+        if len(TheAnalyzer.state_db[si].transition_map) > 1
+    )
+    plain_door_id_set = _get_plain_door_id_set(TheAnalyzer, candidate_set)
+
+    # Only states which are involved in a plain transition are table driven.
+    # For all others, the direct-coded transition map is the better choice.
+    state_index_set = set()
+    for si in candidate_set:
+        for interval, door_id in TheAnalyzer.state_db[si].transition_map:
+            if door_id not in plain_door_id_set: continue
+            state_index_set.add(si)
+            state_index_set.add(door_id.state_index)
+
+    if not state_index_set: return None
+    return TransitionTable(TheAnalyzer, sorted(state_index_set), plain_door_id_set)
+
+def _get_plain_door_id_set(TheAnalyzer, CandidateSet):
+    """RETURNS: Set of DoorID-s of candidate states whose only operations are
+                the increment and the dereferencing of the input pointer.
+    """
+    plain_op_list = _plain_op_list()
+    return set(
+        action.door_id
+        for si in CandidateSet
+        for action in TheAnalyzer.state_db[si].entry.values()
+        if action.command_list == plain_op_list
+    )
+
+def _plain_op_list():
+    return OpList(Op.Increment(E_R.InputP), Op.InputPDereference())
+
+class TransitionTable:
+    """Transition maps of a set of states, implemented by comb-vector
+    compressed tables over lexatom equivalence classes.
+
+    Reload is done by the interpreter loop for all states whose reload doors
+    are 'standard' (see '_get_reload_db()'). The states' doors from and into
+    the reload state are deleted. Thus, they are not subject to code
+    generation.
+    """
+    def __init__(self, TheAnalyzer, StateIndexList, PlainDoorIdSet):
+        self.dial_db   = TheAnalyzer.dial_db
+        self.door_id   = self.dial_db.new_door_id()
+        index          = self.door_id.state_index
+        self.key_db    = dict((si, i) for i, si in enumerate(StateIndexList))
+
+        # Exits: address --> exit number 'e'. The target value is '-e-1'.
+        # Doors with the same address share an exit.
+        self.exit_list = []
+        exit_db        = {}
+        def get_exit(DoorId):
+            e = exit_db.get(DoorId.related_address)
+            if e is None:
+                e = len(self.exit_list)
+                exit_db[DoorId.related_address] = e
+                self.exit_list.append(DoorId)
+            return - e - 1
+
+        # Reload: DoorID-s of the exit switch, of the return after reload
+        #         success, and of the return after reload failure.
+        reload_db = _get_reload_db(TheAnalyzer, StateIndexList)
+        if reload_db:
+            self.reload_door_id_triplet = tuple(self.dial_db.new_door_id(index) 
+                                                for i in range(3))
+            door_id_reloaded, door_id_reload_fail = self.reload_door_id_triplet[1:]
+            # Exit 0: reload for the current table state.
+            reload_door_id = TheAnalyzer.reload_state.add_state(index,
+                      door_id_reloaded, door_id_reload_fail,
+                      OpList(Op.GotoDoorIdIfInputPNotEqualPointer(door_id_reload_fail,
+                                                                  E_R.EndOfStreamP)))
+            get_exit(reload_door_id)
+            self.__delete_reload_doors(TheAnalyzer, reload_db)
+        else:
+            self.reload_door_id_triplet = None
+
+        reload_door_id_set = set(reload_db.values())
+        def get_target(DoorId):
+            if DoorId in PlainDoorIdSet and DoorId.state_index in self.key_db:
+                return self.key_db[DoorId.state_index]
+            elif DoorId in reload_door_id_set:
+                return -1
+            return get_exit(DoorId)
+
+        tm_list = [
+            [ (interval, get_target(door_id))
+              for interval, door_id in TheAnalyzer.state_db[si].transition_map ]
+            for si in StateIndexList
+        ]
+
+        # Upon reload failure, the state's drop-out is entered. For states
+        # that do not reload through the loop, the entry is never used.
+        self.reload_fail_list = [ 
+            get_exit(TheAnalyzer.drop_out_DoorID(si)) if si in reload_db else -1
+            for si in StateIndexList
+        ]
+
+        self.border_list,   \
+        self.class_list,    \
+        row_list            = _get_classes(tm_list)
+
+        self.class_n        = len(row_list[0])
+        self.default_list,  \
+        self.base_list,     \
+        self.check_list,    \
+        self.next_list      = _get_comb_vector(row_list, self.class_n)
+
+    @staticmethod
+    def __delete_reload_doors(TheAnalyzer, ReloadDb):
+        """Deletes the transitions from the states of 'ReloadDb' into the 
+        reload state and back. The interpreter loop does the reload.
+        """
+        reload_state = TheAnalyzer.reload_state
+        for si in ReloadDb:
+            reload_state.entry.delete(reload_state.index, si)
+            TheAnalyzer.state_db[si].entry.delete(si, reload_state.index)
+
+    def __contains__(self, StateIndex):
+        return StateIndex in self.key_db
+
+    def code_entry(self, StateIndex):
+        """RETURNS: Code that enters the interpreter loop for the state
+                    'StateIndex'. It replaces the state's transition map.
+        """
+        return [
+            "    %s\n" % Lng.ASSIGN("transition_table_state",
+                                    "%i" % self.key_db[StateIndex]),
+            "    %s\n" % Lng.GOTO(self.door_id, self.dial_db)
+        ]
+
+    def code_loop(self):
+        """RETURNS: Code of the interpreter loop and requires the tables as
+                    variables.
+        """
+        variable_db.require("transition_table_state")
+        variable_db.require("transition_table_target")
+
+        index         = self.door_id.state_index
+        name_db       = {}
+        def array(Name, ValueList, Signed):
+            name_db[Name] = variable_db.require_array("transition_table_%i_" + Name,
+                                                      ElementN = len(ValueList),
+                                                      Initial  = _initial(ValueList),
+                                                      Index    = index,
+                                                      Type     = "static const %s" % _c_type(ValueList, Signed))
+
+        array("class",   self.class_list[:CLASS_ARRAY_SIZE], False)
+        array("base",    self.base_list,    False)
+        array("check",   self.check_list,   True)
+        array("next",    self.next_list,    True)
+        array("default", self.default_list, True)
+        if len(self.class_list) > CLASS_ARRAY_SIZE:
+            array("border",       self.border_list[CLASS_ARRAY_SIZE:], False)
+            array("border_class", self.class_list[CLASS_ARRAY_SIZE:],  False)
+
+        if self.reload_door_id_triplet is not None:
+            array("reload_fail", self.reload_fail_list, True)
+            after_reload_txt = Lng.COMMAND_LIST(OpList(Op.InputPDereference()), 
+                                                self.dial_db)
+        else:
+            after_reload_txt = None
+
+        goto_exit_list = [
+            Lng.GOTO(door_id, self.dial_db) for door_id in self.exit_list
+        ]
+        return Lng.TRANSITION_TABLE_LOOP(self.door_id, name_db,
+                                         Lng.COMMAND_LIST(_plain_op_list(), self.dial_db),
+                                         goto_exit_list, 
+                                         self.reload_door_id_triplet, after_reload_txt)
+
+def _get_reload_db(TheAnalyzer, StateIndexList):
+    """A state's reload door is 'standard', if 
+
+        -- before reload, it only checks for the end of stream and
+           enters the state's drop-out, if it is not reached.
+        -- after reload failure, the state's drop-out is entered.
+        -- after reload success, the input is dereferenced. 
+       
+    Those states may reload through the interpreter loop.
+
+    RETURNS: map: state index --> DoorID of standard reload door
+    """
+    reload_state = TheAnalyzer.reload_state
+    if   reload_state is None:                             return {}
+    elif not TheAnalyzer.engine_type.subject_to_reload():  return {}
+
+    after_reload_op_list = OpList(Op.InputPDereference())
+    result = {}
+    for si in StateIndexList:
+        state          = TheAnalyzer.state_db[si]
+        reload_door_id = state.transition_map.get_target(Setup.buffer_limit_code)
+        if reload_door_id is None or reload_door_id.state_index != reload_state.index:
+            continue
+        op_list = reload_state.entry.get_command_list(reload_state.index, si)
+        if op_list is None or len(op_list) != 2: continue
+        prepare, check = op_list
+        if   prepare.id != E_Op.PrepareAfterReload:                       continue
+        elif check.id != E_Op.GotoDoorIdIfInputPNotEqualPointer:          continue
+        elif check.content.pointer != E_R.EndOfStreamP:                   continue
+        drop_out_door_id = TheAnalyzer.drop_out_DoorID(si)
+        if   check.content.door_id != drop_out_door_id:                   continue
+        elif prepare.content.on_failure_door_id != drop_out_door_id:      continue
+        elif    state.entry.get_door_id(si, reload_state.index) \
+             != prepare.content.on_success_door_id:                       continue
+        elif    state.entry.get_command_list(si, reload_state.index) \
+             != after_reload_op_list:                                     continue
+        result[si] = reload_door_id
+    return result
+
+def _get_classes(TmList):
+    """Partitions the lexatom range into equivalence classes. Two lexatoms
+    belong to the same class, if they trigger the same target in every
+    transition map of 'TmList'.
+
+    RETURNS: [0] List of borders of the elementary intervals. Lexatoms below
+                 'CLASS_ARRAY_SIZE' have an elementary interval of their own.
+             [1] List of classes--one for each elementary interval.
+             [2] Rows of targets--one row for each transition map. A row
+                 contains a target for each class.
+    """
+    border_set = set(range(CLASS_ARRAY_SIZE + 1))
+    for tm in TmList:
+        border_set.update(interval.begin for interval, target in tm)
+    border_list = sorted(x for x in border_set
+                         if x < Setup.lexatom.type_range.end)
+
+    def target_list(TM):
+        """RETURNS: Target for each elementary interval."""
+        result = []
+        for interval, target in TM:
+            i0 = bisect_right(border_list, interval.begin) - 1
+            i1 = bisect_right(border_list, interval.end - 1)
+            result.extend([target] * (i1 - i0))
+        return result
+
+    # Refine the partition transition map by transition map.
+    target_list_list = [ target_list(tm) for tm in TmList ]
+    class_list       = [0] * len(border_list)
+    for targets in target_list_list:
+        class_db   = {}
+        class_list = [
+            class_db.setdefault(key, len(class_db))
+            for key in zip(class_list, targets)
+        ]
+
+    # Number the classes in order of appearance.
+    class_db   = {}
+    class_list = [ class_db.setdefault(c, len(class_db)) for c in class_list ]
+    class_n    = len(class_db)
+
+    # One representative elementary interval per class
+    representative_list = [ None ] * class_n
+    for i, c in enumerate(class_list):
+        if representative_list[c] is None: representative_list[c] = i
+
+    row_list = [
+        [ targets[i] for i in representative_list ]
+        for targets in target_list_list
+    ]
+
+    # Merge adjacent elementary intervals above the class array if they belong
+    # to the same class (less borders to search).
+    merged_border_list = border_list[:CLASS_ARRAY_SIZE]
+    merged_class_list  = class_list[:CLASS_ARRAY_SIZE]
+    for border, c in zip(border_list[CLASS_ARRAY_SIZE:], class_list[CLASS_ARRAY_SIZE:]):
+        if len(merged_border_list) > CLASS_ARRAY_SIZE and merged_class_list[-1] == c:
+            continue
+        merged_border_list.append(border)
+        merged_class_list.append(c)
+
+    return merged_border_list, merged_class_list, row_list
+
+def _get_comb_vector(RowList, ClassN):
+    """Row displacement compression of the rows in 'RowList'. Each row's
+    most frequent target becomes its default. The remaining entries are
+    placed at 'base + class' so that no two entries of different rows
+    collide. Rows with many entries are placed first. Each row takes the 
+    first base that fits (first-fit).
+
+    RETURNS: [0] default list
+             [1] base list
+             [2] check list (-1 for unused entries)
+             [3] next list
+    """
+    default_list = []
+    entry_list   = []
+    for row in RowList:
+        default = Counter(row).most_common(1)[0][0]
+        default_list.append(default)
+        entry_list.append([ (c, target) for c, target in enumerate(row) if target != default ])
+
+    # Bit 'i' of 'occupied' is set <=> 'next[i]' is used. The bases where a
+    # row fits are determined at once: base 'b' fits, if slot 'b + c' is free
+    # for all entries' classes 'c'. First-fit takes the lowest such base.
+    base_list  = [ 0 ] * len(RowList)
+    check_list = []
+    next_list  = []
+    occupied   = 0
+    for key in sorted(range(len(RowList)), key=lambda k: - len(entry_list[k])):
+        entries = entry_list[key]
+        if not entries: continue
+        # Slots beyond 'check_list' are free. So, 'len(check_list)' fits.
+        all_mask  = (1 << (len(check_list) + ClassN)) - 1
+        free      = ~occupied & all_mask
+        base_mask = all_mask
+        for c, target in entries:
+            base_mask &= free >> c
+        base = (base_mask & - base_mask).bit_length() - 1
+
+        end = base + entries[-1][0] + 1
+        if end > len(check_list):
+            check_list.extend([-1] * (end - len(check_list)))
+            next_list.extend([0]   * (end - len(next_list)))
+        for c, target in entries:
+            check_list[base + c] = key
+            next_list[base + c]  = target
+            occupied            |= 1 << (base + c)
+        base_list[key] = base
+
+    # Any 'base + class' must be a valid index.
+    end = max(base_list) + ClassN
+    if end > len(check_list):
+        check_list.extend([-1] * (end - len(check_list)))
+        next_list.extend([0]   * (end - len(next_list)))
+
+    return default_list, base_list, check_list, next_list
+
+def _c_type(ValueList, SignedF):
+    """RETURNS: Smallest integer type that can hold all values of 'ValueList'.
+    """
+    low  = min(ValueList)
+    high = max(ValueList)
+    for bit_n in (8, 16, 32):
+        if SignedF:
+            if low >= - 2**(bit_n - 1) and high < 2**(bit_n - 1): return "int%i_t" % bit_n
+        else:
+            if low >= 0 and high < 2**bit_n:                      return "uint%i_t" % bit_n
+    return "int64_t" if SignedF else "uint64_t"
+
+def _initial(ValueList):
+    """RETURNS: Initializer for an array of the values in 'ValueList'.
+    """
+    txt = ["{\n"]
+    for i in range(0, len(ValueList), 16):
+        txt.append("        %s,\n" % ", ".join("%i" % x for x in ValueList[i:i+16]))
+    txt.append("    }")
+    return "".join(txt)
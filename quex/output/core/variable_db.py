@@ -32,6 +32,21 @@ candidate_db = {
 "template_%i_target_%i":                        ["const QUEX_TYPE_GOTO_LABEL",    None,                     False],
 "template_%i_map_state_key_to_recursive_entry": ["const QUEX_TYPE_GOTO_LABEL",    None,                     False],
 #
+# (*) Transition Tables ('--engine-style table'; type depends on values)
+"transition_table_state":                       ["ptrdiff_t",                     "(ptrdiff_t)0",           False],
+"transition_table_target":                      ["ptrdiff_t",                     "(ptrdiff_t)0",           False],
+"transition_table_%i_class":                    ["static const uint8_t",          None,                     False],
+"transition_table_%i_base":                     ["static const uint32_t",         None,                     False],
+"transition_table_%i_check":                    ["static const int32_t",          None,                     False],
+"transition_table_%i_next":                     ["static const int32_t",          None,                     False],
+"transition_table_%i_default":                  ["static const int32_t",          None,                     False],
+"transition_table_%i_reload_fail":              ["static const int32_t",          None,                     False],
+"transition_table_%i_border":                   ["static const QUEX_TYPE_LEXATOM", None,                    False],
+"transition_table_%i_border_class":             ["static const uint32_t",         None,                     False],
+#
+# (*) Bitmaps in transition maps
+"bitmap_%i":                                    ["static const uint8_t",          None,                     False],
+#
 # (*) Skipper etc.
 "position_delta":                 ["ptrdiff_t",          "(ptrdiff_t)0",            False],
 "count_reference_p":              ["QUEX_TYPE_LEXATOM*", "(QUEX_TYPE_LEXATOM*)0x0", False],
@@ -131,7 +146,7 @@ class VariableDB:
             else:
                 variable_db.require(Lng.REGISTER_NAME(register_info))
 
-    def require_array(self, Name, ElementN, Initial, Index=None, Condition_ComputedGoto=None):
+    def require_array(self, Name, ElementN, Initial, Index=None, Condition_ComputedGoto=None, Type=None):
         global candidate_db
         IndexOrTuple = Index
 
@@ -141,7 +156,8 @@ class VariableDB:
         x = candidate_db[Name]
 
         if IndexOrTuple is not None: Name = Name % IndexOrTuple
-        self.__enter(Name, x[0], ElementN, Initial, condition, condition_negated_f, x[2])
+        if Type is None:             Type = x[0]
+        self.__enter(Name, Type, ElementN, Initial, condition, condition_negated_f, x[2])
 
         return Name
 
@@ -54,7 +54,7 @@ def get(CaMap, ModeName):
     dial_db = DialDB()
 
     mode_with_same_counter = DefaultCounterFunctionDB.get_mode_name(CaMap)
-    if mode_with_same_counter is not None:
+    if mode_with_same_counter is not None and mode_with_same_counter != ModeName:
         # Use previously done implementation for this 'CaMap'
         return __frame(Lng.DEFAULT_COUNTER_FUNCTION_NAME(ModeName), 
                        [ "(void)me; (void)LexemeBegin; (void)LexemeEnd;\n",
@@ -85,10 +85,34 @@ def get(CaMap, ModeName):
     implementation = __frame(Lng.DEFAULT_COUNTER_FUNCTION_NAME(ModeName), code, 
                              Lng.INPUT_P(), door_id_return, dial_db) 
 
-    DefaultCounterFunctionDB.enter(CaMap, ModeName)
+    if mode_with_same_counter is None:
+        DefaultCounterFunctionDB.enter(CaMap, ModeName)
 
     return implementation
 
+def prepare(ModeIterable):
+    """Determines which mode implements the default counter for which 
+    'CaMap' BEFORE any counter is generated. The first mode in 'ModeIterable'
+    with a given 'CaMap' implements the counter, all others refer to it.
+
+    This way, the result of 'get()' for a mode does not depend on whether 
+    'get()' has been called for other modes before.
+    """
+    if not required_counter(): return
+
+    for mode in ModeIterable:
+        ca_map = mode.ca_map_for_run_time_counter
+        if ca_map is None: continue
+        elif DefaultCounterFunctionDB.get_mode_name(ca_map) is not None: continue
+        DefaultCounterFunctionDB.enter(ca_map, mode.name)
+
+def implementing_mode_name(Mode):
+    """RETURNS: Name of the mode which implements the default counter that is 
+                used by 'Mode'. None, if 'Mode' does not use a default counter.
+    """
+    if Mode.ca_map_for_run_time_counter is None: return None
+    return DefaultCounterFunctionDB.get_mode_name(Mode.ca_map_for_run_time_counter)
+
 def __frame(FunctionName, CodeTxt, IteratorName, DoorIdReturn, dial_db):
 
     txt = [  \
@@ -16,6 +16,7 @@ from   quex.engine.misc.file_operations                  import open_file_or_die
                                                                 get_file_content_or_die, \
                                                                 write_safely_and_close
 import quex.engine.misc.error                            as     error
+import quex.engine.misc.perfect_hash                     as     perfect_hash
 from   quex.engine.misc.tools                            import typed, \
                                                                 do_and_delete_if, \
                                                                 none_isinstance, \
@@ -206,6 +207,7 @@ class Language(dict):
         self.__code_generation_reload_label       = None
         self.__code_generation_on_reload_fail_adr = None
         self.__debug_unit_name                    = "<undefined>"
+        self.__skip_simd_f                        = False
         assert self.ON_AFTER_MATCH_THEN_RETURN.endswith(";")
         self.__re_FLUSH                          = re.compile(r"\b%s\b" % self.ON_AFTER_MATCH_THEN_RETURN[:-1])
         # NOTE: 'END_OF_STREAM' is not an error, it is the event of input 
@@ -807,6 +809,9 @@ class Language(dict):
         elif Op.id == E_Op.InputPDereference:
             return "    %s\n" % self.ASSIGN("input", self.INPUT_P_DEREFERENCE())
 
+        elif Op.id == E_Op.InputPSkipCharacterSet:
+            return self.SKIP_CHARACTER_SET(Op.content.interval_tuple)
+
         elif Op.id == E_Op.Increment:
             return "    ++%s;\n" % self.REGISTER_NAME(Op.content.register)
 
@@ -862,10 +867,15 @@ class Language(dict):
 
     @typed(dial_db=DialDB)
     def HEADER_DEFINITIONS(self, dial_db):
-        return blue_print(cpp_header_definition_str, [
+        txt = blue_print(cpp_header_definition_str, [
             ("$$CONTINUE_WITH_ON_AFTER_MATCH$$", self.LABEL_STR_BY_ADR(DoorID.continue_with_on_after_match(dial_db).related_address)),
             ("$$RETURN_WITH_ON_AFTER_MATCH$$",   self.LABEL_STR_BY_ADR(DoorID.return_with_on_after_match(dial_db).related_address)),
         ])
+        if self.__skip_simd_f:
+            # Vectorized skip loops have been generated (see 'SKIP_CHARACTER_SET').
+            txt += cpp_skip_simd_include_str
+            self.__skip_simd_f = False
+        return txt
 
     def RETURN_THIS(self, Value):
         return "return %s;" % Value
@@ -1115,6 +1125,107 @@ class Language(dict):
         """
         return self.IF("input", Condition, Value, Index==0, SimpleF=True, SpaceF=(Length>2))
 
+    def IF_INPUT_IN_BITMAP(self, Begin, Size, RangeCheckF, Word, ArrayName):
+        """Bit 'input - Begin' of a bitmap of 'Size' bits is set. The bitmap is
+        either the constant 'Word' or the byte array 'ArrayName'. If 
+        'RangeCheckF', then 'input' may lie outside the bitmap.
+
+        RETURNS: Opening of an 'if' block.
+        """
+        if Begin: offset = "(QUEX_TYPE_LEXATOM)(input - 0x%X)" % Begin
+        else:     offset = "input"
+        if Word is not None: test = "((0x%Xu >> %s) & 1)" % (Word, offset)
+        else:                test = "(%s[%s >> 3] & (1 << (%s & 7)))" % (ArrayName, offset, offset)
+        if RangeCheckF: return "if( %s < 0x%X && %s ) {\n" % (offset, Size, test)
+        else:           return "if( %s ) {\n" % test
+
+    def TWO_LEVEL_TABLE_LOOKUP(self, Name, Begin, Shift):
+        """RETURNS: Expression that maps 'input' to its target class by the 
+                    two-level table 'Name' (see module 'two_level_table').
+        """
+        if Begin: offset = "(QUEX_TYPE_LEXATOM)(input - 0x%X)" % Begin
+        else:     offset = "input"
+        return "QUEX_NAME(%s_leaf)[((size_t)QUEX_NAME(%s_index)[%s >> %i] << %i) + (%s & 0x%X)]" \
+               % (Name, Name, offset, Shift, Shift, offset, (1 << Shift) - 1)
+
+    def TWO_LEVEL_TABLE_DEFINITION(self, Name, IndexType, IndexList, LeafList):
+        """RETURNS: Definition of the tables of a two-level table. A guard 
+                    prevents double definition, if multiple modes require it.
+        """
+        def array(Type, ArrayName, ValueList):
+            txt = [ "static const %s QUEX_NAME(%s)[%i] = {\n" % (Type, ArrayName, len(ValueList)) ]
+            txt.extend(
+                "    %s,\n" % ", ".join("%i" % x for x in ValueList[i:i+16])
+                for i in range(0, len(ValueList), 16)
+            )
+            txt.append("};\n")
+            return "".join(txt)
+
+        guard = "QUEX_%s_DEFINED" % Name.upper()
+        return "".join([
+            "#ifndef %s\n" % guard,
+            "#define %s\n" % guard,
+            array(IndexType, "%s_index" % Name, IndexList),
+            array("uint8_t", "%s_leaf"  % Name, LeafList),
+            "#endif\n",
+        ])
+
+    def KEYWORD_HASH_DISPATCH(self, SequenceList, DisplacementList, CaseList, DefaultConsequence):
+        """Identifies the lexeme as one of the keywords in 'SequenceList' by a
+        minimal perfect hash (see module 'perfect_hash'). The keyword in slot
+        'i' triggers 'CaseList[i]'. Any other lexeme triggers the default.
+
+        RETURNS: Code block.
+        """
+        def array(Type, ArrayName, ValueList):
+            txt = [ "    static const %s %s[%i] = {\n" % (Type, ArrayName, len(ValueList)) ]
+            txt.extend(
+                "        %s,\n" % ", ".join("%i" % x for x in ValueList[i:i+16])
+                for i in range(0, len(ValueList), 16)
+            )
+            txt.append("    };\n")
+            return "".join(txt)
+
+        N          = len(SequenceList)
+        R          = len(DisplacementList)
+        text_list  = [ x for sequence in SequenceList for x in sequence ]
+        begin_list = [ 0 ]
+        for sequence in SequenceList:
+            begin_list.append(begin_list[-1] + len(sequence))
+
+        case_list = [ (i, "{\n%s\n} break;" % code) for i, code in enumerate(CaseList) ]
+        default   = "{\n%s\n} break;" % DefaultConsequence
+
+        txt = [
+            "{\n",
+            array("QUEX_TYPE_LEXATOM", "keyword_text", text_list),
+            array("uint32_t", "keyword_begin", begin_list),
+            array("uint16_t", "keyword_displacement", DisplacementList),
+            "    const QUEX_TYPE_LEXATOM* keyword_p;\n",
+            "    const QUEX_TYPE_LEXATOM* keyword_q;\n",
+            "    uint32_t                 keyword_h = (uint32_t)%iu;\n" % perfect_hash.FNV_OFFSET,
+            "    size_t                   keyword_i;\n",
+            "\n",
+            "    for(keyword_p = %s; keyword_p != %s; ++keyword_p) {\n" % (self.LEXEME_START_P(), self.INPUT_P()),
+            "        keyword_h = (uint32_t)((keyword_h ^ (uint32_t)*keyword_p) * (uint32_t)%iu);\n" % perfect_hash.FNV_PRIME,
+            "    }\n",
+            "    keyword_h = (uint32_t)((keyword_h ^ (uint32_t)keyword_displacement[keyword_h %% %iu]) * (uint32_t)0x%Xu);\n" \
+            % (R, perfect_hash.MIX_FACTOR),
+            "    keyword_i = (size_t)((keyword_h ^ (keyword_h >> %i)) %% %iu);\n" % (perfect_hash.MIX_SHIFT, N),
+            "    if( %s != (size_t)(keyword_begin[keyword_i + 1] - keyword_begin[keyword_i]) ) {\n" % self.LEXEME_LENGTH(),
+            "        keyword_i = %i;\n" % N,
+            "    } else {\n",
+            "        keyword_q = &keyword_text[keyword_begin[keyword_i]];\n",
+            "        for(keyword_p = %s; keyword_p != %s; ++keyword_p, ++keyword_q) {\n" % (self.LEXEME_START_P(), self.INPUT_P()),
+            "            if( *keyword_p != *keyword_q ) { keyword_i = %i; break; }\n" % N,
+            "        }\n",
+            "    }\n",
+        ]
+        txt.extend(self.BRANCH_TABLE("keyword_i", case_list, CaseFormat="dec",
+                                     DefaultConsequence=default))
+        txt.append("}\n")
+        return "".join(txt)
+
     def IF_ACCEPTANCE_CONDITION_SET(self, FirstF, AccConditionSet, Consequence):
         def append_if_pre_context(acc_condition_id, result):
             if acc_condition_id == E_AcceptanceCondition.BEGIN_OF_LINE:
@@ -1177,6 +1288,9 @@ class Language(dict):
     def debug_unit_name_set(self, Name):
         self.__debug_unit_name = Name
 
+    def debug_unit_name_get(self):
+        return self.__debug_unit_name
+
     def STATE_DEBUG_INFO(self, TheState, GlobalEntryF):
         assert isinstance(TheState, Processor)
         name = self.__debug_unit_name
@@ -1197,6 +1311,26 @@ class Language(dict):
         else:
             return ""
 
+    def STATISTICS_STATE_COUNT(self, UnitName, StateIndex, BoundaryList):
+        """Counting of the lexatom 'input' in the interval of the transition
+        map where it appears ('--profile-generate'). The statistics objects are 
+        static. They are linked into the list of statistics objects upon the 
+        first entry into the state.
+        """
+        boundary_n = len(BoundaryList)
+        return "".join([
+            "    {\n",
+            "        static const QUEX_TYPE_LEXATOM          boundary[] = { %s };\n" \
+            % ", ".join("0x%X" % x for x in BoundaryList),
+            "        static QUEX_TYPE_STATISTICS_COUNTER     counter[%i];\n" % (boundary_n + 1),
+            "        static QUEX_NAME(statistics_state)      statistics = {\n",
+            "            \"%s\", %i, { %i, &boundary[0], &counter[0] }, (QUEX_NAME(statistics_state)*)0, 0\n" \
+            % (UnitName, StateIndex, boundary_n),
+            "        };\n",
+            "        QUEX_NAME(statistics_state_count)(&statistics, input);\n",
+            "    }\n"
+        ])
+
     @typed(X=RouterContentElement)
     def POSITIONING(self, X):
         Positioning = X.positioning
@@ -1253,6 +1387,199 @@ class Language(dict):
             for cause, effect in sequence
         ]
 
+    def SKIP_CHARACTER_SET(self, IntervalTuple):
+        """Skips all lexatoms in 'IntervalTuple' starting from the input 
+        pointer. The buffer limit code is never in the set, so the scan stops
+        at the latest at the end of the buffer's content. 
+
+        If only a single lexatom (besides the buffer limit code) ends the 
+        scan, 'memchr()' finds it (1 byte lexatoms, standard library). Else,
+        blocks of lexatoms are checked by AVX2 or SSE2 instructions, if 
+        available, or word by word (1 byte lexatoms, at most 3 lexatoms end
+        the scan). The remainder is checked lexatom by lexatom.
+
+        RETURNS: String.
+        """
+        input_p       = self.INPUT_P()
+        stop_list     = self.__skip_stop_list(IntervalTuple)
+        single_byte_f = Setup.lexatom.size_in_byte == 1
+        if stop_list is None: stop_but_blc = None
+        else:                 stop_but_blc = [ x for x in stop_list if x != Setup.buffer_limit_code ]
+
+        def scalar_condition(Begin, End):
+            if End - Begin == 1: 
+                return "*%s == (QUEX_TYPE_LEXATOM)0x%X" % (input_p, Begin)
+            return "(QUEX_TYPE_LEXATOM)(*%s - (QUEX_TYPE_LEXATOM)0x%X) <= (QUEX_TYPE_LEXATOM)0x%X" \
+                   % (input_p, Begin, End - Begin - 1)
+
+        scalar_txt = "\n           || ".join(
+            "(%s)" % scalar_condition(begin, end) for begin, end in IntervalTuple
+        )
+        txt = [ "    {\n" ]
+        if     single_byte_f and stop_but_blc is not None and len(stop_but_blc) == 1 \
+           and condition.do("std-lib && not-tiny-std-lib"):
+            txt.append(blue_print(cpp_skip_memchr_str, [
+                ("$$INPUT_P$$", input_p),
+                ("$$STOP$$",    "0x%X" % stop_but_blc[0]),
+            ]))
+        elif Setup.lexatom.size_in_byte in (1, 2):
+            self.__skip_simd_f = True
+            txt.extend([
+                "#   if   defined(QUEX_SKIP_SIMD_AVX2)\n",
+                self.__skip_simd_loop(IntervalTuple, "_mm256", "si256", 32),
+                "#   elif defined(QUEX_SKIP_SIMD_SSE2)\n",
+                self.__skip_simd_loop(IntervalTuple, "_mm",    "si128", 16),
+            ])
+            if single_byte_f and stop_list is not None:
+                txt.extend([
+                    "#   else\n",
+                    self.__skip_swar_loop(stop_list, scalar_txt),
+                ])
+            txt.append("#   endif\n")
+        txt.extend([
+            "        while( %s ) {\n" % scalar_txt,
+            "            ++%s;\n" % input_p,
+            "        }\n",
+            "    }\n",
+        ])
+        return "".join(txt)
+
+    def __skip_stop_list(self, IntervalTuple):
+        """RETURNS: Lexatoms that are not in 'IntervalTuple'--if there are 
+                    no more than 3. Else, None.
+        """
+        result = []
+        begin  = 0
+        for interval_begin, interval_end in sorted(IntervalTuple) + [(Setup.lexatom.type_range.end, None)]:
+            result.extend(range(begin, min(interval_begin, begin + 4)))
+            if len(result) > 3: return None
+            begin = interval_end
+        return result
+
+    def __skip_swar_loop(self, StopList, ScalarTxt):
+        """Word-at-a-time scan for lexatoms in 'StopList' (1 byte lexatoms).
+        'x - ones & ~x & highs' is non-zero, if a byte in 'x' is zero.
+        """
+        xor_txt = "".join(
+            "                const size_t x%i = word ^ (ones * (size_t)0x%X);\n" % (i, stop)
+            for i, stop in enumerate(StopList)
+        )
+        condition_txt = " | ".join(
+            "((x%i - ones) & ~x%i)" % (i, i) for i in range(len(StopList))
+        )
+        return blue_print(cpp_skip_swar_str, [
+            ("$$INPUT_P$$",   self.INPUT_P()),
+            ("$$SCALAR$$",    ScalarTxt.replace("\n           ", "\n                   ")),
+            ("$$XOR$$",       xor_txt),
+            ("$$CONDITION$$", condition_txt),
+        ])
+
+    def __skip_simd_loop(self, IntervalTuple, Prefix, Suffix, ByteN):
+        bit_n = Setup.lexatom.size_in_byte * 8
+        def intrinsic(Name, *Args):
+            return "%s_%s(%s)" % (Prefix, Name, ", ".join(Args))
+
+        constant_txt = []
+        condition_list = []
+        for i, (begin, end) in enumerate(IntervalTuple):
+            constant_txt.append("            const __m%ii begin_%i = %s;\n" 
+                                % (ByteN * 8, i, intrinsic("set1_epi%i" % bit_n, "(int)0x%X" % begin)))
+            if end - begin == 1:
+                condition_list.append(intrinsic("cmpeq_epi%i" % bit_n, "chunk", "begin_%i" % i))
+            else:
+                constant_txt.append("            const __m%ii delta_%i = %s;\n" 
+                                    % (ByteN * 8, i, 
+                                       intrinsic("set1_epi%i" % bit_n, "(int)0x%X" % (end - begin - 1))))
+                condition_list.append(
+                    intrinsic("cmpeq_epi%i" % bit_n, 
+                              intrinsic("subs_epu%i" % bit_n, 
+                                        intrinsic("sub_epi%i" % bit_n, "chunk", "begin_%i" % i),
+                                        "delta_%i" % i),
+                              intrinsic("setzero_%s" % Suffix)))
+
+        condition_txt = condition_list[0]
+        for other in condition_list[1:]:
+            condition_txt = intrinsic("or_%s" % Suffix, condition_txt, other)
+
+        return blue_print(cpp_skip_simd_loop_str, [
+            ("$$CONSTANTS$$",  "".join(constant_txt)),
+            ("$$INPUT_P$$",    self.INPUT_P()),
+            ("$$BYTE_N$$",     "%i" % ByteN),
+            ("$$M$$",          "__m%ii" % (ByteN * 8)),
+            ("$$LOAD$$",       intrinsic("loadu_%s" % Suffix, "(const __m%ii*)%s" % (ByteN * 8, self.INPUT_P()))),
+            ("$$IN_SET$$",     condition_txt),
+            ("$$MOVEMASK$$",   intrinsic("movemask_epi8", "in_set")),
+            ("$$MASK_ALL$$",   "0xFFFFFFFFu" if ByteN == 32 else "0xFFFFu"),
+        ])
+
+    def TRANSITION_TABLE_LOOP(self, DoorId, NameDb, PlainTransitionTxt, GotoExitList,
+                              ReloadDoorIdTriplet=None, AfterReloadTxt=None):
+        """Interpreter loop of a table driven transition map (see module 
+        'quex.output.core.transition_table'). 'NameDb' maps table names to the
+        names of the arrays that implement them. 'GotoExitList[e]' is the
+        'goto' to be executed upon the target '-e-1'.
+
+        If the loop reloads, 'ReloadDoorIdTriplet' contains the DoorID-s of
+        the exit switch, of the return after reload, and of the reload failure.
+        Upon failure, the exit is taken from the table 'reload_fail'.
+
+        RETURNS: List of strings.
+        """
+        if "border" in NameDb:
+            class_txt = blue_print(cpp_transition_table_class_search_str, [
+                ("$$CLASS$$",        NameDb["class"]),
+                ("$$BORDER$$",       NameDb["border"]),
+                ("$$BORDER_CLASS$$", NameDb["border_class"]),
+            ])
+        else:
+            class_txt = "    transition_table_target = (ptrdiff_t)%s[input];\n" % NameDb["class"]
+
+        L = len(GotoExitList)
+        exit_txt = [
+            "    case %i: %s\n" % (- e - 1, goto) if e != L - 1 else \
+            "    default: %s\n" % goto
+            for e, goto in enumerate(GotoExitList)
+        ]
+
+        txt = [
+            "\n\n    %s\n" % self.UNREACHABLE,
+            "%s\n" % self.LABEL(DoorId),
+            class_txt,
+            blue_print(cpp_transition_table_lookup_str, [
+                ("$$BASE$$",    NameDb["base"]),
+                ("$$CHECK$$",   NameDb["check"]),
+                ("$$NEXT$$",    NameDb["next"]),
+                ("$$DEFAULT$$", NameDb["default"]),
+            ]),
+            "    if( transition_table_target >= 0 ) {\n",
+        ]
+        txt.extend("        %s\n" % line.strip() 
+                   for line in PlainTransitionTxt if line.strip())
+        txt.extend([
+            "        transition_table_state = transition_table_target;\n",
+            "        goto %s;\n" % self.LABEL_STR(DoorId),
+            "    }\n",
+        ])
+        if ReloadDoorIdTriplet is not None:
+            txt.append("%s\n" % self.LABEL(ReloadDoorIdTriplet[0]))
+        txt.append("    switch( transition_table_target ) {\n")
+        txt.extend(exit_txt)
+        txt.append("    }\n")
+
+        if ReloadDoorIdTriplet is None: return txt
+
+        exit_door_id, reloaded_door_id, reload_fail_door_id = ReloadDoorIdTriplet
+        txt.append("%s\n" % self.LABEL(reloaded_door_id))
+        txt.extend("    %s\n" % line.strip() 
+                   for line in AfterReloadTxt if line.strip())
+        txt.extend([
+            "    goto %s;\n" % self.LABEL_STR(DoorId),
+            "%s\n" % self.LABEL(reload_fail_door_id),
+            "    transition_table_target = (ptrdiff_t)%s[transition_table_state];\n" % NameDb["reload_fail"],
+            "    goto %s;\n" % self.LABEL_STR(exit_door_id),
+        ])
+        return txt
+
     def CASE_STR(self, Format):
         return {
             "hex": "case 0x%X: ", 
@@ -1810,6 +2137,73 @@ $$INC: implementations.i$$
 $$FOOTER$$
 """
 
+cpp_skip_simd_include_str = """
+#if ! defined(QUEX_OPTION_SKIP_SIMD_DISABLED_EXT) && defined(__GNUC__)
+#   if   defined(__AVX2__)
+#       include <immintrin.h>
+#       define QUEX_SKIP_SIMD_AVX2
+#   elif defined(__SSE2__)
+#       include <emmintrin.h>
+#       define QUEX_SKIP_SIMD_SSE2
+#   endif
+#endif
+"""
+
+cpp_skip_memchr_str = """        $$INPUT_P$$ = (QUEX_TYPE_LEXATOM*)QUEX_GSTD(memchr)((const void*)$$INPUT_P$$, $$STOP$$, 
+                                                       (size_t)(me->buffer.input.end_p - $$INPUT_P$$));
+        if( ! $$INPUT_P$$ ) $$INPUT_P$$ = me->buffer.input.end_p;
+"""
+
+cpp_skip_swar_str = """        {
+            const size_t ones  = ((size_t)-1) / 0xFF;
+            const size_t highs = ones << 7;
+            while( ((size_t)$$INPUT_P$$ & (sizeof(size_t) - 1)) 
+                   && ($$SCALAR$$) ) {
+                ++$$INPUT_P$$;
+            }
+            while( $$INPUT_P$$ + sizeof(size_t) <= me->buffer._memory._back ) {
+                const size_t word = *(const size_t*)$$INPUT_P$$;
+$$XOR$$                if( ($$CONDITION$$) & highs ) break;
+                $$INPUT_P$$ += sizeof(size_t);
+            }
+        }
+"""
+
+cpp_skip_simd_loop_str = """        {
+$$CONSTANTS$$            while( $$INPUT_P$$ + $$BYTE_N$$ / sizeof(QUEX_TYPE_LEXATOM) <= me->buffer._memory._back ) {
+                const $$M$$ chunk  = $$LOAD$$;
+                const $$M$$ in_set = $$IN_SET$$;
+                const unsigned mask = (unsigned)$$MOVEMASK$$ ^ $$MASK_ALL$$;
+                if( mask ) {
+                    $$INPUT_P$$ += (unsigned)__builtin_ctz(mask) / sizeof(QUEX_TYPE_LEXATOM);
+                    break;
+                }
+                $$INPUT_P$$ += $$BYTE_N$$ / sizeof(QUEX_TYPE_LEXATOM);
+            }
+        }
+"""
+
+cpp_transition_table_class_search_str = """    if( input < (QUEX_TYPE_LEXATOM)(sizeof($$CLASS$$) / sizeof($$CLASS$$[0])) ) {
+        transition_table_target = (ptrdiff_t)$$CLASS$$[input];
+    } else {
+        ptrdiff_t low = 0;
+        ptrdiff_t up  = (ptrdiff_t)(sizeof($$BORDER$$) / sizeof($$BORDER$$[0]));
+        ptrdiff_t middle;
+        while( up - low > 1 ) {
+            middle = (low + up) >> 1;
+            if( input < $$BORDER$$[middle] ) { up = middle; }
+            else { low = middle; }
+        }
+        transition_table_target = (ptrdiff_t)$$BORDER_CLASS$$[low];
+    }
+"""
+
+cpp_transition_table_lookup_str = """    transition_table_target += (ptrdiff_t)$$BASE$$[transition_table_state];
+    transition_table_target  = $$CHECK$$[transition_table_target] == transition_table_state ?
+                               (ptrdiff_t)$$NEXT$$[transition_table_target]
+                             : (ptrdiff_t)$$DEFAULT$$[transition_table_state];
+"""
+
 cpp_reload_forward_str = """
     __quex_debug3("RELOAD_FORWARD: success->%i; failure->%i", 
                   (int)target_state_index, (int)target_state_else_index);
@@ -4,12 +4,14 @@
 from   quex.engine.misc.file_operations import open_file_or_die, \
                                                write_safely_and_close 
 from   quex.engine.misc.tools           import flatten
+import quex.engine.misc.phase_stats     as     phase_stats
 import quex.output.analyzer.adapt       as     adapt
 from   quex.blackboard                  import Lng, setup as Setup
 from   quex.DEFINITIONS                 import QUEX_PATH
 
 import os
 
+@phase_stats.measured("source package copy")
 def do(OutputDir, DirList=None):
     file_set = __collect_files(DirList)
     __copy_files(OutputDir, file_set)
@@ -31,6 +33,8 @@ dir_db = {
         "receiving.i",
         "TokenQueue",
         "TokenQueue.i",
+        "TokenColumns",
+        "TokenColumns.i",
         "CDefault.qx",
         "CppDefault.qx" 
     ],
@@ -42,6 +46,10 @@ dir_db = {
         "Accumulator",
         "Accumulator.i",
     ],
+    "extra/mmap/": [
+        "MMAP",
+        "MMAP.i",
+    ],
     "buffer/lexatoms/": [
         "LexatomLoader", 
         "LexatomLoader.i",
@@ -67,6 +75,7 @@ dir_db = {
         "Buffer_nested.i",
         "Buffer_callbacks.i",
         "Buffer_invariance.i",
+        "Buffer_newline_index.i",
     ],
     "analyzer/": [
         "Mode",
@@ -119,12 +128,15 @@ dir_db = {
         "ByteLoader_OSAL",    "ByteLoader_OSAL.i",
         "ByteLoader_stream",  "ByteLoader_stream.i",
         "ByteLoader_Memory",  "ByteLoader_Memory.i",
+        "ByteLoader_MMAP",    "ByteLoader_MMAP.i",
         "ByteLoader_Monitor", "ByteLoader_Monitor.i",
     ],
     "quex/converter/": [
         "Converter",               "Converter.i",
         "iconv/Converter_IConv",   "iconv/Converter_IConv.i",
         "icu/Converter_ICU",       "icu/Converter_ICU.i",
+        "utf/Converter_UTF8",      "utf/Converter_UTF8.i",
+        "utf/Converter_UTF16",     "utf/Converter_UTF16.i",
         "icu/special_headers.h",
         "iconv/special_headers.h",
     ],
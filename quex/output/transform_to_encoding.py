@@ -4,7 +4,9 @@
 from   quex.blackboard         import setup as Setup
 from   quex.input.setup        import NotificationDB
 import quex.engine.misc.error  as     error
+import quex.engine.misc.phase_stats as phase_stats
 
+@phase_stats.measured("encoding transformation")
 def do(sm, OriginalSmList=None):
     backup_id = sm.get_id()
     ok_f, sm = Setup.buffer_encoding.do_state_machine(sm) 